@@ -112,13 +112,18 @@ async def process_ticker(
     news_start: str,
     news_end: str,
     allocation_pct: float = 0.25,
-    max_position_size: float = None
+    max_position_size: float = None,
+    order_manager=None,
+    pipeline=None
 ) -> dict:
     """
     Process a single ticker: fetch data, engineer features, generate signal, execute.
     
     This function encapsulates Steps 1-5 of the trading loop for one symbol,
-    and runs concurrently with other tickers via asyncio.gather().
+    and runs concurrently with other tickers via asyncio.gather(). Blocking
+    fetches run on the pipeline's thread pool and feature engineering on its
+    process pool, so tickers overlap; each stage's wall time is recorded in
+    result['timings'].
     
     Args:
         ticker: Symbol to process (e.g., 'SPY', 'AAPL')
@@ -132,19 +137,24 @@ async def process_ticker(
         news_start: News window start date
         news_end: News window end date
         allocation_pct: Fraction of equity per ticker (default 0.25 = 25%)
+        order_manager: Optional started OrderManager (fills from the trade-updates stream)
+        pipeline: src.live_pipeline.LivePipeline (default: inline, stages run serially)
         
     Returns:
         Dict with ticker processing results
     """
     from src.executor import async_execute_trade
-    from src.optimizer import calculate_alpha_with_weights
+    from src.live_pipeline import LivePipeline, compute_live_signal, fetch_bars
     
+    pipeline = pipeline or LivePipeline(inline=True)
+    timings = {}
     result = {
         'ticker': ticker,
         'success': False,
         'signal': None,
         'trade_result': None,
-        'error': None
+        'error': None,
+        'timings': timings
     }
     
     try:
@@ -164,112 +174,46 @@ async def process_ticker(
              node_config['position_cap_usd'] = max_position_size
              LOG.info(f"[RISK GUARD] Capping {ticker} exposure limit to ${max_position_size:,.2f}")
 
-        # Step 1: Fetch bars from Alpaca
+        # Step 1 + 2: Bars and fundamentals are independent - fetch them concurrently
         LOG.info(f"\n[STEP 1] Fetching {ticker} {interval_str} bars from Alpaca (SIP feed)...")
         LOG.info(f"[HOT START] Fetching {WARMUP_BUFFER}-bar trailing history for normalization warmup")
-        bars = alpaca_client.fetch_historical_bars(
-            symbol=ticker,
-            timeframe=interval_enum,
-            start=bar_start,
-            end=bar_end,
-            feed='sip',
-            lookback_buffer=WARMUP_BUFFER
-        )
-        LOG.info(f"[{ticker}] Fetched {len(bars)} bars (includes {WARMUP_BUFFER} warmup)")
-        
-        # FORCE-VERIFY: Resample if fetched data doesn't match requested interval
-        bars, was_resampled, actual_secs, expected_secs = force_resample_ohlcv(
-            bars, interval_str, ticker=ticker
-        )
-        if was_resampled:
-            LOG.info(f"[{ticker}] Resampled to {len(bars)} bars at {interval_str}")
-        else:
-            LOG.info(f"[VALIDATION] [OK] Frequency verified: {interval_str} ({int(actual_secs)}s delta)")
-
-        
         LOG.info(f"[LIVE {ticker}] Step 2: Fetching fundamental metrics...")
-        fmp_metrics = fmp_client.fetch_fundamental_metrics(ticker)
+        bars, fmp_metrics = await asyncio.gather(
+            pipeline.io(timings, 'bars', fetch_bars, alpaca_client, ticker, interval_str, interval_enum,
+                        bar_start, bar_end, WARMUP_BUFFER),
+            pipeline.io(timings, 'fundamentals', fmp_client.fetch_fundamental_metrics, ticker)
+        )
         
         LOG.info(f"[LIVE {ticker}] Step 3: Fetching news...")
-        news_list = fmp_client.fetch_historical_news(ticker, news_start, news_end, price_df=bars)
-        
-        LOG.info(f"[LIVE {ticker}] Step 4: Feature engineering...")
-        df = bars.copy()
-        df['log_return'] = feature_engineer.calculate_log_return(df)
-        df['rvol'] = feature_engineer.calculate_rvol(df, window=20)
-        df['parkinson_vol'] = feature_engineer.calculate_parkinson_vol(df)
-        df['mktCap'] = fmp_metrics['mktCap']
-        df['pe'] = fmp_metrics['pe']
-        df['avgVolume_fmp'] = fmp_metrics['avgVolume']
-        
-        feature_matrix_live = merge_news_pit(df, news_list, lookback_hours=4, ticker=ticker)
+        news_list = await pipeline.io(timings, 'news', fmp_client.fetch_historical_news,
+                                      ticker, news_start, news_end, price_df=bars)
         
-        # Add technical indicators (with node_config for RSI lookback)
-        add_technical_indicators(feature_matrix_live, node_config=node_config)
+        # Steps 4-5 are pandas-heavy: run them on the process pool
+        LOG.info(f"[LIVE {ticker}] Step 4-5: Feature engineering and signal...")
+        live_signal = await pipeline.cpu(timings, 'features', compute_live_signal,
+                                         bars, fmp_metrics, news_list, node_config, ticker, WARMUP_BUFFER)
         
-        # Generate master alpha signal (with node_config for weights and sentry gate)
-        generate_master_signal(feature_matrix_live, node_config=node_config, ticker=ticker)
-        
-        feature_matrix_live = trim_warmup_period(feature_matrix_live, warmup_rows=20)
-        
-        # HOT START: Strip warmup buffer for live trading
-        # Ensure signal generation only uses fully-warmed normalization windows
-        if len(feature_matrix_live) > WARMUP_BUFFER:
-            LOG.info(f"[HOT START] [{ticker}] Isolating {WARMUP_BUFFER} warmup bars from live trading window")
-            feature_matrix_live = feature_matrix_live.iloc[WARMUP_BUFFER:].copy()
-            LOG.success(f"[HOT START: ARMED] [{ticker}] Rolling normalization fully populated. Trading bars: {len(feature_matrix_live)}")
-        
-        LOG.info(f"[LIVE {ticker}] Step 5: Generating signal...")
-        # AG: TEMPORAL LEAK PATCH - Feature Isolation
-        # CRITICAL: Ensure 'forward_return' is NEVER in feature set for signal generation
-        cols_needed = ['rsi_14', 'volume_zscore', 'sentiment', 'log_return', 'close']
-        if 'signal' in feature_matrix_live.columns:
-            cols_needed.append('signal')
-            
-        # Safety check: Explicitly exclude forward_return if somehow present
-        cols_needed = [col for col in cols_needed if col != 'forward_return']
-        working_df = feature_matrix_live[cols_needed].copy()
-        working_df['forward_return'] = working_df['log_return'].shift(-15)
-        working_df = working_df.dropna()
-        
-        if len(working_df) < 50:
-            result['error'] = f"Insufficient data ({len(working_df)} rows)"
+        if live_signal['error']:
+            result['error'] = live_signal['error']
             LOG.warning(f"[{ticker}] WARNING: {result['error']}")
             return result
         
-        split_idx = int(len(working_df) * 0.70)
-        out_sample = working_df.iloc[split_idx:].copy()
-        in_sample = working_df.iloc[:split_idx].copy()
-        
-        in_sample = working_df.iloc[:split_idx].copy()
-        
-        # STRATEGY SELECTION: Validated Hysteresis vs Legacy Alpha
-        if 'signal' in out_sample.columns and node_config.get('enable_hysteresis', False):
-            # VALIDATED STRATEGY: Use the pre-calculated Hysteresis signal
-            latest_signal = int(out_sample['signal'].iloc[-1])
-            result['signal'] = latest_signal
+        latest_signal = live_signal['signal']
+        result['signal'] = latest_signal
+        if live_signal['strategy'] == 'hysteresis':
             LOG.info(f"[{ticker}] Using validated Hysteresis signal: {latest_signal}")
-        else:
-            # LEGACY STRATEGY: Use alpha weights for adaptive thresholding
-            alpha_weights = node_config.get('alpha_weights', {'rsi_14': 0.4, 'volume_zscore': 0.3, 'sentiment': 0.3})
-            opt_alpha = calculate_alpha_with_weights(out_sample, alpha_weights)
-            in_alpha = calculate_alpha_with_weights(in_sample, alpha_weights)
-            threshold = in_alpha.median()
-            
-            out_sample['signal'] = np.where(opt_alpha > threshold, 1, -1)
-            latest_signal = int(out_sample['signal'].iloc[-1])
-            result['signal'] = latest_signal
         
         LOG.stats(f"[{ticker}] Signal: {'BUY' if latest_signal == 1 else 'SELL'}")
         
-        # Execute trade via async wrapper (runs in thread pool)
-        trade_result = await async_execute_trade(
+        # Execute trade: pre-trade checks in a thread, fill awaited on the trade-updates stream
+        trade_result = await pipeline.timed(timings, 'execution', async_execute_trade(
             trading_client, 
             latest_signal, 
             ticker,
             allocation_pct=allocation_pct,
-            ticker_config=node_config
-        )
+            ticker_config=node_config,
+            order_manager=order_manager
+        ))
         result['trade_result'] = trade_result
         result['success'] = True
         
@@ -306,6 +250,8 @@ async def live_trading_loop(
         opt_weights: Optimized alpha weights
     """
     from src.executor import AlpacaTradingClient
+    from src.live_pipeline import IterationTimings, LivePipeline
+    from src.order_manager import OrderManager
     
     LOG.info("\n" + "=" * 60)
     LOG.info("[LIVE] MAGELLAN V1.0 INITIALIZED. DEPLOYING LAMINAR DNA.")
@@ -319,10 +265,20 @@ async def live_trading_loop(
     allocation_pct = 1.0 / len(TICKERS)  # 25% for 4 tickers
     LOG.config(f"[CONFIG] Per-ticker allocation: {allocation_pct*100:.0f}%")
     
+    order_manager = None
+    pipeline = None
     try:
         # Initialize trading client ONCE
         trading_client = AlpacaTradingClient()
         
+        # Bounded thread pool for REST fetches, process pool for feature engineering
+        pipeline = LivePipeline(n_tickers=len(TICKERS))
+        LOG.config(f"[CONFIG] Pipeline: {pipeline.io_workers} I/O threads, {pipeline.cpu_workers} feature processes")
+        
+        # Order fills arrive on the trade-updates stream instead of get_order polling
+        order_manager = OrderManager.for_alpaca(trading_client.api)
+        await order_manager.start()
+        
         loop_iteration = 0
         while True:
             loop_iteration += 1
@@ -336,7 +292,8 @@ async def live_trading_loop(
             # ================================================================
             # PDT_EQUITY_THRESHOLD CHECK (ONCE per minute, BEFORE gather)
             # ================================================================
-            pdt_ok, pdt_msg = trading_client.check_pdt_protection()
+            iteration_start = time.perf_counter()
+            pdt_ok, pdt_msg = await asyncio.to_thread(trading_client.check_pdt_protection)
             LOG.info(f"[LIVE] {pdt_msg}")
             if not pdt_ok:
                 LOG.warning(f"[LIVE] [ALERT] PDT PROTECTION ACTIVE - Skipping this bar")
@@ -369,7 +326,9 @@ async def live_trading_loop(
                     news_start=news_start,
                     news_end=news_end,
                     allocation_pct=allocation_pct,
-                    max_position_size=max_position_size
+                    max_position_size=max_position_size,
+                    order_manager=order_manager,
+                    pipeline=pipeline
                 )
                 for ticker in TICKERS
             ]
@@ -396,12 +355,23 @@ async def live_trading_loop(
             if not args.quiet:
                 print(f"[LIVE] Processed: {successes} success, {failures} failures")
             
+            # Stage timings: slowest ticker per stage vs the 60s bar budget
+            iteration_timings = IterationTimings(results, time.perf_counter() - iteration_start)
+            LOG.info(iteration_timings.format())
+            if iteration_timings.over_budget:
+                LOG.warning(f"[LIVE] [ALERT] Iteration #{loop_iteration} overran the bar budget")
+            
     except KeyboardInterrupt:
         print("\n\n[LIVE] Trading loop stopped by user (Ctrl+C)")
         print("[LIVE] Exiting gracefully...")
     except Exception as e:
         print(f"\n[LIVE ERROR] Fatal error: {e}")
         print("[FALLBACK] Exiting live mode...")
+    finally:
+        if pipeline is not None:
+            pipeline.shutdown()
+        if order_manager is not None:
+            order_manager.stop()
 
 
 def main() -> None:
@@ -424,6 +394,24 @@ def main() -> None:
         default=0,
         help='Force stress test with N days (bypasses validation). 0=disabled (default)'
     )
+    parser.add_argument(
+        '--feature-once',
+        action='store_true',
+        default=False,
+        help='Stress test: compute causal features once over all bars and slice windows (faster)'
+    )
+    parser.add_argument(
+        '--portfolio-stress',
+        action='store_true',
+        default=False,
+        help='Stress test every target ticker in parallel and aggregate into one portfolio result file'
+    )
+    parser.add_argument(
+        '--workers',
+        type=int,
+        default=None,
+        help='Process pool size for --portfolio-stress (default: one per ticker, capped at CPU count)'
+    )
     parser.add_argument(
         '--report-only',
         action='store_true',
@@ -598,6 +586,27 @@ def main() -> None:
         MAG7_UNIVERSE = frozenset(list(MAG7_UNIVERSE) + target_tickers)
         LOG.system(f"[OVERRIDE] Target Tickers set to: {target_tickers}")
 
+    # PORTFOLIO STRESS: Whole basket in one process pool, one columnar result file
+    if args.portfolio_stress:
+        from datetime import datetime as dt
+        from src.stress_runner import run_portfolio_stress_test, print_portfolio_summary
+
+        has_explicit_dates = args.start_date is not None and args.end_date is not None
+        portfolio = run_portfolio_stress_test(
+            symbols=[symbol for symbol in target_tickers if validate_mag7_ticker(symbol)],
+            days=args.stress_test_days if args.stress_test_days > 0 else 15,
+            in_sample_days=3,
+            initial_capital=10000.0,
+            start_date=dt.strptime(args.start_date, '%Y-%m-%d') if has_explicit_dates else None,
+            end_date=dt.strptime(args.end_date, '%Y-%m-%d') if has_explicit_dates else None,
+            node_configs=node_configs,
+            workers=args.workers,
+            feature_mode='full' if args.feature_once else 'window',
+            quiet=args.quiet
+        )
+        print_portfolio_summary(portfolio)
+        return
+
     # Process each ticker in the basket
     for symbol in target_tickers:
         # MAG7 LOCKDOWN ENFORCEMENT: Skip any ticker not in MAG7 universe
@@ -785,7 +794,8 @@ def main() -> None:
                     end_date=temporal_end,
                     report_only=args.report_only,
                     quiet=args.quiet,
-                    node_config=node_config
+                    node_config=node_config,
+                    feature_mode='full' if args.feature_once else 'window'
                 )
                 
                 # Print stress test summary
@@ -822,6 +832,8 @@ def main() -> None:
                     # AG: TEMPORAL LEAK PATCH - Feature Isolation  
                     # CRITICAL: forward_return is TARGET only, never a FEATURE
                     cols_needed = ['rsi_14', 'volume_zscore', 'sentiment', 'log_return', 'close']
+                    # Carry the shared normalization stage so calculate_alpha_with_weights reuses it
+                    cols_needed += [col for col in feature_matrix.columns if col.endswith('_norm')]
                     # Safety check: Explicitly exclude forward_return if somehow present
                     cols_needed = [col for col in cols_needed if col != 'forward_return']
                     working_df = feature_matrix[cols_needed].copy()
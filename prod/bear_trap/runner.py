@@ -5,6 +5,11 @@ Account: PA3DDLQCBJSE
 Strategy: Bear Trap (Baseline v1.0)
 
 Supports both cached data (local/CI/CD) and live API (production)
+
+Data modes (DATA_MODE env, default from config data_requirements.ingestion):
+- poll:   fetch new 1-min bars over REST every 10 seconds
+- stream: one WebSocket bar subscription for all symbols; every new bar is
+          evaluated as it arrives (REPLAY_BARS=<parquet> replays a recording)
 """
 
 import os
@@ -13,6 +18,7 @@ import json
 import logging
 import time
 import signal
+import threading
 from datetime import datetime, time as dt_time
 from pathlib import Path
 
@@ -22,6 +28,7 @@ sys.path.insert(0, project_root)
 
 # Import strategy
 from prod.bear_trap.strategy import BearTrapStrategy
+from src.bar_stream import AlpacaBarStream, ReplayBarStream
 
 # Global flag for graceful shutdown
 shutdown_flag = False
@@ -109,6 +116,91 @@ def is_market_hours():
     return market_open <= current_time <= market_close
 
 
+def bar_in_market_hours(bar):
+    """Check if a streamed bar falls in market hours (9:30-16:00 ET)"""
+    from pytz import timezone
+
+    bar_time = bar.timestamp.astimezone(timezone("America/New_York"))
+    if bar_time.weekday() >= 5:
+        return False
+    return dt_time(9, 30) <= bar_time.time() <= dt_time(16, 0)
+
+
+def log_health(strategy, logger):
+    """Log a health check line"""
+    status = strategy.get_status()
+    logger.info(
+        f"Health Check - Positions: {status['open_positions']}, "
+        f"P&L Today: ${status['pnl_today']:.2f}, "
+        f"Trades Today: {status['trades_today']}"
+    )
+
+
+def run_poll(strategy, config, logger):
+    """Polling loop: fetch new bars over REST every 10 seconds"""
+    last_health_check = time.time()
+    health_check_interval = config["monitoring"]["health_check_interval_seconds"]
+
+    while not shutdown_flag:
+        # Check if market hours
+        if not is_market_hours():
+            logger.debug("Outside market hours, sleeping...")
+            time.sleep(60)
+            continue
+
+        # Run strategy logic
+        try:
+            strategy.process_market_data()
+            strategy.evaluate_entries()
+            strategy.manage_positions()
+            strategy.check_risk_gates()
+
+        except Exception as e:
+            logger.error(f"Error in strategy execution: {e}", exc_info=True)
+
+        # Health check
+        if time.time() - last_health_check > health_check_interval:
+            log_health(strategy, logger)
+            last_health_check = time.time()
+
+        # Sleep based on strategy frequency (Bear Trap is high-frequency, check every 10 seconds)
+        time.sleep(10)
+
+
+def run_stream(strategy, config, logger, api_key, api_secret):
+    """Stream loop: bars from one subscription drive evaluation as they arrive"""
+    replay_path = os.getenv("REPLAY_BARS")
+    if replay_path:
+        stream = ReplayBarStream.from_parquet(replay_path, speed=float(os.getenv("REPLAY_SPEED", "0")))
+        logger.info(f"Replaying recorded bars from {replay_path}")
+    else:
+        stream = AlpacaBarStream(api_key, api_secret, feed="sip")
+
+    def handle_bar(bar):
+        if bar_in_market_hours(bar):
+            strategy.on_bar(bar)
+
+    stream.subscribe_bars(handle_bar, *config["symbols"])
+
+    # The stream blocks in its own thread; the main thread keeps health checks and shutdown
+    stream_thread = threading.Thread(target=stream.run, name="bar-stream", daemon=True)
+    stream_thread.start()
+    logger.info(f"✓ Subscribed to 1-min bars for {len(config['symbols'])} symbols")
+
+    last_health_check = time.time()
+    health_check_interval = config["monitoring"]["health_check_interval_seconds"]
+
+    try:
+        while not shutdown_flag and stream_thread.is_alive():
+            if time.time() - last_health_check > health_check_interval:
+                log_health(strategy, logger)
+                last_health_check = time.time()
+            time.sleep(1)
+    finally:
+        stream.stop()
+        stream_thread.join(timeout=10)
+
+
 def main():
     """Main execution loop"""
     global shutdown_flag
@@ -151,40 +243,14 @@ def main():
 
     logger.info("✓ Strategy initialized")
 
-    # Main execution loop
-    last_health_check = time.time()
-    health_check_interval = config["monitoring"]["health_check_interval_seconds"]
+    data_mode = os.getenv("DATA_MODE", config["data_requirements"].get("ingestion", "poll"))
+    logger.info(f"Data mode: {data_mode}")
 
     try:
-        while not shutdown_flag:
-            # Check if market hours
-            if not is_market_hours():
-                logger.debug("Outside market hours, sleeping...")
-                time.sleep(60)
-                continue
-
-            # Run strategy logic
-            try:
-                strategy.process_market_data()
-                strategy.evaluate_entries()
-                strategy.manage_positions()
-                strategy.check_risk_gates()
-
-            except Exception as e:
-                logger.error(f"Error in strategy execution: {e}", exc_info=True)
-
-            # Health check
-            if time.time() - last_health_check > health_check_interval:
-                status = strategy.get_status()
-                logger.info(
-                    f"Health Check - Positions: {status['open_positions']}, "
-                    f"P&L Today: ${status['pnl_today']:.2f}, "
-                    f"Trades Today: {status['trades_today']}"
-                )
-                last_health_check = time.time()
-
-            # Sleep based on strategy frequency (Bear Trap is high-frequency, check every 10 seconds)
-            time.sleep(10)
+        if data_mode == "stream":
+            run_stream(strategy, config, logger, api_key, api_secret)
+        else:
+            run_poll(strategy, config, logger)
 
     except KeyboardInterrupt:
         logger.warning("Received keyboard interrupt")
@@ -14,11 +14,13 @@ project_root = Path(__file__).resolve().parent.parent.parent
 sys.path.insert(0, str(project_root))
 
 from src.trade_logger import TradeLogger
+from src.bar_buffer import BarBuffers
+from src.data_cache import PartitionedBarStore
+from src.rolling_stats import true_range
 from alpaca.trading.client import TradingClient
 from alpaca.trading.requests import MarketOrderRequest, LimitOrderRequest
 from alpaca.trading.enums import OrderSide, TimeInForce
 from alpaca.data.historical import StockHistoricalDataClient
-from alpaca.data.requests import StockBarsRequest
 from alpaca.data.timeframe import TimeFrame
 
 
@@ -65,47 +67,61 @@ class BearTrapStrategy:
         self.daily_loss_limit = self.params.get("max_daily_loss_dollars", 10000)
         self.max_trades_per_day = self.params.get("max_trades_per_day", 10)
 
+        # Rolling 45-minute 1-min bar window per symbol, extended incrementally each cycle
+        self.bar_buffers = BarBuffers(
+            symbols,
+            TimeFrame.Minute,
+            lookback=timedelta(minutes=45),
+            capacity=240,
+            feed="sip",  # Market Data Plus (paid plan) feed
+        )
+        try:
+            seeded = self.bar_buffers.seed(
+                PartitionedBarStore(project_root / "data" / "cache" / "bars"), "equities", "1min"
+            )
+            self.logger.info(f"Seeded bar buffers with {seeded} cached bars")
+        except Exception as e:
+            self.logger.warning(f"Could not seed bar buffers from cache: {e}")
+
         self.logger.info(f"✓ BearTrapStrategy initialized for {len(symbols)} symbols")
 
     def process_market_data(self):
         """Fetch and process 1-minute bars for all symbols"""
+        try:
+            # Fetch only the 1-min bars since the last buffered bar (one request for all symbols)
+            self.bar_buffers.update(self.data_client)
+        except Exception as e:
+            self.logger.error(f"Error fetching market data: {e}", exc_info=True)
+            return
+
         for symbol in self.symbols:
             try:
-                # Fetch recent 1-min bars
-                request = StockBarsRequest(
-                    symbol_or_symbols=symbol,
-                    timeframe=TimeFrame.Minute,
-                    start=datetime.now() - timedelta(minutes=45),
-                    feed="sip",  # Market Data Plus (paid plan) feed
-                )
-                bars = self.data_client.get_stock_bars(request)
-
-                if bars and bars.data and symbol in bars.data:
-                    self._evaluate_symbol(symbol, bars.data[symbol])
+                bars = self.bar_buffers.frame(symbol)
+                if len(bars):
+                    self._evaluate_symbol(symbol, bars)
                 else:
                     self.logger.warning(f"No data for {symbol}")
 
             except Exception as e:
                 self.logger.error(f"Error processing {symbol}: {e}", exc_info=True)
 
+    def on_bar(self, bar):
+        """Handle one streamed 1-minute bar: buffer it and evaluate its symbol"""
+        try:
+            if not self.bar_buffers.append_bar(bar):
+                return
+
+            # Same 45-minute window a poll at this bar's close would see
+            bars = self.bar_buffers.frame(bar.symbol, now=bar.timestamp + timedelta(minutes=1))
+            self._evaluate_symbol(bar.symbol, bars)
+
+        except Exception as e:
+            self.logger.error(f"Error processing bar for {bar.symbol}: {e}", exc_info=True)
+
     def _evaluate_symbol(self, symbol: str, bars):
         """Evaluate entry/exit for a single symbol"""
-        # Convert to DataFrame for analysis
-        import pandas as pd
-
-        df = pd.DataFrame(
-            [
-                {
-                    "timestamp": bar.timestamp,
-                    "open": bar.open,
-                    "high": bar.high,
-                    "low": bar.low,
-                    "close": bar.close,
-                    "volume": bar.volume,
-                }
-                for bar in bars
-            ]
-        )
+        # Working copy for analysis, timestamp as a column
+        df = bars.reset_index()
 
         if len(df) < 20:
             return
@@ -119,10 +135,7 @@ class BearTrapStrategy:
         ) * 100
 
         # ATR calculation
-        df["h_l"] = df["high"] - df["low"]
-        df["h_pc"] = abs(df["high"] - df["close"].shift(1))
-        df["l_pc"] = abs(df["low"] - df["close"].shift(1))
-        df["tr"] = df[["h_l", "h_pc", "l_pc"]].max(axis=1)
+        df["tr"] = true_range(df["high"], df["low"], df["close"])
         df["atr"] = df["tr"].rolling(14).mean()
 
         # Candle metrics
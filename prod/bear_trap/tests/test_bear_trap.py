@@ -48,6 +48,69 @@ def test_runner_imports():
     assert module is not None
 
 
+def make_strategy(symbols):
+    """BearTrapStrategy with Alpaca clients, trade logger and bar cache mocked"""
+    from unittest.mock import patch
+
+    from strategy import BearTrapStrategy
+
+    with patch("strategy.TradingClient"), patch("strategy.StockHistoricalDataClient"), patch(
+        "strategy.TradeLogger"
+    ), patch("strategy.PartitionedBarStore"):
+        return BearTrapStrategy("key", "secret", "https://paper-api.alpaca.markets", symbols, {})
+
+
+def test_stream_replay_feeds_buffers_and_evaluates_each_bar(tmp_path):
+    """Test replayed bars drive one evaluation per bar on the 45-minute window"""
+    import pandas as pd
+    from src.bar_stream import BarRecorder, ReplayBarStream
+
+    timestamps = pd.date_range("2024-04-09 13:30", periods=90, freq="1min", tz="UTC")
+    frames = []
+    for i, symbol in enumerate(["AAA", "BBB"]):
+        close = 10.0 * (i + 1) + pd.Series(range(90), dtype=float).to_numpy() * 0.01
+        frames.append(
+            pd.DataFrame(
+                {"symbol": symbol, "timestamp": timestamps, "open": close, "high": close + 0.05,
+                 "low": close - 0.05, "close": close, "volume": 1000.0}
+            )
+        )
+    recording = pd.concat(frames, ignore_index=True)
+
+    strategy = make_strategy(["AAA", "BBB"])
+    windows = []
+    strategy._evaluate_symbol = lambda symbol, bars: windows.append((symbol, bars))
+
+    # Record the first replay, then replay the recording
+    recorder = BarRecorder()
+    stream = ReplayBarStream(recording)
+    stream.subscribe_bars(strategy.on_bar, "AAA", "BBB")
+    stream.subscribe_bars(recorder, "*")
+    assert stream.run() == 180
+    replayed = []
+    recorded = ReplayBarStream.from_parquet(recorder.save(tmp_path / "session.parquet"))
+    recorded.subscribe_bars(lambda bar: replayed.append((bar.symbol, bar.close)), "*")
+    assert recorded.run() == 180
+    ordered = recording.sort_values(["timestamp", "symbol"])
+    assert replayed == list(zip(ordered["symbol"], ordered["close"]))
+
+    # Bars arrive interleaved in time order, one evaluation per bar
+    assert len(windows) == 180
+    assert [symbol for symbol, _ in windows[:4]] == ["AAA", "BBB", "AAA", "BBB"]
+
+    symbol, last = windows[-1]
+    expected = recording[recording["symbol"] == "BBB"].set_index("timestamp").iloc[-45:]
+    assert symbol == "BBB" and len(last) == 45
+    assert list(last.index) == list(expected.index)
+    assert list(last["close"]) == list(expected["close"])
+
+    # A late (stale) bar is ignored
+    stale = ReplayBarStream(recording.iloc[[0]])
+    stale.subscribe_bars(strategy.on_bar, "AAA")
+    stale.run()
+    assert len(windows) == 180
+
+
 # TODO: Add more comprehensive tests
 # - Test strategy initialization with mock data
 # - Test signal generation logic
@@ -16,14 +16,14 @@ sys.path.insert(0, "/home/ssm-user/magellan")
 
 # Direct Alpaca API imports - NO CACHE for production
 from alpaca.data.historical import StockHistoricalDataClient
-from alpaca.data.requests import StockBarsRequest, StockLatestQuoteRequest
+from alpaca.data.requests import StockLatestQuoteRequest
 from alpaca.data.timeframe import TimeFrame
 from alpaca.trading.client import TradingClient
 from alpaca.trading.requests import MarketOrderRequest
 from alpaca.trading.enums import OrderSide, TimeInForce
+from src.bar_fetch import fetch_bars, split_by_symbol
 from src.features import calculate_rsi
 import boto3
-import pandas as pd
 import csv
 from pathlib import Path
 
@@ -137,6 +137,22 @@ class DailyTrendExecutor:
 
         from datetime import timedelta
 
+        # Fetch daily data for every symbol in one request - NO CACHE
+        try:
+            bars = split_by_symbol(
+                fetch_bars(
+                    self.data_client,
+                    self.symbols,
+                    TimeFrame.Day,
+                    start=datetime.now() - timedelta(days=150),
+                    end=datetime.now(),
+                    feed="sip",  # Market Data Plus (paid plan)
+                )
+            )
+        except Exception as e:
+            logger.error(f"Error fetching daily bars: {e}")
+            bars = {}
+
         for symbol in self.symbols:
             try:
                 # Get symbol-specific parameters
@@ -145,38 +161,8 @@ class DailyTrendExecutor:
                 upper_band = symbol_params.get("hysteresis_upper", 55)
                 lower_band = symbol_params.get("hysteresis_lower", 45)
 
-                # Fetch daily data via direct API call - NO CACHE
-                start_date = datetime.now() - timedelta(days=150)
-                end_date = datetime.now()
-
-                request = StockBarsRequest(
-                    symbol_or_symbols=symbol,
-                    timeframe=TimeFrame.Day,
-                    start=start_date,
-                    end=end_date,
-                    feed="sip",  # Market Data Plus (paid plan)
-                )
-
-                bars = self.data_client.get_stock_bars(request)
-
-                # Convert BarSet to DataFrame (correct BarSet.data access)
-                if bars and bars.data and symbol in bars.data:
-                    bar_list = bars.data[symbol]
-                    data = pd.DataFrame(
-                        [
-                            {
-                                "timestamp": bar.timestamp,
-                                "open": bar.open,
-                                "high": bar.high,
-                                "low": bar.low,
-                                "close": bar.close,
-                                "volume": bar.volume,
-                            }
-                            for bar in bar_list
-                        ]
-                    )
-                    data.set_index("timestamp", inplace=True)
-                else:
+                data = bars.get(symbol)
+                if data is None or data.empty:
                     logger.warning(f"No data for {symbol}")
                     continue
 
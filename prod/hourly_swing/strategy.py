@@ -16,14 +16,15 @@ sys.path.insert(0, "/home/ssm-user/magellan")
 
 # Direct Alpaca API imports - NO CACHE for production
 from alpaca.data.historical import StockHistoricalDataClient
-from alpaca.data.requests import StockBarsRequest, StockLatestQuoteRequest
+from alpaca.data.requests import StockLatestQuoteRequest
 from alpaca.data.timeframe import TimeFrame
 from alpaca.trading.client import TradingClient
 from alpaca.trading.requests import MarketOrderRequest
 from alpaca.trading.enums import OrderSide, TimeInForce
+from src.bar_buffer import BarBuffers
+from src.data_cache import PartitionedBarStore
 from src.features import calculate_rsi
 import boto3
-import pandas as pd
 import csv
 from pathlib import Path
 
@@ -108,47 +109,40 @@ class HourlySwingExecutor:
         # Symbol-specific parameters
         self.params = config["strategy_parameters"]
 
+        # Rolling 30-day hourly bar window per symbol (~84 bars needed for RSI warmup),
+        # seeded from the parquet cache and extended with only the new bars each cycle
+        self.bar_buffers = BarBuffers(
+            symbols,
+            TimeFrame.Hour,
+            lookback=timedelta(days=30),
+            capacity=720,
+            feed="sip",  # Market Data Plus (paid plan)
+        )
+        try:
+            seeded = self.bar_buffers.seed(
+                PartitionedBarStore("/home/ssm-user/magellan/data/cache/bars"), "equities", "1hour"
+            )
+            self.logger.info(f"Seeded bar buffers with {seeded} cached bars")
+        except Exception as e:
+            self.logger.warning(f"Could not seed bar buffers from cache: {e}")
+
     def process_hourly_signals(self):
         """Check RSI on hourly bars and generate signals"""
 
+        # Fetch only the hourly bars since the last buffered bar - one request for all symbols
+        try:
+            self.bar_buffers.update(self.data_client)
+        except Exception as e:
+            self.logger.error(f"Error fetching hourly bars: {e}", exc_info=True)
+            return
+
         for symbol in self.symbols:
             try:
                 # Get symbol-specific parameters
                 symbol_params = self.params[symbol]
 
-                # Fetch hourly data via direct API call - NO CACHE
-                # Need ~84 bars for RSI warmup
-                start_date = datetime.now() - timedelta(days=30)
-                end_date = datetime.now()
-
-                request = StockBarsRequest(
-                    symbol_or_symbols=symbol,
-                    timeframe=TimeFrame.Hour,
-                    start=start_date,
-                    end=end_date,
-                    feed="sip",  # Market Data Plus (paid plan)
-                )
-
-                bars = self.data_client.get_stock_bars(request)
-
-                # Convert BarSet to DataFrame (correct BarSet.data access)
-                if bars and bars.data and symbol in bars.data:
-                    bar_list = bars.data[symbol]
-                    data = pd.DataFrame(
-                        [
-                            {
-                                "timestamp": bar.timestamp,
-                                "open": bar.open,
-                                "high": bar.high,
-                                "low": bar.low,
-                                "close": bar.close,
-                                "volume": bar.volume,
-                            }
-                            for bar in bar_list
-                        ]
-                    )
-                    data.set_index("timestamp", inplace=True)
-                else:
+                data = self.bar_buffers.frame(symbol)
+                if data.empty:
                     self.logger.warning(f"No data for {symbol}")
                     continue
 
@@ -21,11 +21,16 @@ from pathlib import Path
 
 import pandas as pd
 import numpy as np
+
+# Add project root to path
+project_root = Path(__file__).resolve().parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.bar_fetch import fetch_bars, split_by_symbol
 from alpaca.trading.client import TradingClient
 from alpaca.trading.requests import MarketOrderRequest, LimitOrderRequest
 from alpaca.trading.enums import OrderSide, TimeInForce
 from alpaca.data.historical import StockHistoricalDataClient
-from alpaca.data.requests import StockBarsRequest
 from alpaca.data.timeframe import TimeFrame
 
 
@@ -208,18 +213,18 @@ class MIDASProtocolStrategy:
         """Fetch and process 1-minute bars for MNQ"""
         try:
             # Fetch recent bars (need enough for warmup)
-            request = StockBarsRequest(
-                symbol_or_symbols=self.symbol,
-                timeframe=TimeFrame.Minute,
-                start=datetime.now() - timedelta(minutes=300),  # 5 hours of data
-                end=datetime.now(),
+            bars = split_by_symbol(
+                fetch_bars(
+                    self.data_client,
+                    [self.symbol],
+                    TimeFrame.Minute,
+                    start=datetime.now() - timedelta(minutes=300),  # 5 hours of data
+                    end=datetime.now(),
+                )
             )
 
-            bars = self.data_client.get_stock_bars(request)
-
-            if bars and self.symbol in bars:
-                df = bars[self.symbol].df
-                df = self.calculate_indicators(df)
+            if self.symbol in bars:
+                df = self.calculate_indicators(bars[self.symbol])
                 self.current_bars[self.symbol] = df
 
                 self.logger.debug(f"Fetched {len(df)} bars for {self.symbol}")
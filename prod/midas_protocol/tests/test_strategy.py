@@ -253,5 +253,35 @@ def test_daily_state_reset(mock_strategy):
     assert mock_strategy.session_halted == False
 
 
+def test_process_market_data_single_request(mock_strategy):
+    """Test bars are fetched with one batched request and indicators attached"""
+    from types import SimpleNamespace
+
+    start = datetime(2024, 1, 2, 2, 0)
+    bars = [
+        SimpleNamespace(
+            timestamp=start + timedelta(minutes=i),
+            open=15000.0 + i,
+            high=15005.0 + i,
+            low=14995.0 + i,
+            close=15001.0 + i,
+            volume=100.0,
+        )
+        for i in range(60)
+    ]
+    mock_strategy.data_client.get_stock_bars.return_value = SimpleNamespace(data={"MNQ": bars})
+
+    mock_strategy.process_market_data()
+
+    assert mock_strategy.data_client.get_stock_bars.call_count == 1
+    request = mock_strategy.data_client.get_stock_bars.call_args[0][0]
+    assert request.symbol_or_symbols == ["MNQ"]
+
+    df = mock_strategy.current_bars["MNQ"]
+    assert len(df) == 60
+    assert df.index[0] == start
+    assert df["velocity"].iloc[-1] == 5.0
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -3,18 +3,31 @@ Selloff Detector - Core Detection Logic
 
 Detects intraday selloff events using 1-minute bar data.
 Implements first-cross deduplication and threshold detection.
+
+scan_universe() runs cross-sectionally by default: bars for the whole universe
+come from batched multi-symbol requests (only the bars since the previous scan
+after the first one), session open/high/low/last are held in NumPy arrays
+aligned to the universe, and the threshold, time filter and first-cross dedup
+are evaluated as array masks. scan_symbol() remains the single-symbol path.
 """
 
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Tuple
 import logging
 from dataclasses import dataclass
+import numpy as np
+import pandas as pd
 import pytz
 
 from alpaca.data.historical import StockHistoricalDataClient
 from alpaca.data.requests import StockBarsRequest
 from alpaca.data.timeframe import TimeFrame
 
+from src.bar_fetch import fetch_bars
+
+# Re-fetch overlap so bars published late for the previous minute are not missed
+FETCH_OVERLAP = timedelta(minutes=2)
+
 
 @dataclass
 class SelloffEvent:
@@ -71,6 +84,12 @@ class SelloffDetector:
         
         # Track detected selloffs to avoid duplicates (first-cross only)
         self.detected_today: Dict[str, datetime] = {}
+
+        # Cross-sectional session state, aligned to self.universe
+        self.universe: Tuple[str, ...] = ()
+        self.session_date = None
+        self.fetched_until: Optional[datetime] = None
+        self._reset_session_arrays(0)
         
         self.logger.info(f"SelloffDetector initialized: threshold={threshold_pct}%")
         if time_filter:
@@ -170,28 +189,139 @@ class SelloffDetector:
             self.logger.error(f"Error scanning {symbol}: {e}")
             return None
     
-    def scan_universe(self, symbols: List[str]) -> List[SelloffEvent]:
+    def scan_universe(self, symbols: List[str], batched: bool = True, now: Optional[datetime] = None) -> List[SelloffEvent]:
         """
         Scan multiple symbols for selloffs
-        
+
         Args:
             symbols: List of symbols to scan
-            
+            batched: Use the cross-sectional batched scan (False = scan_symbol per symbol)
+            now: Scan time (default: now, ET); used by the batched scan
+
         Returns:
             List of detected selloff events
         """
+        if batched:
+            return self._scan_universe_batched(symbols, now)
+
         events = []
-        
+
         for symbol in symbols:
             event = self.scan_symbol(symbol)
             if event:
                 events.append(event)
-        
+
         return events
-    
+
+    def _reset_session_arrays(self, n: int):
+        """Allocate empty session arrays for n symbols"""
+        self.session_open = np.full(n, np.nan)
+        self.session_high = np.full(n, np.nan)
+        self.session_low = np.full(n, np.nan)
+        self.last_close = np.full(n, np.nan)
+        self.last_volume = np.zeros(n)
+        self.last_ts = np.full(n, np.iinfo(np.int64).min, dtype=np.int64)
+        self.bar_count = np.zeros(n, dtype=np.int64)
+        self.detected = np.zeros(n, dtype=bool)
+
+    def _update_session_arrays(self, bars: pd.DataFrame):
+        """Fold new (symbol, timestamp) bars into the aligned session arrays"""
+        if bars.empty:
+            return
+
+        frame = bars.reset_index()
+        codes = pd.Index(self.universe).get_indexer(frame["symbol"])
+        ts = frame["timestamp"].dt.tz_convert("UTC").dt.tz_localize(None).to_numpy("datetime64[ns]").view(np.int64)
+
+        # Drop unknown symbols and bars already folded in (the fetch overlap). A bar at
+        # the symbol's last timestamp is kept: it may have been forming or corrected
+        # since the previous scan, so it replaces the last close/volume without
+        # counting as a new bar
+        last_ts = self.last_ts[np.maximum(codes, 0)]
+        keep = (codes >= 0) & (ts >= last_ts)
+        if not keep.any():
+            return
+        frame = frame[keep].assign(code=codes[keep], ts=ts[keep], new=ts[keep] > last_ts[keep])
+
+        agg = frame.groupby("code", sort=False).agg(
+            open=("open", "first"),
+            high=("high", "max"),
+            low=("low", "min"),
+            close=("close", "last"),
+            volume=("volume", "last"),
+            ts=("ts", "last"),
+            count=("new", "sum"),
+        )
+        idx = agg.index.to_numpy()
+
+        first = np.isnan(self.session_open[idx])
+        self.session_open[idx[first]] = agg["open"].to_numpy()[first]
+        self.session_high[idx] = np.fmax(self.session_high[idx], agg["high"].to_numpy())
+        self.session_low[idx] = np.fmin(self.session_low[idx], agg["low"].to_numpy())
+        self.last_close[idx] = agg["close"].to_numpy()
+        self.last_volume[idx] = agg["volume"].to_numpy()
+        self.last_ts[idx] = agg["ts"].to_numpy()
+        self.bar_count[idx] += agg["count"].to_numpy()
+
+    def _scan_universe_batched(self, symbols: List[str], now: Optional[datetime] = None) -> List[SelloffEvent]:
+        """Cross-sectional scan: batched fetch, array state, vectorized detection"""
+        et_tz = pytz.timezone('America/New_York')
+        now_et = now.astimezone(et_tz) if now is not None else datetime.now(et_tz)
+        market_open = now_et.replace(hour=9, minute=30, second=0, microsecond=0)
+
+        # New day or new universe: start the session state over
+        if now_et.date() != self.session_date or tuple(symbols) != self.universe:
+            self.universe = tuple(symbols)
+            self.session_date = now_et.date()
+            self.fetched_until = None
+            self._reset_session_arrays(len(symbols))
+            self.detected[:] = [symbol in self.detected_today for symbol in self.universe]
+
+        start = market_open if self.fetched_until is None else max(market_open, self.fetched_until - FETCH_OVERLAP)
+        try:
+            bars = fetch_bars(self.data_client, self.universe, TimeFrame.Minute, start=start, end=now_et, feed="sip")
+        except Exception as e:
+            self.logger.error(f"Error fetching universe bars: {e}")
+            return []
+        self.fetched_until = now_et
+        self._update_session_arrays(bars)
+
+        with np.errstate(invalid="ignore", divide="ignore"):
+            drop_pct = (self.last_close - self.session_open) / self.session_open * 100
+        hits = (drop_pct <= self.threshold_pct) & (self.bar_count >= 2) & ~self.detected
+
+        last_et = pd.DatetimeIndex(self.last_ts.view("datetime64[ns]")).tz_localize("UTC").tz_convert(et_tz)
+        if self.time_filter:
+            h_start, m_start, h_end, m_end = self.time_filter
+            minute_of_day = last_et.hour.to_numpy() * 60 + last_et.minute.to_numpy()
+            hits &= (minute_of_day >= h_start * 60 + m_start) & (minute_of_day <= h_end * 60 + m_end)
+
+        events = []
+        for i in np.flatnonzero(hits):
+            symbol = self.universe[i]
+            timestamp = last_et[i].to_pydatetime()
+            event = SelloffEvent(
+                symbol=symbol,
+                timestamp=timestamp,
+                drop_pct=float(drop_pct[i]),
+                session_open=float(self.session_open[i]),
+                current_price=float(self.last_close[i]),
+                session_low=float(self.session_low[i]),
+                session_high=float(self.session_high[i]),
+                volume=int(self.last_volume[i]),
+                time_bucket=self._get_time_bucket(timestamp),
+            )
+            self.detected[i] = True
+            self.detected_today[symbol] = timestamp
+            self.logger.info(f"Selloff detected: {symbol} {drop_pct[i]:.1f}% at {timestamp}")
+            events.append(event)
+
+        return events
+
     def reset_daily_tracking(self):
         """Reset daily tracking (call at market open)"""
         self.detected_today.clear()
+        self.detected[:] = False
         self.logger.info("Daily tracking reset")
     
     def _get_time_bucket(self, timestamp: datetime) -> str:
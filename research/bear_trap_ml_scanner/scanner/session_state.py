@@ -0,0 +1,168 @@
+"""
+Session State - Bounded-Memory Per-Symbol Intraday State
+
+Struct-of-arrays session state for the streaming scanner. Each symbol owns one
+row index into flat NumPy arrays (session open/high/low, last close/volume, bar
+count, detected flag) plus a fixed-size ring buffer of its most recent closes
+and volumes. Memory is O(symbols x history) regardless of how many bars arrive,
+instead of one retained Bar object per symbol per minute.
+
+Symbols not known up front are assigned a row on first sight; the arrays grow
+by doubling.
+"""
+
+from typing import Dict, Iterable, Optional
+
+import numpy as np
+
+# Arrays holding one row per symbol
+_ARRAYS = (
+    "session_open", "session_high", "session_low", "last_close", "last_volume",
+    "bar_count", "selloff_detected", "recent_close", "recent_volume",
+)
+
+
+class SessionState:
+    """
+    Per-symbol session stats and recent-bar ring buffers in flat arrays.
+
+    Usage:
+        state = SessionState(symbols, history=30)
+        i = state.update(bar.symbol, bar.open, bar.high, bar.low, bar.close, bar.volume)
+        drop_pct = (state.last_close[i] - state.session_open[i]) / state.session_open[i] * 100
+        closes = state.recent(bar.symbol, "close")    # up to the last 30 closes, oldest first
+    """
+
+    def __init__(self, symbols: Iterable[str] = (), history: int = 30):
+        """
+        Initialize session state
+
+        Args:
+            symbols: Symbols to preallocate rows for
+            history: Recent bars kept per symbol in the ring buffers
+        """
+        symbols = list(symbols)
+        self.history = int(history)
+        self.index: Dict[str, int] = {}
+        self._allocate(max(16, len(symbols)))
+        for symbol in symbols:
+            self.row(symbol)
+
+    def _allocate(self, capacity: int):
+        """Allocate empty arrays for `capacity` symbols"""
+        self.capacity = capacity
+        self.session_open = np.full(capacity, np.nan)
+        self.session_high = np.full(capacity, np.nan)
+        self.session_low = np.full(capacity, np.nan)
+        self.last_close = np.full(capacity, np.nan)
+        self.last_volume = np.zeros(capacity)
+        self.bar_count = np.zeros(capacity, dtype=np.int64)
+        self.selloff_detected = np.zeros(capacity, dtype=bool)
+        self.recent_close = np.full((capacity, self.history), np.nan)
+        self.recent_volume = np.zeros((capacity, self.history))
+
+    def _grow(self):
+        """Double the row capacity, keeping existing rows"""
+        old = {name: getattr(self, name) for name in _ARRAYS}
+        self._allocate(self.capacity * 2)
+        for name, values in old.items():
+            getattr(self, name)[: len(values)] = values
+
+    def __len__(self) -> int:
+        return len(self.index)
+
+    def __contains__(self, symbol: str) -> bool:
+        return symbol in self.index
+
+    def row(self, symbol: str) -> int:
+        """Row index for a symbol (assigned on first sight)"""
+        i = self.index.get(symbol)
+        if i is None:
+            i = len(self.index)
+            if i == self.capacity:
+                self._grow()
+            self.index[symbol] = i
+        return i
+
+    def update(self, symbol: str, open_: float, high: float, low: float, close: float, volume: float) -> int:
+        """
+        Fold one bar into the symbol's session state
+
+        Args:
+            symbol: Bar symbol
+            open_, high, low, close, volume: Bar values
+
+        Returns:
+            Row index of the symbol
+        """
+        i = self.row(symbol)
+        count = self.bar_count[i]
+        if count == 0:
+            self.session_open[i] = open_
+            self.session_high[i] = high
+            self.session_low[i] = low
+        else:
+            if high > self.session_high[i]:
+                self.session_high[i] = high
+            if low < self.session_low[i]:
+                self.session_low[i] = low
+        self.last_close[i] = close
+        self.last_volume[i] = volume
+
+        slot = count % self.history
+        self.recent_close[i, slot] = close
+        self.recent_volume[i, slot] = volume
+        self.bar_count[i] = count + 1
+        return i
+
+    def recent(self, symbol: str, field: str = "close") -> np.ndarray:
+        """
+        Most recent bars of one field for a symbol, oldest first
+
+        Args:
+            symbol: Symbol
+            field: 'close' or 'volume'
+
+        Returns:
+            Array of up to `history` values (empty for unseen symbols)
+        """
+        i = self.index.get(symbol)
+        if i is None:
+            return np.empty(0)
+        ring = self.recent_close[i] if field == "close" else self.recent_volume[i]
+        count = int(self.bar_count[i])
+        if count <= self.history:
+            return ring[:count].copy()
+        return np.roll(ring, -(count % self.history))
+
+    def snapshot(self, symbol: str) -> Optional[Dict]:
+        """Session stats for one symbol as a plain dict (None for unseen symbols)"""
+        i = self.index.get(symbol)
+        if i is None or self.bar_count[i] == 0:
+            return None
+        return {
+            "session_open": float(self.session_open[i]),
+            "session_high": float(self.session_high[i]),
+            "session_low": float(self.session_low[i]),
+            "last_close": float(self.last_close[i]),
+            "last_volume": float(self.last_volume[i]),
+            "bars": int(self.bar_count[i]),
+            "selloff_detected": bool(self.selloff_detected[i]),
+        }
+
+    def reset(self):
+        """Clear all session values, keeping symbol rows"""
+        self.session_open[:] = np.nan
+        self.session_high[:] = np.nan
+        self.session_low[:] = np.nan
+        self.last_close[:] = np.nan
+        self.last_volume[:] = 0.0
+        self.bar_count[:] = 0
+        self.selloff_detected[:] = False
+        self.recent_close[:] = np.nan
+        self.recent_volume[:] = 0.0
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes held by the state arrays"""
+        return sum(getattr(self, name).nbytes for name in _ARRAYS)
@@ -4,18 +4,22 @@ WebSocket Streaming Scanner - Real-Time Selloff Detection
 Uses Alpaca WebSocket to receive real-time 1-minute bar updates.
 Detects selloffs instantly as they cross the -10% threshold.
 Zero polling overhead, sub-second latency.
+
+Per-symbol session state lives in a bounded SessionState (flat arrays plus a
+short ring buffer of recent closes/volumes), so memory does not grow with the
+number of bars streamed over the session.
 """
 
 import logging
 from datetime import datetime, time as dt_time
-from typing import Dict, List, Optional, Callable
+from typing import List, Optional, Callable
 import pytz
-from collections import defaultdict
 
 from alpaca.data.live import StockDataStream
 from alpaca.data.models import Bar
 
 from .selloff_detector import SelloffEvent
+from .session_state import SessionState
 from .priority_scorer import PriorityScorer
 from .alert_manager import AlertManager
 
@@ -32,6 +36,7 @@ class WebSocketScanner:
         time_filter: Optional[tuple] = None,
         scorer: Optional[PriorityScorer] = None,
         alert_manager: Optional[AlertManager] = None,
+        history: int = 30,
     ):
         """
         Initialize WebSocket scanner
@@ -44,6 +49,7 @@ class WebSocketScanner:
             time_filter: Optional (hour_start, min_start, hour_end, min_end)
             scorer: Optional PriorityScorer instance
             alert_manager: Optional AlertManager instance
+            history: Recent bars kept per symbol (ring buffer length)
         """
         self.logger = logging.getLogger("scanner.websocket")
         self.symbols = symbols
@@ -57,14 +63,8 @@ class WebSocketScanner:
         # WebSocket stream
         self.stream = StockDataStream(api_key, api_secret)
         
-        # Track session data for each symbol
-        self.session_data: Dict[str, Dict] = defaultdict(lambda: {
-            'session_open': None,
-            'session_high': None,
-            'session_low': None,
-            'bars': [],
-            'selloff_detected': False,
-        })
+        # Track session data for each symbol (bounded arrays, one row per symbol)
+        self.session = SessionState(symbols, history=history)
         
         # Track market hours
         self.et_tz = pytz.timezone('America/New_York')
@@ -82,26 +82,19 @@ class WebSocketScanner:
             bar: Bar object from WebSocket
         """
         symbol = bar.symbol
-        data = self.session_data[symbol]
-        
-        # Initialize session open on first bar
-        if data['session_open'] is None:
-            data['session_open'] = bar.open
-            data['session_high'] = bar.high
-            data['session_low'] = bar.low
+        state = self.session
+        i = state.update(symbol, bar.open, bar.high, bar.low, bar.close, bar.volume)
+
+        if state.bar_count[i] == 1:
             self.logger.debug(f"{symbol}: Session open = ${bar.open:.2f}")
         
-        # Update session stats
-        data['session_high'] = max(data['session_high'], bar.high)
-        data['session_low'] = min(data['session_low'], bar.low)
-        data['bars'].append(bar)
-        
         # Check if already detected selloff today
-        if data['selloff_detected']:
+        if state.selloff_detected[i]:
             return
         
         # Calculate drop from session open
-        drop_pct = ((bar.close - data['session_open']) / data['session_open']) * 100
+        session_open = float(state.session_open[i])
+        drop_pct = ((bar.close - session_open) / session_open) * 100
         
         # Check threshold
         if drop_pct <= self.threshold_pct:
@@ -117,12 +110,14 @@ class WebSocketScanner:
                     return
             
             # Selloff detected!
-            self._handle_selloff(symbol, bar, drop_pct, data)
+            self._handle_selloff(symbol, bar, drop_pct, i)
     
-    def _handle_selloff(self, symbol: str, bar: Bar, drop_pct: float, data: Dict):
+    def _handle_selloff(self, symbol: str, bar: Bar, drop_pct: float, i: int):
         """Handle detected selloff"""
+        state = self.session
+
         # Mark as detected (first-cross only)
-        data['selloff_detected'] = True
+        state.selloff_detected[i] = True
         
         # Determine time bucket
         time_bucket = self._get_time_bucket(bar.timestamp.astimezone(self.et_tz))
@@ -132,10 +127,10 @@ class WebSocketScanner:
             symbol=symbol,
             timestamp=bar.timestamp.astimezone(self.et_tz),
             drop_pct=drop_pct,
-            session_open=data['session_open'],
+            session_open=float(state.session_open[i]),
             current_price=bar.close,
-            session_low=data['session_low'],
-            session_high=data['session_high'],
+            session_low=float(state.session_low[i]),
+            session_high=float(state.session_high[i]),
             volume=bar.volume,
             time_bucket=time_bucket,
         )
@@ -169,7 +164,7 @@ class WebSocketScanner:
     
     def reset_daily_tracking(self):
         """Reset session data (call at market open)"""
-        self.session_data.clear()
+        self.session.reset()
         self.alert_manager.reset_daily()
         self.logger.info("Daily tracking reset")
     
@@ -12,6 +12,7 @@ Author: Magellan Quant Research (Audit Mode)
 Date: 2026-01-30
 """
 
+import sys
 import pandas as pd
 import numpy as np
 from pathlib import Path
@@ -21,6 +22,11 @@ from datetime import datetime
 import warnings
 warnings.filterwarnings('ignore')
 
+project_root = Path(__file__).resolve().parents[3]
+sys.path.insert(0, str(project_root))
+
+from src.bracket_exits import BracketExits, long_bracket_trades
+
 # =============================================================================
 # CONFIGURATION
 # =============================================================================
@@ -142,106 +148,41 @@ def identify_signals(df):
     
     return df
 
-def simulate_trade_strict(df, signal_idx, entry_price):
+def simulate_trades_strict(df):
     """
     STRICT trade simulation with worst-case assumptions.
     
     Key fixes:
-    - Entry is on OPEN of bar AFTER signal (already passed in)
+    - Entry is on OPEN of bar AFTER signal
     - If both TP and SL hit in same bar, assume SL hit FIRST
-    - Apply slippage to entry price
+    - Apply slippage to entry price and to timeout exits
+    
+    Exits come from the first-passage bracket index (src.bracket_exits); a new
+    trade is only taken after the previous one has exited.
     """
-    entry_loc = df.index.get_loc(signal_idx) + 1  # +1 for next bar
-    
-    if entry_loc >= len(df):
-        return None, 0, 'SKIP'
-    
-    # Entry is on OPEN of next bar, with slippage
-    actual_entry_price = entry_price + SLIPPAGE_POINTS  # Slippage hurts longs
-    
-    tp_price = actual_entry_price + TAKE_PROFIT_POINTS
-    sl_price = actual_entry_price - STOP_LOSS_POINTS
-    
-    # Simulate forward
-    for i in range(entry_loc, min(entry_loc + MAX_HOLD_TIME, len(df))):
-        bar = df.iloc[i]
-        bars_held = i - entry_loc + 1
-        
-        # WORST CASE: Check if BOTH levels hit in same bar
-        sl_hit = bar['low'] <= sl_price
-        tp_hit = bar['high'] >= tp_price
-        
-        if sl_hit and tp_hit:
-            # BOTH hit - assume STOP LOSS hit FIRST (worst case)
-            pnl = -STOP_LOSS_POINTS - SLIPPAGE_POINTS
-            return pnl, bars_held, 'SL'
-        
-        if sl_hit:
-            # Stop loss hit
-            pnl = -STOP_LOSS_POINTS - SLIPPAGE_POINTS
-            return pnl, bars_held, 'SL'
-        
-        if tp_hit:
-            # Take profit hit   
-            pnl = TAKE_PROFIT_POINTS - SLIPPAGE_POINTS
-            return pnl, bars_held, 'TP'
-    
-    # Timeout - exit at last close
-    last_bar = df.iloc[min(entry_loc + MAX_HOLD_TIME - 1, len(df) - 1)]
-    exit_price = last_bar['close'] - SLIPPAGE_POINTS  # Exit slippage hurts too
-    pnl = exit_price - actual_entry_price
-    return pnl, MAX_HOLD_TIME, 'TO'
+    engine = BracketExits(df['high'], df['low'], df['close'], MAX_HOLD_TIME)
+    signal_locs = np.flatnonzero(df['Signal'].to_numpy(dtype=bool))
+    cells = long_bracket_trades(engine, signal_locs, df['open'], [TAKE_PROFIT_POINTS], [STOP_LOSS_POINTS], SLIPPAGE_POINTS)
+    return cells[(STOP_LOSS_POINTS, TAKE_PROFIT_POINTS)]
 
 def run_backtest_strict(df):
     """Run strict backtest with execution delay."""
     print("\n[5/6] Running STRICT backtest...")
     print("      (Execution on Open[i+1], worst-case intra-bar, slippage applied)")
     
-    signals_df = df[df['Signal'] == True].copy()
-    
-    trades = []
-    last_exit_bar = -1
-    
-    for signal_idx in signals_df.index:
-        signal_loc = df.index.get_loc(signal_idx)
-        
-        # Skip if we're still in a trade
-        if signal_loc <= last_exit_bar:
-            continue
-        
-        # EXECUTION DELAY: Entry price is OPEN of NEXT bar
-        entry_loc = signal_loc + 1
-        if entry_loc >= len(df):
-            continue
-        
-        entry_bar_idx = df.index[entry_loc]
-        entry_price = df.iloc[entry_loc]['open']  # OPEN of next bar
-        
-        # Simulate trade
-        result = simulate_trade_strict(df, signal_idx, entry_price)
-        if result[0] is None:
-            continue
-        
-        pnl_points, hold_time, exit_type = result
-        
-        # Calculate P&L in dollars
-        pnl_dollars = (pnl_points * POINT_VALUE * POSITION_SIZE) - COMMISSION
-        
-        trades.append({
-            'signal_time': signal_idx,
-            'entry_time': entry_bar_idx,
-            'entry_price': entry_price + SLIPPAGE_POINTS,  # Actual entry after slippage
-            'pnl_points': pnl_points,
-            'pnl_dollars': pnl_dollars,
-            'hold_time': hold_time,
-            'exit_type': exit_type,
-            'setup': 'Crash' if df.loc[signal_idx, 'Setup1'] else 'Quiet'
-        })
-        
-        # Update last exit
-        last_exit_bar = entry_loc + hold_time
-    
-    trades_df = pd.DataFrame(trades)
+    trades = simulate_trades_strict(df)
+    signal_locs = trades['signal_loc']
+    
+    trades_df = pd.DataFrame({
+        'signal_time': df.index[signal_locs],
+        'entry_time': df.index[trades['entry_loc']],
+        'entry_price': trades['entry_price'],  # Actual entry after slippage
+        'pnl_points': trades['pnl_points'],
+        'pnl_dollars': (trades['pnl_points'] * POINT_VALUE * POSITION_SIZE) - COMMISSION,
+        'hold_time': trades['hold_time'],
+        'exit_type': trades['exit_type'],
+        'setup': np.where(df['Setup1'].to_numpy(dtype=bool)[signal_locs], 'Crash', 'Quiet')
+    })
     print(f"      Total trades executed: {len(trades_df):,}")
     
     return trades_df
@@ -18,6 +18,7 @@ Author: Magellan Quant Research
 Date: 2026-01-30
 """
 
+import sys
 import pandas as pd
 import numpy as np
 from pathlib import Path
@@ -28,6 +29,11 @@ from datetime import datetime
 import warnings
 warnings.filterwarnings('ignore')
 
+project_root = Path(__file__).resolve().parents[3]
+sys.path.insert(0, str(project_root))
+
+from src.bracket_exits import BracketExits, long_bracket_trades
+
 # =============================================================================
 # CONFIGURATION
 # =============================================================================
@@ -177,91 +183,44 @@ def apply_model(df, clf, feature_cols):
 # TRADE SIMULATION (Parameterized)
 # =============================================================================
 
-def simulate_trade(df, signal_idx, entry_price, tp_points, sl_points):
+def simulate_grid(df, tp_values, sl_values):
     """
-    Simulate a single trade with specific TP/SL parameters.
-    
+    Simulate every TP/SL combination in one pass over the signals.
+
     Constraints Applied:
     - $6.50 total friction ($2.50 comms + 2.0 pts slippage)
     - 60 minute time limit
     - Worst-case: if both TP and SL hit on same bar, assume SL hit first
+
+    Exits come from the first-passage bracket index (src.bracket_exits), so each
+    TP and SL level is scanned once for all signals instead of one df.iloc walk
+    per signal per combination.
     """
-    entry_loc = df.index.get_loc(signal_idx) + 1
-    
-    if entry_loc >= len(df):
-        return None, 0, 'SKIP', None
-    
-    # Apply slippage on entry
-    actual_entry = entry_price + SLIPPAGE_POINTS
-    tp_price = actual_entry + tp_points
-    sl_price = actual_entry - sl_points
-    
-    for i in range(entry_loc, min(entry_loc + MAX_HOLD_TIME, len(df))):
-        bar = df.iloc[i]
-        bars_held = i - entry_loc + 1
-        
-        sl_hit = bar['low'] <= sl_price
-        tp_hit = bar['high'] >= tp_price
-        
-        # WORST CASE: If both hit on same bar, assume SL hit first
-        if sl_hit and tp_hit:
-            return -sl_points - SLIPPAGE_POINTS, bars_held, 'SL', df.index[i]
-        if sl_hit:
-            return -sl_points - SLIPPAGE_POINTS, bars_held, 'SL', df.index[i]
-        if tp_hit:
-            return tp_points - SLIPPAGE_POINTS, bars_held, 'TP', df.index[i]
-    
-    # Timeout exit at market
-    last_idx = min(entry_loc + MAX_HOLD_TIME - 1, len(df) - 1)
-    last_bar = df.iloc[last_idx]
-    exit_price = last_bar['close'] - SLIPPAGE_POINTS  # Exit slippage
-    return exit_price - actual_entry, MAX_HOLD_TIME, 'TO', df.index[last_idx]
+    engine = BracketExits(df['high'], df['low'], df['close'], MAX_HOLD_TIME)
+    signal_locs = np.flatnonzero(df['Signal'].to_numpy(dtype=bool))
+    cells = long_bracket_trades(engine, signal_locs, df['open'], tp_values, sl_values, SLIPPAGE_POINTS)
+    
+    velocity = df['Velocity_5m'].to_numpy()
+    setup = df['Setup'].to_numpy()
+    trades = {}
+    for (sl, tp), cell in cells.items():
+        trades[(sl, tp)] = pd.DataFrame({
+            'signal_time': df.index[cell['signal_loc']],
+            'entry_time': df.index[cell['entry_loc']],
+            'exit_time': df.index[cell['exit_loc']],
+            'entry_price': cell['entry_price'],
+            'setup': setup[cell['signal_loc']],
+            'velocity_5m': velocity[cell['signal_loc']],
+            'pnl_points': cell['pnl_points'],
+            'pnl_dollars': (cell['pnl_points'] * POINT_VALUE) - COMMISSION,
+            'hold_time': cell['hold_time'],
+            'exit_type': cell['exit_type']
+        })
+    return trades
 
 def run_backtest(df, tp_points, sl_points):
     """Run backtest with specific TP/SL parameters."""
-    signals_df = df[df['Signal'] == True].copy()
-    
-    trades = []
-    last_exit_bar = -1
-    
-    for signal_idx in signals_df.index:
-        signal_loc = df.index.get_loc(signal_idx)
-        
-        if signal_loc <= last_exit_bar:
-            continue
-        
-        entry_loc = signal_loc + 1
-        if entry_loc >= len(df):
-            continue
-        
-        entry_bar_idx = df.index[entry_loc]
-        entry_price = df.iloc[entry_loc]['open']
-        velocity = signals_df.loc[signal_idx, 'Velocity_5m']
-        setup = signals_df.loc[signal_idx, 'Setup']
-        
-        result = simulate_trade(df, signal_idx, entry_price, tp_points, sl_points)
-        if result[0] is None:
-            continue
-        
-        pnl_points, hold_time, exit_type, exit_time = result
-        pnl_dollars = (pnl_points * POINT_VALUE) - COMMISSION
-        
-        trades.append({
-            'signal_time': signal_idx,
-            'entry_time': entry_bar_idx,
-            'exit_time': exit_time,
-            'entry_price': entry_price + SLIPPAGE_POINTS,
-            'setup': setup,
-            'velocity_5m': velocity,
-            'pnl_points': pnl_points,
-            'pnl_dollars': pnl_dollars,
-            'hold_time': hold_time,
-            'exit_type': exit_type
-        })
-        
-        last_exit_bar = entry_loc + hold_time
-    
-    return pd.DataFrame(trades)
+    return simulate_grid(df, [tp_points], [sl_points])[(sl_points, tp_points)]
 
 def calculate_metrics(trades_df, tp_points, sl_points):
     """Calculate performance metrics for a given TP/SL combination."""
@@ -330,16 +289,14 @@ def run_grid_search(test_signals, train_golden):
     total_combinations = len(STOP_LOSS_VALUES) * len(TAKE_PROFIT_VALUES)
     current = 0
     
+    grid_trades = simulate_grid(test_signals, TAKE_PROFIT_VALUES, STOP_LOSS_VALUES)
+    
     for sl in STOP_LOSS_VALUES:
         for tp in TAKE_PROFIT_VALUES:
             current += 1
             
-            # For each TP/SL, we need to retrain the target (since target depends on TP/SL)
-            # But we keep the same signals for fair comparison
-            # Actually, re-read: the entry signals should be independent of exit parameters
-            # We just need to change the exit logic
-            
-            trades = run_backtest(test_signals, tp, sl)
+            # Entry signals are independent of exit parameters; only the exits change
+            trades = grid_trades[(sl, tp)]
             metrics = calculate_metrics(trades, tp, sl)
             
             results.append({
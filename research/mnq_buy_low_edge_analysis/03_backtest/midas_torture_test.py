@@ -16,6 +16,7 @@ Author: Magellan Quant Research (Pessimist Mode)
 Date: 2026-01-30
 """
 
+import sys
 import pandas as pd
 import numpy as np
 from pathlib import Path
@@ -26,6 +27,11 @@ from datetime import datetime
 import warnings
 warnings.filterwarnings('ignore')
 
+project_root = Path(__file__).resolve().parents[3]
+sys.path.insert(0, str(project_root))
+
+from src.bracket_exits import BracketExits, long_bracket_trades
+
 # =============================================================================
 # CONFIGURATION (TORTURE MODE)
 # =============================================================================
@@ -164,100 +170,42 @@ def apply_model(df, clf, feature_cols):
 # TORTURE TEST EXECUTION
 # =============================================================================
 
-def simulate_trade_torture(df, signal_idx, entry_price, velocity):
+def simulate_trades_torture(df):
     """
     TORTURE MODE trade simulation.
     - Entry suffers 2.0 points slippage
     - If both TP and SL hit, assume SL FIRST
+    - One position at a time (first-passage bracket exits)
     """
-    entry_loc = df.index.get_loc(signal_idx) + 1
-    
-    if entry_loc >= len(df):
-        return None, 0, 'SKIP', None
-    
-    # Entry price after slippage (hurts longs)
-    actual_entry = entry_price + SLIPPAGE_SPREAD_POINTS
-    tp_price = actual_entry + TAKE_PROFIT_POINTS
-    sl_price = actual_entry - STOP_LOSS_POINTS
-    
-    for i in range(entry_loc, min(entry_loc + MAX_HOLD_TIME, len(df))):
-        bar = df.iloc[i]
-        bars_held = i - entry_loc + 1
-        
-        sl_hit = bar['low'] <= sl_price
-        tp_hit = bar['high'] >= tp_price
-        
-        # WORST CASE: Both hit = SL FIRST
-        if sl_hit and tp_hit:
-            pnl_points = -STOP_LOSS_POINTS - SLIPPAGE_SPREAD_POINTS
-            return pnl_points, bars_held, 'SL', df.index[i]
-        
-        if sl_hit:
-            pnl_points = -STOP_LOSS_POINTS - SLIPPAGE_SPREAD_POINTS
-            return pnl_points, bars_held, 'SL', df.index[i]
-        
-        if tp_hit:
-            pnl_points = TAKE_PROFIT_POINTS - SLIPPAGE_SPREAD_POINTS
-            return pnl_points, bars_held, 'TP', df.index[i]
-    
-    # Timeout
-    last_idx = min(entry_loc + MAX_HOLD_TIME - 1, len(df) - 1)
-    last_bar = df.iloc[last_idx]
-    exit_price = last_bar['close'] - SLIPPAGE_SPREAD_POINTS
-    pnl_points = exit_price - actual_entry
-    return pnl_points, MAX_HOLD_TIME, 'TO', df.index[last_idx]
+    engine = BracketExits(df['high'], df['low'], df['close'], MAX_HOLD_TIME)
+    signal_locs = np.flatnonzero(df['Signal'].to_numpy(dtype=bool))
+    cells = long_bracket_trades(
+        engine, signal_locs, df['open'], [TAKE_PROFIT_POINTS], [STOP_LOSS_POINTS], SLIPPAGE_SPREAD_POINTS
+    )
+    return cells[(STOP_LOSS_POINTS, TAKE_PROFIT_POINTS)]
 
 def run_torture_test(df):
     """Run the torture test backtest."""
     print(f"\n[5/7] Running TORTURE TEST on 2025 data...")
     print(f"      (Every trade starts ${TOTAL_COST_PER_TRADE} in the hole)")
     
-    signals_df = df[df['Signal'] == True].copy()
-    
-    trades = []
-    last_exit_bar = -1
-    
-    for signal_idx in signals_df.index:
-        signal_loc = df.index.get_loc(signal_idx)
-        
-        if signal_loc <= last_exit_bar:
-            continue
-        
-        entry_loc = signal_loc + 1
-        if entry_loc >= len(df):
-            continue
-        
-        entry_bar_idx = df.index[entry_loc]
-        entry_price = df.iloc[entry_loc]['open']
-        velocity = df.loc[signal_idx, 'Velocity_5m']
-        setup = df.loc[signal_idx, 'Setup']
-        
-        result = simulate_trade_torture(df, signal_idx, entry_price, velocity)
-        if result[0] is None:
-            continue
-        
-        pnl_points, hold_time, exit_type, exit_time = result
-        
+    trades = simulate_trades_torture(df)
+    signal_locs = trades['signal_loc']
+    
+    trades_df = pd.DataFrame({
+        'signal_time': df.index[signal_locs],
+        'entry_time': df.index[trades['entry_loc']],
+        'exit_time': df.index[trades['exit_loc']],
+        'entry_price': df['open'].to_numpy()[trades['entry_loc']],
+        'actual_entry': trades['entry_price'],
+        'setup': df['Setup'].to_numpy()[signal_locs],
+        'velocity_5m': df['Velocity_5m'].to_numpy()[signal_locs],
+        'pnl_points': trades['pnl_points'],
         # PnL in dollars (subtract commission)
-        pnl_dollars = (pnl_points * POINT_VALUE) - COMMISSION
-        
-        trades.append({
-            'signal_time': signal_idx,
-            'entry_time': entry_bar_idx,
-            'exit_time': exit_time,
-            'entry_price': entry_price,
-            'actual_entry': entry_price + SLIPPAGE_SPREAD_POINTS,
-            'setup': setup,
-            'velocity_5m': velocity,
-            'pnl_points': pnl_points,
-            'pnl_dollars': pnl_dollars,
-            'hold_time': hold_time,
-            'exit_type': exit_type
-        })
-        
-        last_exit_bar = entry_loc + hold_time
-    
-    trades_df = pd.DataFrame(trades)
+        'pnl_dollars': (trades['pnl_points'] * POINT_VALUE) - COMMISSION,
+        'hold_time': trades['hold_time'],
+        'exit_type': trades['exit_type']
+    })
     print(f"      Total trades: {len(trades_df):,}")
     
     return trades_df
@@ -12,6 +12,7 @@ Author: Magellan Quant Research (Validation Mode)
 Date: 2026-01-30
 """
 
+import sys
 import pandas as pd
 import numpy as np
 from pathlib import Path
@@ -22,6 +23,11 @@ from datetime import datetime
 import warnings
 warnings.filterwarnings('ignore')
 
+project_root = Path(__file__).resolve().parents[3]
+sys.path.insert(0, str(project_root))
+
+from src.bracket_exits import BracketExits, long_bracket_trades
+
 # =============================================================================
 # CONFIGURATION
 # =============================================================================
@@ -245,77 +251,28 @@ def apply_learned_rules(df, clf, feature_cols):
 # STRICT BACKTEST
 # =============================================================================
 
-def simulate_trade_strict(df, signal_idx, entry_price):
-    """Strict trade simulation."""
-    entry_loc = df.index.get_loc(signal_idx) + 1
-    
-    if entry_loc >= len(df):
-        return None, 0, 'SKIP'
-    
-    actual_entry_price = entry_price + SLIPPAGE_POINTS
-    tp_price = actual_entry_price + TAKE_PROFIT_POINTS
-    sl_price = actual_entry_price - STOP_LOSS_POINTS
-    
-    for i in range(entry_loc, min(entry_loc + MAX_HOLD_TIME, len(df))):
-        bar = df.iloc[i]
-        bars_held = i - entry_loc + 1
-        
-        sl_hit = bar['low'] <= sl_price
-        tp_hit = bar['high'] >= tp_price
-        
-        if sl_hit and tp_hit:
-            return -STOP_LOSS_POINTS - SLIPPAGE_POINTS, bars_held, 'SL'
-        if sl_hit:
-            return -STOP_LOSS_POINTS - SLIPPAGE_POINTS, bars_held, 'SL'
-        if tp_hit:
-            return TAKE_PROFIT_POINTS - SLIPPAGE_POINTS, bars_held, 'TP'
-    
-    last_bar = df.iloc[min(entry_loc + MAX_HOLD_TIME - 1, len(df) - 1)]
-    exit_price = last_bar['close'] - SLIPPAGE_POINTS
-    return exit_price - actual_entry_price, MAX_HOLD_TIME, 'TO'
+def simulate_trades_strict(df):
+    """Strict trade simulation (first-passage bracket exits, one position at a time)."""
+    engine = BracketExits(df['high'], df['low'], df['close'], MAX_HOLD_TIME)
+    signal_locs = np.flatnonzero(df['Signal'].to_numpy(dtype=bool))
+    cells = long_bracket_trades(engine, signal_locs, df['open'], [TAKE_PROFIT_POINTS], [STOP_LOSS_POINTS], SLIPPAGE_POINTS)
+    return cells[(STOP_LOSS_POINTS, TAKE_PROFIT_POINTS)]
 
 def run_backtest(df, label=""):
     """Run strict backtest."""
-    signals_df = df[df['Signal'] == True].copy()
-    
-    trades = []
-    last_exit_bar = -1
-    
-    for signal_idx in signals_df.index:
-        signal_loc = df.index.get_loc(signal_idx)
-        
-        if signal_loc <= last_exit_bar:
-            continue
-        
-        entry_loc = signal_loc + 1
-        if entry_loc >= len(df):
-            continue
-        
-        entry_bar_idx = df.index[entry_loc]
-        entry_price = df.iloc[entry_loc]['open']
-        
-        result = simulate_trade_strict(df, signal_idx, entry_price)
-        if result[0] is None:
-            continue
-        
-        pnl_points, hold_time, exit_type = result
-        pnl_dollars = (pnl_points * POINT_VALUE) - COMMISSION
-        
-        trades.append({
-            'entry_time': entry_bar_idx,
-            'entry_price': entry_price + SLIPPAGE_POINTS,
-            'pnl_points': pnl_points,
-            'pnl_dollars': pnl_dollars,
-            'hold_time': hold_time,
-            'exit_type': exit_type
-        })
-        
-        last_exit_bar = entry_loc + hold_time
+    trades = simulate_trades_strict(df)
     
-    if len(trades) == 0:
+    if len(trades['entry_loc']) == 0:
         return pd.DataFrame()
     
-    trades_df = pd.DataFrame(trades)
+    trades_df = pd.DataFrame({
+        'entry_time': df.index[trades['entry_loc']],
+        'entry_price': trades['entry_price'],
+        'pnl_points': trades['pnl_points'],
+        'pnl_dollars': (trades['pnl_points'] * POINT_VALUE) - COMMISSION,
+        'hold_time': trades['hold_time'],
+        'exit_type': trades['exit_type']
+    })
     return trades_df
 
 def calculate_metrics(trades_df, label=""):
@@ -25,6 +25,7 @@ from dotenv import load_dotenv
 load_dotenv()
 
 from src.data_handler import AlpacaDataClient
+from src.hysteresis import latch_states
 from alpaca.data.timeframe import TimeFrame
 import requests
 import os
@@ -173,68 +174,55 @@ class UniversalBacktester:
         df['rsi'] = self.calculate_rsi(df['close'], period=28)
         df['rsi_prev'] = df['rsi'].shift(1)
         
-        # Initialize tracking
-        position = 'flat'
-        entry_price = None
-        entry_date = None
-        trades = []
-        equity_curve = []
         initial_capital = 100000
-        cash = initial_capital
+        dates = df.index
+        price = df['close'].to_numpy(dtype=float)
+        rsi = df['rsi'].to_numpy(dtype=float)
+        prev_rsi = df['rsi_prev'].to_numpy(dtype=float)
+        valid = ~(np.isnan(rsi) | np.isnan(prev_rsi))
+        valid[0] = False
         
-        # Backtest loop
-        for idx in range(1, len(df)):
-            current_date = df.index[idx]
-            current_price = df.iloc[idx]['close']
-            current_rsi = df.iloc[idx]['rsi']
-            prev_rsi = df.iloc[idx]['rsi_prev']
-            
-            if pd.isna(current_rsi) or pd.isna(prev_rsi):
-                equity_curve.append(cash)
-                continue
-            
-            # ENTRY: Strict crossover above threshold
-            if position == 'flat':
-                if prev_rsi <= entry_threshold and current_rsi > entry_threshold:
-                    friction_cost = (friction_bps / 10000) * current_price * position_size
-                    entry_price = current_price
-                    entry_date = current_date
-                    position = 'long'
-                    cash -= (current_price * position_size + friction_cost)
-            
-            # EXIT: Strict crossover below threshold
-            elif position == 'long':
-                if prev_rsi >= exit_threshold and current_rsi < exit_threshold:
-                    friction_cost = (friction_bps / 10000) * current_price * position_size
-                    proceeds = current_price * position_size - friction_cost
-                    pnl_dollars = proceeds - (entry_price * position_size)
-                    pnl_pct = ((current_price / entry_price) - 1) * 100
-                    hold_time = (current_date - entry_date).total_seconds() / 3600
-                    
-                    trades.append({
-                        'entry_date': entry_date,
-                        'exit_date': current_date,
-                        'entry_price': entry_price,
-                        'exit_price': current_price,
-                        'pnl_dollars': pnl_dollars,
-                        'pnl_pct': pnl_pct,
-                        'hold_hours': hold_time
-                    })
-                    
-                    cash += proceeds
-                    position = 'flat'
-                    entry_price = None
-                    entry_date = None
-            
-            # Track equity
-            if position == 'long':
-                unrealized_pnl = (current_price - entry_price) * position_size
-                equity_curve.append(cash + unrealized_pnl)
-            else:
-                equity_curve.append(cash)
+        # ENTRY: Strict crossover above threshold / EXIT: Strict crossover below threshold
+        # The two can never fire on the same bar, so the position is a set/reset latch
+        entry_cross = valid & (prev_rsi <= entry_threshold) & (rsi > entry_threshold)
+        exit_cross = valid & (prev_rsi >= exit_threshold) & (rsi < exit_threshold)
+        long = latch_states(entry_cross, exit_cross)
+        held = np.r_[False, long[:-1]]
+        entries = np.flatnonzero(long & ~held)
+        exits = np.flatnonzero(~long & held)
+        
+        # Cash moves only on fills
+        friction = (friction_bps / 10000) * price * position_size
+        cash_flow = np.zeros(len(df))
+        cash_flow[entries] = -(price[entries] * position_size + friction[entries])
+        cash_flow[exits] = price[exits] * position_size - friction[exits]
+        cash_path = np.cumsum(np.r_[initial_capital, cash_flow[1:]])
+        cash = cash_path[-1]
+        
+        # Track equity (bars 1..n-1; unrealized P&L while long)
+        steps = np.arange(len(df))
+        entry_loc = np.maximum.accumulate(np.where(long & ~held, steps, 0))
+        unrealized = np.where(long & valid, (price - price[entry_loc]) * position_size, 0.0)
+        equity_curve = (cash_path[1:] + unrealized[1:]).tolist()
+        
+        trades = []
+        for entry, exit_ in zip(entries.tolist(), exits.tolist()):
+            entry_price = price[entry]
+            proceeds = price[exit_] * position_size - friction[exit_]
+            trades.append({
+                'entry_date': dates[entry],
+                'exit_date': dates[exit_],
+                'entry_price': entry_price,
+                'exit_price': price[exit_],
+                'pnl_dollars': proceeds - (entry_price * position_size),
+                'pnl_pct': ((price[exit_] / entry_price) - 1) * 100,
+                'hold_hours': (dates[exit_] - dates[entry]).total_seconds() / 3600
+            })
         
         # Close any open position
-        if position == 'long':
+        if len(entries) > len(exits):
+            entry_price = price[entries[-1]]
+            entry_date = dates[entries[-1]]
             current_price = df.iloc[-1]['close']
             current_date = df.index[-1]
             friction_cost = (friction_bps / 10000) * current_price * position_size
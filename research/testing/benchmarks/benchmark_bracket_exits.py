@@ -0,0 +1,133 @@
+"""
+Benchmark - MIDAS TP/SL Grid: df.iloc Loop vs First-Passage Bracket Exits
+=========================================================================
+Runs the midas_grid_search_optimizer 7x7 TP/SL grid over synthetic MNQ-like
+1-minute bars (about 23 hours a day, 252 days a year) with:
+
+- legacy:  run_backtest / simulate_trade per cell (df.iloc walk per signal)
+- bracket: long_bracket_trades (one first-passage scan per TP and SL level,
+           sequential one-position selection per cell)
+
+The legacy loop is timed on a sample of cells and extrapolated to the full
+grid; the sampled cells are checked for identical trades.
+
+Usage:
+    python research/testing/benchmarks/benchmark_bracket_exits.py
+    python research/testing/benchmarks/benchmark_bracket_exits.py --years 2 --legacy-cells 3
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+project_root = Path(__file__).resolve().parent.parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.bracket_exits import BracketExits, long_bracket_trades
+
+MAX_HOLD_TIME = 60
+SLIPPAGE_POINTS = 2.0
+STOP_LOSS_VALUES = [8, 10, 12, 15, 18, 20, 25]
+TAKE_PROFIT_VALUES = [30, 40, 50, 60, 80, 100, 120]
+
+
+def make_bars(years: float, signal_rate: float, seed: int = 42) -> pd.DataFrame:
+    """Random-walk 1-minute OHLC bars with a sparse boolean Signal column."""
+    rng = np.random.default_rng(seed)
+    n = int(years * 252 * 23 * 60)
+    close = 18000 + np.cumsum(rng.normal(0, 6, n))
+    open_ = np.r_[close[0], close[:-1]] + rng.normal(0, 1, n)
+    df = pd.DataFrame(
+        {
+            "open": open_,
+            "high": np.maximum(open_, close) + rng.exponential(4, n),
+            "low": np.minimum(open_, close) - rng.exponential(4, n),
+            "close": close,
+        },
+        index=pd.date_range("2024-01-01", periods=n, freq="1min"),
+    )
+    df["Signal"] = rng.random(n) < signal_rate
+    return df
+
+
+def legacy_simulate_trade(df, signal_idx, entry_price, tp_points, sl_points):
+    """The previous midas_grid_search_optimizer.simulate_trade."""
+    entry_loc = df.index.get_loc(signal_idx) + 1
+    if entry_loc >= len(df):
+        return None, 0, 'SKIP', None
+    actual_entry = entry_price + SLIPPAGE_POINTS
+    tp_price = actual_entry + tp_points
+    sl_price = actual_entry - sl_points
+    for i in range(entry_loc, min(entry_loc + MAX_HOLD_TIME, len(df))):
+        bar = df.iloc[i]
+        bars_held = i - entry_loc + 1
+        if bar['low'] <= sl_price:
+            return -sl_points - SLIPPAGE_POINTS, bars_held, 'SL', df.index[i]
+        if bar['high'] >= tp_price:
+            return tp_points - SLIPPAGE_POINTS, bars_held, 'TP', df.index[i]
+    last_idx = min(entry_loc + MAX_HOLD_TIME - 1, len(df) - 1)
+    exit_price = df.iloc[last_idx]['close'] - SLIPPAGE_POINTS
+    return exit_price - actual_entry, MAX_HOLD_TIME, 'TO', df.index[last_idx]
+
+
+def legacy_run_backtest(df, tp_points, sl_points) -> list:
+    """The previous run_backtest loop; returns (signal_time, exit_time, pnl_points, exit_type) tuples."""
+    trades = []
+    last_exit_bar = -1
+    for signal_idx in df.index[df['Signal']]:
+        signal_loc = df.index.get_loc(signal_idx)
+        if signal_loc <= last_exit_bar:
+            continue
+        entry_loc = signal_loc + 1
+        if entry_loc >= len(df):
+            continue
+        entry_price = df.iloc[entry_loc]['open']
+        pnl_points, hold_time, exit_type, exit_time = legacy_simulate_trade(df, signal_idx, entry_price, tp_points, sl_points)
+        trades.append((signal_idx, exit_time, pnl_points, exit_type))
+        last_exit_bar = entry_loc + hold_time
+    return trades
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark MIDAS TP/SL grid simulation")
+    parser.add_argument("--years", type=float, default=2.0)
+    parser.add_argument("--signal-rate", type=float, default=0.002)
+    parser.add_argument("--legacy-cells", type=int, default=2, help="Grid cells to time with the legacy loop")
+    args = parser.parse_args()
+
+    df = make_bars(args.years, args.signal_rate)
+    n_cells = len(STOP_LOSS_VALUES) * len(TAKE_PROFIT_VALUES)
+    print(f"Bars: {len(df):,} | signals: {int(df['Signal'].sum()):,} | grid: {n_cells} cells")
+
+    start = time.perf_counter()
+    engine = BracketExits(df["high"], df["low"], df["close"], MAX_HOLD_TIME)
+    cells = long_bracket_trades(
+        engine, np.flatnonzero(df["Signal"]), df["open"], TAKE_PROFIT_VALUES, STOP_LOSS_VALUES, SLIPPAGE_POINTS
+    )
+    bracket = time.perf_counter() - start
+
+    sample = [(STOP_LOSS_VALUES[i], TAKE_PROFIT_VALUES[-1 - i]) for i in range(min(args.legacy_cells, len(STOP_LOSS_VALUES)))]
+    start = time.perf_counter()
+    for sl, tp in sample:
+        expected = legacy_run_backtest(df, tp, sl)
+        cell = cells[(sl, tp)]
+        result = list(zip(df.index[cell["signal_loc"]], df.index[cell["exit_loc"]], cell["pnl_points"], cell["exit_type"]))
+        assert len(result) == len(expected) and all(
+            r[0] == e[0] and r[1] == e[1] and np.isclose(r[2], e[2]) and r[3] == e[3] for r, e in zip(result, expected)
+        ), f"Mismatch in cell SL={sl} TP={tp}"
+    legacy_cell = (time.perf_counter() - start) / len(sample)
+    legacy = legacy_cell * n_cells
+
+    trades = sum(len(c["signal_loc"]) for c in cells.values())
+    print(f"{'Mode':<10} {'Grid s':>10} {'ms/cell':>10}")
+    print(f"{'legacy':<10} {legacy:>10.1f} {legacy_cell * 1e3:>10.1f}   (extrapolated from {len(sample)} cells)")
+    print(f"{'bracket':<10} {bracket:>10.2f} {bracket / n_cells * 1e3:>10.1f}")
+    print(f"\nTrades across grid: {trades:,} | sampled cells identical | speedup: {legacy / bracket:.0f}x")
+
+
+if __name__ == "__main__":
+    main()
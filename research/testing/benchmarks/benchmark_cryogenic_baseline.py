@@ -0,0 +1,113 @@
+"""
+Benchmark - VSS Cryogenic Baseline Scaling
+==========================================
+Compares the legacy per-hot-bar rolling-median recompute (O(n^2)) with the
+precomputed thermal_state() columns from src/rolling_stats.py, and times the
+full generate_master_signal() VSS path from 10k to 1M bars.
+
+Usage:
+    python research/testing/benchmarks/benchmark_cryogenic_baseline.py
+    python research/testing/benchmarks/benchmark_cryogenic_baseline.py --sizes 10000 100000 --legacy-max 10000
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+project_root = Path(__file__).resolve().parent.parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.features import FeatureEngineer, add_technical_indicators, generate_master_signal
+from src.rolling_stats import rolling_atr, thermal_state
+
+
+def make_bars(n: int, seed: int = 42) -> pd.DataFrame:
+    """Synthetic 1-minute OHLCV bars with volatility clusters (so cryo-hot bars occur)."""
+    rng = np.random.default_rng(seed)
+    regime = np.where(rng.random(n) < 0.02, 4.0, 1.0)
+    regime = pd.Series(regime).rolling(30, min_periods=1).max().to_numpy()
+    returns = rng.normal(0.0, 0.0008, n) * regime
+    close = 50.0 * np.exp(np.cumsum(returns))
+    spread = np.abs(rng.normal(0.0, 0.001, n)) * close * regime
+    index = pd.date_range("2024-01-02 09:30", periods=n, freq="1min")
+    df = pd.DataFrame(
+        {
+            "open": close,
+            "high": close + spread,
+            "low": close - spread,
+            "close": close,
+            "volume": rng.integers(100, 10000, n).astype(float),
+        },
+        index=index,
+    )
+    df["log_return"] = FeatureEngineer.calculate_log_return(df)
+    df["sentiment"] = 0.0
+    return df
+
+
+def time_legacy_baseline(df: pd.DataFrame) -> float:
+    """Legacy path: rolling median recomputed over the whole frame on every hot bar."""
+    start = time.perf_counter()
+    vol_temp = rolling_atr(df["high"], df["low"], df["close"], window=20)
+    cryo_mask = vol_temp > (1.5 * vol_temp.rolling(window=200).median())
+    for idx in df.index[cryo_mask.to_numpy()]:
+        vol_temp.rolling(window=200).median().loc[idx]
+    return time.perf_counter() - start
+
+
+def time_thermal_state(df: pd.DataFrame) -> float:
+    """New path: temperature, baseline and damping ratio computed once as columns."""
+    start = time.perf_counter()
+    thermal_state(df["high"], df["low"], df["close"])
+    return time.perf_counter() - start
+
+
+def time_master_signal(df: pd.DataFrame) -> float:
+    """Full generate_master_signal() VSS path (indicators excluded)."""
+    add_technical_indicators(df)
+    start = time.perf_counter()
+    generate_master_signal(df, ticker="VSS")
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="VSS cryogenic baseline scaling benchmark")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000, 1_000_000])
+    parser.add_argument("--legacy-max", type=int, default=10_000, help="Largest size to run the O(n^2) legacy path")
+    args = parser.parse_args()
+
+    rows = []
+    for n in args.sizes:
+        df = make_bars(n)
+        hot_bars = int(thermal_state(df["high"], df["low"], df["close"])["cryo_hot"].sum())
+
+        legacy = time_legacy_baseline(df) if n <= args.legacy_max else float("nan")
+        thermal = time_thermal_state(df)
+        master = time_master_signal(df)
+
+        rows.append(
+            {
+                "bars": n,
+                "hot_bars": hot_bars,
+                "legacy_baseline_s": legacy,
+                "thermal_state_s": thermal,
+                "master_signal_s": master,
+                "speedup": legacy / thermal if not np.isnan(legacy) else float("nan"),
+            }
+        )
+
+    results = pd.DataFrame(rows)
+    print("\n" + "=" * 80)
+    print("[BENCHMARK] VSS Cryogenic Baseline Scaling")
+    print("=" * 80)
+    print(results.to_string(index=False, float_format=lambda x: f"{x:,.4f}"))
+    print("=" * 80)
+    return results
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,129 @@
+"""
+Benchmark - Feature-Once, Slice-Many Rolling Backtest Featurization
+===================================================================
+Times the featurization work of run_rolling_backtest() in both feature modes on
+cached 1-minute bars (data/cache/equities) with cached FMP news (.cache/fmp_news):
+
+- window: build_window_features() for every IS and OOS window (legacy path)
+- full:   build_feature_matrix() once, then slice_window_features() per window
+          (full_with_signal also regenerates the master signal per slice, as with
+          enable_hysteresis)
+
+Weight optimization and P&L simulation are identical in both modes and excluded.
+Bars are tiled forward in time to reach --days trading days.
+
+Usage:
+    python research/testing/benchmarks/benchmark_feature_once.py
+    python research/testing/benchmarks/benchmark_feature_once.py --days 60 250 --in-sample-days 3
+"""
+
+import argparse
+import pickle
+import sys
+import time
+from pathlib import Path
+
+import pandas as pd
+
+project_root = Path(__file__).resolve().parent.parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.backtester_pro import build_feature_matrix, build_window_features, slice_window_features
+from src.logger import set_log_level
+
+BARS_FILE = project_root / "data" / "cache" / "equities" / "SOFI_1min_20240401_20240630.parquet"
+NEWS_FILE = project_root / ".cache" / "fmp_news" / "0b2ca7e5163ebfe0513b0167fdc46807.pkl"
+
+
+def make_bars(num_days: int) -> pd.DataFrame:
+    """Cached 1-minute bars, tiled forward in whole 13-week blocks to cover num_days trading days."""
+    bars = pd.read_parquet(BARS_FILE)[["open", "high", "low", "close", "volume"]]
+    block_days = bars.index.normalize().nunique()
+    blocks = []
+    for i in range(-(-num_days // block_days)):
+        block = bars.copy()
+        block.index = block.index + pd.Timedelta(weeks=13 * i)
+        blocks.append(block)
+    tiled = pd.concat(blocks)
+    days = tiled.index.normalize().unique()[:num_days]
+    return tiled[tiled.index.normalize().isin(days)]
+
+
+def window_bounds(bars: pd.DataFrame, in_sample_days: int):
+    """(is_start, is_end, oos_start, oos_end) date strings for every rolling window."""
+    days = bars.index.normalize().unique()
+    bounds = []
+    for i in range(len(days) - in_sample_days):
+        is_start, oos_day = days[i], days[i + in_sample_days]
+        next_day = oos_day + pd.Timedelta(days=1)
+        bounds.append(
+            (
+                is_start.strftime("%Y-%m-%d"),
+                oos_day.strftime("%Y-%m-%d"),
+                oos_day.strftime("%Y-%m-%d"),
+                next_day.strftime("%Y-%m-%d"),
+            )
+        )
+    return bounds
+
+
+def time_window_mode(bars, news_list, bounds) -> float:
+    start = time.perf_counter()
+    for is_start, is_end, oos_start, oos_end in bounds:
+        build_window_features(bars[(bars.index >= is_start) & (bars.index < is_end)], news_list, "SOFI")
+        build_window_features(bars[(bars.index >= oos_start) & (bars.index < oos_end)], news_list, "SOFI")
+    return time.perf_counter() - start
+
+
+def time_full_mode(bars, news_list, bounds, master_signal: bool) -> float:
+    start = time.perf_counter()
+    feature_matrix = build_feature_matrix(bars, news_list, "SOFI")
+    for is_start, is_end, oos_start, oos_end in bounds:
+        slice_window_features(feature_matrix, news_list, is_start, is_end, "SOFI", master_signal=master_signal)
+        slice_window_features(feature_matrix, news_list, oos_start, oos_end, "SOFI", master_signal=master_signal)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Feature-once vs per-window featurization benchmark")
+    parser.add_argument("--days", type=int, nargs="+", default=[60, 250])
+    parser.add_argument("--in-sample-days", type=int, default=3)
+    args = parser.parse_args()
+
+    with NEWS_FILE.open("rb") as f:
+        news_list = pickle.load(f)
+
+    # Per-window terminal logs would dominate the timing
+    set_log_level(quiet=True)
+
+    rows = []
+    for num_days in args.days:
+        bars = make_bars(num_days)
+        bounds = window_bounds(bars, args.in_sample_days)
+        window_s = time_window_mode(bars, news_list, bounds)
+        full_s = time_full_mode(bars, news_list, bounds, master_signal=False)
+        full_signal_s = time_full_mode(bars, news_list, bounds, master_signal=True)
+        rows.append(
+            {
+                "days": num_days,
+                "bars": len(bars),
+                "windows": len(bounds),
+                "window_mode_s": window_s,
+                "full_mode_s": full_s,
+                "speedup": window_s / full_s,
+                "full_with_signal_s": full_signal_s,
+                "speedup_with_signal": window_s / full_signal_s,
+            }
+        )
+
+    results = pd.DataFrame(rows)
+    print("\n" + "=" * 80)
+    print("[BENCHMARK] Rolling Backtest Featurization: per-window vs feature-once")
+    print("=" * 80)
+    print(results.to_string(index=False, float_format=lambda x: f"{x:,.4f}"))
+    print("=" * 80)
+    return results
+
+
+if __name__ == "__main__":
+    main()
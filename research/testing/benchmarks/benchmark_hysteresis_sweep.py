@@ -0,0 +1,114 @@
+"""
+Benchmark - RSI Hysteresis Parameter Sweep
+==========================================
+Sweeps RSI period x upper x lower x friction for the long-only Daily Trend /
+Hourly Swing hysteresis strategy on synthetic closes with:
+
+- legacy: one df['rsi'].iloc state-machine loop per (period, upper, lower) cell,
+          as in the perturbation studies, then pandas metrics per friction
+- sweep:  rsi_hysteresis_sweep (RSI once per period, batched latch over all
+          band pairs, friction levels reusing the same returns and turnover)
+
+The legacy loop is timed on a sample of cells and extrapolated; the sampled
+cells are checked against the sweep output.
+
+Usage:
+    python research/testing/benchmarks/benchmark_hysteresis_sweep.py
+    python research/testing/benchmarks/benchmark_hysteresis_sweep.py --bars 15000 --periods-per-year 1638
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+project_root = Path(__file__).resolve().parent.parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.features import calculate_rsi
+from src.hysteresis_sweep import band_pairs, rsi_hysteresis_sweep
+
+PERIODS = [7, 14, 21, 28, 35, 42]
+UPPERS = list(range(50, 76))
+LOWERS = list(range(25, 51))
+FRICTIONS = [2, 5, 10, 15, 20]
+
+
+def legacy_cell(df, period, upper, lower, frictions, periods_per_year):
+    """Per-bar Schmitt trigger (perturbation-study loop) plus pandas metrics per friction."""
+    df['rsi'] = calculate_rsi(df['close'], period=period)
+    position = 0
+    signals = []
+    for i in range(len(df)):
+        rsi_val = df['rsi'].iloc[i]
+        if pd.isna(rsi_val):
+            signals.append(position)
+            continue
+        if position == 0:
+            if rsi_val > upper:
+                position = 1
+        elif position == 1:
+            if rsi_val < lower:
+                position = 0
+        signals.append(position)
+
+    signal = pd.Series(signals, index=df.index, dtype=float)
+    held = signal.shift(1).fillna(0.0)
+    gross = held * df['close'].pct_change().fillna(0.0)
+    rows = []
+    for bps in frictions:
+        net = gross - bps / 10000.0 * (signal - held).abs()
+        equity = (1 + net).cumprod()
+        rows.append((net.mean() / net.std() * np.sqrt(periods_per_year), equity.iloc[-1] - 1))
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark RSI hysteresis parameter sweeps")
+    parser.add_argument("--bars", type=int, default=2520, help="Bars of history (2520 = 10 years daily)")
+    parser.add_argument("--periods-per-year", type=float, default=252)
+    parser.add_argument("--legacy-cells", type=int, default=5)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(42)
+    close = pd.Series(
+        100 * np.exp(np.cumsum(rng.normal(0.0003, 0.015, args.bars))),
+        index=pd.bdate_range("2015-01-02", periods=args.bars),
+        name="close",
+    )
+    pairs = band_pairs(UPPERS, LOWERS)
+    n_cells = len(PERIODS) * len(pairs)
+    print(f"Bars: {args.bars:,} | periods: {len(PERIODS)} | band pairs: {len(pairs)} | frictions: {len(FRICTIONS)}")
+    print(f"Parameter sets: {n_cells:,} ({n_cells * len(FRICTIONS):,} result rows)")
+
+    start = time.perf_counter()
+    result = rsi_hysteresis_sweep(close, PERIODS, UPPERS, LOWERS, FRICTIONS, periods_per_year=args.periods_per_year)
+    sweep = time.perf_counter() - start
+
+    sample = [(PERIODS[i % len(PERIODS)], *pairs[(i * 97) % len(pairs)]) for i in range(args.legacy_cells)]
+    df = close.to_frame()
+    start = time.perf_counter()
+    for period, upper, lower in sample:
+        rows = legacy_cell(df, period, upper, lower, FRICTIONS, args.periods_per_year)
+        for bps, (sharpe, total_return) in zip(FRICTIONS, rows):
+            cell = result.loc[(period, upper, lower, bps)]
+            assert np.isclose(cell["sharpe"], sharpe) and np.isclose(cell["total_return"], total_return)
+    legacy_cell_s = (time.perf_counter() - start) / len(sample)
+    legacy = legacy_cell_s * n_cells
+
+    print(f"{'Mode':<8} {'Sweep s':>10} {'ms/set':>10}")
+    print(f"{'legacy':<8} {legacy:>10.1f} {legacy_cell_s * 1e3:>10.2f}   (extrapolated from {len(sample)} sets)")
+    print(f"{'sweep':<8} {sweep:>10.2f} {sweep / n_cells * 1e3:>10.3f}")
+    print(f"\nSampled sets identical | speedup: {legacy / sweep:.0f}x")
+
+    best = result.xs(10, level="friction_bps")["sharpe"].nlargest(3)
+    print("\nTop Sharpe at 10 bps:")
+    for (period, upper, lower), sharpe in best.items():
+        print(f"  RSI {period:>2} {upper:.0f}/{lower:.0f}: {sharpe:.2f}")
+
+
+if __name__ == "__main__":
+    main()
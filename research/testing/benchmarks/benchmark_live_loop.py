@@ -0,0 +1,149 @@
+"""
+Benchmark - Live Minute Loop: Serial vs Concurrent process_ticker
+=================================================================
+Runs one iteration of main.process_ticker over a MAG7-sized basket with data
+clients that sleep for a configurable REST latency per call (Alpaca bars, FMP
+quote, FMP news) and a local FakeBroker for execution, with:
+
+- inline:   LivePipeline(inline=True) - every stage blocks the event loop, so
+            asyncio.gather runs the tickers one after another
+- pipeline: LivePipeline - bounded thread pool for fetches, process pool for
+            feature engineering
+
+Reports iteration wall time against the 60s bar budget and the slowest ticker
+per stage (the pipeline's critical path).
+
+Usage:
+    python research/testing/benchmarks/benchmark_live_loop.py
+    python research/testing/benchmarks/benchmark_live_loop.py --tickers 10 --latency 1.5 --bars 2000
+"""
+
+import argparse
+import asyncio
+import contextlib
+import io
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+project_root = Path(__file__).resolve().parent.parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+import main
+from src.executor import AlpacaTradingClient
+from src.features import FeatureEngineer
+from src.live_pipeline import ITERATION_BUDGET, STAGES, IterationTimings, LivePipeline
+from src.order_manager import FakeBroker, OrderManager
+
+UNIVERSE = ["NVDA", "AAPL", "MSFT", "GOOGL", "AMZN", "META", "TSLA", "AMD", "NFLX", "AVGO", "ORCL", "CRM"]
+
+
+def make_bars(seed: int, n: int) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.002, n)))
+    open_ = np.r_[close[0], close[:-1]]
+    return pd.DataFrame(
+        {
+            "open": open_,
+            "high": np.maximum(open_, close) * 1.001,
+            "low": np.minimum(open_, close) * 0.999,
+            "close": close,
+            "volume": rng.integers(1000, 50000, n).astype(float),
+        },
+        index=pd.date_range("2024-05-06 08:00", periods=n, freq="1min"),
+    )
+
+
+class SlowAlpacaData:
+    def __init__(self, latency: float, bars: dict):
+        self.latency = latency
+        self.bars = bars
+
+    def fetch_historical_bars(self, symbol, timeframe, start, end, feed="sip", lookback_buffer=0):
+        time.sleep(self.latency)
+        return self.bars[symbol].copy()
+
+
+class SlowFMP:
+    def __init__(self, latency: float):
+        self.latency = latency
+
+    def fetch_fundamental_metrics(self, symbol):
+        time.sleep(self.latency)
+        return {"symbol": symbol, "mktCap": 1e12, "pe": 30.0, "avgVolume": 5e7}
+
+    def fetch_historical_news(self, symbol, start, end, price_df=None):
+        time.sleep(self.latency)
+        return []
+
+
+async def run_iteration(tickers, pipeline, alpaca_client, fmp_client) -> IterationTimings:
+    broker = FakeBroker(latency=0.05, equity=1_000_000.0)
+    trading_client = AlpacaTradingClient(api=broker)
+    manager = OrderManager(broker, broker)
+    await manager.start()
+    broker.wait_ready()
+
+    start = time.perf_counter()
+    results = await asyncio.gather(
+        *(
+            main.process_ticker(
+                ticker=ticker,
+                alpaca_client=alpaca_client,
+                fmp_client=fmp_client,
+                feature_engineer=FeatureEngineer(),
+                trading_client=trading_client,
+                node_config={"rsi_lookback": 14},
+                bar_start="2024-05-06",
+                bar_end="2024-05-06",
+                news_start="2024-05-02",
+                news_end="2024-05-06",
+                allocation_pct=1.0 / len(tickers),
+                order_manager=manager,
+                pipeline=pipeline,
+            )
+            for ticker in tickers
+        )
+    )
+    summary = IterationTimings(results, time.perf_counter() - start)
+    manager.stop()
+
+    failed = [r["error"] for r in results if not r["success"]]
+    if failed:
+        raise RuntimeError(f"{len(failed)} tickers failed, e.g. {failed[0]}")
+    return summary
+
+
+def main_():
+    parser = argparse.ArgumentParser(description="Benchmark serial vs concurrent live minute loop")
+    parser.add_argument("--tickers", type=int, default=7, help=f"Basket size (max {len(UNIVERSE)})")
+    parser.add_argument("--latency", type=float, default=1.0, help="Seconds per REST call (3 per ticker)")
+    parser.add_argument("--bars", type=int, default=1000, help="Bars returned per fetch")
+    parser.add_argument("--cpu-workers", type=int, default=None)
+    args = parser.parse_args()
+
+    tickers = UNIVERSE[: args.tickers]
+    bars = {t: make_bars(i, args.bars) for i, t in enumerate(tickers)}
+    alpaca_client, fmp_client = SlowAlpacaData(args.latency, bars), SlowFMP(args.latency)
+    os.chdir(tempfile.mkdtemp())  # executor writes live_trades.log to the working directory
+
+    print(f"Tickers: {len(tickers)} | REST latency: {args.latency:.2f}s x 3 calls | bars: {args.bars} | CPUs: {os.cpu_count()}")
+    print(f"{'Mode':<10} {'Wall s':>8} {'Budget':>7} " + " ".join(f"{s:>12}" for s in STAGES))
+    for label, inline in (("inline", True), ("pipeline", False)):
+        pipeline = LivePipeline(n_tickers=len(tickers), cpu_workers=args.cpu_workers, inline=inline)
+        try:
+            with contextlib.redirect_stdout(io.StringIO()):  # pipeline telemetry
+                summary = asyncio.run(run_iteration(tickers, pipeline, alpaca_client, fmp_client))
+        finally:
+            pipeline.shutdown()
+        budget = f"{100 * summary.wall / ITERATION_BUDGET:.0f}%"
+        print(f"{label:<10} {summary.wall:>8.2f} {budget:>7} " + " ".join(f"{summary.max_by_stage[s]:>11.2f}s" for s in STAGES))
+
+
+if __name__ == "__main__":
+    main_()
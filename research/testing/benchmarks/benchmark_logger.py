@@ -0,0 +1,100 @@
+"""
+Benchmark - SystemLogger Per-Bar Telemetry Cost
+===============================================
+Measures the caller-side cost of one per-bar telemetry line (the
+carrier-filter "Carrier Alignment" telemetry message) for:
+
+- legacy:   f-string + open/append/close of debug_vault.log per message
+- queued:   f-string + queued record, batched writes on the writer thread
+- lazy:     %-style args, formatted on the writer thread
+- disabled: debug file off and terminal quiet, guarded by LOG.enabled()
+
+"drain" is the extra time LOG.flush() waits for the writer after the loop.
+
+Usage:
+    python research/testing/benchmarks/benchmark_logger.py
+    python research/testing/benchmarks/benchmark_logger.py --bars 500000
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+
+import numpy as np
+
+project_root = Path(__file__).resolve().parent.parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+
+def legacy_write_debug(path: str, message: str):
+    """The previous SystemLogger._write_debug: one open/close per message."""
+    try:
+        with open(path, "a") as f:
+            f.write(f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')} {message}\n")
+    except Exception:
+        pass
+
+
+def run(mode: str, bars: int, values: np.ndarray) -> tuple:
+    """Log one line per bar; return (caller seconds, drain seconds)."""
+    from src.logger import SystemLogger
+
+    logger = SystemLogger(SystemLogger.QUIET, debug_file=(mode != "disabled"))
+    path = logger.debug_file_path
+
+    start = time.perf_counter()
+    if mode == "legacy":
+        for i in range(bars):
+            car_val, sig_val = values[i, 0], values[i, 1]
+            legacy_write_debug(path, f"[FLOW] [SIGNAL] Carrier Alignment: {car_val:.4f} | Signal: {sig_val:.4f} | Result: HOLD")
+    elif mode == "queued":
+        for i in range(bars):
+            car_val, sig_val = values[i, 0], values[i, 1]
+            logger.info(f"[SIGNAL] Carrier Alignment: {car_val:.4f} | Signal: {sig_val:.4f} | Result: HOLD")
+    elif mode == "lazy":
+        for i in range(bars):
+            logger.info("[SIGNAL] Carrier Alignment: %.4f | Signal: %.4f | Result: %s", values[i, 0], values[i, 1], "HOLD")
+    else:
+        log_bars = logger.enabled(logger.VERBOSE)
+        for i in range(bars):
+            if log_bars:
+                logger.info("[SIGNAL] Carrier Alignment: %.4f | Signal: %.4f | Result: %s", values[i, 0], values[i, 1], "HOLD")
+    caller = time.perf_counter() - start
+
+    start = time.perf_counter()
+    logger.close()
+    drain = time.perf_counter() - start
+    return caller, drain
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark SystemLogger per-bar logging cost")
+    parser.add_argument("--bars", type=int, default=200_000)
+    args = parser.parse_args()
+
+    values = np.random.default_rng(42).random((args.bars, 2))
+    print(f"Bars: {args.bars:,} (one telemetry line per bar)")
+    print(f"{'Mode':<10} {'Caller s':>10} {'ns/bar':>10} {'Drain s':>10} {'Total s':>10}")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        cwd = os.getcwd()
+        os.chdir(tmp)
+        try:
+            results = {}
+            for mode in ("legacy", "queued", "lazy", "disabled"):
+                caller, drain = run(mode, args.bars, values)
+                results[mode] = caller
+                print(f"{mode:<10} {caller:>10.3f} {caller / args.bars * 1e9:>10.0f} {drain:>10.3f} {caller + drain:>10.3f}")
+        finally:
+            os.chdir(cwd)
+
+    print(f"\nCaller-side speedup vs legacy: queued {results['legacy'] / results['queued']:.1f}x, "
+          f"lazy {results['legacy'] / results['lazy']:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
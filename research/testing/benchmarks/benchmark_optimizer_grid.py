@@ -0,0 +1,113 @@
+"""
+Benchmark - optimize_alpha_weights Grid Evaluation
+==================================================
+Compares the legacy per-combination loop (pandas Series + median / spearmanr per
+combo) with the batched alpha-matrix scoring in src/optimizer.py across grid
+sizes (weight_step) and feature counts.
+
+Usage:
+    python research/testing/benchmarks/benchmark_optimizer_grid.py
+    python research/testing/benchmarks/benchmark_optimizer_grid.py --bars 1170 --steps 0.1 0.05 --metric ic
+"""
+
+import argparse
+import itertools
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+from scipy.stats import spearmanr
+
+project_root = Path(__file__).resolve().parent.parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.optimizer import generate_weight_grid, optimize_alpha_weights
+
+
+def make_features(n: int, n_features: int, seed: int = 42) -> pd.DataFrame:
+    """Synthetic feature frame with a weak forward-return signal."""
+    rng = np.random.default_rng(seed)
+    features = rng.normal(size=(n, n_features)).cumsum(axis=0)
+    df = pd.DataFrame(features, columns=[f"f{i}" for i in range(n_features)])
+    df["log_return"] = 0.0005 * np.tanh(df["f0"].diff().fillna(0.0)) + rng.normal(0.0, 0.001, n)
+    return df
+
+
+def time_legacy_grid(df: pd.DataFrame, feature_cols: list, metric: str, weight_step: float) -> float:
+    """Legacy path: one pandas Series and one median/spearmanr per weight combination."""
+    start = time.perf_counter()
+    working_df = df[feature_cols + ["log_return"]].copy()
+    working_df["forward_return"] = working_df["log_return"].shift(-15)
+    working_df = working_df.dropna()
+
+    normalized = {}
+    for col in feature_cols:
+        rolling_min = working_df[col].rolling(window=252, min_periods=20).min()
+        rolling_max = working_df[col].rolling(window=252, min_periods=20).max()
+        normalized[col] = ((working_df[col] - rolling_min) / (rolling_max - rolling_min).replace(0, np.inf)).fillna(
+            0.5
+        )
+
+    for weights in generate_weight_grid(len(feature_cols), weight_step):
+        alpha_score = sum(weights[i] * normalized[feature_cols[i]] for i in range(len(feature_cols)))
+        if metric == "hit_rate":
+            signal = np.where(alpha_score > alpha_score.median(), 1, -1)
+            ((signal * working_df["forward_return"].values) > 0).mean()
+        else:
+            spearmanr(alpha_score, working_df["forward_return"])
+    return time.perf_counter() - start
+
+
+def time_batched_grid(df: pd.DataFrame, feature_cols: list, metric: str, weight_step: float) -> float:
+    """New path: optimize_alpha_weights() scoring all combinations as one alpha matrix."""
+    start = time.perf_counter()
+    optimize_alpha_weights(df, feature_cols=feature_cols, metric=metric, weight_step=weight_step)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Optimizer grid evaluation benchmark")
+    parser.add_argument("--bars", type=int, nargs="+", default=[1_170, 20_000], help="Window sizes (1,170 = 3-day IS)")
+    parser.add_argument("--steps", type=float, nargs="+", default=[0.1, 0.05, 0.02])
+    parser.add_argument("--features", type=int, nargs="+", default=[3, 4])
+    parser.add_argument("--metric", choices=["hit_rate", "ic"], default="hit_rate")
+    parser.add_argument("--legacy-max-combos", type=int, default=1500, help="Skip the legacy loop above this grid size")
+    args = parser.parse_args()
+
+    rows = []
+    for n_bars, n_features in itertools.product(args.bars, args.features):
+        df = make_features(n_bars, n_features)
+        feature_cols = [f"f{i}" for i in range(n_features)]
+        for step in args.steps:
+            n_combos = len(generate_weight_grid(n_features, step))
+            legacy = (
+                time_legacy_grid(df, feature_cols, args.metric, step)
+                if n_combos <= args.legacy_max_combos
+                else float("nan")
+            )
+            batched = time_batched_grid(df, feature_cols, args.metric, step)
+            rows.append(
+                {
+                    "bars": n_bars,
+                    "features": n_features,
+                    "weight_step": step,
+                    "combos": n_combos,
+                    "legacy_s": legacy,
+                    "batched_s": batched,
+                    "speedup": legacy / batched if not np.isnan(legacy) else float("nan"),
+                }
+            )
+
+    results = pd.DataFrame(rows)
+    print("\n" + "=" * 80)
+    print(f"[BENCHMARK] Optimizer Grid Evaluation (metric={args.metric})")
+    print("=" * 80)
+    print(results.to_string(index=False, float_format=lambda x: f"{x:,.4f}"))
+    print("=" * 80)
+    return results
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""
+Benchmark - Polling vs Event-Driven Order Fills
+===============================================
+Submits a basket of marketable limit orders to a local FakeBroker whose fills
+arrive after a scripted latency, and waits for every fill with:
+
+- polling: async_execute_trade without an order manager (execute_trade in a
+  worker thread, get_order every 1s for up to 10s)
+- events:  async_execute_trade with an OrderManager (fills resolved from the
+  trade-updates stream)
+
+Reports wall time until the whole basket is confirmed filled and the REST calls
+made while waiting (get_order / cancel_order).
+
+Usage:
+    python research/testing/benchmarks/benchmark_order_manager.py
+    python research/testing/benchmarks/benchmark_order_manager.py --tickers 20 --latency 0.3
+"""
+
+import argparse
+import asyncio
+import contextlib
+import io
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+project_root = Path(__file__).resolve().parent.parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.executor import AlpacaTradingClient, async_execute_trade
+from src.order_manager import FakeBroker, OrderManager
+
+
+async def run_basket(symbols, latency: float, event_driven: bool) -> dict:
+    quotes = {s: (99.99, 100.00) for s in symbols}
+    broker = FakeBroker(latency=latency, quotes=quotes, equity=1_000_000.0)
+    client = AlpacaTradingClient(api=broker)
+    manager = OrderManager(broker, broker)
+    await manager.start()  # Polling also needs the fake stream running to emit fills
+    broker.wait_ready()
+
+    allocation_pct = 1.0 / len(symbols)
+    start = time.perf_counter()
+    results = await asyncio.gather(
+        *(
+            async_execute_trade(client, 1, s, allocation_pct, order_manager=manager if event_driven else None)
+            for s in symbols
+        )
+    )
+    elapsed = time.perf_counter() - start
+    manager.stop()
+
+    filled = sum(r.get("status") == "FILLED" for r in results)
+    return {
+        "elapsed": elapsed,
+        "filled": filled,
+        "get_order": broker.calls.get("get_order", 0),
+        "cancel_order": broker.calls.get("cancel_order", 0),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark polling vs event-driven order fills")
+    parser.add_argument("--tickers", type=int, default=10)
+    parser.add_argument("--latency", type=float, default=0.15, help="Seconds from submission to fill")
+    args = parser.parse_args()
+
+    symbols = [f"SYM{i}" for i in range(args.tickers)]
+    os.chdir(tempfile.mkdtemp())  # executor writes live_trades.log to the working directory
+
+    print(f"Tickers: {args.tickers} | broker fill latency: {args.latency * 1000:.0f} ms")
+    print(f"{'Mode':<10} {'Basket s':>9} {'Filled':>7} {'get_order':>10} {'cancel':>7}")
+    for label, event_driven in (("polling", False), ("events", True)):
+        with contextlib.redirect_stdout(io.StringIO()):  # executor telemetry
+            stats = asyncio.run(run_basket(symbols, args.latency, event_driven))
+        print(
+            f"{label:<10} {stats['elapsed']:>9.2f} {stats['filled']:>7} "
+            f"{stats['get_order']:>10} {stats['cancel_order']:>7}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,137 @@
+"""
+Benchmark - Cross-Sectional Selloff Scan
+========================================
+Compares SelloffDetector's per-symbol scan loop (one bars request and one Python
+pass per symbol, full session refetched every scan) with the batched scan (one
+multi-symbol request per 100 symbols, only new bars after the first scan, NumPy
+masks across the universe). A fake data client serves synthetic 1-minute bars
+and adds a fixed round-trip latency per request.
+
+Usage:
+    python research/testing/benchmarks/benchmark_selloff_scan.py
+    python research/testing/benchmarks/benchmark_selloff_scan.py --symbols 500 --scans 30 --latency-ms 40
+"""
+
+import argparse
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+
+project_root = Path(__file__).resolve().parent.parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from research.bear_trap_ml_scanner.scanner import selloff_detector
+from research.bear_trap_ml_scanner.scanner.selloff_detector import SelloffDetector
+
+SESSION = pd.date_range("2024-04-09 09:30", "2024-04-09 15:59", freq="1min", tz="America/New_York")
+
+
+def make_bars(n_symbols: int, seed: int = 42) -> dict:
+    """Per-symbol synthetic session bars as SimpleNamespace lists (the Alpaca BarSet shape)."""
+    rng = np.random.default_rng(seed)
+    timestamps = [ts.to_pydatetime() for ts in SESSION.tz_convert("UTC")]
+    bars = {}
+    for i in range(n_symbols):
+        close = 50.0 * np.exp(np.cumsum(rng.normal(-0.0003, 0.003, len(SESSION))))
+        open_ = np.r_[50.0, close[:-1]]
+        volume = rng.integers(1_000, 50_000, len(SESSION)).astype(float)
+        bars[f"S{i:04d}"] = [
+            SimpleNamespace(timestamp=ts, open=o, high=max(o, c), low=min(o, c), close=c, volume=v)
+            for ts, o, c, v in zip(timestamps, open_, close, volume)
+        ]
+    return bars
+
+
+class LatencyDataClient:
+    """Serves bars up to `now` for the requested window, sleeping `latency` per request."""
+
+    def __init__(self, bars: dict, latency: float):
+        self.bars = bars
+        self.latency = latency
+        self.now = None
+        self.requests = 0
+        self.bars_served = 0
+
+    def get_stock_bars(self, request):
+        time.sleep(self.latency)
+        self.requests += 1
+        symbols = request.symbol_or_symbols
+        symbols = [symbols] if isinstance(symbols, str) else symbols
+        start = pd.Timestamp(request.start).tz_localize("UTC").to_pydatetime()
+        end = min(pd.Timestamp(request.end).tz_localize("UTC"), self.now).to_pydatetime()
+        data = {}
+        for symbol in symbols:
+            data[symbol] = [bar for bar in self.bars[symbol] if start <= bar.timestamp <= end]
+            self.bars_served += len(data[symbol])
+        return SimpleNamespace(data=data)
+
+
+def run_session(bars: dict, scans, latency: float, batched: bool) -> dict:
+    """Run every scan of the session and report wall time, requests, bars and events."""
+    symbols = list(bars)
+    detector = SelloffDetector("key", "secret", threshold_pct=-5.0)
+    client = LatencyDataClient(bars, latency)
+    detector.data_client = client
+
+    events = 0
+    per_scan = []
+    for scan in scans:
+        now = scan.to_pydatetime()
+        client.now = scan.tz_convert("UTC")
+
+        class FrozenDatetime(datetime):
+            @classmethod
+            def now(cls, tz=None):
+                return now.astimezone(tz)
+
+        start = time.perf_counter()
+        if batched:
+            events += len(detector.scan_universe(symbols, now=now))
+        else:
+            with patch.object(selloff_detector, "datetime", FrozenDatetime):
+                events += len(detector.scan_universe(symbols, batched=False))
+        per_scan.append(time.perf_counter() - start)
+
+    return {
+        "total": sum(per_scan),
+        "mean": float(np.mean(per_scan)),
+        "requests": client.requests,
+        "bars": client.bars_served,
+        "events": events,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark per-symbol vs batched selloff scans")
+    parser.add_argument("--symbols", type=int, default=250)
+    parser.add_argument("--scans", type=int, default=20, help="Scans spread across the session")
+    parser.add_argument("--latency-ms", type=float, default=25.0, help="Simulated round trip per request")
+    args = parser.parse_args()
+
+    bars = make_bars(args.symbols)
+    scans = pd.date_range(SESSION[5], SESSION[-1], periods=args.scans).floor("min") + pd.Timedelta(seconds=30)
+    latency = args.latency_ms / 1000.0
+
+    print(f"Symbols: {args.symbols} | Scans: {args.scans} | Latency: {args.latency_ms:.0f} ms/request")
+    print(f"{'Mode':<12} {'Total s':>10} {'Per scan s':>12} {'Requests':>10} {'Bars':>12} {'Events':>8}")
+
+    results = {}
+    for mode, batched in (("per-symbol", False), ("batched", True)):
+        r = run_session(bars, scans, latency, batched)
+        results[mode] = r
+        print(f"{mode:<12} {r['total']:>10.2f} {r['mean']:>12.3f} {r['requests']:>10} {r['bars']:>12} {r['events']:>8}")
+
+    speedup = results["per-symbol"]["mean"] / results["batched"]["mean"]
+    print(f"\nBatched scan speedup: {speedup:.1f}x per scan")
+    if results["per-symbol"]["events"] != results["batched"]["events"]:
+        print("WARNING: event counts differ between modes")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,131 @@
+"""
+Benchmark - TradeLogger Decision Logging
+========================================
+Replays a day of BearTrapStrategy skip decisions (one log_decision per symbol
+every 10 seconds) through:
+
+- legacy:   csv.writer with open/append/close and json.dumps per call
+- buffered: TradeLogger (in-memory batches, Parquet parts on a background thread)
+
+and reports caller-side cost per call, then the time to read the day back
+(CSV text parse vs typed Parquet read) and to build the daily summary.
+
+Usage:
+    python research/testing/benchmarks/benchmark_trade_logger.py
+    python research/testing/benchmarks/benchmark_trade_logger.py --symbols 100 --hours 6.5
+"""
+
+import argparse
+import csv
+import json
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+project_root = Path(__file__).resolve().parent.parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.trade_logger import TradeLogger
+
+
+def legacy_log_decision(path: Path, **kwargs):
+    """The previous CSV TradeLogger.log_decision."""
+    with open(path, "a", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(
+            [
+                kwargs.get("timestamp", datetime.now()).isoformat(),
+                kwargs.get("symbol"),
+                kwargs.get("decision_type"),
+                kwargs.get("reason"),
+                kwargs.get("details", ""),
+                kwargs.get("current_price"),
+                json.dumps(kwargs.get("indicator_values", {})),
+                json.dumps(kwargs.get("risk_status", {})),
+            ]
+        )
+
+
+def make_decisions(n_symbols: int, hours: float, seed: int = 42) -> list:
+    """Skip decisions for every symbol every 10 seconds."""
+    rng = np.random.default_rng(seed)
+    start = datetime(2026, 1, 20, 9, 30)
+    cycles = int(hours * 360)
+    rows = []
+    for c in range(cycles):
+        ts = start + timedelta(seconds=10 * c)
+        changes = rng.normal(-3.0, 2.0, n_symbols)
+        for s in range(n_symbols):
+            change = float(changes[s])
+            rows.append(
+                dict(
+                    timestamp=ts,
+                    symbol=f"S{s:03d}",
+                    decision_type="SKIP_ENTRY",
+                    reason=f"Not down enough: {change:.1f}%",
+                    details=f"Required: -15%, Current: {change:.1f}%",
+                    current_price=20.0 + s,
+                    indicator_values={"day_change_pct": change},
+                )
+            )
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark legacy CSV vs buffered Parquet TradeLogger")
+    parser.add_argument("--symbols", type=int, default=50)
+    parser.add_argument("--hours", type=float, default=6.5)
+    args = parser.parse_args()
+
+    rows = make_decisions(args.symbols, args.hours)
+    n = len(rows)
+    print(f"Decisions: {n:,} ({args.symbols} symbols, every 10s for {args.hours}h)")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+
+        legacy_path = tmp / "bear_trap_decisions_legacy.csv"
+        start = time.perf_counter()
+        for row in rows:
+            legacy_log_decision(legacy_path, **row)
+        legacy_log = time.perf_counter() - start
+
+        start = time.perf_counter()
+        legacy_df = pd.read_csv(legacy_path, header=None)
+        legacy_df["indicators"] = [json.loads(v) for v in legacy_df[6]]
+        legacy_read = time.perf_counter() - start
+
+        logger = TradeLogger("bear_trap", log_dir=tmp / "buffered")
+        start = time.perf_counter()
+        for row in rows:
+            logger.log_decision(**row)
+        buffered_log = time.perf_counter() - start
+
+        start = time.perf_counter()
+        logger.close()
+        drain = time.perf_counter() - start
+        parts = len(list(logger.decision_log_path.glob("*.parquet")))
+
+        start = time.perf_counter()
+        df = logger.read_decisions(parse_json=True)
+        buffered_read = time.perf_counter() - start
+        assert len(df) == n and len(legacy_df) == n
+
+        start = time.perf_counter()
+        logger.create_daily_summary()
+        summary = time.perf_counter() - start
+
+    print(f"{'Mode':<10} {'Log s':>8} {'us/call':>9} {'Read day s':>11}")
+    print(f"{'legacy':<10} {legacy_log:>8.2f} {legacy_log / n * 1e6:>9.1f} {legacy_read:>11.3f}")
+    print(f"{'buffered':<10} {buffered_log:>8.2f} {buffered_log / n * 1e6:>9.1f} {buffered_read:>11.3f}")
+    print(f"\nFinal drain on close: {drain:.3f}s | parts written: {parts} | summary + compaction: {summary:.3f}s")
+    print(f"Caller-side speedup: {legacy_log / buffered_log:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
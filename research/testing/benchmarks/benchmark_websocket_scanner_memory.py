@@ -0,0 +1,163 @@
+"""
+Benchmark - WebSocketScanner Session Memory
+===========================================
+Drives WebSocketScanner._handle_bar with a synthetic full-session stream
+(N symbols x 390 one-minute Alpaca Bar objects, minute by minute) and reports
+peak RSS and per-bar handler latency for:
+
+- dict:    the previous per-symbol dict state that appended every Bar to a list
+- bounded: SessionState (flat arrays + fixed-size recent-bar ring buffers)
+
+Each mode runs in its own subprocess so peak RSS is measured independently.
+
+Usage:
+    python research/testing/benchmarks/benchmark_websocket_scanner_memory.py
+    python research/testing/benchmarks/benchmark_websocket_scanner_memory.py --symbols 8000 --minutes 390
+"""
+
+import argparse
+import json
+import resource
+import subprocess
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+import numpy as np
+
+project_root = Path(__file__).resolve().parent.parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+
+class AlertSink:
+    """Counts alerts instead of printing / writing JSON."""
+
+    def __init__(self):
+        self.alerts = 0
+
+    def send_alert(self, event, score_data):
+        self.alerts += 1
+
+    def reset_daily(self):
+        self.alerts = 0
+
+
+class DictSessionScanner:
+    """The previous WebSocketScanner session handling: a dict per symbol retaining every Bar."""
+
+    def __init__(self, threshold_pct: float):
+        from collections import defaultdict
+
+        self.threshold_pct = threshold_pct
+        self.detected = 0
+        self.session_data = defaultdict(lambda: {
+            'session_open': None,
+            'session_high': None,
+            'session_low': None,
+            'bars': [],
+            'selloff_detected': False,
+        })
+
+    async def _handle_bar(self, bar):
+        data = self.session_data[bar.symbol]
+        if data['session_open'] is None:
+            data['session_open'] = bar.open
+            data['session_high'] = bar.high
+            data['session_low'] = bar.low
+        data['session_high'] = max(data['session_high'], bar.high)
+        data['session_low'] = min(data['session_low'], bar.low)
+        data['bars'].append(bar)
+        if data['selloff_detected']:
+            return
+        drop_pct = ((bar.close - data['session_open']) / data['session_open']) * 100
+        if drop_pct <= self.threshold_pct:
+            data['selloff_detected'] = True
+            self.detected += 1
+
+
+def synthetic_stream(symbols, minutes: int, seed: int = 42):
+    """Yield Alpaca Bar objects minute by minute for every symbol (random-walk prices)."""
+    from alpaca.data.models import Bar
+
+    rng = np.random.default_rng(seed)
+    price = np.full(len(symbols), 50.0)
+    start = datetime(2024, 4, 9, 13, 30, tzinfo=timezone.utc)
+    for minute in range(minutes):
+        timestamp = start + timedelta(minutes=minute)
+        close = price * np.exp(rng.normal(-0.0002, 0.004, len(symbols)))
+        volume = rng.integers(100, 50_000, len(symbols))
+        for j, symbol in enumerate(symbols):
+            o, c = float(price[j]), float(close[j])
+            yield Bar(symbol, {
+                "t": timestamp, "o": o, "h": max(o, c), "l": min(o, c), "c": c,
+                "v": float(volume[j]), "n": 10, "vw": c,
+            })
+        price = close
+
+
+def run_mode(mode: str, n_symbols: int, minutes: int) -> dict:
+    """Stream a session through one handler and measure RSS and latency."""
+    symbols = [f"S{i:05d}" for i in range(n_symbols)]
+    threshold = -10.0
+
+    if mode == "dict":
+        scanner = DictSessionScanner(threshold)
+    else:
+        from research.bear_trap_ml_scanner.scanner.websocket_scanner import WebSocketScanner
+
+        scanner = WebSocketScanner("key", "secret", symbols, threshold_pct=threshold, alert_manager=AlertSink())
+
+    rss_start = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    latencies = np.empty(n_symbols * minutes, dtype=np.int64)
+    handler = scanner._handle_bar
+    perf = time.perf_counter_ns
+
+    for k, bar in enumerate(synthetic_stream(symbols, minutes)):
+        t0 = perf()
+        # Drive the coroutine without an event loop (the handler never awaits)
+        try:
+            handler(bar).send(None)
+        except StopIteration:
+            pass
+        latencies[k] = perf() - t0
+
+    rss_peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return {
+        "mode": mode,
+        "bars": int(len(latencies)),
+        "rss_start_mb": rss_start / 1024,
+        "rss_peak_mb": rss_peak / 1024,
+        "p50_us": float(np.percentile(latencies, 50)) / 1000,
+        "p99_us": float(np.percentile(latencies, 99)) / 1000,
+        "mean_us": float(latencies.mean()) / 1000,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark WebSocketScanner session memory and handler latency")
+    parser.add_argument("--symbols", type=int, default=5000)
+    parser.add_argument("--minutes", type=int, default=390)
+    parser.add_argument("--mode", choices=["dict", "bounded"], help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.mode:
+        print(json.dumps(run_mode(args.mode, args.symbols, args.minutes)))
+        return
+
+    print(f"Symbols: {args.symbols} | Minutes: {args.minutes} | Bars: {args.symbols * args.minutes:,}")
+    print(f"{'Mode':<10} {'RSS start MB':>13} {'RSS peak MB':>12} {'p50 us':>8} {'p99 us':>8} {'mean us':>8}")
+    for mode in ("dict", "bounded"):
+        out = subprocess.run(
+            [sys.executable, __file__, "--mode", mode, "--symbols", str(args.symbols), "--minutes", str(args.minutes)],
+            capture_output=True, text=True, check=True,
+        )
+        r = json.loads(out.stdout.strip().splitlines()[-1])
+        print(
+            f"{mode:<10} {r['rss_start_mb']:>13.1f} {r['rss_peak_mb']:>12.1f} "
+            f"{r['p50_us']:>8.2f} {r['p99_us']:>8.2f} {r['mean_us']:>8.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+"""
+Parity Tests - Incremental Rolling Bar Buffer
+
+BarBuffers seeded from the parquet cache and extended each cycle with only the
+bars since the last timestamp must give the runners exactly the look-back window
+a full refetch would, while fetching a small fraction of the bars. Uses cached
+SOFI 1-minute bars behind a fake data client.
+"""
+
+import sys
+from datetime import timedelta
+from pathlib import Path
+from types import SimpleNamespace
+
+import pandas as pd
+import pytest
+
+project_root = Path(__file__).resolve().parent.parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from alpaca.data.timeframe import TimeFrame
+from src.bar_buffer import BarBuffers, BarRingBuffer
+from src.data_cache import PartitionedBarStore
+
+BARS_FILE = project_root / "data" / "cache" / "equities" / "SOFI_1min_20240401_20240630.parquet"
+COLUMNS = ["open", "high", "low", "close", "volume"]
+
+
+@pytest.fixture(scope="module")
+def source_bars():
+    if not BARS_FILE.exists():
+        pytest.skip("Cached parquet not available")
+    bars = pd.read_parquet(BARS_FILE)[COLUMNS].loc["2024-04-01":"2024-04-10"].astype(float)
+    bars.index = bars.index.tz_localize("UTC")
+    return bars
+
+
+class FakeDataClient:
+    """Serves bars in [request.start, now] for every requested symbol (symbol B is scaled x2)."""
+
+    def __init__(self, bars):
+        self.bars = bars
+        self.now = None
+        self.requests = []
+        self.bars_served = 0
+
+    def get_stock_bars(self, request):
+        self.requests.append(request)
+        # StockBarsRequest normalizes datetimes to naive UTC
+        start = pd.Timestamp(request.start).tz_localize("UTC")
+        window = self.bars[(self.bars.index >= start) & (self.bars.index <= self.now)]
+        data = {}
+        for symbol in request.symbol_or_symbols:
+            scale = 2.0 if symbol == "B" else 1.0
+            data[symbol] = [
+                SimpleNamespace(
+                    timestamp=ts.to_pydatetime(), open=r.open * scale, high=r.high * scale,
+                    low=r.low * scale, close=r.close * scale, volume=r.volume,
+                )
+                for ts, r in zip(window.index, window.itertuples())
+            ]
+            self.bars_served += len(window)
+        return SimpleNamespace(data=data)
+
+
+def test_ring_buffer_wraps_and_replaces_last_bar(source_bars):
+    day = source_bars.loc["2024-04-02"]
+    buffer = BarRingBuffer(capacity=100)
+
+    # Overlapping chunks: only bars after the last timestamp are appended
+    for start in range(0, 518, 37):
+        buffer.extend(day.iloc[max(0, start - 5) : start + 37])
+
+    assert len(buffer) == 100
+    assert buffer.last_timestamp == day.index[517]
+    pd.testing.assert_frame_equal(buffer.to_frame(), day.iloc[418:518], check_freq=False, check_names=False)
+
+    # A re-sent last bar (still forming on the previous fetch) replaces the stored one
+    revised = day.iloc[517:519].copy()
+    revised["close"] = [1.0, 2.0]
+    assert buffer.extend(revised) == 1
+    tail = buffer.to_frame().iloc[-2:]
+    assert list(tail["close"]) == [1.0, 2.0]
+
+    since = day.index[500]
+    assert buffer.to_frame(start=since).index[0] == since
+
+
+def test_incremental_cycles_match_full_refetch(tmp_path, source_bars):
+    lookback = timedelta(minutes=45)
+    store = PartitionedBarStore(tmp_path)
+    cached = source_bars.loc[:"2024-04-09 13:59"]
+    store.write("equities", "A", "1min", cached.tz_localize(None), "2024-04-01", "2024-04-09")
+
+    client = FakeDataClient(source_bars)
+    buffers = BarBuffers(["A", "B"], TimeFrame.Minute, lookback, capacity=240, feed="sip")
+
+    # Startup on 2024-04-09 just after 14:00 UTC: A is seeded from cache, B starts empty
+    cycles = pd.date_range("2024-04-09 14:00:30", periods=120, freq="30s", tz="UTC")
+    assert buffers.seed(store, "equities", "1min", now=cycles[0]) > 0
+    assert len(buffers.buffers["A"]) and not len(buffers.buffers["B"])
+
+    full_refetch_bars = 0
+    for now in cycles:
+        client.now = now
+        buffers.update(client, now=now)
+
+        expected = source_bars[(source_bars.index >= now - lookback) & (source_bars.index <= now)]
+        full_refetch_bars += 2 * len(expected)
+        pd.testing.assert_frame_equal(
+            buffers.frame("A", now=now), expected, check_freq=False, check_names=False
+        )
+        scaled = expected.copy()
+        scaled[["open", "high", "low", "close"]] *= 2.0
+        pd.testing.assert_frame_equal(
+            buffers.frame("B", now=now), scaled, check_freq=False, check_names=False
+        )
+
+    # One batched request per cycle, each starting at the last buffered bar
+    assert len(client.requests) == len(cycles)
+    assert all(r.symbol_or_symbols == ["A", "B"] for r in client.requests)
+    assert pd.Timestamp(client.requests[-1].start).tz_localize("UTC") >= cycles[-1] - timedelta(minutes=2)
+    assert buffers.bars_fetched == client.bars_served
+    assert client.bars_served * 10 < full_refetch_bars
@@ -0,0 +1,114 @@
+"""
+Parity Tests - Batched Multi-Symbol Bar Fetch
+
+fetch_bars() must issue one multi-symbol StockBarsRequest per cycle and give,
+per symbol, exactly the frame the old per-symbol BarSet conversion in the prod
+runners built. Uses cached SOFI bars behind a fake data client.
+"""
+
+import sys
+from datetime import datetime
+from pathlib import Path
+from types import SimpleNamespace
+
+import pandas as pd
+import pytest
+
+project_root = Path(__file__).resolve().parent.parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+import src.bar_fetch as bar_fetch
+from alpaca.data.timeframe import TimeFrame
+from src.bar_fetch import fetch_bars, split_by_symbol
+
+BARS_FILE = project_root / "data" / "cache" / "equities" / "SOFI_1min_20240401_20240630.parquet"
+SYMBOLS = ["SOFI", "NVDA", "TSLA", "AMD"]
+
+
+@pytest.fixture(scope="module")
+def bar_objects():
+    if not BARS_FILE.exists():
+        pytest.skip("Cached parquet not available")
+    bars = pd.read_parquet(BARS_FILE).loc["2024-04-01":"2024-04-05"]
+    objects = {}
+    for i, symbol in enumerate(SYMBOLS):
+        # Each symbol gets a scaled, shortened copy so frames differ
+        window = bars.iloc[: len(bars) - 100 * i]
+        objects[symbol] = [
+            SimpleNamespace(
+                timestamp=ts.tz_localize("UTC").to_pydatetime(),
+                open=r.open * (i + 1),
+                high=r.high * (i + 1),
+                low=r.low * (i + 1),
+                close=r.close * (i + 1),
+                volume=float(r.volume),
+            )
+            for ts, r in zip(window.index, window.itertuples())
+        ]
+    return objects
+
+
+class FakeDataClient:
+    def __init__(self, bar_objects):
+        self.bar_objects = bar_objects
+        self.requests = []
+
+    def get_stock_bars(self, request):
+        self.requests.append(request)
+        symbols = request.symbol_or_symbols
+        symbols = [symbols] if isinstance(symbols, str) else symbols
+        return SimpleNamespace(data={s: self.bar_objects[s] for s in symbols if s in self.bar_objects})
+
+
+def per_symbol_frame(bar_list):
+    """The conversion each prod runner used to do after its own request."""
+    data = pd.DataFrame(
+        [
+            {
+                "timestamp": bar.timestamp,
+                "open": bar.open,
+                "high": bar.high,
+                "low": bar.low,
+                "close": bar.close,
+                "volume": bar.volume,
+            }
+            for bar in bar_list
+        ]
+    )
+    data.set_index("timestamp", inplace=True)
+    return data
+
+
+def test_one_request_matches_per_symbol_conversion(bar_objects):
+    client = FakeDataClient(bar_objects)
+
+    frame = fetch_bars(client, SYMBOLS + ["MISSING"], TimeFrame.Hour, start=datetime(2024, 4, 1), feed="sip")
+
+    assert len(client.requests) == 1
+    assert client.requests[0].symbol_or_symbols == SYMBOLS + ["MISSING"]
+    assert frame.index.names == ["symbol", "timestamp"]
+    assert len(frame) == sum(len(bar_objects[s]) for s in SYMBOLS)
+
+    bars = split_by_symbol(frame)
+    assert list(bars) == SYMBOLS
+    for symbol in SYMBOLS:
+        pd.testing.assert_frame_equal(bars[symbol], per_symbol_frame(bar_objects[symbol]))
+
+
+def test_large_universe_is_batched(bar_objects, monkeypatch):
+    monkeypatch.setattr(bar_fetch, "MAX_SYMBOLS_PER_REQUEST", 3)
+    client = FakeDataClient(bar_objects)
+
+    frame = fetch_bars(client, SYMBOLS, TimeFrame.Minute, start=datetime(2024, 4, 1))
+
+    assert [r.symbol_or_symbols for r in client.requests] == [SYMBOLS[:3], SYMBOLS[3:]]
+    assert list(split_by_symbol(frame)) == SYMBOLS
+
+
+def test_empty_barset():
+    client = FakeDataClient({})
+
+    frame = fetch_bars(client, ["SOFI"], TimeFrame.Day, start=datetime(2024, 4, 1))
+
+    assert frame.empty and list(frame.columns) == list(bar_fetch.BAR_FIELDS)
+    assert split_by_symbol(frame) == {}
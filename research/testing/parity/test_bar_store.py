@@ -0,0 +1,122 @@
+"""
+Parity Tests - Range-Aware Partitioned Bar Store
+
+Sub-ranges and extended ranges must be answered from existing month partitions,
+fetching only the missing gaps, and must return exactly the bars a direct fetch
+of the same range would. Uses cached SOFI 1-minute bars as the "API".
+"""
+
+import sys
+from datetime import date
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+project_root = Path(__file__).resolve().parent.parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+import src.data_cache as data_cache
+from src.data_cache import DataCache, PartitionedBarStore, merge_ranges, subtract_ranges
+
+BARS_FILE = project_root / "data" / "cache" / "equities" / "SOFI_1min_20240401_20240630.parquet"
+
+
+@pytest.fixture(scope="module")
+def source_bars():
+    if not BARS_FILE.exists():
+        pytest.skip("Cached parquet not available")
+    return pd.read_parquet(BARS_FILE)
+
+
+def direct(bars: pd.DataFrame, start: str, end: str) -> pd.DataFrame:
+    """Bars a fresh fetch of [start, end] (end inclusive) returns."""
+    end_excl = pd.Timestamp(end) + pd.Timedelta(days=1)
+    return bars[(bars.index >= pd.Timestamp(start)) & (bars.index < end_excl)]
+
+
+class CountingFetcher:
+    def __init__(self, bars):
+        self.bars = bars
+        self.calls = []
+
+    def __call__(self, start, end):
+        self.calls.append((start, end))
+        return direct(self.bars, start, end)
+
+
+def test_range_helpers():
+    d = date
+    assert merge_ranges([(d(2024, 4, 10), d(2024, 4, 20)), (d(2024, 4, 1), d(2024, 4, 9))]) == [
+        (d(2024, 4, 1), d(2024, 4, 20))
+    ]
+    covered = [(d(2024, 4, 5), d(2024, 4, 10)), (d(2024, 4, 20), d(2024, 4, 25))]
+    assert subtract_ranges(d(2024, 4, 1), d(2024, 4, 30), covered) == [
+        (d(2024, 4, 1), d(2024, 4, 4)),
+        (d(2024, 4, 11), d(2024, 4, 19)),
+        (d(2024, 4, 26), d(2024, 4, 30)),
+    ]
+    assert subtract_ranges(d(2024, 4, 6), d(2024, 4, 9), covered) == []
+
+
+def test_sub_and_extended_ranges_fetch_only_gaps(tmp_path, source_bars):
+    store = PartitionedBarStore(tmp_path)
+    fetch = CountingFetcher(source_bars)
+
+    first = store.get_or_fetch("equities", "SOFI", "1min", "2024-04-10", "2024-05-10", fetch)
+    pd.testing.assert_frame_equal(first, direct(source_bars, "2024-04-10", "2024-05-10"), check_freq=False)
+    assert fetch.calls == [("2024-04-10", "2024-05-10")]
+
+    # Sub-range: answered from the partitions, no fetch
+    sub = store.get_or_fetch("equities", "SOFI", "1min", "2024-04-15", "2024-04-30", fetch)
+    pd.testing.assert_frame_equal(sub, direct(source_bars, "2024-04-15", "2024-04-30"), check_freq=False)
+    assert len(fetch.calls) == 1
+
+    # Extended on both sides: only the two gaps are fetched
+    wide = store.get_or_fetch("equities", "SOFI", "1min", "2024-04-01", "2024-06-14", fetch)
+    pd.testing.assert_frame_equal(wide, direct(source_bars, "2024-04-01", "2024-06-14"), check_freq=False)
+    assert fetch.calls[1:] == [("2024-04-01", "2024-04-09"), ("2024-05-11", "2024-06-14")]
+
+    assert sorted(p.name for p in store.partition_dir("equities", "SOFI", "1min").glob("*.parquet")) == [
+        "2024-04.parquet",
+        "2024-05.parquet",
+        "2024-06.parquet",
+    ]
+
+
+def test_column_projection_and_incremental_overwrite(tmp_path, source_bars):
+    store = PartitionedBarStore(tmp_path)
+    day = direct(source_bars, "2024-04-02", "2024-04-02")
+
+    # A partial day first, then the full day: overlapping timestamps are replaced, new ones appended
+    store.write("equities", "SOFI", "1min", day.iloc[: len(day) // 2] * 0.0, "2024-04-02", "2024-04-02")
+    store.write("equities", "SOFI", "1min", day, "2024-04-02", "2024-04-02")
+
+    closes = store.read("equities", "SOFI", "1min", "2024-04-02", "2024-04-02", columns=["close"])
+    assert list(closes.columns) == ["close"]
+    pd.testing.assert_frame_equal(closes, day[["close"]], check_freq=False)
+
+
+def test_data_cache_equity_uses_store_and_legacy_import(tmp_path, monkeypatch, source_bars):
+    calls = []
+
+    class FakeAlpaca:
+        def fetch_historical_bars(self, symbol, timeframe, start, end, feed="sip"):
+            calls.append((start, end))
+            return direct(source_bars, start, end)
+
+    monkeypatch.setattr(data_cache, "AlpacaDataClient", FakeAlpaca)
+    cache = DataCache(cache_dir=str(tmp_path))
+
+    # Legacy file covering April is imported; a May request then fetches only May
+    direct(source_bars, "2024-04-01", "2024-04-30").to_parquet(tmp_path / "equities" / "SOFI_1min_20240401_20240430.parquet")
+    assert cache.import_legacy_files("equities") == 1
+
+    df = cache.get_or_fetch_equity("SOFI", "1min", "2024-04-20", "2024-05-05")
+    pd.testing.assert_frame_equal(df, direct(source_bars, "2024-04-20", "2024-05-05"), check_freq=False)
+    assert calls == [("2024-05-01", "2024-05-05")]
+
+    # Weekend-only gaps are marked covered without a fetch (2024-05-11/12 is Sat/Sun)
+    cache.get_or_fetch_equity("SOFI", "1min", "2024-05-06", "2024-05-10")
+    cache.get_or_fetch_equity("SOFI", "1min", "2024-05-01", "2024-05-12")
+    assert calls == [("2024-05-01", "2024-05-05"), ("2024-05-06", "2024-05-10")]
@@ -0,0 +1,129 @@
+"""
+Parity Tests - First-Passage Bracket Exits
+
+BracketExits / long_bracket_trades must reproduce the MIDAS simulate_trade +
+run_backtest loop (df.iloc walk, SL first on same-bar touches, timeout at the
+last window close, one position at a time) for every cell of a TP x SL grid,
+including brackets truncated at the end of the data. Uses synthetic 1-minute
+MNQ-like bars.
+"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+project_root = Path(__file__).resolve().parent.parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.bracket_exits import EXIT_SL, EXIT_TIMEOUT, EXIT_TP, BracketExits, long_bracket_trades, sequential_entries
+
+MAX_HOLD_TIME = 60
+SLIPPAGE_POINTS = 2.0
+STOP_LOSS_VALUES = [8, 12, 20]
+TAKE_PROFIT_VALUES = [30, 40, 80]
+
+
+@pytest.fixture(scope="module")
+def bars():
+    rng = np.random.default_rng(7)
+    n = 6000
+    close = 18000 + np.cumsum(rng.normal(0, 6, n))
+    open_ = np.r_[close[0], close[:-1]] + rng.normal(0, 1, n)
+    high = np.maximum(open_, close) + rng.exponential(4, n)
+    low = np.minimum(open_, close) - rng.exponential(4, n)
+    df = pd.DataFrame(
+        {"open": open_, "high": high, "low": low, "close": close},
+        index=pd.date_range("2025-01-02 02:00", periods=n, freq="1min"),
+    )
+    signal = rng.random(n) < 0.05
+    signal[[n - 30, n - 2, n - 1]] = True  # Truncated windows and a signal on the last bar
+    df["Signal"] = signal
+    return df
+
+
+def legacy_simulate_trade(df, signal_idx, entry_price, tp_points, sl_points):
+    """Legacy midas_grid_search_optimizer.simulate_trade (verbatim logic)."""
+    entry_loc = df.index.get_loc(signal_idx) + 1
+    if entry_loc >= len(df):
+        return None, 0, 'SKIP', None
+    actual_entry = entry_price + SLIPPAGE_POINTS
+    tp_price = actual_entry + tp_points
+    sl_price = actual_entry - sl_points
+    for i in range(entry_loc, min(entry_loc + MAX_HOLD_TIME, len(df))):
+        bar = df.iloc[i]
+        bars_held = i - entry_loc + 1
+        sl_hit = bar['low'] <= sl_price
+        tp_hit = bar['high'] >= tp_price
+        if sl_hit:
+            return -sl_points - SLIPPAGE_POINTS, bars_held, 'SL', df.index[i]
+        if tp_hit:
+            return tp_points - SLIPPAGE_POINTS, bars_held, 'TP', df.index[i]
+    last_idx = min(entry_loc + MAX_HOLD_TIME - 1, len(df) - 1)
+    exit_price = df.iloc[last_idx]['close'] - SLIPPAGE_POINTS
+    return exit_price - actual_entry, MAX_HOLD_TIME, 'TO', df.index[last_idx]
+
+
+def legacy_run_backtest(df, tp_points, sl_points):
+    """Legacy run_backtest loop, reduced to the columns the engine produces."""
+    trades = []
+    last_exit_bar = -1
+    for signal_idx in df.index[df['Signal']]:
+        signal_loc = df.index.get_loc(signal_idx)
+        if signal_loc <= last_exit_bar:
+            continue
+        entry_loc = signal_loc + 1
+        if entry_loc >= len(df):
+            continue
+        entry_price = df.iloc[entry_loc]['open']
+        pnl_points, hold_time, exit_type, exit_time = legacy_simulate_trade(df, signal_idx, entry_price, tp_points, sl_points)
+        trades.append((signal_idx, exit_time, entry_price + SLIPPAGE_POINTS, pnl_points, hold_time, exit_type))
+        last_exit_bar = entry_loc + hold_time
+    return pd.DataFrame(trades, columns=['signal_time', 'exit_time', 'entry_price', 'pnl_points', 'hold_time', 'exit_type'])
+
+
+def test_grid_matches_legacy_loop(bars):
+    engine = BracketExits(bars['high'], bars['low'], bars['close'], MAX_HOLD_TIME)
+    cells = long_bracket_trades(
+        engine, np.flatnonzero(bars['Signal']), bars['open'], TAKE_PROFIT_VALUES, STOP_LOSS_VALUES, SLIPPAGE_POINTS
+    )
+    assert len(cells) == len(STOP_LOSS_VALUES) * len(TAKE_PROFIT_VALUES)
+
+    for sl in STOP_LOSS_VALUES:
+        for tp in TAKE_PROFIT_VALUES:
+            expected = legacy_run_backtest(bars, tp, sl)
+            cell = cells[(sl, tp)]
+            result = pd.DataFrame({
+                'signal_time': bars.index[cell['signal_loc']],
+                'exit_time': bars.index[cell['exit_loc']],
+                'entry_price': cell['entry_price'],
+                'pnl_points': cell['pnl_points'],
+                'hold_time': cell['hold_time'],
+                'exit_type': cell['exit_type'],
+            })
+            pd.testing.assert_frame_equal(result, expected, check_dtype=False)
+            assert set(expected['exit_type']) == {'TP', 'SL', 'TO'}
+
+
+def test_first_touch_ties_and_truncation():
+    high = np.array([10.0, 11.0, 15.0, 12.0, 20.0])
+    low = np.array([9.0, 8.0, 5.0, 9.0, 9.0])
+    close = np.array([9.5, 10.0, 10.0, 11.0, 19.0])
+    engine = BracketExits(high, low, close, max_hold=3)
+
+    np.testing.assert_array_equal(engine.forward_max_high, [15.0, 15.0, 20.0, 20.0, 20.0])
+    np.testing.assert_array_equal(engine.forward_min_low, [5.0, 5.0, 5.0, 9.0, 9.0])
+    np.testing.assert_array_equal(engine.first_touch([0, 3], [[11.0, 16.0], [19.0, 25.0]], "high"), [[1, 3], [1, 3]])
+
+    # Bar 2 touches both: SL wins; entry 3 has a 2-bar window and times out on bar 4's close
+    exit_locs, exit_types = engine.exits([0, 1, 3], tp_prices=[14.0, 14.0, 25.0], sl_prices=[6.0, 7.0, 1.0])
+    np.testing.assert_array_equal(exit_locs[:, 0], [2, 2, 4])
+    np.testing.assert_array_equal(exit_types[:, 0], [EXIT_SL, EXIT_SL, EXIT_TIMEOUT])
+
+    exit_locs, exit_types = engine.grid([0], [10.0], tp_points=[1.0, 4.0], sl_points=[3.0, 6.0])
+    np.testing.assert_array_equal(exit_types[0], [[EXIT_TP, EXIT_SL], [EXIT_TP, EXIT_TP]])
+    np.testing.assert_array_equal(exit_locs[0], [[1, 2], [1, 2]])
+
+    np.testing.assert_array_equal(sequential_entries([0, 1, 4, 5, 9], [4, 5, 7, 8, 12]), [True, False, False, True, True])
@@ -0,0 +1,117 @@
+"""
+Parity Tests - Vectorized Carrier-Wave Filter and Shared Multi-Timeframe RSI
+
+carrier_wave_confluence() as array operations must produce the same
+'carrier_signal' column as the legacy per-bar df.loc loop, add_wavelet_signals()
+must be unchanged, and the 60-minute resample + RSI must be computed once per
+frame across the carrier, wavelet and master-signal paths. Uses cached SOFI
+1-minute bars resampled to 5 minutes.
+"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+project_root = Path(__file__).resolve().parent.parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+import src.features as features
+from src.features import add_wavelet_signals, calculate_rsi, carrier_wave_confluence, multi_timeframe_rsi
+
+BARS_FILE = project_root / "data" / "cache" / "equities" / "SOFI_1min_20240401_20240630.parquet"
+
+
+@pytest.fixture(scope="module")
+def bars_5min():
+    if not BARS_FILE.exists():
+        pytest.skip("Cached parquet not available")
+    bars = pd.read_parquet(BARS_FILE)[["open", "high", "low", "close", "volume"]]
+    return bars.resample("5Min").agg({"open": "first", "high": "max", "low": "min", "close": "last", "volume": "sum"}).dropna()
+
+
+def legacy_resampled_rsi(close, rule):
+    """Legacy inline resample + RSI + forward-fill (None when too short)."""
+    resampled = close.resample(rule).last().dropna()
+    if len(resampled) < 14:
+        return None
+    return calculate_rsi(resampled, period=14).reindex(close.index, method="ffill")
+
+
+def legacy_carrier_signal(df):
+    """Legacy per-bar loop from carrier_wave_confluence (telemetry removed, logic verbatim)."""
+    rsi_5 = calculate_rsi(df["close"], period=14)
+    signal_alpha = (rsi_5 / 100.0).fillna(0.5)
+    rsi_60 = legacy_resampled_rsi(df["close"], "60Min")
+    carrier_alpha = (rsi_60 / 100.0) if rsi_60 is not None else pd.Series(0.5, index=df.index)
+    carrier_alpha = carrier_alpha.fillna(0.5)
+
+    signal_polarity = np.sign(signal_alpha - 0.5)
+    carrier_polarity = np.sign(carrier_alpha - 0.5)
+    out = df.copy()
+    out["carrier_signal"] = 0
+    for idx in out.index:
+        sig_pol = signal_polarity.loc[idx]
+        car_pol = carrier_polarity.loc[idx]
+        sig_val = signal_alpha.loc[idx]
+        if (sig_pol * car_pol) < 0:
+            out.loc[idx, "carrier_signal"] = 0
+        elif sig_val > 0.6:
+            out.loc[idx, "carrier_signal"] = 1
+        elif sig_val < 0.4:
+            out.loc[idx, "carrier_signal"] = -1
+        else:
+            out.loc[idx, "carrier_signal"] = 0
+    return out["carrier_signal"]
+
+
+@pytest.mark.parametrize("bars", [3000, 60])  # 60 bars = 5 hours: 60-minute fallback path
+def test_carrier_signal_matches_legacy_loop(bars_5min, bars):
+    df = bars_5min.iloc[:bars].copy()
+    expected = legacy_carrier_signal(df)
+    result = carrier_wave_confluence(df.copy())["carrier_signal"]
+    pd.testing.assert_series_equal(result, expected)
+    assert set(result.unique()) <= {-1, 0, 1}
+
+
+def test_multi_timeframe_rsi_matches_inline_resample(bars_5min):
+    close = bars_5min["close"].iloc[:3000]
+    rsi = multi_timeframe_rsi(close, rules=(None, "15Min", "60Min"))
+    pd.testing.assert_series_equal(rsi[None], calculate_rsi(close, period=14))
+    for rule in ("15Min", "60Min"):
+        pd.testing.assert_series_equal(rsi[rule], legacy_resampled_rsi(close, rule))
+    assert multi_timeframe_rsi(close.iloc[:40], rules=("60Min",))["60Min"] is None
+
+    # add_wavelet_signals on the shared helper: same formula as the inline version
+    df = add_wavelet_signals(bars_5min.iloc[:3000].copy())
+    rsi_5, rsi_15, rsi_60 = (rsi[r].fillna(50.0) for r in (None, "15Min", "60Min"))
+    macro = rsi_60.mean() / 100.0
+    multiplier = 1.0 + (macro - 0.6) * 2.5 if macro > 0.6 else 1.0 - (0.4 - macro) * 2.5 if macro < 0.4 else 1.0
+    expected = (((rsi_5 * 0.2) + (rsi_15 * 0.3) + (rsi_60 * 0.5)) / 100.0 * multiplier).clip(0.0, 1.0)
+    pd.testing.assert_series_equal(df["wavelet_alpha"], expected, check_names=False)
+
+
+def test_resample_computed_once_per_frame(bars_5min, monkeypatch):
+    calls = []
+    timeframe_rsi = features._timeframe_rsi
+
+    def counting(close, rule, period):
+        calls.append(rule)
+        return timeframe_rsi(close, rule, period)
+
+    monkeypatch.setattr(features, "_timeframe_rsi", counting)
+    features._MTF_RSI_CACHE.clear()
+
+    df = bars_5min.iloc[:2000].copy()
+    add_wavelet_signals(df)
+    carrier_wave_confluence(df)
+    multi_timeframe_rsi(df["close"], rules=("60Min",))
+    assert sorted(calls, key=str) == sorted([None, "15Min", "60Min"], key=str)
+
+    # Different closes are a different frame
+    shifted = df.copy()
+    shifted["close"] *= 1.01
+    carrier_wave_confluence(shifted)
+    assert len(calls) == 5
@@ -0,0 +1,136 @@
+"""
+Parity Tests - Feature-Once, Slice-Many Rolling Backtest
+
+Windows sliced from build_feature_matrix() must match per-window recomputation
+(build_window_features()) wherever the features are strictly causal: every column
+for a window that starts with the data, and the finite look-back columns for
+every later window. Sentiment is recomputed per window, so it matches everywhere
+and never depends on bars or news after the window (the news-frequency proxy
+used for constant sentiment z-scores over the frame it is given). Columns with
+longer memory than the window (EWM RSI, 252-bar normalization) must be reported
+by compare_window_features().
+"""
+
+import pickle
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+project_root = Path(__file__).resolve().parent.parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.backtester_pro import (
+    CAUSAL_FEATURE_COLS,
+    WINDOW_FEATURE_COLS,
+    build_feature_matrix,
+    build_window_features,
+    compare_window_features,
+    slice_window_features,
+)
+
+BARS_FILE = project_root / "data" / "cache" / "equities" / "SOFI_1min_20240401_20240630.parquet"
+NEWS_FILE = project_root / ".cache" / "fmp_news" / "0b2ca7e5163ebfe0513b0167fdc46807.pkl"
+
+TOLERANCE = 1e-9
+FINITE_LOOKBACK_COLS = ["log_return", "volatility_14", "volume_zscore"]
+IN_SAMPLE_DAYS = 3
+
+
+@pytest.fixture(scope="module")
+def bars_and_news():
+    if not BARS_FILE.exists() or not NEWS_FILE.exists():
+        pytest.skip("Cached bars/news not available")
+    bars = pd.read_parquet(BARS_FILE)[["open", "high", "low", "close", "volume"]]
+    bars = bars[bars.index < "2024-05-01"]
+    with NEWS_FILE.open("rb") as f:
+        news_list = pickle.load(f)
+    return bars, news_list
+
+
+def window_range(bars: pd.DataFrame, first_day: int, num_days: int):
+    days = bars.index.normalize().unique()
+    start = days[first_day].strftime("%Y-%m-%d")
+    end = (days[first_day + num_days - 1] + pd.Timedelta(days=1)).strftime("%Y-%m-%d")
+    return start, end
+
+
+def recompute(bars, news_list, start, end):
+    return build_window_features(bars[(bars.index >= start) & (bars.index < end)], news_list, "SOFI")
+
+
+def test_window_at_data_start_matches_on_all_causal_columns(bars_and_news):
+    bars, news_list = bars_and_news
+    start, end = window_range(bars, 0, IN_SAMPLE_DAYS)
+    feature_matrix = build_feature_matrix(bars[bars.index < end], news_list, "SOFI")
+
+    sliced = slice_window_features(feature_matrix, news_list, start, end, "SOFI")
+    recomputed = recompute(bars, news_list, start, end)
+
+    diffs = compare_window_features(sliced, recomputed)
+    assert set(diffs) == set(CAUSAL_FEATURE_COLS + WINDOW_FEATURE_COLS)
+    assert all(diff <= TOLERANCE for diff in diffs.values()), diffs
+
+    # Same frame in, same master signal out
+    pd.testing.assert_series_equal(sliced["signal"], recomputed["signal"])
+
+
+def test_later_windows_match_on_finite_lookback_columns(bars_and_news):
+    bars, news_list = bars_and_news
+    feature_matrix = build_feature_matrix(bars, news_list, "SOFI")
+    num_days = bars.index.normalize().nunique()
+
+    flagged = set()
+    for first_day in range(1, num_days - IN_SAMPLE_DAYS, 4):
+        for span in (IN_SAMPLE_DAYS, 1):
+            start, end = window_range(bars, first_day, span)
+            sliced = slice_window_features(feature_matrix, news_list, start, end, "SOFI", master_signal=False)
+            diffs = compare_window_features(sliced, recompute(bars, news_list, start, end))
+
+            for col in FINITE_LOOKBACK_COLS + WINDOW_FEATURE_COLS:
+                assert diffs[col] <= TOLERANCE, (start, col, diffs[col])
+            flagged.update(col for col, diff in diffs.items() if diff > TOLERANCE)
+
+    # Per-window recomputation truncates the history of long-memory features
+    assert "rsi_14" in flagged
+    assert "volume_zscore_norm" in flagged
+    assert not flagged & set(FINITE_LOOKBACK_COLS + WINDOW_FEATURE_COLS)
+
+
+def test_constant_sentiment_proxy_does_not_see_later_news():
+    """Constant API sentiment engages the news-count proxy; later news bursts must not move earlier windows."""
+    days = pd.bdate_range("2024-04-01", periods=6)
+    index = pd.DatetimeIndex(
+        [t for day in days for t in pd.date_range(day + pd.Timedelta(hours=13, minutes=30), periods=390, freq="1min")]
+    )
+    rng = np.random.default_rng(3)
+    close = 20 * np.exp(np.cumsum(rng.normal(0, 0.001, len(index))))
+    bars = pd.DataFrame(
+        {"open": close, "high": close * 1.001, "low": close * 0.999, "close": close, "volume": rng.integers(100, 1000, len(index)).astype(float)},
+        index=index,
+    )
+    # Sparse news for the first days, a heavy burst on the last two
+    times = [day + pd.Timedelta(hours=h) for day in days[:4] for h in (14, 17)]
+    times += [day + pd.Timedelta(hours=13, minutes=40 + 3 * k) for day in days[4:] for k in range(80)]
+    news_list = [{"publishedDate": t, "sentiment": 0.5, "title": "Update"} for t in times]
+
+    start, end = days[0].strftime("%Y-%m-%d"), (days[2] + pd.Timedelta(days=1)).strftime("%Y-%m-%d")
+    full = slice_window_features(build_feature_matrix(bars, news_list, "SYN"), news_list, start, end, "SYN", master_signal=False)
+    truncated = slice_window_features(
+        build_feature_matrix(bars[bars.index < end], news_list, "SYN"), news_list, start, end, "SYN", master_signal=False
+    )
+    recomputed = recompute(bars, news_list, start, end)
+
+    assert full["sentiment"].nunique() > 1
+    for col in WINDOW_FEATURE_COLS:
+        pd.testing.assert_series_equal(full[col], truncated[col])
+        pd.testing.assert_series_equal(full[col], recomputed.loc[full.index, col])
+
+
+def test_nan_on_one_side_is_reported():
+    index = pd.date_range("2024-04-01 09:30", periods=3, freq="1min")
+    sliced = pd.DataFrame({"log_return": [0.1, float("nan"), 0.3]}, index=index)
+    recomputed = pd.DataFrame({"log_return": [0.1, 0.2, 0.3]}, index=index)
+    assert compare_window_features(sliced, recomputed) == {"log_return": float("inf")}
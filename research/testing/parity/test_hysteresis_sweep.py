@@ -0,0 +1,203 @@
+"""
+Parity Tests - RSI Hysteresis Latch and Parameter Sweep
+
+The Schmitt-trigger latch (src.hysteresis.schmitt_trigger / latch_states) must
+reproduce the per-bar loops it replaces: generate_master_signal's
+enable_hysteresis branch, StrategySimulator.simulate in scripts/simulation_testing.py
+and UniversalBacktester.run_rsi_strategy. rsi_hysteresis_sweep must give the
+same metrics as evaluating each (period, upper, lower, friction) cell on its own.
+"""
+
+import importlib.util
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+project_root = Path(__file__).resolve().parent.parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.features import FeatureEngineer, add_technical_indicators, calculate_rsi, generate_master_signal
+from src.hysteresis import latch_states, schmitt_trigger
+from src.hysteresis_sweep import SWEEP_INDEX, SWEEP_METRICS, rsi_hysteresis_sweep
+
+BARS_FILE = project_root / "data" / "cache" / "equities" / "SOFI_1min_20240401_20240630.parquet"
+
+
+def load_module(relative_path: str, name: str):
+    spec = importlib.util.spec_from_file_location(name, project_root / relative_path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.fixture(scope="module")
+def daily_close():
+    rng = np.random.default_rng(3)
+    n = 1500
+    close = 100 * np.exp(np.cumsum(rng.normal(0.0004, 0.02, n)))
+    return pd.Series(close, index=pd.bdate_range("2019-01-02", periods=n), name="close")
+
+
+def legacy_schmitt_loop(rsi_values, upper, lower, allow_shorts):
+    """Legacy generate_master_signal Schmidt Trigger loop (logic verbatim)."""
+    states = np.zeros(len(rsi_values))
+    current_state = 0
+    for i, rsi_value in enumerate(rsi_values):
+        if current_state == 0:
+            if rsi_value > upper:
+                current_state = 1
+            elif allow_shorts and rsi_value < lower:
+                current_state = -1
+        elif current_state == 1:
+            if rsi_value < lower:
+                current_state = 0
+        elif current_state == -1:
+            if rsi_value > upper:
+                current_state = 0
+        states[i] = current_state
+    return states
+
+
+@pytest.mark.parametrize("allow_shorts", [False, True])
+def test_schmitt_trigger_matches_master_signal_loop(daily_close, allow_shorts):
+    rsi = calculate_rsi(daily_close, period=14).to_numpy(copy=True)
+    rsi[[0, 1, 400, 401, 900]] = np.nan  # NaN bars hold the state
+    for upper, lower in [(55, 45), (60, 40), (50, 50)]:
+        expected = legacy_schmitt_loop(rsi, upper, lower, allow_shorts)
+        np.testing.assert_array_equal(schmitt_trigger(rsi, upper, lower, allow_shorts), expected)
+
+    if not BARS_FILE.exists():
+        pytest.skip("Cached parquet not available")
+    bars = pd.read_parquet(BARS_FILE)[["open", "high", "low", "close", "volume"]].iloc[:2000].copy()
+    bars["log_return"] = FeatureEngineer.calculate_log_return(bars)
+    bars["sentiment"] = 0.0
+    add_technical_indicators(bars)
+    node_config = {"enable_hysteresis": True, "hysteresis_upper_rsi": 58, "hysteresis_lower_rsi": 42, "allow_shorts": allow_shorts}
+    result = generate_master_signal(bars, node_config=node_config)
+    expected = legacy_schmitt_loop(result["rsi_14"].to_numpy(), 58, 42, allow_shorts)
+    np.testing.assert_array_equal(result["position_state"].to_numpy(), expected)
+    assert result["signal"].dtype == np.float64 and (result["signal"].to_numpy() == expected).all()
+
+
+def test_latch_states_batched_columns(daily_close):
+    rsi = calculate_rsi(daily_close, period=21).to_numpy()[:, None]
+    uppers = np.array([52.0, 55.0, 60.0, 70.0])
+    lowers = np.array([48.0, 45.0, 40.0, 30.0])
+    batched = latch_states(rsi > uppers, rsi < lowers)
+    assert batched.shape == (len(rsi), 4)
+    for k in range(4):
+        np.testing.assert_array_equal(batched[:, k], legacy_schmitt_loop(rsi[:, 0], uppers[k], lowers[k], False) == 1)
+
+
+def test_simulation_testing_matches_legacy_loop(daily_close):
+    simulation_testing = load_module("scripts/simulation_testing.py", "simulation_testing")
+    sim = simulation_testing.DailyTrendHysteresisSimulator("SPY", rsi_period=21, upper_band=55, lower_band=45)
+    price_data = pd.DataFrame({"date": daily_close.index, "close": daily_close.to_numpy()})
+    equity_df, stats, trades = sim.simulate(price_data.copy())
+
+    # Legacy per-bar loop (verbatim logic)
+    price_data["rsi"] = sim.calculate_rsi(price_data["close"], 21)
+    position, equity, legacy_trades, curve = 0, sim.initial_capital, [], []
+    for i in range(len(price_data)):
+        row = price_data.iloc[i]
+        if pd.isna(row["rsi"]):
+            curve.append({"date": row["date"], "equity": equity, "position": position})
+            continue
+        if row["rsi"] > 55 and position == 0:
+            position, entry_price, entry_date = 1, row["close"], row["date"]
+        elif row["rsi"] < 45 and position == 1:
+            trade_return = (row["close"] / entry_price) - 1
+            trade_return -= 0.0005
+            equity *= 1 + trade_return
+            legacy_trades.append(
+                {"entry_date": entry_date, "exit_date": row["date"], "entry_price": entry_price,
+                 "exit_price": row["close"], "return": trade_return, "equity": equity}
+            )
+            position = 0
+        curve.append({"date": row["date"], "equity": equity, "position": position})
+
+    assert len(trades) > 10 and trades == legacy_trades
+    pd.testing.assert_frame_equal(equity_df, pd.DataFrame(curve))
+    assert stats["final_equity"] == equity
+
+
+@pytest.mark.parametrize("entry,exit_,friction", [(55, 45, 5.0), (60, 40, 0.0)])
+def test_universal_rsi_strategy_matches_legacy_loop(daily_close, entry, exit_, friction):
+    engine = load_module("research/testing/backtests/batch_scripts/universal_backtest_engine.py", "universal_backtest_engine")
+    bt = engine.UniversalBacktester(
+        {"strategy_type": "daily_trend", "symbol": "SPY", "asset_type": "equity", "test_periods": [], "friction_scenarios": []}
+    )
+    captured = {}
+    bt.calculate_metrics = lambda trades, curve, capital, df: captured.update(trades=trades, curve=curve)
+    df = daily_close.to_frame()
+    bt.run_rsi_strategy(df.copy(), entry, exit_, friction, 100)
+
+    # Legacy per-bar loop (verbatim logic)
+    df["rsi"] = bt.calculate_rsi(df["close"], period=28)
+    df["rsi_prev"] = df["rsi"].shift(1)
+    position, entry_price, entry_date, trades, curve, cash = "flat", None, None, [], [], 100000
+    for idx in range(1, len(df)):
+        current_date, current_price = df.index[idx], df.iloc[idx]["close"]
+        current_rsi, prev_rsi = df.iloc[idx]["rsi"], df.iloc[idx]["rsi_prev"]
+        if position == "flat":
+            if prev_rsi <= entry and current_rsi > entry:
+                friction_cost = (friction / 10000) * current_price * 100
+                entry_price, entry_date, position = current_price, current_date, "long"
+                cash -= (current_price * 100 + friction_cost)
+        elif position == "long":
+            if prev_rsi >= exit_ and current_rsi < exit_:
+                friction_cost = (friction / 10000) * current_price * 100
+                proceeds = current_price * 100 - friction_cost
+                trades.append({
+                    "entry_date": entry_date, "exit_date": current_date, "entry_price": entry_price,
+                    "exit_price": current_price, "pnl_dollars": proceeds - (entry_price * 100),
+                    "pnl_pct": ((current_price / entry_price) - 1) * 100,
+                    "hold_hours": (current_date - entry_date).total_seconds() / 3600,
+                })
+                cash += proceeds
+                position = "flat"
+        curve.append(cash + (current_price - entry_price) * 100 if position == "long" else cash)
+
+    assert len(trades) > 5
+    assert captured["curve"] == curve
+    assert captured["trades"][: len(trades)] == trades
+    assert len(captured["trades"]) == len(trades) + (position == "long")
+
+
+def reference_cell(close, period, upper, lower, friction_bps, periods_per_year=252):
+    """One sweep cell evaluated on its own with the legacy loop and pandas."""
+    position = pd.Series(legacy_schmitt_loop(calculate_rsi(close, period=period).to_numpy(), upper, lower, False), index=close.index)
+    held = position.shift(1).fillna(0.0)
+    net = held * close.pct_change().fillna(0.0) - friction_bps / 10000.0 * (position - held).abs()
+    equity = (1 + net).cumprod()
+    return {
+        "sharpe": net.mean() / net.std() * np.sqrt(periods_per_year) if net.std() > 0 else 0.0,
+        "total_return": equity.iloc[-1] - 1,
+        "trades": int(((position == 1) & (held == 0)).sum()),
+    }
+
+
+def test_sweep_matches_per_cell_reference(daily_close):
+    periods, uppers, lowers, frictions = [14, 28], [50, 55, 60, 65], [35, 45, 50, 55], [0, 10]
+    result = rsi_hysteresis_sweep(daily_close, periods, uppers, lowers, frictions)
+
+    assert result.index.names == SWEEP_INDEX and list(result.columns) == SWEEP_METRICS
+    n_pairs = sum(1 for u in uppers for l in lowers if l < u)
+    assert len(result) == len(periods) * n_pairs * len(frictions)
+    assert (55, 55) not in {(u, l) for _, u, l, _ in result.index}
+    assert result["trades"].dtype == np.int64
+
+    for period in periods:
+        for upper, lower in [(55, 45), (65, 35), (60, 55), (50, 35)]:
+            for friction in frictions:
+                expected = reference_cell(daily_close, period, upper, lower, friction)
+                row = result.loc[(period, upper, lower, friction)]
+                for metric in SWEEP_METRICS:
+                    assert row[metric] == pytest.approx(expected[metric], rel=1e-9, abs=1e-12), (period, upper, lower, friction, metric)
+
+    # More friction never helps
+    cube = result["total_return"].unstack("friction_bps")
+    assert (cube[10] <= cube[0] + 1e-12).all()
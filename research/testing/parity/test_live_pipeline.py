@@ -0,0 +1,159 @@
+"""
+Parity Tests - Concurrent Live Pipeline
+
+process_ticker on a LivePipeline (thread pool fetches, process pool features)
+must produce the same signals and orders as the inline pipeline that runs every
+stage serially, while a basket of slow data clients overlaps its I/O so the
+iteration takes about one ticker's fetch time rather than the sum of all of
+them. Stage timings must be recorded per ticker and summarized per iteration.
+"""
+
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+project_root = Path(__file__).resolve().parent.parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+import main
+from src.executor import AlpacaTradingClient
+from src.features import FeatureEngineer
+from src.live_pipeline import STAGES, IterationTimings, LivePipeline, compute_live_signal
+from src.order_manager import FakeBroker, OrderManager
+
+TICKERS = ["NVDA", "AAPL", "MSFT", "GOOGL", "AMZN", "META", "TSLA", "AMD"]
+
+
+def synthetic_bars(ticker: str, n: int = 400) -> pd.DataFrame:
+    rng = np.random.default_rng(sum(map(ord, ticker)))
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.002, n)))
+    open_ = np.r_[close[0], close[:-1]]
+    return pd.DataFrame(
+        {
+            "open": open_,
+            "high": np.maximum(open_, close) * 1.001,
+            "low": np.minimum(open_, close) * 0.999,
+            "close": close,
+            "volume": rng.integers(1000, 50000, n).astype(float),
+        },
+        index=pd.date_range("2024-05-06 13:30", periods=n, freq="1min"),
+    )
+
+
+class SlowAlpacaData:
+    def __init__(self, latency):
+        self.latency = latency
+
+    def fetch_historical_bars(self, symbol, timeframe, start, end, feed="sip", lookback_buffer=0):
+        time.sleep(self.latency)
+        return synthetic_bars(symbol)
+
+
+class SlowFMP:
+    def __init__(self, latency):
+        self.latency = latency
+
+    def fetch_fundamental_metrics(self, symbol):
+        time.sleep(self.latency)
+        return {"symbol": symbol, "mktCap": 1e12, "pe": 30.0, "avgVolume": 5e7}
+
+    def fetch_historical_news(self, symbol, start, end, price_df=None):
+        time.sleep(self.latency)
+        return []
+
+
+def run_basket(pipeline, latency, node_config):
+    """Run process_ticker for the whole basket against fake data clients and a fake broker."""
+    broker = FakeBroker(latency=0.01, equity=1_000_000.0)
+    trading_client = AlpacaTradingClient(api=broker)
+
+    async def basket():
+        manager = OrderManager(broker, broker)
+        await manager.start()
+        broker.wait_ready()
+        start = time.perf_counter()
+        results = await asyncio.gather(
+            *(
+                main.process_ticker(
+                    ticker=ticker,
+                    alpaca_client=SlowAlpacaData(latency),
+                    fmp_client=SlowFMP(latency),
+                    feature_engineer=FeatureEngineer(),
+                    trading_client=trading_client,
+                    node_config=dict(node_config),
+                    bar_start="2024-05-06",
+                    bar_end="2024-05-06",
+                    news_start="2024-05-02",
+                    news_end="2024-05-06",
+                    allocation_pct=1.0 / len(TICKERS),
+                    order_manager=manager,
+                    pipeline=pipeline,
+                )
+                for ticker in TICKERS
+            )
+        )
+        elapsed = time.perf_counter() - start
+        manager.stop()
+        return results, elapsed
+
+    return asyncio.run(basket())
+
+
+@pytest.fixture
+def pipeline():
+    pipeline = LivePipeline(n_tickers=len(TICKERS), cpu_workers=2)
+    yield pipeline
+    pipeline.shutdown()
+
+
+def test_process_pool_signal_matches_inline(pipeline):
+    node_config = {"rsi_lookback": 14, "alpha_weights": {"rsi_14": 0.4, "volume_zscore": 0.3, "sentiment": 0.3}}
+    metrics = {"mktCap": 1e12, "pe": 30.0, "avgVolume": 5e7}
+    for ticker in TICKERS[:3]:
+        bars = synthetic_bars(ticker)
+        inline = compute_live_signal(bars, metrics, [], node_config, ticker, main.WARMUP_BUFFER)
+        pooled = pipeline.cpu_executor.submit(compute_live_signal, bars, metrics, [], node_config, ticker, main.WARMUP_BUFFER).result()
+        assert inline == pooled and inline["signal"] in (1, -1) and inline["error"] is None
+
+
+def test_basket_overlaps_io_and_matches_inline(tmp_path, monkeypatch, pipeline):
+    monkeypatch.chdir(tmp_path)  # live_trades.log
+    latency = 0.2
+    node_config = {"rsi_lookback": 14}
+
+    inline_results, inline_elapsed = run_basket(LivePipeline(inline=True), latency, node_config)
+    results, elapsed = run_basket(pipeline, latency, node_config)
+
+    assert all(r["success"] for r in results), [r["error"] for r in results]
+    assert [r["signal"] for r in results] == [r["signal"] for r in inline_results]
+    for r, baseline in zip(results, inline_results):
+        for key in ("executed", "side", "qty", "status"):
+            assert r["trade_result"].get(key) == baseline["trade_result"].get(key)
+
+    # Inline runs 3 fetches per ticker back to back; the pipeline overlaps every ticker's I/O
+    assert inline_elapsed > 3 * latency * len(TICKERS)
+    assert elapsed < inline_elapsed / 3
+
+    timings = results[0]["timings"]
+    assert set(timings) == set(STAGES)
+    assert timings["bars"] >= latency and timings["news"] >= latency
+
+
+def test_iteration_timings_summary():
+    results = [
+        {"timings": {"bars": 0.5, "fundamentals": 0.3, "news": 0.4, "features": 0.2, "execution": 0.1}},
+        {"timings": {"bars": 0.7, "fundamentals": 0.2, "news": 0.1, "features": 0.3}},
+        RuntimeError("ticker failed"),
+    ]
+    summary = IterationTimings(results, wall=1.5)
+
+    assert summary.n_tickers == 2
+    assert summary.max_by_stage["bars"] == 0.7 and summary.max_by_stage["execution"] == 0.1
+    assert summary.serial_estimate == pytest.approx(2.8)
+    assert not summary.over_budget and IterationTimings(results, wall=61.0).over_budget
+    assert "2 tickers in 1.50s" in summary.format()
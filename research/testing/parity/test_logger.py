@@ -0,0 +1,86 @@
+"""
+Parity Tests - Buffered SystemLogger
+
+Queued debug-vault writes must land in order with the same line format as the
+synchronous writer, %-style args must format lazily, disabled levels must skip
+the file entirely, and records logged in multiprocessing workers must survive
+worker exit.
+"""
+
+import multiprocessing as mp
+import re
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+project_root = Path(__file__).resolve().parent.parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.logger import SystemLogger
+
+LINE = re.compile(r"^\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2} \[(\w+)\] (.*)$")
+
+
+def read_records(path):
+    lines = Path(path).read_text().splitlines()[2:]  # skip header + blank line
+    return [LINE.match(line).groups() for line in lines]
+
+
+def test_queued_writes_keep_order_and_format(tmp_path, monkeypatch, capsys):
+    monkeypatch.chdir(tmp_path)
+    logger = SystemLogger(SystemLogger.NORMAL)
+
+    logger.info("[SIGNAL] Carrier Alignment: %.4f | Result: %s", 0.51234, "HOLD")
+    logger.warning("low cash %d%%", 5)
+    logger.debug("raw 100%")
+    for i in range(5000):
+        logger.debug("bar %d", i)
+    logger.flush()
+
+    records = read_records(tmp_path / "debug_vault.log")
+    assert records[:3] == [
+        ("FLOW", "[SIGNAL] Carrier Alignment: 0.5123 | Result: HOLD"),
+        ("CRITICAL", "⚠️  low cash 5%"),
+        ("DEBUG", "raw 100%"),
+    ]
+    assert [r[1] for r in records[3:]] == [f"bar {i}" for i in range(5000)]
+
+    # Terminal output is formatted eagerly and follows verbosity
+    assert capsys.readouterr().out.strip() == "low cash 5%"
+    logger.close()
+    logger.debug("after close")
+    assert len(read_records(tmp_path / "debug_vault.log")) == 5003
+
+
+def test_disabled_levels_skip_formatting_and_file(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    logger = SystemLogger(SystemLogger.QUIET, debug_file=False)
+    assert not logger.enabled(SystemLogger.VERBOSE)
+    assert logger.enabled(SystemLogger.QUIET)
+
+    logger.info("never formatted %d", object())  # would raise if formatted
+    logger.flush()
+    assert not (tmp_path / "debug_vault.log").exists()
+
+    logger.set_debug_file(True)
+    assert logger.enabled(SystemLogger.VERBOSE)
+
+
+def _log_in_worker(i):
+    from src.logger import LOG
+
+    for k in range(500):
+        LOG.debug("worker %d %d", i, k)
+    return i
+
+
+def test_worker_records_flushed_on_exit(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    from src import logger as logger_module
+
+    monkeypatch.setattr(logger_module, "LOG", SystemLogger())
+    with ProcessPoolExecutor(max_workers=2, mp_context=mp.get_context("fork")) as pool:
+        assert sorted(pool.map(_log_in_worker, range(4))) == [0, 1, 2, 3]
+
+    records = read_records(tmp_path / "debug_vault.log")
+    assert len([r for r in records if r[1].startswith("worker")]) == 2000
@@ -0,0 +1,98 @@
+"""
+Parity Tests - merge_news_pit Sorted-Merge Aggregation
+
+Checks the searchsorted/cumsum PIT aggregator against the legacy per-bar
+boolean-mask path on cached FMP news (.cache/fmp_news) and on synthetic
+articles placed exactly on window boundaries.
+"""
+
+import pickle
+import sys
+from datetime import timedelta
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+project_root = Path(__file__).resolve().parent.parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.features import _pit_window_stats, _pit_window_stats_legacy, merge_news_pit
+
+NEWS_CACHE_DIR = project_root / ".cache" / "fmp_news"
+
+NEWS_FILES = [
+    "0b2ca7e5163ebfe0513b0167fdc46807.pkl",
+    "2003f4957848892cbff2add13f25ca54.pkl",
+    "42dec0b1d1608d95ad63feba8faff981.pkl",
+]
+
+
+def load_cached_news(filename: str) -> list:
+    path = NEWS_CACHE_DIR / filename
+    if not path.exists():
+        pytest.skip(f"Cached news not available: {filename}")
+    with path.open("rb") as f:
+        return pickle.load(f)
+
+
+def bars_covering(news_list: list, freq: str = "15min") -> pd.DataFrame:
+    start = min(n["publishedDate"] for n in news_list).floor("D")
+    end = max(n["publishedDate"] for n in news_list).ceil("D")
+    index = pd.date_range(start, end, freq=freq, name="timestamp")
+    return pd.DataFrame({"close": np.linspace(100.0, 110.0, len(index))}, index=index)
+
+
+def with_random_sentiment(news_list: list, seed: int = 3) -> list:
+    rng = np.random.default_rng(seed)
+    return [{**n, "sentiment": float(rng.uniform(-1.0, 1.0))} for n in news_list]
+
+
+@pytest.mark.parametrize("filename", NEWS_FILES)
+@pytest.mark.parametrize("randomize", [False, True])
+def test_sorted_pit_matches_legacy_on_cached_news(filename, randomize):
+    news_list = load_cached_news(filename)
+    if randomize:
+        news_list = with_random_sentiment(news_list)
+    bars = bars_covering(news_list)
+
+    sorted_df = merge_news_pit(bars, news_list, lookback_hours=4, pit_method="sorted")
+    legacy_df = merge_news_pit(bars, news_list, lookback_hours=4, pit_method="legacy")
+
+    # Frequency proxy (constant API sentiment) is count-based and must match exactly
+    if not randomize:
+        pd.testing.assert_frame_equal(sorted_df, legacy_df, check_exact=True)
+    else:
+        pd.testing.assert_frame_equal(sorted_df, legacy_df, check_exact=False, rtol=0, atol=1e-12)
+
+
+def test_window_bounds_are_strict_pit():
+    """Articles exactly at window_start are included, articles exactly at bar_time are excluded."""
+    bar_index = pd.date_range("2024-03-01 09:30", periods=600, freq="1min")
+    rng = np.random.default_rng(5)
+
+    on_bar = list(bar_index[::37])
+    on_window_start = [t - timedelta(hours=4) for t in bar_index[::53]]
+    random_times = list(pd.to_datetime(rng.integers(bar_index[0].value - 5 * 3600 * 10**9, bar_index[-1].value, 200)))
+    published = pd.Series(sorted(on_bar + on_window_start + random_times + on_bar[:5]))
+    sentiment = pd.Series(rng.uniform(-1.0, 1.0, len(published)))
+
+    counts, means = _pit_window_stats(bar_index, published, sentiment, timedelta(hours=4))
+    legacy_counts, legacy_means = _pit_window_stats_legacy(bar_index, published, sentiment, timedelta(hours=4))
+
+    np.testing.assert_array_equal(counts, legacy_counts)
+    np.testing.assert_allclose(means, legacy_means, rtol=0, atol=1e-12)
+
+
+def test_missing_publish_times_are_ignored():
+    bar_index = pd.date_range("2024-03-01 09:30", periods=120, freq="1min")
+    published = pd.Series(pd.to_datetime(["2024-03-01 08:00", "2024-03-01 09:45", None, "2024-03-01 10:00"]))
+    published = published.sort_values().reset_index(drop=True)
+    sentiment = pd.Series([0.2, -0.4, 0.9, 0.1])
+
+    counts, means = _pit_window_stats(bar_index, published, sentiment, timedelta(hours=4))
+    legacy_counts, legacy_means = _pit_window_stats_legacy(bar_index, published, sentiment, timedelta(hours=4))
+
+    np.testing.assert_array_equal(counts, legacy_counts)
+    np.testing.assert_allclose(means, legacy_means, rtol=0, atol=1e-12)
@@ -0,0 +1,165 @@
+"""
+Parity Tests - optimize_alpha_weights Batched Grid Evaluation
+
+Replays the legacy per-combination loop (pandas median / spearmanr per combo) on
+cached parquet bars, fed with the same shared-stage normalized features. Hit-rate scoring must select the same weights with the same
+metric; rank-IC scores must agree with spearmanr to floating-point tolerance.
+"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+from scipy.stats import spearmanr
+
+project_root = Path(__file__).resolve().parent.parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.features import FeatureEngineer, add_technical_indicators, get_normalized_features
+from src.optimizer import (
+    generate_weight_grid,
+    optimize_alpha_weights,
+    rank_ics,
+    weighted_alpha_matrix,
+)
+
+CACHE_DIR = project_root / "data" / "cache" / "equities"
+
+PARITY_FILES = [
+    "SOFI_1min_20240401_20240630.parquet",
+    "GME_1min_20240401_20240630.parquet",
+]
+
+BARS_PER_CASE = 3000
+FEATURE_COLS = ["rsi_14", "volume_zscore", "sentiment"]
+
+
+def legacy_weight_combos(weight_step):
+    """Legacy 3-feature grid construction (verbatim)."""
+    weight_options = np.arange(0.0, 1.0 + weight_step, weight_step)
+    weight_combos = []
+    for w1 in weight_options:
+        for w2 in weight_options:
+            w3 = 1.0 - w1 - w2
+            if 0.0 <= w3 <= 1.0:
+                w3 = round(w3, 2)
+                weight_combos.append((round(w1, 2), round(w2, 2), w3))
+    return list(set(weight_combos))
+
+
+def legacy_grid_scores(df, feature_cols, horizon, metric, weight_step):
+    """Legacy optimize_alpha_weights() scoring loop; returns (combos, scores, best_weights, best_metric)."""
+    working_df = df[feature_cols + ["log_return"]].copy()
+    working_df["forward_return"] = working_df["log_return"].shift(-horizon)
+    working_df = working_df.dropna()
+
+    # Same normalized inputs as the optimizer (shared normalization stage)
+    normalized = get_normalized_features(df, feature_cols).loc[working_df.index]
+
+    weight_combos = legacy_weight_combos(weight_step)
+    best_metric = -999
+    best_weights = None
+    scores = []
+    for weights in weight_combos:
+        alpha_score = sum(weights[i] * normalized[feature_cols[i]] for i in range(len(feature_cols)))
+        if metric == "hit_rate":
+            median_alpha = alpha_score.median()
+            signal = np.where(alpha_score > median_alpha, 1, -1)
+            correct = (signal * working_df["forward_return"].values) > 0
+            score = correct.mean()
+        else:
+            score, _ = spearmanr(alpha_score, working_df["forward_return"])
+            if pd.isna(score):
+                score = 0.0
+        scores.append(score)
+        if score > best_metric:
+            best_metric = score
+            best_weights = weights
+
+    return weight_combos, np.array(scores), best_weights, best_metric
+
+
+def load_feature_frame(filename: str) -> pd.DataFrame:
+    path = CACHE_DIR / filename
+    if not path.exists():
+        pytest.skip(f"Cached parquet not available: {filename}")
+
+    bars = pd.read_parquet(path)[["open", "high", "low", "close", "volume"]].iloc[:BARS_PER_CASE].copy()
+    bars["log_return"] = FeatureEngineer.calculate_log_return(bars)
+    rng = np.random.default_rng(7)
+    bars["sentiment"] = np.cumsum(rng.normal(0.0, 0.05, len(bars))).clip(-1.0, 1.0)
+    add_technical_indicators(bars)
+    return bars
+
+
+@pytest.mark.parametrize("weight_step", [0.1, 0.05, 0.02])
+def test_weight_grid_matches_legacy_order(weight_step):
+    assert generate_weight_grid(3, weight_step) == legacy_weight_combos(weight_step)
+
+
+@pytest.mark.parametrize("filename", PARITY_FILES)
+@pytest.mark.parametrize("horizon", [1, 15])
+@pytest.mark.parametrize("weight_step", [0.1, 0.05])
+def test_hit_rate_grid_matches_legacy(filename, horizon, weight_step):
+    df = load_feature_frame(filename)
+
+    result = optimize_alpha_weights(
+        df, feature_cols=FEATURE_COLS, horizon=horizon, metric="hit_rate", weight_step=weight_step
+    )
+    _, _, best_weights, best_metric = legacy_grid_scores(df, FEATURE_COLS, horizon, "hit_rate", weight_step)
+
+    assert result["optimal_weights"] == dict(zip(FEATURE_COLS, best_weights))
+    assert result["best_metric"] == best_metric
+
+
+@pytest.mark.parametrize("filename", PARITY_FILES)
+def test_rank_ic_matches_spearmanr(filename):
+    df = load_feature_frame(filename)
+    combos, legacy_scores, best_weights, best_metric = legacy_grid_scores(df, FEATURE_COLS, 15, "ic", 0.1)
+
+    working_df = df[FEATURE_COLS + ["log_return"]].copy()
+    working_df["forward_return"] = working_df["log_return"].shift(-15)
+    working_df = working_df.dropna()
+    normalized = get_normalized_features(df, FEATURE_COLS).loc[working_df.index]
+    alpha_matrix = weighted_alpha_matrix(normalized.to_numpy(), np.array(combos))
+
+    np.testing.assert_allclose(
+        rank_ics(alpha_matrix, working_df["forward_return"].to_numpy()), legacy_scores, rtol=0, atol=1e-12
+    )
+
+    result = optimize_alpha_weights(df, feature_cols=FEATURE_COLS, horizon=15, metric="ic", weight_step=0.1)
+    assert result["optimal_weights"] == dict(zip(FEATURE_COLS, best_weights))
+    assert result["best_metric"] == pytest.approx(best_metric, abs=1e-12)
+
+
+def test_rank_ic_constant_column_scores_zero():
+    alpha_matrix = np.vstack([np.ones(100), np.arange(100.0)])
+    ic = rank_ics(alpha_matrix, np.arange(100.0))
+    assert ic[0] == 0.0
+    assert ic[1] == pytest.approx(1.0)
+
+
+def test_grid_supports_more_than_three_features():
+    combos = generate_weight_grid(4, 0.25)
+    assert len(combos) == 35
+    assert all(len(c) == 4 and abs(sum(c) - 1.0) < 1e-9 for c in combos)
+
+    rng = np.random.default_rng(3)
+    df = pd.DataFrame(rng.normal(size=(500, 5)), columns=["a", "b", "c", "d", "log_return"])
+    result = optimize_alpha_weights(df, feature_cols=["a", "b", "c", "d"], horizon=1, weight_step=0.25)
+    assert result["weights_tested"] == 35
+    assert set(result["optimal_weights"]) == {"a", "b", "c", "d"}
+
+
+def test_blocked_scoring_matches_single_block(monkeypatch):
+    import src.optimizer as optimizer
+
+    df = load_feature_frame(PARITY_FILES[0])
+    full = optimize_alpha_weights(df, feature_cols=FEATURE_COLS, metric="hit_rate", weight_step=0.05)
+
+    monkeypatch.setattr(optimizer, "MAX_GRID_CELLS", 7 * len(df))
+    blocked = optimize_alpha_weights(df, feature_cols=FEATURE_COLS, metric="hit_rate", weight_step=0.05)
+
+    assert blocked == full
@@ -0,0 +1,194 @@
+"""
+Parity Tests - Event-Driven Order Manager
+
+Fills delivered on the (fake) trade-updates stream must resolve the submitting
+coroutine without any get_order polling: full fills, partial fills followed by
+a fill, rejections, and orders left open past their timeout (canceled, or
+filled during the cancel race). A basket submitted together must resolve as
+fast as its slowest order, and async_execute_trade with an order manager must
+produce the same result dict as the polling path. A dropped terminal event must
+be reconciled with one get_order call, and a dead stream must fall back to
+polling.
+"""
+
+import asyncio
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+
+project_root = Path(__file__).resolve().parent.parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.executor import AlpacaTradingClient, async_execute_trade, execute_trade
+from src.order_manager import FakeBroker, OrderManager
+
+
+def run_with_manager(broker, coro_fn, **kwargs):
+    """Start an OrderManager on the fake broker, run coro_fn(manager), then stop it."""
+
+    async def main():
+        manager = OrderManager(broker, broker, **kwargs)
+        await manager.start()
+        broker.wait_ready()
+        try:
+            return await coro_fn(manager)
+        finally:
+            manager.stop()
+
+    return asyncio.run(main())
+
+
+def test_fill_resolves_without_polling():
+    broker = FakeBroker(latency=0.05)
+    outcome = run_with_manager(broker, lambda m: m.submit("AAPL", 10, "buy", limit_price=190.01))
+
+    assert outcome["status"] == "filled" and not outcome["timed_out"]
+    assert outcome["filled_qty"] == "10" and float(outcome["filled_avg_price"]) == 190.01
+    assert outcome["events"] == ["new", "fill"]
+    assert outcome["latency"] < 1.0
+    assert broker.calls == {"submit_order": 1}
+    assert broker.positions == {"AAPL": 10}
+
+
+def test_partial_fill_then_fill():
+    script = {"TSLA": [(0.02, "partial_fill", 4, 250.0), (0.05, "fill", 10, 250.5)]}
+    broker = FakeBroker(script=script)
+    outcome = run_with_manager(broker, lambda m: m.submit("TSLA", 10, "buy", limit_price=251.0))
+
+    assert outcome["status"] == "filled"
+    assert outcome["events"] == ["new", "partial_fill", "fill"]
+    assert outcome["filled_qty"] == "10" and float(outcome["filled_avg_price"]) == 250.5
+
+
+def test_rejection_is_terminal():
+    broker = FakeBroker(script={"XYZ": [(0.01, "rejected", None, None)]})
+    outcome = run_with_manager(broker, lambda m: m.submit("XYZ", 5, "sell", limit_price=9.99))
+
+    assert outcome["status"] == "rejected" and outcome["filled_qty"] == "0"
+    assert broker.calls == {"submit_order": 1}
+
+
+def test_timeout_cancels_open_order():
+    broker = FakeBroker(script={"NVDA": []})  # Never fills
+    outcome = run_with_manager(broker, lambda m: m.submit("NVDA", 3, "buy", limit_price=900.0, timeout=0.1))
+
+    assert outcome["timed_out"] and outcome["status"] == "canceled"
+    assert broker.calls == {"submit_order": 1, "cancel_order": 1}
+    assert broker.orders[outcome["order_id"]]["status"] == "canceled"
+
+
+def test_fill_during_cancel_race_is_kept():
+    broker = FakeBroker(script={"AMD": [(0.15, "fill", None, None)]})
+    broker.cancel_order = lambda order_id: (_ for _ in ()).throw(ValueError("order is already filled"))
+    outcome = run_with_manager(broker, lambda m: m.submit("AMD", 7, "buy", limit_price=150.0, timeout=0.05))
+
+    assert outcome["timed_out"] and outcome["status"] == "filled" and outcome["filled_qty"] == "7"
+
+
+def test_dropped_fill_is_reconciled_over_rest():
+    broker = FakeBroker(script={"AAPL": [(0.02, "fill", None, None)]}, dropped={"AAPL": {"fill"}})
+    outcome = run_with_manager(
+        broker, lambda m: m.submit("AAPL", 10, "buy", limit_price=190.0, timeout=0.1), cancel_grace=0.05
+    )
+
+    assert outcome["timed_out"] and outcome["reconciled"]
+    assert outcome["status"] == "filled" and outcome["filled_qty"] == "10"
+    assert outcome["events"] == ["new"]
+    # The cancel is refused (already filled), then exactly one reconcile
+    assert broker.calls == {"submit_order": 1, "cancel_order": 1, "get_order": 1}
+
+
+def test_dead_stream_falls_back_to_polling(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)  # live_trades.log
+    monkeypatch.setattr("src.executor.time.sleep", lambda s: None)
+    broker = FakeBroker(latency=0.0, quotes={"AAPL": (189.99, 190.00)})
+    client = AlpacaTradingClient(api=broker)
+
+    async def dead_stream(manager):
+        assert manager.stream_alive()
+        broker.stop()  # The trade-updates thread exits
+        await asyncio.to_thread(manager._thread.join, 5)
+        assert not manager.stream_alive()
+
+        # Fills still happen at the broker; only the stream to this process is gone
+        thread = threading.Thread(target=broker.run, daemon=True)
+        thread.start()
+        broker.wait_ready()
+        try:
+            return await async_execute_trade(client, 1, "AAPL", 0.25, {"position_cap_usd": 50000.0}, order_manager=manager)
+        finally:
+            broker.stop()
+            thread.join(5)
+
+    result = run_with_manager(broker, dead_stream)
+    assert result["status"] == "FILLED"
+    assert broker.calls["get_order"] >= 1
+
+
+def test_start_reports_unauthenticated_stream():
+    broker = FakeBroker()
+    broker.is_authenticated = lambda: False
+
+    async def main():
+        manager = OrderManager(broker, broker, connect_timeout=0.2)
+        try:
+            return await manager.start(), manager.stream_alive()
+        finally:
+            manager.stop()
+
+    assert asyncio.run(main()) == (False, False)
+
+
+def test_batch_resolves_concurrently():
+    symbols = [f"SYM{i}" for i in range(10)]
+    script = {s: [(0.05 + 0.01 * i, "fill", None, None)] for i, s in enumerate(symbols)}
+    script["SYM9"] = [(0.01, "rejected", None, None)]
+    broker = FakeBroker(script=script)
+    orders = [{"symbol": s, "qty": 1, "side": "buy", "limit_price": 10.0} for s in symbols]
+
+    async def basket(manager):
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        outcomes = await manager.submit_batch(orders, timeout=2.0)
+        return outcomes, loop.time() - start
+
+    outcomes, elapsed = run_with_manager(broker, basket)
+    assert [o["symbol"] for o in outcomes] == symbols
+    assert [o["status"] for o in outcomes] == ["filled"] * 9 + ["rejected"]
+    assert len({o["order_id"] for o in outcomes}) == 10
+    # Serial waits would take at least the sum of the fill delays (~0.8s)
+    assert elapsed < 0.6
+
+
+def test_async_execute_trade_matches_polling_path(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)  # live_trades.log
+    monkeypatch.setattr("src.executor.time.sleep", lambda s: None)
+    config = {"position_cap_usd": 50000.0}
+
+    # Polling path: get_order sees the fill once the stream thread has emitted it
+    polled = FakeBroker(latency=0.0, quotes={"AAPL": (189.99, 190.00)})
+    polling_client = AlpacaTradingClient(api=polled)
+
+    async def polling(manager):
+        return await asyncio.to_thread(execute_trade, polling_client, 1, "AAPL", 0.25, config)
+
+    polling_result = run_with_manager(polled, polling)
+
+    broker = FakeBroker(latency=0.02, quotes={"AAPL": (189.99, 190.00)})
+    client = AlpacaTradingClient(api=broker)
+    event_result = run_with_manager(
+        broker, lambda m: async_execute_trade(client, 1, "AAPL", 0.25, config, order_manager=m)
+    )
+
+    for key in ("symbol", "signal", "executed", "qty", "side", "limit_price", "status", "rejection_reason"):
+        assert event_result[key] == polling_result[key], key
+    assert event_result["status"] == "FILLED" and event_result["qty"] == int(25000 / 190.00)
+    assert event_result["limit_price"] == 190.01
+    assert "get_order" not in broker.calls and polled.calls["get_order"] >= 1
+
+    # Position-aware logic still runs before submission: already long, nothing to buy
+    again = run_with_manager(broker, lambda m: async_execute_trade(client, 1, "AAPL", 0.25, config, order_manager=m))
+    assert not again["executed"] and again["rejection_reason"].startswith("Already LONG")
+    assert broker.calls["submit_order"] == 1
@@ -0,0 +1,152 @@
+"""
+Parity Tests - simulate_portfolio Array Equity Kernel
+
+Replays the legacy iterrows equity loop on cached parquet bars and checks that
+simulate_portfolio() and simulate_signal_matrix() reproduce every metric and the
+equity curve bit-for-bit.
+"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+project_root = Path(__file__).resolve().parent.parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.features import FeatureEngineer
+from src.pnl_tracker import calculate_max_drawdown, calculate_sharpe_ratio, simulate_portfolio, simulate_signal_matrix
+
+CACHE_DIR = project_root / "data" / "cache" / "equities"
+
+PARITY_FILES = [
+    "SOFI_1min_20240401_20240630.parquet",
+    "NVDA_1hour_20240101_20251231.parquet",
+]
+
+BARS_PER_CASE = 3000
+
+# (initial_capital, friction_bps, max_position_dollars)
+CASES = [
+    (100000.0, 0.0, None),
+    (100000.0, 1.5, 100000),
+    (250000.0, 2.5, 100000.0),
+    (50000.0, 1.5, 25000.0),
+]
+
+
+def legacy_simulate_portfolio(df, initial_capital=100000.0, friction_bps=0.0, max_position_dollars=None):
+    """Legacy simulate_portfolio() (iterrows equity loop, logic verbatim)."""
+    working_df = df[["close", "signal", "log_return"]].copy()
+    working_df = working_df.dropna()
+
+    friction_decimal = friction_bps / 10000.0
+    working_df["signal_execution"] = working_df["signal"].shift(1).fillna(0)
+    working_df["signal_change"] = working_df["signal_execution"].diff().fillna(0) != 0
+    working_df["position_return"] = working_df["signal_execution"] * working_df["log_return"]
+    working_df["friction_cost"] = working_df["signal_change"] * friction_decimal
+    working_df["net_return"] = working_df["position_return"] - working_df["friction_cost"]
+
+    equity_series = []
+    current_equity = initial_capital
+    for idx, row in working_df.iterrows():
+        if max_position_dollars is not None:
+            position_size = min(current_equity, max_position_dollars)
+        else:
+            position_size = current_equity
+        simple_return = np.exp(row["net_return"]) - 1
+        dollar_return = position_size * simple_return
+        current_equity = current_equity + dollar_return
+        equity_series.append(current_equity)
+
+    equity_curve = pd.Series(equity_series, index=working_df.index)
+    final_equity = equity_curve.iloc[-1]
+    total_return_dollars = final_equity - initial_capital
+
+    return {
+        "initial_capital": initial_capital,
+        "final_equity": final_equity,
+        "total_return_dollars": total_return_dollars,
+        "total_return_pct": (total_return_dollars / initial_capital) * 100,
+        "max_drawdown_pct": calculate_max_drawdown(equity_curve),
+        "sharpe_ratio": calculate_sharpe_ratio(working_df["net_return"]),
+        "num_trades": int(working_df["signal_change"].sum()),
+        "equity_curve": equity_curve,
+    }
+
+
+def load_signal_frame(filename: str) -> pd.DataFrame:
+    path = CACHE_DIR / filename
+    if not path.exists():
+        pytest.skip(f"Cached parquet not available: {filename}")
+
+    bars = pd.read_parquet(path)[["close"]].iloc[:BARS_PER_CASE].copy()
+    bars["log_return"] = FeatureEngineer.calculate_log_return(bars)
+    return bars
+
+
+def signal_variants(n: int) -> np.ndarray:
+    """Long/short, long/flat and sparse-NaN signal variants."""
+    rng = np.random.default_rng(17)
+    long_short = np.where(np.cumsum(rng.normal(size=n)) > 0, 1, -1)
+    long_flat = (rng.random(n) < 0.4).astype(int)
+    three_state = rng.integers(-1, 2, n)
+    return np.column_stack([long_short, long_flat, three_state])
+
+
+def assert_metrics_equal(result, expected):
+    assert result.keys() == expected.keys()
+    for key in expected:
+        if key == "equity_curve":
+            pd.testing.assert_series_equal(result[key], expected[key], check_exact=True)
+        else:
+            assert result[key] == expected[key], key
+
+
+@pytest.mark.parametrize("filename", PARITY_FILES)
+@pytest.mark.parametrize("initial_capital,friction_bps,max_position_dollars", CASES)
+def test_simulate_portfolio_matches_legacy(filename, initial_capital, friction_bps, max_position_dollars):
+    bars = load_signal_frame(filename)
+    for signal in signal_variants(len(bars)).T:
+        df = bars.assign(signal=signal)
+        result = simulate_portfolio(df, initial_capital, friction_bps, max_position_dollars)
+        expected = legacy_simulate_portfolio(df, initial_capital, friction_bps, max_position_dollars)
+        assert_metrics_equal(result, expected)
+
+
+@pytest.mark.parametrize("filename", PARITY_FILES)
+@pytest.mark.parametrize("initial_capital,friction_bps,max_position_dollars", CASES)
+def test_signal_matrix_matches_per_column_legacy(filename, initial_capital, friction_bps, max_position_dollars):
+    bars = load_signal_frame(filename)
+    signals = signal_variants(len(bars))
+
+    results = simulate_signal_matrix(bars, signals, initial_capital, friction_bps, max_position_dollars)
+
+    assert len(results) == signals.shape[1]
+    for k, result in enumerate(results):
+        expected = legacy_simulate_portfolio(
+            bars.assign(signal=signals[:, k]), initial_capital, friction_bps, max_position_dollars
+        )
+        assert_metrics_equal(result, expected)
+
+
+def test_missing_rows_are_dropped_before_shift():
+    bars = load_signal_frame(PARITY_FILES[0]).iloc[:500].copy()
+    signal = signal_variants(len(bars))[:, 2].astype(float)
+    signal[[10, 11, 250]] = np.nan
+    bars.iloc[[40, 41], bars.columns.get_loc("log_return")] = np.nan
+    df = bars.assign(signal=signal)
+
+    assert_metrics_equal(
+        simulate_portfolio(df, 100000.0, 1.5, 100000), legacy_simulate_portfolio(df, 100000.0, 1.5, 100000)
+    )
+
+
+def test_empty_frame_returns_flat_metrics():
+    df = pd.DataFrame({"close": [np.nan], "signal": [1], "log_return": [np.nan]})
+    result = simulate_portfolio(df, initial_capital=5000.0)
+    assert result["final_equity"] == 5000.0
+    assert result["num_trades"] == 0
+    assert result["equity_curve"].empty
@@ -0,0 +1,229 @@
+"""
+Parity Tests - Concurrent Bulk Prefetch Engine
+
+Runs PrefetchEngine against a local HTTP stub of the Alpaca bars and FMP EOD
+endpoints (serving cached SOFI bars). Bars written concurrently must match the
+source exactly, pagination and 429 retries must be handled, a second run must
+plan nothing, and the token bucket must hold the request rate. Daily equity bars
+must match DataCache.get_or_fetch_equity over the same stub, weekends included.
+"""
+
+import json
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qs, urlparse
+
+import numpy as np
+import pandas as pd
+import pytest
+
+project_root = Path(__file__).resolve().parent.parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.data_cache import DataCache, PartitionedBarStore
+from src.prefetch import PrefetchEngine, TokenBucket, month_chunks
+
+BARS_FILE = project_root / "data" / "cache" / "equities" / "SOFI_1min_20240401_20240630.parquet"
+PAGE_SIZE = 4000
+SYMBOLS = ["SOFI", "SOFA", "SOFB", "SOFC", "SOFD", "SOFE"]
+AGG = {"open": "first", "high": "max", "low": "min", "close": "last", "volume": "sum", "trade_count": "sum", "vwap": "mean"}
+
+
+def in_range(bars, start, end):
+    return bars[(bars.index >= pd.Timestamp(start)) & (bars.index < pd.Timestamp(end) + pd.Timedelta(days=1))]
+
+
+def alpaca_bars(bars, timeframe, start, end):
+    """Bars as Alpaca serves them: 1Day bars cover a New York session and are stamped at its midnight (UTC)."""
+    if timeframe == "1Min":
+        return in_range(bars, start, end)
+    if timeframe == "1Hour":
+        return in_range(bars, start, end).resample("1h").agg(AGG).dropna()
+    session = bars.index.tz_localize("UTC").tz_convert("America/New_York").normalize()
+    daily = in_range(bars.groupby(session.tz_localize(None)).agg(AGG), start, end)
+    daily.index = daily.index.tz_localize("America/New_York").tz_convert("UTC").tz_localize(None)
+    return daily
+
+
+def extended_hours_bars():
+    """Two winter weeks of 04:00-19:59 New York minute bars; Friday's last hour falls on Saturday UTC."""
+    days = pd.bdate_range("2024-01-08", "2024-01-19")
+    index = pd.DatetimeIndex([t for day in days for t in pd.date_range(day + pd.Timedelta(hours=4), periods=960, freq="1min")])
+    index = index.tz_localize("America/New_York").tz_convert("UTC").tz_localize(None)
+    close = 10.0 + 0.001 * np.arange(len(index))
+    return pd.DataFrame(
+        {"open": close, "high": close + 0.01, "low": close - 0.01, "close": close, "volume": 100.0,
+         "trade_count": 5.0, "vwap": close},
+        index=pd.DatetimeIndex(index, name="timestamp"),
+    )
+
+
+@pytest.fixture(scope="module")
+def source_bars():
+    if not BARS_FILE.exists():
+        pytest.skip("Cached parquet not available")
+    bars = pd.read_parquet(BARS_FILE)
+    return bars[["open", "high", "low", "close", "volume", "trade_count", "vwap"]]
+
+
+@pytest.fixture
+def stub(source_bars):
+    """Local HTTP stub; the first request for 'SOFB' is rejected with 429."""
+    state = {"requests": [], "throttled": set()}
+    lock = threading.Lock()
+
+    class Handler(BaseHTTPRequestHandler):
+        def log_message(self, *args):
+            pass
+
+        def _send(self, status, payload, headers=None):
+            body = json.dumps(payload).encode()
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            for key, value in (headers or {}).items():
+                self.send_header(key, value)
+            self.end_headers()
+            self.wfile.write(body)
+
+        def do_GET(self):
+            url = urlparse(self.path)
+            query = {key: values[0] for key, values in parse_qs(url.query).items()}
+            with lock:
+                state["requests"].append((url.path, query))
+
+            if url.path.startswith("/v2/stocks/"):
+                symbol = url.path.split("/")[3]
+                with lock:
+                    throttle = symbol == "SOFB" and symbol not in state["throttled"]
+                    state["throttled"].add(symbol)
+                if throttle:
+                    return self._send(429, {"message": "too many requests"}, {"Retry-After": "0"})
+
+                window = alpaca_bars(source_bars, query.get("timeframe", "1Min"), query["start"], query["end"])
+                offset = int(query.get("page_token", 0))
+                page = window.iloc[offset : offset + PAGE_SIZE]
+                bars = [
+                    {"t": ts.strftime("%Y-%m-%dT%H:%M:%SZ"), "o": r.open, "h": r.high, "l": r.low, "c": r.close,
+                     "v": r.volume, "n": r.trade_count, "vw": r.vwap}
+                    for ts, r in zip(page.index, page.itertuples())
+                ]
+                next_token = str(offset + PAGE_SIZE) if offset + PAGE_SIZE < len(window) else None
+                return self._send(200, {"bars": bars, "symbol": symbol, "next_page_token": next_token})
+
+            if url.path == "/stable/historical-price-eod/full":
+                daily = in_range(source_bars, query["from"], query["to"]).resample("1D").agg(
+                    {"open": "first", "high": "max", "low": "min", "close": "last", "volume": "sum"}
+                ).dropna()
+                rows = [{"date": ts.strftime("%Y-%m-%d"), **row} for ts, row in zip(daily.index, daily.to_dict("records"))]
+                return self._send(200, rows[::-1])
+
+            self._send(404, {"message": "not found"})
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    state["url"] = f"http://127.0.0.1:{server.server_address[1]}"
+    yield state
+    server.shutdown()
+
+
+def make_engine(store, stub, **kwargs):
+    limits = kwargs.pop("limits", {"alpaca": {"per_minute": 60000, "burst": 100}, "fmp": {"per_minute": 60000, "burst": 100}})
+    return PrefetchEngine(
+        store=store, alpaca_data_url=stub["url"], fmp_url=f"{stub['url']}/stable", limits=limits, **kwargs
+    )
+
+
+def test_token_bucket_reserves_in_order():
+    now = [0.0]
+    slept = []
+    bucket = TokenBucket(rate=10.0, capacity=2, clock=lambda: now[0], sleep=slept.append)
+
+    waits = [bucket.acquire() for _ in range(4)]
+    assert waits == pytest.approx([0.0, 0.0, 0.1, 0.2])
+
+    # Refill is capped at capacity
+    now[0] = 10.0
+    assert [bucket.acquire() for _ in range(3)] == pytest.approx([0.0, 0.0, 0.1])
+
+
+def test_month_chunks():
+    d = pd.Timestamp
+    chunks = month_chunks(d("2024-04-20").date(), d("2024-06-05").date())
+    assert [(str(s), str(e)) for s, e in chunks] == [
+        ("2024-04-20", "2024-04-30"),
+        ("2024-05-01", "2024-05-31"),
+        ("2024-06-01", "2024-06-05"),
+    ]
+
+
+def test_concurrent_prefetch_matches_source(tmp_path, stub, source_bars):
+    store = PartitionedBarStore(tmp_path)
+    engine = make_engine(store, stub, workers=8)
+    jobs = [("equities", symbol, "1min", "2024-04-10", "2024-05-20") for symbol in SYMBOLS]
+
+    report = engine.run(jobs, progress=False)
+
+    assert report["errors"] == []
+    assert report["tasks"] == report["completed"] == 2 * len(SYMBOLS)
+    expected = in_range(source_bars, "2024-04-10", "2024-05-20")
+    assert report["bars"] == len(expected) * len(SYMBOLS)
+    # Pagination plus one retried 429
+    assert report["requests"]["alpaca"] == len(stub["requests"]) > 2 * len(SYMBOLS)
+
+    for symbol in SYMBOLS:
+        stored = store.read("equities", symbol, "1min", "2024-04-10", "2024-05-20")
+        pd.testing.assert_frame_equal(stored, expected, check_dtype=False, check_freq=False)
+
+    # Everything is covered now: a second run plans nothing and makes no requests
+    again = make_engine(store, stub).run(jobs, progress=False)
+    assert again["tasks"] == 0 and again["requests"]["alpaca"] == 0
+
+
+def test_fmp_daily_bars(tmp_path, stub, source_bars):
+    store = PartitionedBarStore(tmp_path)
+    report = make_engine(store, stub, workers=2).run([("futures", "SIUSD", "1day", "2024-04-01", "2024-05-31")], progress=False)
+
+    assert report["errors"] == [] and report["requests"]["fmp"] == 2
+    stored = store.read("futures", "SIUSD", "1day", "2024-04-01", "2024-05-31")
+    assert stored.index.is_monotonic_increasing
+    assert stored["close"].iloc[-1] == in_range(source_bars, "2024-05-31", "2024-05-31")["close"].iloc[-1]
+
+
+def test_rate_limit_is_respected(tmp_path, stub):
+    store = PartitionedBarStore(tmp_path)
+    limits = {"alpaca": {"per_minute": 3000, "burst": 1}}
+    engine = make_engine(store, stub, workers=8, limits=limits)
+    jobs = [("equities", symbol, "1min", "2024-04-01", "2024-04-05") for symbol in SYMBOLS]
+
+    started = time.perf_counter()
+    report = engine.run(jobs, progress=False)
+    elapsed = time.perf_counter() - started
+
+    # At 50 requests/s with a burst of 1, n requests need at least (n - 1) / 50 s, even with 8 workers
+    requests_made = report["requests"]["alpaca"]
+    assert requests_made > len(SYMBOLS)
+    assert elapsed >= (requests_made - 1) / 50.0
+
+
+@pytest.mark.parametrize("source_bars", [extended_hours_bars()])
+def test_daily_equity_prefetch_matches_data_cache(tmp_path, monkeypatch, stub, source_bars):
+    for key, value in {"APCA_API_KEY_ID": "key", "APCA_API_SECRET_KEY": "secret",
+                       "APCA_API_BASE_URL": stub["url"], "APCA_API_DATA_URL": stub["url"]}.items():
+        monkeypatch.setenv(key, value)
+    start, end = "2024-01-08", "2024-01-19"
+
+    store = PartitionedBarStore(tmp_path / "prefetch")
+    report = make_engine(store, stub).run([("equities", "SOFI", "1day", start, end)], progress=False)
+    prefetched = store.read("equities", "SOFI", "1day", start, end)
+    cached = DataCache(tmp_path / "cache").get_or_fetch_equity("SOFI", "1day", start, end)
+
+    assert report["errors"] == []
+    assert [q["timeframe"] for path, q in stub["requests"]] == ["1Day", "1Day"]
+    pd.testing.assert_frame_equal(prefetched, cached, check_dtype=False, check_freq=False)
+    # One bar per session: Friday after-hours must not become a Saturday bar
+    assert len(prefetched) == 10 and prefetched.index.dayofweek.max() == 4
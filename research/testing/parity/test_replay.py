@@ -0,0 +1,177 @@
+"""
+Parity Tests - Replay Harness for the Prod Strategy Classes
+
+The replay data client must never serve a bar before it has closed (derived
+timeframes include the forming bar, as the live API does), the trading client
+must fill market orders at the next bar's open and keep positions / cash
+consistent, and an unmodified BearTrapStrategy replayed over a scripted
+bear-trap session must enter on the reclaim bar and leave on its 30-minute time
+stop. Process-pool replays must match serial ones.
+"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+project_root = Path(__file__).resolve().parent.parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from alpaca.data.requests import StockBarsRequest, StockLatestQuoteRequest
+from alpaca.data.timeframe import TimeFrame
+from alpaca.trading.enums import OrderSide, TimeInForce
+from alpaca.trading.requests import LimitOrderRequest, MarketOrderRequest
+from src.bar_fetch import barset_to_frame
+from src.replay import (
+    ReplayAPIError,
+    ReplayClock,
+    ReplayDataClient,
+    ReplayTradingClient,
+    cycle_times,
+    replay_strategy,
+    run_replays,
+    symbol_day_tasks,
+)
+from src.rolling_stats import true_range
+
+SESSION_OPEN = pd.Timestamp("2024-04-09 13:30")  # 09:30 ET, naive UTC as in the cache
+
+
+def minute_bars(n=120, start=SESSION_OPEN, seed=0):
+    rng = np.random.default_rng(seed)
+    close = 50 + np.cumsum(rng.normal(0, 0.1, n))
+    open_ = np.r_[50.0, close[:-1]]
+    return pd.DataFrame(
+        {
+            "open": open_,
+            "high": np.maximum(open_, close) + 0.05,
+            "low": np.minimum(open_, close) - 0.05,
+            "close": close,
+            "volume": rng.integers(100, 1000, n).astype(float),
+        },
+        index=pd.date_range(start, periods=n, freq="1min", name="timestamp"),
+    )
+
+
+def bear_trap_session(start=SESSION_OPEN):
+    """Flat open, a 20% slide, a high-volume reclaim candle at bar 40, then a slow grind up."""
+    rows = [(10.0, 10.02, 9.98, 10.0, 1000.0)] * 20
+    price = 10.0
+    for _ in range(20):
+        rows.append((price, price + 0.01, price - 0.11, price - 0.10, 1000.0))
+        price -= 0.10
+    rows.append((7.95, 8.12, 7.80, 8.10, 3000.0))
+    for k in range(60):
+        rows.append((8.15 + 0.01 * k, 8.20 + 0.01 * k, 8.10 + 0.01 * k, 8.16 + 0.01 * k, 1000.0))
+    return pd.DataFrame(
+        rows,
+        columns=["open", "high", "low", "close", "volume"],
+        index=pd.date_range(start, periods=len(rows), freq="1min", name="timestamp"),
+    )
+
+
+def test_data_client_serves_only_closed_bars():
+    bars = minute_bars()
+    clock = ReplayClock("2024-04-09 14:15:30")
+    client = ReplayDataClient({"SPY": bars}, clock)
+
+    request = StockBarsRequest(symbol_or_symbols=["SPY"], timeframe=TimeFrame.Minute, start=SESSION_OPEN.to_pydatetime())
+    frame = barset_to_frame(client.get_stock_bars(request)).droplevel("symbol")
+    assert frame.index[-1] == pd.Timestamp("2024-04-09 14:14", tz="UTC")
+    pd.testing.assert_frame_equal(frame, bars.loc[:"2024-04-09 14:14"].tz_localize("UTC"), check_names=False, check_freq=False, check_index_type=False)
+
+    # Naive end far in the future is still capped at the clock
+    request = StockBarsRequest(symbol_or_symbols="SPY", timeframe=TimeFrame.Minute, start=SESSION_OPEN.to_pydatetime(), end=pd.Timestamp("2030-01-01").to_pydatetime())
+    assert len(client.get_stock_bars(request).data["SPY"]) == 45
+
+    # Hourly: the closed 13:00 bar plus the forming 14:00 bar from 14:00-14:14
+    request = StockBarsRequest(symbol_or_symbols="SPY", timeframe=TimeFrame.Hour, start=SESSION_OPEN.floor("1h").to_pydatetime())
+    hourly = barset_to_frame(client.get_stock_bars(request)).droplevel("symbol")
+    forming = bars.loc["2024-04-09 14:00":"2024-04-09 14:14"]
+    assert list(hourly.index) == [pd.Timestamp("2024-04-09 13:00", tz="UTC"), pd.Timestamp("2024-04-09 14:00", tz="UTC")]
+    np.testing.assert_allclose(
+        hourly.iloc[-1].to_numpy(),
+        [forming["open"].iloc[0], forming["high"].max(), forming["low"].min(), forming["close"].iloc[-1], forming["volume"].sum()],
+    )
+
+    seeded = client.read("equities", "SPY", "1min", "2024-04-09", "2024-04-09", columns=["close"])
+    assert list(seeded.columns) == ["close"] and len(seeded) == 45 and seeded.index.tz is None
+
+    quote = client.get_stock_latest_quote(StockLatestQuoteRequest(symbol_or_symbols="SPY"))["SPY"]
+    assert quote.bid_price == quote.ask_price == bars.loc["2024-04-09 14:14", "close"]
+
+
+def test_clock_answers_datetime_now():
+    clock = ReplayClock("2024-04-09 19:56", local_tz="America/New_York")
+    now = clock.datetime.now()
+    assert now.tzinfo is None and (now.hour, now.minute) == (15, 56)
+    assert clock.datetime.now(pd.Timestamp(0, tz="UTC").tzinfo).hour == 19
+    assert isinstance(clock.datetime(2024, 1, 1), clock.datetime)
+
+
+def test_trading_client_fills_and_positions():
+    bars = minute_bars()
+    clock = ReplayClock("2024-04-09 14:00")
+    data_client = ReplayDataClient({"SPY": bars}, clock)
+    trading = ReplayTradingClient(data_client, cash=100000, slippage_bps=10)
+
+    order = trading.submit_order(MarketOrderRequest(symbol="SPY", qty=100, side=OrderSide.BUY, time_in_force=TimeInForce.DAY))
+    entry = bars.loc["2024-04-09 14:00", "open"] * 1.001
+    assert order.status == "filled" and float(order.filled_avg_price) == pytest.approx(entry)
+    position = trading.get_open_position("SPY")
+    assert float(position.qty) == 100 and float(position.avg_entry_price) == pytest.approx(entry)
+
+    clock.set("2024-04-09 14:30")
+    mark = bars.loc["2024-04-09 14:29", "close"]
+    assert float(trading.get_account().equity) == pytest.approx(100000 - 100 * entry + 100 * mark)
+
+    # Non-marketable limit orders are canceled, not queued
+    limit = trading.submit_order(LimitOrderRequest(symbol="SPY", qty=100, side=OrderSide.SELL, time_in_force=TimeInForce.DAY, limit_price=1000.0))
+    assert limit.status == "canceled" and len(trading.fills) == 1
+
+    trading.submit_order(MarketOrderRequest(symbol="SPY", qty=100, side=OrderSide.SELL, time_in_force=TimeInForce.DAY))
+    exit_ = bars.loc["2024-04-09 14:30", "open"] * 0.999
+    assert trading.realized_pnl == pytest.approx(100 * (exit_ - entry))
+    assert trading.cash == pytest.approx(100000 + trading.realized_pnl)
+    with pytest.raises(ReplayAPIError):
+        trading.get_open_position("SPY")
+    assert list(trading.fills_frame()["side"]) == ["buy", "sell"]
+
+
+def test_bear_trap_replay_runs_prod_class():
+    session = bear_trap_session()
+    result = replay_strategy(
+        {"strategy": "bear_trap", "bars": {"ONDS": session}, "start": "2024-04-09", "end": "2024-04-09", "local_tz": "America/New_York"}
+    )
+
+    assert result["errors"] == 0 and result["cycles"] == len(cycle_times("bear_trap", "2024-04-09", "2024-04-09")) == 391
+    fills = result["fills"]
+    assert list(fills["side"]) == ["buy", "sell"]
+
+    # Reclaim bar 40 closes at 10:11 ET; the market order fills at the 10:11 bar's open
+    entry_time = pd.Timestamp("2024-04-09 14:11", tz="UTC")
+    assert fills["timestamp"].iloc[0] == entry_time and fills["price"].iloc[0] == session.loc["2024-04-09 14:11", "open"]
+    # 2% of equity at risk against a stop 0.45 ATR below the session low
+    window = session.iloc[:41]
+    atr = true_range(window["high"], window["low"], window["close"]).rolling(14).mean().iloc[-1]
+    assert fills["qty"].iloc[0] == int(100000 * 0.02 / (8.10 - (7.80 - 0.45 * atr)))
+
+    # 30-minute time stop, filled at the next bar's open
+    exit_time = entry_time + pd.Timedelta(minutes=30)
+    assert fills["timestamp"].iloc[1] == exit_time and fills["price"].iloc[1] == session.loc[exit_time.tz_localize(None), "open"]
+    assert result["open_positions"] == {} and result["status"]["trades_today"] == 1
+    assert result["realized_pnl"] == pytest.approx(fills["qty"].iloc[0] * (fills["price"].iloc[1] - fills["price"].iloc[0]))
+
+
+def test_process_pool_matches_serial():
+    bars = {"ONDS": pd.concat([bear_trap_session(), bear_trap_session(SESSION_OPEN + pd.Timedelta(days=1))])}
+    tasks = symbol_day_tasks("bear_trap", bars, ["2024-04-09", "2024-04-10"])
+    serial = run_replays(tasks, workers=1)
+    parallel = run_replays(tasks, workers=2)
+
+    assert [len(r["fills"]) for r in serial] == [2, 2]
+    for a, b in zip(serial, parallel):
+        pd.testing.assert_frame_equal(a["fills"], b["fills"])
+        assert a["final_equity"] == b["final_equity"]
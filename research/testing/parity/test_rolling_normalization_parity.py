@@ -0,0 +1,111 @@
+"""
+Parity Tests - Shared Rolling Normalization Stage
+
+The O(n) block min/max in src/rolling_stats.py must reproduce pandas
+rolling(window, min_periods).min()/.max() exactly (NaN/inf skipping, warmup), and
+the attached '<col>_norm' columns must equal the legacy per-consumer
+normalization on the same frame.
+"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+project_root = Path(__file__).resolve().parent.parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.features import (
+    FeatureEngineer,
+    add_technical_indicators,
+    generate_master_signal,
+    get_normalized_features,
+    NORM_FEATURES,
+)
+from src.optimizer import calculate_alpha_with_weights
+from src.rolling_stats import rolling_min_max, rolling_minmax_normalize
+
+CACHE_DIR = project_root / "data" / "cache" / "equities"
+
+
+def legacy_normalize(series: pd.Series, window: int = 252, min_periods: int = 20) -> pd.Series:
+    """Legacy pandas rolling min-max normalization (verbatim)."""
+    rolling_min = series.rolling(window=window, min_periods=min_periods).min()
+    rolling_max = series.rolling(window=window, min_periods=min_periods).max()
+    col_range = rolling_max - rolling_min
+    return ((series - rolling_min) / col_range.replace(0, np.inf)).fillna(0.5)
+
+
+def noisy_series(n: int, seed: int) -> pd.Series:
+    rng = np.random.default_rng(seed)
+    values = rng.normal(size=n)
+    if n > 10:
+        values[rng.random(n) < 0.15] = np.nan
+        values[rng.random(n) < 0.01] = np.inf
+        values[rng.random(n) < 0.01] = -np.inf
+        values[rng.random(n) < 0.05] = 0.0
+        values[:5] = np.nan
+    return pd.Series(values)
+
+
+@pytest.mark.parametrize("n", [0, 1, 19, 251, 252, 253, 5003])
+@pytest.mark.parametrize("window,min_periods", [(252, 20), (7, 7), (3, 1), (1, 1)])
+def test_rolling_min_max_matches_pandas(n, window, min_periods):
+    series = noisy_series(n, seed=n + window)
+    rolling_min, rolling_max = rolling_min_max(series.to_numpy(), window, min_periods)
+
+    rolling = series.rolling(window=window, min_periods=min_periods)
+    np.testing.assert_array_equal(rolling_min, rolling.min().to_numpy())
+    np.testing.assert_array_equal(rolling_max, rolling.max().to_numpy())
+
+
+@pytest.mark.parametrize("n", [19, 252, 5003])
+def test_rolling_minmax_normalize_matches_legacy(n):
+    series = noisy_series(n, seed=3)
+    with np.errstate(invalid="ignore"):
+        expected = legacy_normalize(series)
+    pd.testing.assert_series_equal(rolling_minmax_normalize(series), expected, check_exact=True)
+
+
+def load_feature_frame(filename: str = "SOFI_1min_20240401_20240630.parquet") -> pd.DataFrame:
+    path = CACHE_DIR / filename
+    if not path.exists():
+        pytest.skip(f"Cached parquet not available: {filename}")
+
+    bars = pd.read_parquet(path)[["open", "high", "low", "close", "volume"]].iloc[:3000].copy()
+    bars["log_return"] = FeatureEngineer.calculate_log_return(bars)
+    rng = np.random.default_rng(7)
+    bars["sentiment"] = np.cumsum(rng.normal(0.0, 0.05, len(bars))).clip(-1.0, 1.0)
+    add_technical_indicators(bars)
+    return bars
+
+
+def test_stage_attaches_columns_matching_legacy():
+    df = load_feature_frame()
+    for col in NORM_FEATURES:
+        pd.testing.assert_series_equal(df[f"{col}_norm"], legacy_normalize(df[col]), check_names=False, check_exact=True)
+
+
+def test_consumers_reuse_attached_columns():
+    df = load_feature_frame()
+    weights = {"rsi_14": 0.4, "volume_zscore": 0.3, "sentiment": 0.3}
+
+    attached = calculate_alpha_with_weights(df, weights)
+    recomputed = calculate_alpha_with_weights(df.drop(columns=[f"{c}_norm" for c in NORM_FEATURES]), weights)
+    pd.testing.assert_series_equal(attached, recomputed, check_exact=True)
+
+    # Attached columns are read as-is (no rolling recompute)
+    df["volume_zscore_norm"] = 0.25
+    assert (get_normalized_features(df, ["volume_zscore"])["volume_zscore"] == 0.25).all()
+
+
+def test_master_signal_alpha_matches_legacy_normalization():
+    df = load_feature_frame()
+    generate_master_signal(df)
+
+    expected = 0.4 * (df["rsi_14"] / 100.0) + 0.3 * legacy_normalize(df["volume_zscore"]) + 0.3 * legacy_normalize(
+        df["sentiment"]
+    )
+    pd.testing.assert_series_equal(df["alpha_score"], expected, check_names=False, check_exact=True)
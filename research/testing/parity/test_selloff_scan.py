@@ -0,0 +1,186 @@
+"""
+Parity Tests - Cross-Sectional Selloff Scan
+
+SelloffDetector.scan_universe() in batched mode (one multi-symbol request per
+scan, only bars since the previous scan, array masks for threshold / time filter
+/ first-cross dedup) must emit exactly the events the per-symbol scan_symbol()
+loop does at every scan of a session, including when a bar re-fetched in the
+overlap was revised since the previous scan. Uses synthetic 1-minute bars behind
+a fake data client.
+"""
+
+import sys
+from datetime import datetime
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+import pytest
+
+project_root = Path(__file__).resolve().parent.parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from research.bear_trap_ml_scanner.scanner import selloff_detector
+from research.bear_trap_ml_scanner.scanner.selloff_detector import SelloffDetector
+
+SYMBOLS = ["AAA", "BBB", "CCC", "DDD", "EEE", "FFF", "GGG", "HHH"]
+SESSION = pd.date_range("2024-04-09 09:30", "2024-04-09 15:59", freq="1min", tz="America/New_York")
+SCANS = pd.date_range("2024-04-09 09:35:30", "2024-04-09 15:55:30", freq="5min", tz="America/New_York")
+
+
+def make_bars(seed: int = 7) -> pd.DataFrame:
+    """(symbol, timestamp) bars; every other symbol slides ~15% at a different time of day."""
+    rng = np.random.default_rng(seed)
+    frames = []
+    for i, symbol in enumerate(SYMBOLS):
+        n = len(SESSION)
+        returns = rng.normal(0.0, 0.002, n)
+        if i % 2 == 0:
+            crash_at = 30 + 45 * i
+            returns[crash_at : crash_at + 20] -= 0.008
+        close = 50.0 * np.exp(np.cumsum(returns))
+        open_ = np.r_[50.0, close[:-1]]
+        frames.append(
+            pd.DataFrame(
+                {
+                    "symbol": symbol,
+                    "timestamp": SESSION.tz_convert("UTC"),
+                    "open": open_,
+                    "high": np.maximum(open_, close) * 1.001,
+                    "low": np.minimum(open_, close) * 0.999,
+                    "close": close,
+                    "volume": rng.integers(1_000, 50_000, n).astype(float),
+                }
+            )
+        )
+    return pd.concat(frames).set_index(["symbol", "timestamp"]).sort_index()
+
+
+class FakeDataClient:
+    """Serves bars in [request.start, min(request.end, now)] per requested symbol."""
+
+    def __init__(self, bars):
+        self.bars = bars
+        self.now = None
+        self.requests = []
+
+    def get_stock_bars(self, request):
+        self.requests.append(request)
+        symbols = request.symbol_or_symbols
+        symbols = [symbols] if isinstance(symbols, str) else symbols
+        # StockBarsRequest normalizes datetimes to naive UTC
+        start = pd.Timestamp(request.start).tz_localize("UTC")
+        end = min(pd.Timestamp(request.end).tz_localize("UTC"), self.now)
+        data = {}
+        for symbol in symbols:
+            window = self.bars.loc[symbol]
+            window = window[(window.index >= start) & (window.index <= end)]
+            data[symbol] = [
+                SimpleNamespace(
+                    timestamp=ts.to_pydatetime(), open=r.open, high=r.high, low=r.low, close=r.close, volume=r.volume
+                )
+                for ts, r in zip(window.index, window.itertuples())
+            ]
+        return SimpleNamespace(data=data)
+
+
+def make_detector(bars, time_filter=None):
+    detector = SelloffDetector("key", "secret", threshold_pct=-10.0, time_filter=time_filter)
+    detector.data_client = FakeDataClient(bars)
+    return detector
+
+
+def frozen_datetime(now):
+    class FrozenDatetime(datetime):
+        @classmethod
+        def now(cls, tz=None):
+            return now.astimezone(tz)
+
+    return FrozenDatetime
+
+
+def event_tuples(events):
+    return [
+        (e.symbol, e.timestamp, e.drop_pct, e.session_open, e.current_price, e.session_low, e.session_high, e.volume,
+         e.time_bucket)
+        for e in events
+    ]
+
+
+@pytest.mark.parametrize("time_filter", [None, (11, 30, 14, 0)])
+def test_batched_scan_matches_per_symbol_scan(time_filter):
+    bars = make_bars()
+    serial = make_detector(bars, time_filter)
+    batched = make_detector(bars, time_filter)
+
+    serial_events, batched_events = [], []
+    for scan in SCANS:
+        now = scan.to_pydatetime()
+        serial.data_client.now = batched.data_client.now = scan.tz_convert("UTC")
+
+        with patch.object(selloff_detector, "datetime", frozen_datetime(now)):
+            serial_events += serial.scan_universe(SYMBOLS, batched=False)
+        batched_events += batched.scan_universe(SYMBOLS, now=now)
+
+    assert serial_events, "synthetic session should produce selloffs"
+    assert event_tuples(batched_events) == event_tuples(serial_events)
+    assert all(type(e.volume) is int for e in batched_events)
+    assert batched.detected_today == serial.detected_today
+
+    # One request per scan for the whole universe, incremental after the first
+    assert len(batched.data_client.requests) == len(SCANS)
+    assert all(r.symbol_or_symbols == SYMBOLS for r in batched.data_client.requests)
+    last_start = pd.Timestamp(batched.data_client.requests[-1].start).tz_localize("UTC")
+    assert last_start >= SCANS[-2].tz_convert("UTC") - pd.Timedelta(minutes=2)
+
+
+def test_batched_scan_resets_on_new_day():
+    bars = make_bars()
+    detector = make_detector(bars)
+    detector.data_client.now = SCANS[-1].tz_convert("UTC")
+    first = detector.scan_universe(SYMBOLS, now=SCANS[-1].to_pydatetime())
+    assert first and all(detector.detected[SYMBOLS.index(e.symbol)] for e in first)
+
+    # Already detected today: no repeat on the next scan
+    assert detector.scan_universe(SYMBOLS, now=SCANS[-1].to_pydatetime()) == []
+
+    # Next session (shifted bars): state and dedup start over after reset_daily_tracking
+    next_day = bars.rename(index=lambda ts: ts + pd.Timedelta(days=1) if isinstance(ts, pd.Timestamp) else ts)
+    detector.data_client = FakeDataClient(next_day)
+    detector.reset_daily_tracking()
+    later = SCANS[-1] + pd.Timedelta(days=1)
+    detector.data_client.now = later.tz_convert("UTC")
+    second = detector.scan_universe(SYMBOLS, now=later.to_pydatetime())
+    assert [e.symbol for e in second] == [e.symbol for e in first]
+    assert all(e.timestamp.date() == later.date() for e in second)
+
+
+def test_revised_last_bar_replaces_forming_bar():
+    """The 10:00 bar is still forming at the first scan and closes 12% down by the second."""
+    index = pd.date_range("2024-04-09 09:30", "2024-04-09 10:00", freq="1min", tz="America/New_York").tz_convert("UTC")
+    flat = pd.DataFrame({"open": 50.0, "high": 50.1, "low": 49.9, "close": 50.0, "volume": 1000.0}, index=index)
+    forming = pd.concat({s: flat for s in SYMBOLS[:2]}, names=["symbol", "timestamp"])
+    forming.loc[("AAA", index[-1]), ["low", "close", "volume"]] = [48.9, 49.0, 100.0]
+    revised = forming.copy()
+    revised.loc[("AAA", index[-1]), ["low", "close", "volume"]] = [43.8, 44.0, 900.0]
+
+    serial = make_detector(forming)
+    batched = make_detector(forming)
+    serial_events, batched_events = [], []
+    for bars, scan in ((forming, "2024-04-09 10:00:40"), (revised, "2024-04-09 10:00:50")):
+        scan = pd.Timestamp(scan, tz="America/New_York")
+        for detector in (serial, batched):
+            detector.data_client.bars = bars
+            detector.data_client.now = scan.tz_convert("UTC")
+        with patch.object(selloff_detector, "datetime", frozen_datetime(scan.to_pydatetime())):
+            serial_events += serial.scan_universe(SYMBOLS[:2], batched=False)
+        batched_events += batched.scan_universe(SYMBOLS[:2], now=scan.to_pydatetime())
+
+    assert [e.symbol for e in serial_events] == ["AAA"]
+    assert event_tuples(batched_events) == event_tuples(serial_events)
+    event = batched_events[0]
+    assert (event.current_price, event.session_low, event.volume) == (44.0, 43.8, 900)
+    # The revision replaced the 10:00 bar instead of counting as a new one
+    assert list(batched.bar_count) == [len(index), len(index)]
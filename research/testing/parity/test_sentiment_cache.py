@@ -0,0 +1,89 @@
+"""
+Parity Tests - Cached Local NLP Sentiment
+
+Cached/batched TextBlob scoring must return the same polarity as scoring each
+article directly, and a second pass over the same articles must be all cache hits.
+Processes sharing one cache directory must not lose each other's scores.
+"""
+
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+from textblob import TextBlob
+
+project_root = Path(__file__).resolve().parent.parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+import src.features as features
+from src.features import merge_news_pit
+from src.sentiment_cache import SentimentCache
+
+ARTICLES = [
+    {"title": "Apple beats earnings estimates", "text": "Strong iPhone demand lifts revenue."},
+    {"title": "Chipmaker misses guidance", "text": "Weak outlook sends shares lower."},
+    {"title": "Fed holds rates steady", "summary": "Markets react calmly."},
+    {"title": "", "text": ""},
+    {"title": "Apple beats earnings estimates", "text": "Strong iPhone demand lifts revenue."},
+]
+
+
+def direct_polarity(article: dict) -> float:
+    text = article.get("text", article.get("summary", ""))
+    full_text = f"{article.get('title', '')} {text}".strip()
+    return TextBlob(full_text).sentiment.polarity if full_text else 0.0
+
+
+def test_cache_scores_match_textblob_and_persist(tmp_path):
+    texts = [f"{a['title']} {a.get('text', a.get('summary', ''))}".strip() for a in ARTICLES]
+
+    cache = SentimentCache(cache_dir=str(tmp_path), batch_size=2)
+    first = cache.score(texts)
+
+    assert first == [direct_polarity(a) for a in ARTICLES]
+    assert cache.stats()["misses"] == 4
+    assert cache.stats()["hits"] == 0
+
+    # A fresh instance reads the persisted parquet: every non-empty article is a hit
+    reloaded = SentimentCache(cache_dir=str(tmp_path))
+    assert reloaded.score(texts) == first
+    assert reloaded.stats() == {"hits": 4, "misses": 0, "cached_articles": 3}
+
+
+def test_merge_news_pit_uses_cache_for_missing_sentiment(tmp_path, monkeypatch):
+    monkeypatch.setattr(features, "sentiment_cache", SentimentCache(cache_dir=str(tmp_path)))
+
+    index = pd.date_range("2024-03-01 09:30", periods=240, freq="1min", name="timestamp")
+    bars = pd.DataFrame({"close": np.linspace(100.0, 101.0, len(index))}, index=index)
+    news_list = [
+        {**article, "publishedDate": index[0] + pd.Timedelta(minutes=30 * i), "sentiment": None}
+        for i, article in enumerate(ARTICLES)
+    ]
+
+    first = merge_news_pit(bars, news_list)
+    second = merge_news_pit(bars, news_list)
+
+    pd.testing.assert_frame_equal(first, second, check_exact=True)
+    assert features.sentiment_cache.stats()["misses"] == 4
+    assert features.sentiment_cache.stats()["hits"] == 4
+
+
+def _score_in_process(args):
+    """Score texts a few at a time so every worker saves repeatedly (runs in a pool)."""
+    cache_dir, texts = args
+    cache = SentimentCache(cache_dir=cache_dir)
+    return [score for i in range(0, len(texts), 4) for score in cache.score(texts[i : i + 4])]
+
+
+def test_concurrent_processes_keep_every_score(tmp_path):
+    texts = [[f"Company {w} reports strong growth in quarter {i}" for i in range(40)] for w in range(4)]
+
+    with ProcessPoolExecutor(max_workers=4) as pool:
+        results = list(pool.map(_score_in_process, [(str(tmp_path), chunk) for chunk in texts]))
+
+    assert results == [[TextBlob(t).sentiment.polarity for t in chunk] for chunk in texts]
+    reloaded = SentimentCache(cache_dir=str(tmp_path))
+    assert reloaded.stats()["cached_articles"] == 160
+    assert not list((tmp_path / "news_sentiment").glob("*.tmp"))
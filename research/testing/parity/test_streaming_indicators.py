@@ -0,0 +1,136 @@
+"""
+Parity Tests - Streaming Incremental Indicators
+
+Feeding bars one at a time through the O(1) streaming indicators must reproduce
+the batch functions exactly (calculate_rsi, add_technical_indicators,
+rolling_atr, session_vwap, MIDAS EMA/ATR), and a JSON state snapshot taken
+mid-stream must resume to the same values. Uses cached SOFI 1-minute bars.
+"""
+
+import json
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+import pytest
+
+project_root = Path(__file__).resolve().parent.parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.features import add_technical_indicators, calculate_rsi
+from src.rolling_stats import rolling_atr, session_vwap
+from src.streaming_indicators import (
+    ATR,
+    EMA,
+    RSI,
+    IndicatorEngine,
+    RollingMean,
+    RollingZScore,
+    SessionHigh,
+    SessionLow,
+    SessionVWAP,
+)
+
+BARS_FILE = project_root / "data" / "cache" / "equities" / "SOFI_1min_20240401_20240630.parquet"
+
+
+@pytest.fixture(scope="module")
+def bars():
+    if not BARS_FILE.exists():
+        pytest.skip("Cached parquet not available")
+    return pd.read_parquet(BARS_FILE)[["open", "high", "low", "close", "volume"]].loc["2024-04-01":"2024-04-30"]
+
+
+def make_engine():
+    return IndicatorEngine(
+        {
+            "rsi": RSI(14),
+            "rsi_wilder": RSI(28, wilder=True),
+            "ema_200": EMA(200),
+            "atr": ATR(14),
+            "atr_ema": ATR(14, method="ema"),
+            "avg_volume": RollingMean(20, field="volume"),
+            "volume_zscore": RollingZScore(20),
+            "vwap": SessionVWAP(),
+            "session_high": SessionHigh(),
+            "session_low": SessionLow(),
+        }
+    )
+
+
+def assert_same(streamed: pd.Series, batch: pd.Series):
+    np.testing.assert_array_equal(streamed.to_numpy(dtype=float), batch.to_numpy(dtype=float))
+
+
+def test_streaming_matches_batch_functions(bars):
+    streamed = make_engine().warm_up(bars)
+    days = bars.index.date
+
+    assert_same(streamed["rsi"], calculate_rsi(bars["close"], period=14))
+    assert_same(streamed["rsi_wilder"], calculate_rsi(bars["close"], period=28, wilder=True))
+    assert_same(streamed["ema_200"], bars["close"].ewm(span=200, adjust=False).mean())
+    assert_same(streamed["atr"], rolling_atr(bars["high"], bars["low"], bars["close"], window=14))
+    assert_same(streamed["avg_volume"], bars["volume"].rolling(20).mean())
+    assert_same(streamed["vwap"], session_vwap(bars["high"], bars["low"], bars["close"], bars["volume"]))
+    assert_same(streamed["session_high"], bars["high"].groupby(days).cummax())
+    assert_same(streamed["session_low"], bars["low"].groupby(days).cummin())
+
+    features = bars.copy()
+    features["log_return"] = np.log(features["close"] / features["close"].shift(1))
+    add_technical_indicators(features)
+    assert_same(streamed["rsi"], features["rsi_14"])
+    assert_same(streamed["volume_zscore"], features["volume_zscore"])
+
+
+def test_streaming_matches_midas_indicators(bars):
+    from prod.midas_protocol.strategy import MIDASProtocolStrategy
+
+    config = json.loads((project_root / "prod" / "midas_protocol" / "config.json").read_text())
+    with patch("prod.midas_protocol.strategy.TradingClient"), patch(
+        "prod.midas_protocol.strategy.StockHistoricalDataClient"
+    ):
+        strategy = MIDASProtocolStrategy("key", "secret", "https://paper-api.alpaca.markets", ["MNQ"], config)
+    batch = strategy.calculate_indicators(bars.iloc[:3000])
+
+    streamed = IndicatorEngine({"ema_200": EMA(200), "atr_14": ATR(14, method="ema")}).warm_up(bars.iloc[:3000])
+    assert_same(streamed["ema_200"], batch["ema_200"])
+    assert_same(streamed["atr_14"], batch["atr_14"])
+
+
+def test_json_state_resumes_exactly(bars):
+    split = len(bars) // 2 + 17
+    uninterrupted = make_engine().warm_up(bars)
+
+    engine = make_engine()
+    engine.warm_up(bars.iloc[:split])
+    saved = json.dumps(engine.state())
+
+    resumed = IndicatorEngine.from_state(json.loads(saved))
+    assert resumed.bars_seen == split
+    tail = resumed.warm_up(bars.iloc[split:])
+
+    pd.testing.assert_frame_equal(tail, uninterrupted.iloc[split:])
+
+
+def test_update_accepts_attribute_bars():
+    class Bar:
+        def __init__(self, timestamp, close):
+            self.timestamp = timestamp
+            self.open = self.high = self.low = self.close = close
+            self.volume = 100.0
+
+    engine = IndicatorEngine({"rsi": RSI(3), "vwap": SessionVWAP(), "high": SessionHigh()})
+    start = pd.Timestamp("2024-04-01 13:30", tz="UTC")
+    for i, close in enumerate([10.0, 11.0, 12.0]):
+        values = engine.update(Bar(start + pd.Timedelta(minutes=i), close))
+
+    assert values["rsi"] == 100.0
+    assert values["vwap"] == pytest.approx(11.0)
+    assert values["high"] == 12.0
+
+    # A new session resets the session indicators but not RSI
+    values = engine.update(Bar(start + pd.Timedelta(days=1), 9.0))
+    assert values["vwap"] == 9.0 and values["high"] == 9.0
+    assert values["rsi"] < 100.0
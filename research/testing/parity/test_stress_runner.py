@@ -0,0 +1,127 @@
+"""
+Parity Tests - Parallel Portfolio Stress-Test Runner
+
+run_portfolio_stress_test() must reproduce per-symbol run_rolling_backtest()
+results, stream every window into the columnar result file, and give the same
+aggregates from a process pool as from the in-process path. Uses cached SOFI
+bars/news behind fake data clients.
+"""
+
+import pickle
+import sys
+from datetime import datetime
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+project_root = Path(__file__).resolve().parent.parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+import src.backtester_pro as backtester_pro
+from src.stress_runner import WINDOW_SCHEMA, run_portfolio_stress_test
+
+BARS_FILE = project_root / "data" / "cache" / "equities" / "SOFI_1min_20240401_20240630.parquet"
+NEWS_FILE = project_root / ".cache" / "fmp_news" / "0b2ca7e5163ebfe0513b0167fdc46807.pkl"
+
+START = datetime(2024, 4, 1)
+END = datetime(2024, 4, 12)
+SYMBOLS = ["SOFI", "SOFI_B"]
+
+
+@pytest.fixture
+def fake_clients(monkeypatch, tmp_path):
+    if not BARS_FILE.exists() or not NEWS_FILE.exists():
+        pytest.skip("Cached bars/news not available")
+    bars = pd.read_parquet(BARS_FILE)[["open", "high", "low", "close", "volume"]]
+    with NEWS_FILE.open("rb") as f:
+        news_list = pickle.load(f)
+
+    class FakeAlpaca:
+        def fetch_historical_bars(self, symbol, timeframe, start, end, feed="sip"):
+            if symbol == "EMPTY":
+                raise ValueError("no bars")
+            # Second symbol gets a scaled copy so the two curves differ
+            scale = 1.0 if symbol == "SOFI" else 2.0
+            window = bars[(bars.index >= start) & (bars.index < end)].copy()
+            window[["open", "high", "low", "close"]] *= scale
+            return window
+
+    class FakeFMP:
+        def fetch_historical_news(self, symbol, start, end, price_df=None):
+            return news_list
+
+    monkeypatch.setattr(backtester_pro, "AlpacaDataClient", FakeAlpaca)
+    monkeypatch.setattr(backtester_pro, "FMPDataClient", FakeFMP)
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+
+def run(tmp_path, workers):
+    return run_portfolio_stress_test(
+        SYMBOLS,
+        start_date=START,
+        end_date=END,
+        initial_capital=10000.0,
+        workers=workers,
+        result_path=str(tmp_path / f"results_{workers}.parquet"),
+        use_cache=False,
+        quiet=True,
+    )
+
+
+def test_portfolio_matches_single_symbol_runs(fake_clients):
+    portfolio = run(fake_clients, workers=1)
+    assert portfolio["errors"] == {}
+
+    for symbol in SYMBOLS:
+        direct = backtester_pro.run_rolling_backtest(
+            symbol, start_date=START, end_date=END, initial_capital=10000.0, quiet=True
+        )
+        result = portfolio["results"][symbol]
+        assert result["final_equity"] == direct["final_equity"]
+        pd.testing.assert_series_equal(result["master_equity_curve"], direct["master_equity_curve"])
+
+    # Every window lands in the columnar file with typed columns
+    windows = pd.read_parquet(portfolio["result_path"])
+    assert list(windows.columns) == WINDOW_SCHEMA.names
+    assert len(windows) == sum(r["total_days"] for r in portfolio["results"].values())
+    assert windows["daily_pnl_dollars"].sum() == pytest.approx(portfolio["cumulative_pnl_dollars"])
+    assert np.allclose(windows[["weight_rsi_14", "weight_volume_zscore", "weight_sentiment"]].sum(axis=1), 1.0)
+
+    # Portfolio equity ends at the sum of the symbols' final equity
+    equity = pd.read_parquet(portfolio["equity_path"])
+    assert equity["portfolio"].iloc[-1] == pytest.approx(portfolio["final_equity"])
+    assert portfolio["daily_results"]["daily_pnl_dollars"].sum() == pytest.approx(portfolio["cumulative_pnl_dollars"])
+
+
+def test_process_pool_matches_in_process(fake_clients):
+    serial = run(fake_clients, workers=1)
+    pooled = run(fake_clients, workers=2)
+
+    assert pooled["symbols"] == serial["symbols"]
+    assert pooled["final_equity"] == serial["final_equity"]
+    pd.testing.assert_frame_equal(pooled["equity_curves"], serial["equity_curves"])
+    pd.testing.assert_frame_equal(pooled["daily_results"], serial["daily_results"])
+
+    serial_rows = pd.read_parquet(serial["result_path"]).sort_values(["symbol", "date"], ignore_index=True)
+    pooled_rows = pd.read_parquet(pooled["result_path"]).sort_values(["symbol", "date"], ignore_index=True)
+    pd.testing.assert_frame_equal(pooled_rows, serial_rows)
+
+
+def test_failed_symbol_is_reported_not_raised(fake_clients):
+    portfolio = run_portfolio_stress_test(
+        ["SOFI", "EMPTY"],
+        start_date=START,
+        end_date=datetime(2024, 4, 5),
+        workers=1,
+        result_path=str(fake_clients / "results.parquet"),
+        use_cache=False,
+        quiet=True,
+    )
+
+    assert portfolio["symbols"] == ["SOFI"]
+    assert "EMPTY" in portfolio["errors"]
+    windows = pd.read_parquet(portfolio["result_path"])
+    assert set(windows["symbol"]) == {"SOFI"}
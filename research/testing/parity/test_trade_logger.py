@@ -0,0 +1,91 @@
+"""
+Parity Tests - Buffered Columnar TradeLogger
+
+Rows logged through the buffered TradeLogger must read back as a typed
+DataFrame with the same values and defaults the CSV logger wrote, flush on the
+size threshold and on close, and create_daily_summary must give the same totals
+computed from the Parquet columns.
+"""
+
+import json
+import sys
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+project_root = Path(__file__).resolve().parent.parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.trade_logger import TradeLogger
+
+
+def test_decisions_round_trip_typed(tmp_path):
+    logger = TradeLogger("bear_trap", log_dir=tmp_path, flush_interval=3600, flush_rows=10_000)
+    start = datetime(2026, 1, 20, 14, 30, tzinfo=timezone.utc)
+    for i in range(50):
+        indicators = {"day_change_pct": np.float64(-3.0 - i), "bars": np.int64(i)}
+        logger.log_decision(
+            timestamp=start + pd.Timedelta(seconds=10 * i),
+            symbol=f"S{i % 5}",
+            decision_type="SKIP_ENTRY",
+            reason=f"Not down enough: {-3.0 - i:.1f}%",
+            current_price=np.float64(10.0 + i),
+            indicator_values=indicators,
+        )
+        indicators["bars"] = -1  # Mutating after logging must not change the row
+    logger.log_risk_gate_failure("S0", "max_daily_loss", {"loss": 1500.0})
+
+    # Nothing on disk until a flush
+    assert not logger.decision_log_path.exists()
+
+    df = logger.read_decisions(parse_json=True)
+    assert len(df) == 51
+    assert str(df["timestamp"].dtype) == "datetime64[us, UTC]"
+    assert df["current_price"].dtype == np.float64
+    assert df["timestamp"].iloc[0] == start
+    assert df["indicator_values"].iloc[7] == {"day_change_pct": -10.0, "bars": 7}
+    assert df["details"].iloc[0] == ""  # CSV logger default
+    assert df["risk_status"].iloc[-1] == {"gate": "max_daily_loss", "details": {"loss": 1500.0}}
+    assert json.loads(logger.read_decisions()["indicator_values"].iloc[0])["bars"] == 0
+
+    s1 = logger.read_decisions(symbol="S1")
+    assert len(s1) == 10 and set(s1["symbol"]) == {"S1"}
+
+
+def test_size_threshold_close_and_summary(tmp_path):
+    logger = TradeLogger("bear_trap", log_dir=tmp_path, flush_interval=3600, flush_rows=20)
+    for i in range(25):
+        logger.log_signal(symbol="AAA", signal_type="BUY", indicator_values={"i": i}, risk_gates_passed=True)
+
+    # Reaching flush_rows wakes the flush thread long before flush_interval
+    deadline = time.monotonic() + 5
+    while not list(logger.signal_log_path.glob("*.parquet")) and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert len(list(logger.signal_log_path.glob("*.parquet"))) == 1
+
+    for i in range(25, 45):
+        logger.log_signal(symbol="AAA", signal_type="BUY", indicator_values={"i": i}, risk_gates_passed=True)
+    trades = [("AAA", 120.0), ("BBB", -40.0), ("AAA", 0.0), ("CCC", 15.5)]
+    for symbol, pnl in trades:
+        logger.log_trade(symbol=symbol, action="EXIT", side="SELL", quantity=100, price=10.0, order_id="x", pnl_dollars=pnl)
+    logger.close()
+
+    # Everything is on disk after close
+    assert len(list(logger.signal_log_path.glob("*.parquet"))) >= 2
+    reopened = TradeLogger("bear_trap", log_dir=tmp_path)
+    signals = reopened.read_signals()
+    assert len(signals) == 45 and signals["risk_gates_passed"].all() and signals["skip_reason"].eq("").all()
+
+    summary = reopened.create_daily_summary()
+    assert summary["total_trades"] == 4
+    assert summary["total_pnl"] == 95.5
+    assert (summary["winning_trades"], summary["losing_trades"]) == (2, 1)
+    assert sorted(summary["symbols_traded"]) == ["AAA", "BBB", "CCC"]
+    assert json.loads((tmp_path / f"bear_trap_summary_{reopened.date_str}.json").read_text()) == summary
+
+    # Summary compacts each day's parts into one
+    assert len(list(reopened.signal_log_path.glob("*.parquet"))) == 1
+    assert len(reopened.read_signals()) == 45
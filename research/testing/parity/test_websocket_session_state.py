@@ -0,0 +1,100 @@
+"""
+Parity Tests - WebSocketScanner Bounded Session State
+
+SessionState must track the same session open/high/low and first-cross selloff
+as the previous per-symbol dict state, keep only the last `history` bars per
+symbol in its ring buffers, and grow for symbols first seen mid-session.
+"""
+
+import sys
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from types import SimpleNamespace
+
+import numpy as np
+
+project_root = Path(__file__).resolve().parent.parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from research.bear_trap_ml_scanner.scanner.session_state import SessionState
+from research.bear_trap_ml_scanner.scanner.websocket_scanner import WebSocketScanner
+
+
+class AlertSink:
+    def __init__(self):
+        self.events = []
+
+    def send_alert(self, event, score_data):
+        self.events.append(event)
+
+    def reset_daily(self):
+        self.events.clear()
+
+
+def make_bars(symbols, minutes, seed=3):
+    rng = np.random.default_rng(seed)
+    start = datetime(2024, 4, 9, 13, 30, tzinfo=timezone.utc)
+    price = np.full(len(symbols), 20.0)
+    bars = []
+    for minute in range(minutes):
+        close = price * np.exp(rng.normal(-0.004, 0.01, len(symbols)))
+        for j, symbol in enumerate(symbols):
+            o, c = float(price[j]), float(close[j])
+            bars.append(SimpleNamespace(
+                symbol=symbol, timestamp=start + timedelta(minutes=minute),
+                open=o, high=max(o, c) * 1.002, low=min(o, c) * 0.998, close=c, volume=float(100 + minute),
+            ))
+        price = close
+    return bars
+
+
+def drive(scanner, bars):
+    for bar in bars:
+        try:
+            scanner._handle_bar(bar).send(None)
+        except StopIteration:
+            pass
+
+
+def test_scanner_session_stats_and_first_cross():
+    symbols = ["AAA", "BBB", "CCC"]
+    bars = make_bars(symbols + ["NEW"], minutes=60)
+    sink = AlertSink()
+    scanner = WebSocketScanner("key", "secret", symbols, threshold_pct=-10.0, alert_manager=sink, history=8)
+    drive(scanner, bars)
+
+    state = scanner.session
+    for symbol in symbols + ["NEW"]:
+        own = [b for b in bars if b.symbol == symbol]
+        snap = state.snapshot(symbol)
+        assert snap["session_open"] == own[0].open
+        assert snap["session_high"] == max(b.high for b in own)
+        assert snap["session_low"] == min(b.low for b in own)
+        assert snap["bars"] == len(own)
+        np.testing.assert_array_equal(state.recent(symbol), [b.close for b in own[-8:]])
+
+        # First bar crossing the threshold, and only that one, raised an alert
+        crossed = [b for b in own if (b.close - own[0].open) / own[0].open * 100 <= -10.0]
+        alerts = [e for e in sink.events if e.symbol == symbol]
+        assert len(alerts) == (1 if crossed else 0)
+        if crossed:
+            assert alerts[0].current_price == crossed[0].close
+            assert snap["selloff_detected"]
+
+    assert sink.events, "synthetic drift should produce selloffs"
+    scanner.reset_daily_tracking()
+    assert state.snapshot("AAA") is None and len(state) == 4
+
+
+def test_session_state_grows_and_wraps():
+    state = SessionState(history=4)
+    for k in range(40):
+        for n in range(20):
+            state.update(f"S{n}", 1.0, 2.0 + k, 0.5, float(k), float(k * 10))
+
+    assert len(state) == 20 and state.capacity == 32
+    assert state.snapshot("S19")["session_high"] == 41.0
+    np.testing.assert_array_equal(state.recent("S0"), [36.0, 37.0, 38.0, 39.0])
+    np.testing.assert_array_equal(state.recent("S0", "volume"), [360.0, 370.0, 380.0, 390.0])
+    assert state.recent("missing").size == 0
+    assert state.nbytes < 32 * 8 * 20
@@ -25,6 +25,7 @@ from dotenv import load_dotenv
 load_dotenv()
 
 from src.data_cache import cache
+from src.hysteresis import schmitt_trigger
 
 # Validated configurations from VALIDATED_STRATEGIES_COMPLETE_REFERENCE.md
 VALIDATED_CONFIGS = {
@@ -76,27 +77,8 @@ def run_backtest(symbol, config, friction_bps):
         # Calculate RSI
         df['rsi'] = calculate_rsi(df['close'], period=config['rsi_period'])
         
-        # Generate signals (RSI hysteresis / Schmidt trigger)
-        position = 0
-        signals = []
-        
-        for i in range(len(df)):
-            rsi_val = df['rsi'].iloc[i]
-            
-            if pd.isna(rsi_val):
-                signals.append(position)
-                continue
-            
-            if position == 0:  # Flat
-                if rsi_val > config['upper_band']:
-                    position = 1  # Go long
-            elif position == 1:  # Long
-                if rsi_val < config['lower_band']:
-                    position = 0  # Go flat
-            
-            signals.append(position)
-        
-        df['signal'] = signals
+        # Generate signals (RSI hysteresis / Schmidt trigger, NaN RSI holds position)
+        df['signal'] = schmitt_trigger(df['rsi'], config['upper_band'], config['lower_band']).astype(np.int64)
         
         # Calculate returns
         df['returns'] = df['close'].pct_change()
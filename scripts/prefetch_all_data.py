@@ -22,6 +22,7 @@ from dotenv import load_dotenv
 load_dotenv()
 
 from src.data_cache import cache
+from src.prefetch import prefetch
 
 # Define test universe
 EQUITIES = ["AAPL", "MSFT", "GOOGL", "NVDA", "META", "AMZN", "TSLA", "NFLX", "AMD", "COIN", "PLTR", "SPY", "QQQ", "IWM"]
@@ -50,31 +51,15 @@ def main():
     total_fetched = 0
     total_cached = 0
 
-    # Fetch Equities
-    print("\n[1/3] FETCHING EQUITY PRICE DATA")
+    # Fetch Equities + Futures concurrently (rate-limited per provider, only missing gaps)
+    print("\n[1-2/3] FETCHING EQUITY + FUTURES PRICE DATA")
     print("-" * 80)
 
-    for symbol in EQUITIES:
-        for period_name, start, end in PERIODS:
-            try:
-                df = cache.get_or_fetch_equity(symbol, "1day", start, end)
-                print(f"✓ {symbol:6} {period_name:10} {len(df):4} bars")
-                total_fetched += 1
-            except Exception as e:
-                print(f"✗ {symbol:6} {period_name:10} ERROR: {e}")
-
-    # Fetch Futures
-    print("\n[2/3] FETCHING FUTURES PRICE DATA")
-    print("-" * 80)
-
-    for symbol in FUTURES:
-        for period_name, start, end in PERIODS:
-            try:
-                df = cache.get_or_fetch_futures(symbol, "1day", start, end)
-                print(f"✓ {symbol:6} {period_name:10} {len(df):4} bars")
-                total_fetched += 1
-            except Exception as e:
-                print(f"✗ {symbol:6} {period_name:10} ERROR: {e}")
+    jobs = [("equities", symbol, "1day", start, end) for symbol in EQUITIES for _, start, end in PERIODS]
+    jobs += [("futures", symbol, "1day", start, end) for symbol in FUTURES for _, start, end in PERIODS]
+    report = prefetch(jobs)
+    total_fetched += report["completed"]
+    print(f"Price data: {report['completed']}/{report['tasks']} chunks, {report['bars']:,} bars in {report['elapsed_sec']:.1f}s")
 
     # Fetch News (Equities only, futures don't have news)
     print("\n[3/3] FETCHING NEWS SENTIMENT DATA")
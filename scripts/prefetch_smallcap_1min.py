@@ -21,8 +21,7 @@ from dotenv import load_dotenv
 
 load_dotenv()
 
-from src.data_cache import cache
-import time
+from src.prefetch import prefetch
 
 # Small-cap universe for scalping strategies
 # Based on SMALL_CAP_SCALPING_STRATEGIES.md
@@ -53,7 +52,7 @@ def main():
     print(f"Total: {len(SMALL_CAPS) * len(PERIODS)} datasets")
     print("=" * 80)
     print("\n⚠️  WARNING: 1-minute data is LARGE (100K+ bars per symbol)")
-    print("⚠️  This will take 10-30 minutes due to API rate limits")
+    print("⚠️  Fetches run concurrently at the provider rate limit")
     print("⚠️  Expected cache size: ~500 MB - 1 GB")
     print("=" * 80)
 
@@ -62,34 +61,21 @@ def main():
         print("Aborted.")
         return
 
-    total_fetched = 0
-    total_bars = 0
-
     print("\n[1/1] FETCHING 1-MINUTE EQUITY DATA")
     print("-" * 80)
 
-    for symbol in SMALL_CAPS:
-        for period_name, start, end in PERIODS:
-            try:
-                print(f"Fetching {symbol:6} {period_name:10}...", end=" ", flush=True)
-                df = cache.get_or_fetch_equity(symbol, "1min", start, end)
-                print(f"✓ {len(df):6} bars")
-                total_fetched += 1
-                total_bars += len(df)
-
-                # Rate limit protection (FMP free tier: 250 calls/day, ~5 calls/sec)
-                # Sleep 1 second between calls to be safe
-                time.sleep(1)
-
-            except Exception as e:
-                print(f"✗ ERROR: {e}")
+    # Concurrent, rate-limited per provider (no fixed sleep between datasets)
+    report = prefetch([("equities", symbol, "1min", start, end) for symbol in SMALL_CAPS for _, start, end in PERIODS])
+    total_fetched = report["completed"]
+    total_bars = report["bars"]
 
     print("\n" + "=" * 80)
     print("PREFETCH COMPLETE")
     print("=" * 80)
     print(f"Total datasets fetched: {total_fetched}")
     print(f"Total bars cached: {total_bars:,}")
-    print(f"All data cached in: data/cache/equities/")
+    print(f"Elapsed: {report['elapsed_sec']:.1f}s | Errors: {len(report['errors'])}")
+    print(f"All data cached in: data/cache/bars/equities/")
     print("\nYou can now run scalping strategy backtests offline!")
     print("\nNext step: Build Strategy E (VWAP Reclaim)")
 
@@ -16,8 +16,7 @@ from dotenv import load_dotenv
 
 load_dotenv()
 
-from src.data_cache import cache
-import time
+from src.prefetch import prefetch
 
 # Expanded small-cap universe (best scalping candidates from user's list)
 EXPANDED_UNIVERSE = [
@@ -81,42 +80,21 @@ def main():
         print("Aborted.")
         return
 
-    total_fetched = 0
-    total_bars = 0
-    errors = []
-
-    print("\n[1/2] FETCHING MIDDLE PERIOD (Apr-Jun 2025) FOR ALL SYMBOLS")
+    print("\n[1/1] FETCHING MIDDLE PERIOD FOR ALL SYMBOLS + RECENT/OLDER FOR NEW SYMBOLS")
     print("-" * 80)
 
-    # Fetch Middle period for ALL symbols
-    for symbol in EXPANDED_UNIVERSE:
-        try:
-            print(f"Fetching {symbol:6} Middle    ...", end=" ", flush=True)
-            df = cache.get_or_fetch_equity(symbol, "1min", "2025-04-01", "2025-06-30")
-            print(f"✓ {len(df):6} bars")
-            total_fetched += 1
-            total_bars += len(df)
-            time.sleep(1)  # Rate limit
-        except Exception as e:
-            print(f"✗ ERROR: {e}")
-            errors.append(f"{symbol} Middle: {e}")
-
-    print("\n[2/2] FETCHING RECENT + OLDER PERIODS FOR NEW SYMBOLS")
-    print("-" * 80)
+    # Plan every dataset up front; the engine only fetches gaps not already cached
+    jobs = [("equities", symbol, "1min", "2025-04-01", "2025-06-30") for symbol in EXPANDED_UNIVERSE]
+    jobs += [
+        ("equities", symbol, "1min", start, end)
+        for symbol in new_symbols
+        for _, start, end in [PERIODS[0], PERIODS[2]]  # Recent and Older
+    ]
+    report = prefetch(jobs)
 
-    # Fetch Recent and Older for NEW symbols only
-    for symbol in new_symbols:
-        for period_name, start, end in [PERIODS[0], PERIODS[2]]:  # Recent and Older
-            try:
-                print(f"Fetching {symbol:6} {period_name:10}...", end=" ", flush=True)
-                df = cache.get_or_fetch_equity(symbol, "1min", start, end)
-                print(f"✓ {len(df):6} bars")
-                total_fetched += 1
-                total_bars += len(df)
-                time.sleep(1)  # Rate limit
-            except Exception as e:
-                print(f"✗ ERROR: {e}")
-                errors.append(f"{symbol} {period_name}: {e}")
+    total_fetched = report["completed"]
+    total_bars = report["bars"]
+    errors = [f"{task['symbol']} {task['start']} -> {task['end']}: {error}" for task, error in report["errors"]]
 
     print("\n" + "=" * 80)
     print("PREFETCH COMPLETE")
@@ -130,7 +108,7 @@ def main():
         for error in errors:
             print(f"  - {error}")
 
-    print(f"\nAll data cached in: data/cache/equities/")
+    print(f"\nAll data cached in: data/cache/bars/equities/")
     print("\nExpanded universe ready for testing!")
 
     # Summary
@@ -8,6 +8,60 @@ import numpy as np
 from datetime import datetime, timedelta
 from typing import Dict, List, Tuple
 import json
+import sys
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.hysteresis import schmitt_trigger
+
+
+def simulate_hysteresis(
+    price_data: pd.DataFrame, upper_band: float, lower_band: float, initial_capital: float, friction: float = 0.0005
+) -> Tuple[pd.DataFrame, List[Dict], float]:
+    """
+    Long-only RSI hysteresis trades from a price_data frame with 'date', 'close' and 'rsi'.
+
+    Positions come from the Schmitt-trigger latch (src.hysteresis.schmitt_trigger):
+    enter at the close when RSI > upper_band, exit at the close when RSI < lower_band,
+    NaN RSI holds. Each closed trade compounds (exit / entry - 1 - friction) into equity;
+    an open position at the end is left open.
+
+    Returns:
+        Tuple of (equity_curve, trades, final equity)
+    """
+    position = schmitt_trigger(price_data["rsi"], upper_band, lower_band)
+    held = np.r_[0, position[:-1]]
+    entries = np.flatnonzero(position > held)
+    exits = np.flatnonzero(position < held)
+    entries = entries[: len(exits)]
+
+    close = price_data["close"].to_numpy(dtype=float)
+    trade_returns = (close[exits] / close[entries]) - 1
+    trade_returns -= friction
+    equity_levels = np.cumprod(np.r_[initial_capital, 1 + trade_returns])
+
+    dates = price_data["date"]
+    trades = [
+        {
+            "entry_date": dates.iloc[e],
+            "exit_date": dates.iloc[x],
+            "entry_price": close[e],
+            "exit_price": close[x],
+            "return": r,
+            "equity": eq,
+        }
+        for e, x, r, eq in zip(entries.tolist(), exits.tolist(), trade_returns.tolist(), equity_levels[1:].tolist())
+    ]
+
+    # Realized equity after each bar (exits booked on their bar)
+    closed = np.cumsum(position < held)
+    equity_curve = pd.DataFrame(
+        {"date": price_data["date"].to_numpy(), "equity": equity_levels[closed], "position": position.astype(np.int64)}
+    )
+    return equity_curve, trades, float(equity_levels[-1])
 
 
 class StrategySimulator:
@@ -125,52 +179,10 @@ class DailyTrendHysteresisSimulator(StrategySimulator):
         # Calculate RSI
         price_data["rsi"] = self.calculate_rsi(price_data["close"], self.rsi_period)
 
-        # Generate signals
-        position = 0  # 0 = flat, 1 = long
-        equity = self.initial_capital
-        trades = []
-        equity_curve = []
-
-        for i in range(len(price_data)):
-            row = price_data.iloc[i]
-
-            if pd.isna(row["rsi"]):
-                equity_curve.append({"date": row["date"], "equity": equity, "position": position})
-                continue
-
-            # Hysteresis logic
-            if row["rsi"] > self.upper_band and position == 0:
-                # Enter long
-                position = 1
-                entry_price = row["close"]
-                entry_date = row["date"]
-
-            elif row["rsi"] < self.lower_band and position == 1:
-                # Exit long
-                exit_price = row["close"]
-                exit_date = row["date"]
-                trade_return = (exit_price / entry_price) - 1
-
-                # Apply friction (5 bps round-trip)
-                trade_return -= 0.0005
-
-                equity *= 1 + trade_return
-                trades.append(
-                    {
-                        "entry_date": entry_date,
-                        "exit_date": exit_date,
-                        "entry_price": entry_price,
-                        "exit_price": exit_price,
-                        "return": trade_return,
-                        "equity": equity,
-                    }
-                )
-                position = 0
-
-            equity_curve.append({"date": row["date"], "equity": equity, "position": position})
-
-        # Convert to DataFrames
-        equity_df = pd.DataFrame(equity_curve)
+        # Generate signals (Schmitt-trigger latch) and trades
+        equity_df, trades, equity = simulate_hysteresis(
+            price_data, self.upper_band, self.lower_band, self.initial_capital, friction=0.0005
+        )
 
         # Calculate statistics
         if len(trades) > 0:
@@ -209,49 +221,10 @@ class HourlySwingSimulator(StrategySimulator):
         # Calculate RSI
         price_data["rsi"] = self.calculate_rsi(price_data["close"], self.rsi_period)
 
-        # Generate signals
-        position = 0
-        equity = self.initial_capital
-        trades = []
-        equity_curve = []
-
-        for i in range(len(price_data)):
-            row = price_data.iloc[i]
-
-            if pd.isna(row["rsi"]):
-                equity_curve.append({"date": row["date"], "equity": equity, "position": position})
-                continue
-
-            # Hysteresis logic (same as daily)
-            if row["rsi"] > self.upper_band and position == 0:
-                position = 1
-                entry_price = row["close"]
-                entry_date = row["date"]
-
-            elif row["rsi"] < self.lower_band and position == 1:
-                exit_price = row["close"]
-                exit_date = row["date"]
-                trade_return = (exit_price / entry_price) - 1
-
-                # Apply friction (5 bps)
-                trade_return -= 0.0005
-
-                equity *= 1 + trade_return
-                trades.append(
-                    {
-                        "entry_date": entry_date,
-                        "exit_date": exit_date,
-                        "entry_price": entry_price,
-                        "exit_price": exit_price,
-                        "return": trade_return,
-                        "equity": equity,
-                    }
-                )
-                position = 0
-
-            equity_curve.append({"date": row["date"], "equity": equity, "position": position})
-
-        equity_df = pd.DataFrame(equity_curve)
+        # Generate signals (Schmitt-trigger latch) and trades
+        equity_df, trades, equity = simulate_hysteresis(
+            price_data, self.upper_band, self.lower_band, self.initial_capital, friction=0.0005
+        )
 
         if len(trades) > 0:
             returns = pd.Series([t["return"] for t in trades])
@@ -10,7 +10,13 @@ from typing import Dict, List
 import os
 
 from src.data_handler import AlpacaDataClient, FMPDataClient
-from src.features import FeatureEngineer, add_technical_indicators, merge_news_pit, generate_master_signal
+from src.features import (
+    FeatureEngineer,
+    add_normalized_features,
+    add_technical_indicators,
+    generate_master_signal,
+    merge_news_pit,
+)
 from src.discovery import trim_warmup_period
 from src.optimizer import optimize_alpha_weights, calculate_alpha_with_weights, RETRAIN_INTERVAL
 from src.pnl_tracker import simulate_portfolio, calculate_max_drawdown
@@ -21,6 +27,143 @@ from src.config_loader import EngineConfig
 LIQUIDITY_CAP_USD = float(EngineConfig().get("POSITION_CAP", strict=True))
 
 
+# Strictly causal feature columns consumed by the window loop (checked by verify_features)
+CAUSAL_FEATURE_COLS = [
+    "log_return",
+    "rsi_14",
+    "volatility_14",
+    "volume_zscore",
+    "rsi_14_norm",
+    "volume_zscore_norm",
+]
+
+# Not causal over the full history: merge_news_pit's frequency proxy z-scores news
+# counts over the whole frame (and picks the proxy from every article), and its
+# edge back-fill reads ahead. slice_window_features recomputes these per window.
+WINDOW_FEATURE_COLS = ["sentiment", "sentiment_norm"]
+
+
+def build_window_features(
+    bars: pd.DataFrame, news_list: List[Dict], symbol: str, node_config: dict = None
+) -> pd.DataFrame:
+    """
+    Featurize one window from scratch (per-window recomputation).
+
+    Args:
+        bars: OHLCV bars for the window
+        news_list: FMP news for PIT sentiment
+        symbol: Stock symbol
+        node_config: Optional ticker-specific config
+
+    Returns:
+        Feature DataFrame with master signal columns, warmup rows trimmed
+    """
+    df = bars.copy()
+    df["log_return"] = FeatureEngineer.calculate_log_return(df)
+    features = merge_news_pit(df, news_list, lookback_hours=4, ticker=symbol)
+    add_technical_indicators(features, node_config=node_config)
+    generate_master_signal(features, node_config=node_config, ticker=symbol)
+    return trim_warmup_period(features, warmup_rows=20)
+
+
+def build_feature_matrix(
+    all_bars: pd.DataFrame, news_list: List[Dict], symbol: str, node_config: dict = None
+) -> pd.DataFrame:
+    """
+    Compute the causal feature matrix once over the full bar history.
+
+    Log returns, technical indicators and the shared normalization stage only
+    look back, so windows can be sliced from this matrix by index. PIT sentiment
+    is attached too, but WINDOW_FEATURE_COLS are replaced per window on slicing.
+
+    Args:
+        all_bars: OHLCV bars for the whole backtest range
+        news_list: FMP news for PIT sentiment
+        symbol: Stock symbol
+        node_config: Optional ticker-specific config
+
+    Returns:
+        Feature DataFrame indexed like all_bars (no master signal columns)
+    """
+    df = all_bars.copy()
+    df["log_return"] = FeatureEngineer.calculate_log_return(df)
+    features = merge_news_pit(df, news_list, lookback_hours=4, ticker=symbol)
+    add_technical_indicators(features, node_config=node_config)
+    return features
+
+
+def slice_window_features(
+    feature_matrix: pd.DataFrame,
+    news_list: List[Dict],
+    start_str: str,
+    end_str: str,
+    symbol: str,
+    node_config: dict = None,
+    master_signal: bool = True,
+) -> pd.DataFrame:
+    """
+    Slice one window from the precomputed feature matrix.
+
+    Sentiment (WINDOW_FEATURE_COLS) is recomputed from the window's own bars,
+    exactly as build_window_features() does, since the full-history version
+    leaks later news into earlier windows. The master signal (frame-level
+    Fermi Gate and hysteresis state) is not causal across windows either, so
+    when requested it is generated on the slice only.
+
+    Args:
+        feature_matrix: Output of build_feature_matrix()
+        news_list: FMP news for PIT sentiment (same list as build_feature_matrix)
+        start_str: Window start date (inclusive, YYYY-MM-DD)
+        end_str: Window end date (exclusive, YYYY-MM-DD)
+        symbol: Stock symbol
+        node_config: Optional ticker-specific config
+        master_signal: Run generate_master_signal() on the slice (default: True)
+
+    Returns:
+        Feature DataFrame, warmup rows trimmed
+    """
+    mask = (feature_matrix.index >= start_str) & (feature_matrix.index < end_str)
+    features = merge_news_pit(feature_matrix.loc[mask], news_list, lookback_hours=4, ticker=symbol)
+    add_normalized_features(features, ["sentiment"])
+    if master_signal:
+        generate_master_signal(features, node_config=node_config, ticker=symbol)
+    return trim_warmup_period(features, warmup_rows=20)
+
+
+def compare_window_features(
+    sliced: pd.DataFrame, recomputed: pd.DataFrame, columns: List[str] = None
+) -> Dict[str, float]:
+    """
+    Compare a sliced window against its per-window recomputation.
+
+    Args:
+        sliced: Window from slice_window_features()
+        recomputed: Same window from build_window_features()
+        columns: Columns to compare (default: CAUSAL_FEATURE_COLS + WINDOW_FEATURE_COLS)
+
+    Returns:
+        Dict mapping column -> max absolute difference on the shared index
+        (NaN on one side only counts as inf)
+    """
+    if columns is None:
+        columns = CAUSAL_FEATURE_COLS + WINDOW_FEATURE_COLS
+
+    common_index = sliced.index.intersection(recomputed.index)
+    diffs = {}
+    for col in columns:
+        if col not in sliced.columns or col not in recomputed.columns:
+            continue
+        a = sliced.loc[common_index, col].to_numpy(dtype=float)
+        b = recomputed.loc[common_index, col].to_numpy(dtype=float)
+        nan_mismatch = np.isnan(a) != np.isnan(b)
+        if nan_mismatch.any():
+            diffs[col] = float("inf")
+        else:
+            abs_diff = np.abs(a - b)
+            diffs[col] = float(np.nanmax(abs_diff)) if (~np.isnan(abs_diff)).any() else 0.0
+    return diffs
+
+
 def calculate_wfe(in_sample_hr: float, out_sample_hr: float) -> float:
     """
     Calculate Walk-Forward Efficiency (WFE).
@@ -83,6 +226,42 @@ def get_trading_days(end_date: datetime, num_days: int) -> List[datetime]:
     return list(reversed(trading_days))
 
 
+def resolve_trading_days(
+    days: int, in_sample_days: int, start_date: datetime = None, end_date: datetime = None
+) -> List[datetime]:
+    """
+    Resolve the trading days covered by a rolling backtest.
+
+    An explicit start_date/end_date range overrides the days count; otherwise
+    days + in_sample_days weekdays are counted back from end_date (default: yesterday).
+
+    Args:
+        days: Number of out-of-sample days
+        in_sample_days: Days for in-sample optimization
+        start_date: Start of an explicit temporal range
+        end_date: End of the range (default: yesterday)
+
+    Returns:
+        List of datetime objects representing trading days (oldest first)
+    """
+    if start_date is not None and end_date is not None:
+        # Calculate trading days between start and end
+        trading_days = []
+        current = start_date
+        while current <= end_date:
+            if current.weekday() < 5:  # Weekday
+                trading_days.append(current)
+            current += timedelta(days=1)
+        return trading_days
+
+    # Fallback: calculate from days_back
+    if end_date is None:
+        end_date = datetime.now() - timedelta(days=1)  # Yesterday
+
+    # Get trading days (we need days + in_sample_days to have full windows)
+    return get_trading_days(end_date, days + in_sample_days)
+
+
 def run_rolling_backtest(
     symbol: str,
     days: int = 15,
@@ -93,6 +272,10 @@ def run_rolling_backtest(
     report_only: bool = False,
     quiet: bool = False,
     node_config: dict = None,
+    feature_mode: str = "window",
+    verify_features: bool = False,
+    verify_tolerance: float = 1e-9,
+    all_bars: pd.DataFrame = None,
 ) -> Dict:
     """
     Run multi-day rolling walk-forward backtest.
@@ -102,6 +285,15 @@ def run_rolling_backtest(
     - Out-of-Sample: 1 day for validation
     - Window advances by 1 day each iteration
 
+    Feature modes:
+    - 'window': featurize every IS and OOS window from scratch (default)
+    - 'full': compute the causal feature matrix once over all bars and slice
+      windows by index; sentiment is recomputed per window, and the master
+      signal is generated per window only when its hysteresis_signal is used
+      (enable_hysteresis).
+      With verify_features, each window is also recomputed and compared on
+      CAUSAL_FEATURE_COLS + WINDOW_FEATURE_COLS (results under 'feature_verification').
+
     Args:
         symbol: Stock symbol (e.g., 'SPY')
         days: Total trading days to process (default: 15)
@@ -109,10 +301,18 @@ def run_rolling_backtest(
         initial_capital: Starting capital in dollars (default: 100,000)
         end_date: End date for backtest (default: yesterday)
         report_only: If True, suppress verbose window-by-window logging
+        feature_mode: 'window' (per-window recomputation) or 'full' (feature-once, slice-many)
+        verify_features: In 'full' mode, compare each sliced window with its recomputation
+        verify_tolerance: Max absolute difference treated as a match (default: 1e-9)
+        all_bars: Pre-fetched OHLCV bars covering the range (e.g. from the data cache);
+            skips the Alpaca fetch when provided
 
     Returns:
         Dict with comprehensive backtest results
     """
+    if feature_mode not in ("window", "full"):
+        raise ValueError(f"Unknown feature_mode: {feature_mode}")
+
     if not quiet:
         print("\n" + "=" * 60)
         print(f"[STRESS TEST] Multi-Day Rolling Walk-Forward Backtest")
@@ -123,36 +323,13 @@ def run_rolling_backtest(
     # Initialize clients
     alpaca_client = AlpacaDataClient()
     fmp_client = FMPDataClient()
-    feature_engineer = FeatureEngineer()
 
     # Determine date range: explicit dates override days_back calculation
-    if start_date is not None and end_date is not None:
-        # Explicit temporal range provided
-        if not quiet:
-            print(
-                f"[TEMPORAL] Syncing Clock to Epoch: {start_date.strftime('%Y-%m-%d')} -> {end_date.strftime('%Y-%m-%d')}"
-            )
-
-        # Calculate trading days between start and end
-        trading_days = []
-        current = start_date
-        while current <= end_date:
-            if current.weekday() < 5:  # Weekday
-                trading_days.append(current)
-            current += timedelta(days=1)
-
-        # Override days count based on actual range
-        days = len(trading_days) - in_sample_days
-        if days < 1:
-            days = 1
-    else:
-        # Fallback: calculate from days_back
-        if end_date is None:
-            end_date = datetime.now() - timedelta(days=1)  # Yesterday
-
-        # Get trading days (we need days + in_sample_days to have full windows)
-        total_days_needed = days + in_sample_days
-        trading_days = get_trading_days(end_date, total_days_needed)
+    if start_date is not None and end_date is not None and not quiet:
+        print(
+            f"[TEMPORAL] Syncing Clock to Epoch: {start_date.strftime('%Y-%m-%d')} -> {end_date.strftime('%Y-%m-%d')}"
+        )
+    trading_days = resolve_trading_days(days, in_sample_days, start_date=start_date, end_date=end_date)
 
     if not quiet:
         print(
@@ -183,9 +360,10 @@ def run_rolling_backtest(
     target_tf = tf_map.get(fetch_interval, TimeFrame.Minute)
 
     try:
-        all_bars = alpaca_client.fetch_historical_bars(
-            symbol=symbol, timeframe=target_tf, start=start_str, end=end_str, feed="sip"
-        )
+        if all_bars is None:
+            all_bars = alpaca_client.fetch_historical_bars(
+                symbol=symbol, timeframe=target_tf, start=start_str, end=end_str, feed="sip"
+            )
         if not quiet:
             print(f"[STRESS TEST] Fetched {len(all_bars)} total bars")
 
@@ -217,6 +395,17 @@ def run_rolling_backtest(
         print(f"[STRESS TEST WARNING] News fetch failed: {e}, using neutral sentiment")
         news_list = []
 
+    # FEATURE-ONCE: Causal features computed over all bars, windows sliced by index
+    feature_matrix = None
+    feature_verification = []
+    if feature_mode == "full":
+        if not quiet:
+            print(f"[STRESS TEST] Feature-once mode: featurizing {len(all_bars)} bars a single time")
+        feature_matrix = build_feature_matrix(all_bars, news_list, symbol, node_config=node_config)
+
+    # The window loop only consumes the master signal's hysteresis_signal (VARIANT F)
+    window_master_signal = bool(node_config and node_config.get("enable_hysteresis", False))
+
     # Process rolling windows
     daily_results = []
     cumulative_equity = initial_capital
@@ -228,23 +417,25 @@ def run_rolling_backtest(
         print(f"\n[STRESS TEST] Processing {num_oos_windows} rolling windows...")
         print("-" * 60)
 
-    # Initialize Report File
+    # Initialize Report (buffered in memory, written once when the run finishes)
     report_path = f"stress_test_report_{symbol}.txt"
-    with open(report_path, "w") as f:
-        f.write(f"STRESS TEST REPORT: {symbol}\n")
-        f.write("=" * 60 + "\n")
+    report_lines = [f"STRESS TEST REPORT: {symbol}", "=" * 60]
 
     def log_msg(msg: str, verbose: bool = False):
         """
         Dual-stream logger:
         - Terminal: Print if not quiet OR if message is critical (WFE-REPORT)
-        - File: Write ONLY if not (verbose and report_only)
+        - File: Buffer ONLY if not (verbose and report_only)
         """
         if not quiet or "[WFE-REPORT]" in msg:
             print(msg)
         if not (verbose and report_only):
-            with open(report_path, "a") as f:
-                f.write(msg + "\n")
+            report_lines.append(msg)
+
+    def write_report():
+        """Write the buffered report in a single open/write."""
+        with open(report_path, "w") as f:
+            f.write("\n".join(report_lines) + "\n")
 
     # 20-Day Rigid Lock: Track block-level metrics
     optimal_weights_locked = None  # Weights locked for RETRAIN_INTERVAL days
@@ -292,22 +483,29 @@ def run_rolling_backtest(
             log_msg(f"  [SKIP] Insufficient bars: IS={len(is_bars)}, OOS={len(oos_bars)}", verbose=True)
             continue
 
-        # Feature engineering for in-sample
-        is_df = is_bars.copy()
-        is_df["log_return"] = feature_engineer.calculate_log_return(is_df)
-        is_features = merge_news_pit(is_df, news_list, lookback_hours=4, ticker=symbol)
-        add_technical_indicators(is_features, node_config=node_config)
+        if feature_mode == "full":
+            is_features = slice_window_features(
+                feature_matrix, news_list, is_start_str, is_end_str, symbol, node_config, master_signal=window_master_signal
+            )
+            oos_features = slice_window_features(
+                feature_matrix, news_list, oos_start_str, oos_end_str, symbol, node_config, master_signal=window_master_signal
+            )
 
-        generate_master_signal(is_features, node_config=node_config, ticker=symbol)
-        is_features = trim_warmup_period(is_features, warmup_rows=20)
+            if verify_features:
+                for segment, sliced, bars in (("IS", is_features, is_bars), ("OOS", oos_features, oos_bars)):
+                    diffs = compare_window_features(sliced, build_window_features(bars, news_list, symbol, node_config))
+                    mismatched = {col: diff for col, diff in diffs.items() if diff > verify_tolerance}
+                    feature_verification.append(
+                        {"window": window_idx + 1, "segment": segment, "max_abs_diff": diffs, "match": not mismatched}
+                    )
+                    if mismatched:
+                        log_msg(f"  [FEATURE-ONCE] {segment} mismatch vs recomputation: {mismatched}", verbose=True)
+        else:
+            # Feature engineering for in-sample
+            is_features = build_window_features(is_bars, news_list, symbol, node_config=node_config)
 
-        # Feature engineering for out-of-sample
-        oos_df = oos_bars.copy()
-        oos_df["log_return"] = feature_engineer.calculate_log_return(oos_df)
-        oos_features = merge_news_pit(oos_df, news_list, lookback_hours=4, ticker=symbol)
-        add_technical_indicators(oos_features, node_config=node_config)
-        generate_master_signal(oos_features, node_config=node_config, ticker=symbol)
-        oos_features = trim_warmup_period(oos_features, warmup_rows=20)
+            # Feature engineering for out-of-sample
+            oos_features = build_window_features(oos_bars, news_list, symbol, node_config=node_config)
 
         if len(is_features) < 50 or len(oos_features) < 30:
             log_msg(
@@ -493,6 +691,7 @@ def run_rolling_backtest(
     # Aggregate results
     if not daily_results:
         print("\n[STRESS TEST] No valid windows processed!")
+        write_report()
         return {"error": "No valid windows"}
 
     # Build master equity curve
@@ -534,6 +733,12 @@ def run_rolling_backtest(
         "report_file_path": report_path,
     }
 
+    if verify_features and feature_mode == "full":
+        matched = sum(1 for v in feature_verification if v["match"])
+        log_msg(f"[FEATURE-ONCE] Verified {matched}/{len(feature_verification)} windows within {verify_tolerance:g}")
+        result["feature_verification"] = feature_verification
+
+    write_report()
     return result
 
 
@@ -548,17 +753,22 @@ def print_stress_test_summary(result: Dict) -> None:
     print("[15-DAY STRESS TEST SUMMARY]")
     print("=" * 60)
 
-    # helper for dual logging within summary
+    # helper for dual logging within summary (report lines appended once at the end)
     report_path = result.get("report_file_path")
+    summary_lines = []
 
     def log_sum(msg):
         print(msg)
-        if report_path:
+        summary_lines.append(msg)
+
+    def append_report():
+        if report_path and summary_lines:
             with open(report_path, "a") as f:
-                f.write(msg + "\n")
+                f.write("\n".join(summary_lines) + "\n")
 
     if "error" in result:
         log_sum(f"[ERROR] Stress test failed: {result['error']}")
+        append_report()
         return
 
     # Header
@@ -620,6 +830,8 @@ def print_stress_test_summary(result: Dict) -> None:
                 f"{day['date']:<12} {day['in_sample_hit_rate']*100:>5.1f}%  {day['out_sample_hit_rate']*100:>5.1f}%  {day['wfe']:>5.2f}  ${day['daily_pnl_dollars']:>+10,.2f}"
             )
 
+    append_report()
+
 
 def export_stress_test_results(result: Dict, filepath: str = "stress_test_equity.csv") -> None:
     """
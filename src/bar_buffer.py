@@ -0,0 +1,306 @@
+"""
+Rolling Bar Buffer Module
+Per-symbol in-memory ring buffers for the live strategy runners.
+
+Each buffer preallocates flat NumPy arrays (timestamp + OHLCV) of fixed capacity
+and keeps the most recent bars in ring order. A BarBuffers set is seeded once at
+startup from the partitioned parquet cache, then every cycle fetches only the
+bars since each symbol's last timestamp (one batched request for all symbols via
+src.bar_fetch) and appends them. The runners' indicator code reads its window
+from the buffer instead of refetching the whole look-back every cycle.
+
+Timestamps are stored as int64 nanoseconds since the epoch in UTC; naive input
+timestamps are taken to be UTC (as in the parquet cache). Frames come back with
+a tz-aware UTC index, matching bars from the Alpaca SDK.
+
+Streamed bars (WebSocket or replay) are appended one at a time with append_bar().
+The default "now" is read through datetime.now, so a replay clock (src.replay)
+drives the look-back windows of unmodified runners.
+
+Consumers:
+- BearTrapStrategy.process_market_data / on_bar: 45-minute window of 1Min bars
+- HourlySwingExecutor.process_hourly_signals: 30-day window of 1H bars
+"""
+
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Iterable, Optional
+
+import numpy as np
+import pandas as pd
+
+from src.bar_fetch import BAR_FIELDS, fetch_bars, split_by_symbol
+
+
+def _utc_now() -> pd.Timestamp:
+    """Current UTC time read through datetime.now (the clock src.replay substitutes)."""
+    return pd.Timestamp(datetime.now(timezone.utc))
+
+
+def _to_utc_ns(index) -> np.ndarray:
+    """Convert a DatetimeIndex (naive = UTC) to int64 nanoseconds since the epoch."""
+    index = pd.DatetimeIndex(index)
+    if index.tz is not None:
+        index = index.tz_convert("UTC").tz_localize(None)
+    return index.as_unit("ns").asi8
+
+
+class BarRingBuffer:
+    """
+    Fixed-capacity ring buffer of OHLCV bars for one symbol.
+
+    Usage:
+        buffer = BarRingBuffer(capacity=600)
+        buffer.extend(bars_df)                # appends bars newer than the last one
+        window = buffer.to_frame(start=now - timedelta(minutes=45))
+    """
+
+    __slots__ = ("capacity", "_ts", "_values", "_start", "_size")
+
+    def __init__(self, capacity: int):
+        """
+        Initialize BarRingBuffer.
+
+        Args:
+            capacity: Maximum number of bars kept (older bars are overwritten)
+        """
+        self.capacity = int(capacity)
+        self._ts = np.zeros(self.capacity, dtype=np.int64)
+        self._values = np.zeros((len(BAR_FIELDS), self.capacity), dtype=np.float64)
+        self._start = 0
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    @property
+    def last_timestamp(self) -> Optional[pd.Timestamp]:
+        """Timestamp of the newest bar (None if empty)."""
+        if self._size == 0:
+            return None
+        return pd.Timestamp(int(self._ts[(self._start + self._size - 1) % self.capacity]), tz="UTC")
+
+    def extend(self, bars: pd.DataFrame) -> int:
+        """
+        Append bars newer than the last stored bar.
+
+        A bar with the same timestamp as the last stored one replaces it (the
+        still-forming bar of the previous fetch); older bars are ignored.
+
+        Args:
+            bars: DataFrame indexed by timestamp (sorted) with open/high/low/close/volume
+
+        Returns:
+            Number of bars appended (a replaced last bar does not count)
+        """
+        if bars is None or len(bars) == 0:
+            return 0
+
+        ts = _to_utc_ns(bars.index)
+        values = bars[list(BAR_FIELDS)].to_numpy(dtype=np.float64).T
+
+        if self._size:
+            last_pos = (self._start + self._size - 1) % self.capacity
+            first_new = int(np.searchsorted(ts, self._ts[last_pos], side="left"))
+            if first_new < len(ts) and ts[first_new] == self._ts[last_pos]:
+                self._values[:, last_pos] = values[:, first_new]
+                first_new += 1
+            ts = ts[first_new:]
+            values = values[:, first_new:]
+
+        n = len(ts)
+        if n == 0:
+            return 0
+        if n > self.capacity:
+            ts = ts[-self.capacity :]
+            values = values[:, -self.capacity :]
+
+        positions = (self._start + self._size + np.arange(len(ts))) % self.capacity
+        self._ts[positions] = ts
+        self._values[:, positions] = values
+
+        overflow = max(0, self._size + len(ts) - self.capacity)
+        self._start = (self._start + overflow) % self.capacity
+        self._size = min(self.capacity, self._size + len(ts))
+        return n
+
+    def append(self, timestamp, open_: float, high: float, low: float, close: float, volume: float) -> bool:
+        """
+        Append one streamed bar in O(1).
+
+        Same rules as extend(): a bar with the last stored timestamp replaces it,
+        an older bar is ignored.
+
+        Args:
+            timestamp: Bar timestamp (naive = UTC)
+            open_, high, low, close, volume: Bar values
+
+        Returns:
+            True if the bar was appended or replaced the last bar
+        """
+        ts = pd.Timestamp(timestamp)
+        ts = (ts.tz_convert("UTC").tz_localize(None) if ts.tz is not None else ts).as_unit("ns").value
+
+        if self._size:
+            last_pos = (self._start + self._size - 1) % self.capacity
+            if ts < self._ts[last_pos]:
+                return False
+            if ts == self._ts[last_pos]:
+                self._values[:, last_pos] = (open_, high, low, close, volume)
+                return True
+
+        pos = (self._start + self._size) % self.capacity
+        self._ts[pos] = ts
+        self._values[:, pos] = (open_, high, low, close, volume)
+        if self._size == self.capacity:
+            self._start = (self._start + 1) % self.capacity
+        else:
+            self._size += 1
+        return True
+
+    def to_frame(self, start=None) -> pd.DataFrame:
+        """
+        Return the buffered bars in time order.
+
+        Args:
+            start: Optional earliest timestamp to include (naive = UTC)
+
+        Returns:
+            DataFrame indexed by tz-aware UTC timestamp with open/high/low/close/volume
+        """
+        order = (self._start + np.arange(self._size)) % self.capacity
+        ts = self._ts[order]
+        if start is not None:
+            first = int(np.searchsorted(ts, _to_utc_ns([start])[0], side="left"))
+            order = order[first:]
+            ts = ts[first:]
+
+        index = pd.DatetimeIndex(ts.view("datetime64[ns]"), name="timestamp").tz_localize("UTC")
+        values = self._values[:, order]
+        return pd.DataFrame({field: values[i] for i, field in enumerate(BAR_FIELDS)}, index=index)
+
+
+class BarBuffers:
+    """
+    Ring buffers for a set of symbols sharing one timeframe and look-back window.
+
+    Usage:
+        buffers = BarBuffers(symbols, TimeFrame.Minute, timedelta(minutes=45), capacity=600, feed="sip")
+        buffers.seed(store, "equities", "1min")   # once at startup
+        buffers.update(data_client)               # every cycle: only new bars are fetched
+        df = buffers.frame("AAPL")                 # last 45 minutes
+    """
+
+    def __init__(
+        self,
+        symbols: Iterable[str],
+        timeframe,
+        lookback: timedelta,
+        capacity: int,
+        feed: Optional[str] = None,
+    ):
+        """
+        Initialize BarBuffers.
+
+        Args:
+            symbols: Symbols to buffer
+            timeframe: Alpaca TimeFrame used for incremental fetches
+            lookback: Window the runner's indicators need (bounds fetches and reads)
+            capacity: Bars kept per symbol (must cover the look-back window)
+            feed: Data feed for fetches, e.g. "sip" (None = account default)
+        """
+        self.timeframe = timeframe
+        self.lookback = lookback
+        self.feed = feed
+        self.buffers: Dict[str, BarRingBuffer] = {symbol: BarRingBuffer(capacity) for symbol in symbols}
+        self.bars_fetched = 0
+
+    @property
+    def symbols(self):
+        return list(self.buffers)
+
+    def seed(self, store, asset_type: str, cache_timeframe: str, now=None) -> int:
+        """
+        Fill the buffers from the parquet cache for the look-back window.
+
+        Args:
+            store: PartitionedBarStore holding cached bars
+            asset_type: Store asset type, e.g. 'equities'
+            cache_timeframe: Store timeframe, e.g. '1min' or '1hour'
+            now: Current time (default: now, UTC)
+
+        Returns:
+            Number of bars loaded
+        """
+        now = _utc_now() if now is None else pd.Timestamp(now)
+        start = (now - self.lookback).tz_localize(None) if now.tz is not None else now - self.lookback
+        loaded = 0
+        for symbol, buffer in self.buffers.items():
+            cached = store.read(asset_type, symbol, cache_timeframe, start.date(), now.date(), columns=list(BAR_FIELDS))
+            if len(cached):
+                loaded += buffer.extend(cached[cached.index >= start])
+        return loaded
+
+    def update(self, data_client, now=None) -> int:
+        """
+        Fetch bars since each symbol's last timestamp and append them.
+
+        One batched request covers all symbols, starting at the oldest last
+        timestamp (or the look-back start for symbols with an empty buffer).
+
+        Args:
+            data_client: StockHistoricalDataClient (or any object with get_stock_bars)
+            now: Current time (default: now, UTC)
+
+        Returns:
+            Number of new bars appended across all symbols
+        """
+        now = _utc_now() if now is None else pd.Timestamp(now)
+        if now.tz is None:
+            now = now.tz_localize("UTC")
+        window_start = now - self.lookback
+        starts = [
+            max(buffer.last_timestamp, window_start) if len(buffer) else window_start
+            for buffer in self.buffers.values()
+        ]
+        if not starts:
+            return 0
+
+        frame = fetch_bars(
+            data_client, self.symbols, self.timeframe, start=min(starts).to_pydatetime(), feed=self.feed
+        )
+        self.bars_fetched += len(frame)
+
+        appended = 0
+        for symbol, bars in split_by_symbol(frame).items():
+            if symbol in self.buffers:
+                appended += self.buffers[symbol].extend(bars)
+        return appended
+
+    def append_bar(self, bar) -> bool:
+        """
+        Append one streamed bar (Alpaca Bar or any object with symbol/timestamp/OHLCV).
+
+        Args:
+            bar: Streamed bar
+
+        Returns:
+            True if the bar was buffered (False for unknown symbols or stale bars)
+        """
+        buffer = self.buffers.get(bar.symbol)
+        if buffer is None:
+            return False
+        return buffer.append(bar.timestamp, bar.open, bar.high, bar.low, bar.close, bar.volume)
+
+    def frame(self, symbol: str, now=None) -> pd.DataFrame:
+        """
+        Return the look-back window of bars for one symbol.
+
+        Args:
+            symbol: Buffered symbol
+            now: Current time (default: now, UTC)
+
+        Returns:
+            DataFrame indexed by tz-aware UTC timestamp (empty if nothing buffered)
+        """
+        now = _utc_now() if now is None else pd.Timestamp(now)
+        return self.buffers[symbol].to_frame(start=now - self.lookback)
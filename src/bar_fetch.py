@@ -0,0 +1,120 @@
+"""
+Batched Bar Fetch Module
+Shared multi-symbol bar requests for the production strategy runners.
+
+One StockBarsRequest with symbol_or_symbols=[...] replaces the per-symbol
+request loop, so a cycle over N symbols costs one API round-trip (plus SDK
+pagination) instead of N. The BarSet is converted once into a columnar frame
+indexed by (symbol, timestamp); runners take their per-symbol slice from it.
+
+Consumers:
+- HourlySwingExecutor.process_hourly_signals: 1H bars, 30 days
+- DailyTrendExecutor.generate_signals: 1D bars, 150 days
+- BearTrapStrategy.process_market_data: 1Min bars, 45 minutes
+- MIDASProtocolStrategy.process_market_data: 1Min bars, 300 minutes
+"""
+
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional
+
+import numpy as np
+import pandas as pd
+from alpaca.data.requests import StockBarsRequest
+
+BAR_FIELDS = ("open", "high", "low", "close", "volume")
+
+# Keeps the request URL well under Alpaca's limits for large universes
+MAX_SYMBOLS_PER_REQUEST = 100
+
+
+def barset_to_frame(barset, symbols: Optional[Iterable[str]] = None) -> pd.DataFrame:
+    """
+    Convert an Alpaca BarSet to a columnar OHLCV frame.
+
+    Each field is gathered straight into a flat array in one pass over the bar
+    objects, instead of building a dict per bar.
+
+    Args:
+        barset: BarSet returned by StockHistoricalDataClient.get_stock_bars
+        symbols: Optional symbol order for the output (defaults to BarSet order)
+
+    Returns:
+        DataFrame indexed by (symbol, timestamp) with columns open, high, low,
+        close, volume. Symbols without bars are absent.
+    """
+    data = getattr(barset, "data", None) or {}
+    if symbols is None:
+        symbols = list(data)
+
+    keys: List[str] = []
+    bars = []
+    for symbol in symbols:
+        symbol_bars = data.get(symbol) or []
+        keys.extend([symbol] * len(symbol_bars))
+        bars.extend(symbol_bars)
+
+    index = pd.MultiIndex.from_arrays(
+        [pd.Index(keys, dtype=object), pd.DatetimeIndex([bar.timestamp for bar in bars])],
+        names=["symbol", "timestamp"],
+    )
+    columns = {
+        field: np.fromiter((getattr(bar, field) for bar in bars), dtype=np.float64, count=len(bars))
+        for field in BAR_FIELDS
+    }
+    return pd.DataFrame(columns, index=index)
+
+
+def split_by_symbol(frame: pd.DataFrame) -> Dict[str, pd.DataFrame]:
+    """
+    Split a (symbol, timestamp) bar frame into per-symbol frames.
+
+    Args:
+        frame: Output of barset_to_frame / fetch_bars
+
+    Returns:
+        Dict of symbol -> DataFrame indexed by timestamp
+    """
+    return {
+        symbol: group.droplevel("symbol")
+        for symbol, group in frame.groupby(level="symbol", sort=False)
+    }
+
+
+def fetch_bars(
+    data_client,
+    symbols: Iterable[str],
+    timeframe,
+    start: datetime,
+    end: Optional[datetime] = None,
+    feed: Optional[str] = None,
+) -> pd.DataFrame:
+    """
+    Fetch bars for many symbols with one multi-symbol request per batch.
+
+    Args:
+        data_client: StockHistoricalDataClient (or any object with get_stock_bars)
+        symbols: Symbols to fetch
+        timeframe: Alpaca TimeFrame
+        start: Start of the bar window
+        end: End of the bar window (None = now)
+        feed: Data feed, e.g. "sip" (None = account default)
+
+    Returns:
+        DataFrame indexed by (symbol, timestamp); see barset_to_frame
+    """
+    symbols = list(dict.fromkeys(symbols))
+    frames = []
+    for i in range(0, len(symbols), MAX_SYMBOLS_PER_REQUEST):
+        batch = symbols[i : i + MAX_SYMBOLS_PER_REQUEST]
+        request = StockBarsRequest(
+            symbol_or_symbols=batch,
+            timeframe=timeframe,
+            start=start,
+            end=end,
+            feed=feed,
+        )
+        frames.append(barset_to_frame(data_client.get_stock_bars(request), batch))
+
+    if not frames:
+        return barset_to_frame(None)
+    return frames[0] if len(frames) == 1 else pd.concat(frames)
@@ -0,0 +1,195 @@
+"""
+Bar Stream Module
+Live and recorded 1-minute bar sources for stream-driven strategy runners.
+
+All sources share the StockDataStream surface used by the research WebSocket
+scanner - subscribe_bars(handler, *symbols), run(), stop() - so a runner can
+switch between a live Alpaca subscription and a replay of recorded bars
+without changing its handler. Handlers are plain (synchronous) callables that
+receive one bar object with symbol / timestamp / open / high / low / close /
+volume attributes.
+
+- AlpacaBarStream: one StockDataStream subscription for every symbol
+- ReplayBarStream: recorded bars in timestamp order, optionally paced
+- BarRecorder: handler that records streamed bars to parquet for later replay
+"""
+
+import time
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+import pandas as pd
+
+from src.bar_fetch import BAR_FIELDS
+from src.logger import LOG
+
+
+class StreamBar:
+    """Lightweight bar record delivered by ReplayBarStream."""
+
+    __slots__ = ("symbol", "timestamp", "open", "high", "low", "close", "volume")
+
+    def __init__(self, symbol, timestamp, open, high, low, close, volume):
+        self.symbol = symbol
+        self.timestamp = timestamp
+        self.open = open
+        self.high = high
+        self.low = low
+        self.close = close
+        self.volume = volume
+
+    def __repr__(self) -> str:
+        return f"StreamBar({self.symbol} {self.timestamp} c={self.close})"
+
+
+class AlpacaBarStream:
+    """
+    Live 1-minute bars for many symbols over a single Alpaca WebSocket.
+
+    Usage:
+        stream = AlpacaBarStream(api_key, api_secret, feed="sip")
+        stream.subscribe_bars(strategy.on_bar, *symbols)
+        stream.run()            # blocks until stop()
+    """
+
+    def __init__(self, api_key: str, api_secret: str, feed: str = "sip"):
+        """
+        Initialize AlpacaBarStream.
+
+        Args:
+            api_key: Alpaca API key
+            api_secret: Alpaca API secret
+            feed: Data feed ('sip' or 'iex')
+        """
+        from alpaca.data.enums import DataFeed
+        from alpaca.data.live import StockDataStream
+
+        self.stream = StockDataStream(api_key, api_secret, feed=DataFeed(feed))
+
+    def subscribe_bars(self, handler: Callable, *symbols: str) -> None:
+        """Subscribe a synchronous handler to 1-minute bars for the given symbols."""
+
+        async def _on_bar(bar):
+            handler(bar)
+
+        self.stream.subscribe_bars(_on_bar, *symbols)
+
+    def run(self) -> None:
+        """Connect and dispatch bars until stop() is called."""
+        self.stream.run()
+
+    def stop(self) -> None:
+        """Close the WebSocket."""
+        self.stream.stop()
+
+
+class ReplayBarStream:
+    """
+    Replay recorded bars through the same handler interface as the live stream.
+
+    Bars are delivered in timestamp order (symbols interleaved), so a replay
+    reproduces the arrival order of a live session.
+
+    Usage:
+        replay = ReplayBarStream.from_parquet("recordings/2024-04-09.parquet")
+        replay.subscribe_bars(strategy.on_bar, *symbols)
+        replay.run()            # returns when the recording is exhausted
+    """
+
+    def __init__(self, bars: pd.DataFrame, speed: float = 0.0, sleep: Callable[[float], None] = time.sleep):
+        """
+        Initialize ReplayBarStream.
+
+        Args:
+            bars: Bars indexed by (symbol, timestamp) (fetch_bars layout) or with
+                'symbol' and 'timestamp' columns
+            speed: Pacing multiple of real time (0 = as fast as possible,
+                60 = one minute of bars per second)
+            sleep: Sleep function (injectable for tests)
+        """
+        if isinstance(bars.index, pd.MultiIndex):
+            bars = bars.reset_index()
+        self.bars = bars.sort_values(["timestamp", "symbol"], kind="stable", ignore_index=True)
+        self.speed = speed
+        self.sleep = sleep
+        self.handlers: Dict[str, List[Callable]] = {}
+        self._stopped = False
+
+    @classmethod
+    def from_parquet(cls, path, **kwargs) -> "ReplayBarStream":
+        """Load a recording written by BarRecorder (or any symbol/timestamp/OHLCV parquet)."""
+        return cls(pd.read_parquet(path), **kwargs)
+
+    def subscribe_bars(self, handler: Callable, *symbols: str) -> None:
+        """Subscribe a handler to bars for the given symbols ('*' = all)."""
+        for symbol in symbols:
+            self.handlers.setdefault(symbol, []).append(handler)
+
+    def run(self) -> int:
+        """
+        Deliver every recorded bar to its subscribers.
+
+        Returns:
+            Number of bars delivered
+        """
+        self._stopped = False
+        wildcard = self.handlers.get("*", [])
+        delivered = 0
+        previous = None
+
+        columns = ["symbol", "timestamp"] + list(BAR_FIELDS)
+        for symbol, timestamp, *values in self.bars[columns].itertuples(index=False, name=None):
+            if self._stopped:
+                break
+            handlers = self.handlers.get(symbol, []) + wildcard
+            if not handlers:
+                continue
+
+            if self.speed and previous is not None and timestamp > previous:
+                self.sleep((timestamp - previous).total_seconds() / self.speed)
+            previous = timestamp
+
+            bar = StreamBar(symbol, timestamp, *values)
+            for handler in handlers:
+                handler(bar)
+            delivered += 1
+
+        LOG.info(f"Replay finished: {delivered} bars delivered")
+        return delivered
+
+    def stop(self) -> None:
+        """Stop the replay after the current bar."""
+        self._stopped = True
+
+
+class BarRecorder:
+    """
+    Record streamed bars so a live session can be replayed later.
+
+    Usage:
+        recorder = BarRecorder()
+        stream.subscribe_bars(recorder, *symbols)
+        ...
+        recorder.save("recordings/2024-04-09.parquet")
+    """
+
+    def __init__(self):
+        self.rows: List[tuple] = []
+
+    def __call__(self, bar) -> None:
+        self.rows.append((bar.symbol, bar.timestamp) + tuple(getattr(bar, field) for field in BAR_FIELDS))
+
+    def to_frame(self) -> pd.DataFrame:
+        """Recorded bars with symbol, timestamp and OHLCV columns."""
+        frame = pd.DataFrame(self.rows, columns=["symbol", "timestamp"] + list(BAR_FIELDS))
+        frame["timestamp"] = pd.to_datetime(frame["timestamp"], utc=True)
+        return frame
+
+    def save(self, path) -> Optional[Path]:
+        """Write the recording to parquet (None if nothing was recorded)."""
+        if not self.rows:
+            return None
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.to_frame().to_parquet(path, index=False)
+        return path
@@ -0,0 +1,236 @@
+"""
+Bracket Exit Module
+First-passage take-profit / stop-loss exits for fixed-horizon long brackets.
+
+A bracket entered on bar e exits on the first bar i in [e, e + max_hold) whose
+high reaches the take-profit or whose low reaches the stop (stop first when both
+are reached on the same bar), otherwise at the close of the last bar of the
+window. The running max-high / min-low of an entry's forward window is monotone,
+so the first touch of any level is the number of window bars still short of it:
+one comparison per (entry, bar, level) replaces the per-trade df.iloc loop, and
+since TP and SL touches are independent a full TP x SL grid costs n_tp + n_sl
+level scans. Entries whose rolling forward max-high / min-low never reaches a
+level are resolved as timeouts without building their windows.
+
+Consumers:
+- midas_grid_search_optimizer: 7x7 TP/SL grid over the 2025 out-of-sample bars
+- midas_walk_forward, midas_torture_test, midas_backtest_strict: single bracket
+"""
+
+from typing import Dict, Iterable, Tuple
+
+import numpy as np
+import pandas as pd
+
+EXIT_TIMEOUT = 0
+EXIT_TP = 1
+EXIT_SL = 2
+EXIT_LABELS = np.array(["TO", "TP", "SL"], dtype=object)
+
+# Entries per window block; a block holds BLOCK_ROWS * max_hold * n_levels booleans
+BLOCK_ROWS = 4096
+
+
+class BracketExits:
+    """
+    First-passage exit index over one frame of bars.
+
+    Args:
+        high: Bar highs
+        low: Bar lows
+        close: Bar closes (timeout exits)
+        max_hold: Bars a bracket may stay open, including the entry bar
+    """
+
+    def __init__(self, high, low, close, max_hold: int):
+        self.high = np.asarray(high, dtype=np.float64)
+        self.low = np.asarray(low, dtype=np.float64)
+        self.close = np.asarray(close, dtype=np.float64)
+        self.max_hold = int(max_hold)
+        if self.max_hold < 1:
+            raise ValueError(f"max_hold must be >= 1, got {max_hold}")
+
+        # Rolling forward extremes over [t, t + max_hold), truncated at the end of data
+        window = dict(window=self.max_hold, min_periods=1)
+        self.forward_max_high = pd.Series(self.high[::-1]).rolling(**window).max().to_numpy()[::-1]
+        self.forward_min_low = pd.Series(self.low[::-1]).rolling(**window).min().to_numpy()[::-1]
+        self._steps = np.arange(self.max_hold)
+
+    def __len__(self) -> int:
+        return len(self.high)
+
+    def window_length(self, entry_locs) -> np.ndarray:
+        """Bars available to each entry (max_hold, fewer near the end of data)."""
+        return np.minimum(self.max_hold, len(self) - np.asarray(entry_locs, dtype=np.int64))
+
+    def _running(self, values: np.ndarray, entry_locs: np.ndarray, pad: float, accumulate) -> np.ndarray:
+        """(entries, max_hold) running extreme of each forward window, padded past the end."""
+        locs = entry_locs[:, None] + self._steps
+        inside = locs < len(values)
+        window = np.where(inside, values[np.minimum(locs, len(values) - 1)], pad)
+        return accumulate(window, axis=1)
+
+    def first_touch(self, entry_locs, levels, side: str) -> np.ndarray:
+        """
+        Bar offset (from the entry bar) of the first touch of each level.
+
+        Args:
+            entry_locs: Positional entry bars, shape (n,)
+            levels: Price levels, shape (n,) / scalar (one per entry) or (n, k)
+            side: 'high' (high >= level) or 'low' (low <= level)
+
+        Returns:
+            (n, k) int offsets; max_hold where the level is not touched in the window
+        """
+        entry_locs = np.asarray(entry_locs, dtype=np.int64)
+        n = len(entry_locs)
+        levels = np.asarray(levels, dtype=np.float64)
+        if levels.ndim < 2:
+            levels = levels.reshape(-1, 1)
+        levels = np.broadcast_to(levels, (n, levels.shape[1]))
+
+        if side == "high":
+            values, pad, accumulate = self.high, -np.inf, np.fmax.accumulate
+            reached = self.forward_max_high[entry_locs][:, None] >= levels
+        elif side == "low":
+            values, pad, accumulate = self.low, np.inf, np.fmin.accumulate
+            reached = self.forward_min_low[entry_locs][:, None] <= levels
+        else:
+            raise ValueError(f"side must be 'high' or 'low', got {side!r}")
+
+        offsets = np.full(levels.shape, self.max_hold, dtype=np.int64)
+        rows = np.flatnonzero(reached.any(axis=1))
+        for start in range(0, len(rows), BLOCK_ROWS):
+            block = rows[start:start + BLOCK_ROWS]
+            running = self._running(values, entry_locs[block], pad, accumulate)[:, :, None]
+            block_levels = levels[block][:, None, :]
+            short = running < block_levels if side == "high" else running > block_levels
+            offsets[block] = short.sum(axis=1)
+        return offsets
+
+    def resolve(self, entry_locs, tp_offsets: np.ndarray, sl_offsets: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Combine TP and SL first touches into exits (SL first on ties).
+
+        tp_offsets and sl_offsets broadcast against each other with the entry
+        axis first.
+
+        Returns:
+            (exit_locs, exit_types) with EXIT_TIMEOUT / EXIT_TP / EXIT_SL codes
+        """
+        tp_offsets, sl_offsets = np.broadcast_arrays(tp_offsets, sl_offsets)
+        expand = (slice(None),) + (None,) * (tp_offsets.ndim - 1)
+        entry_locs = np.asarray(entry_locs, dtype=np.int64)[expand]
+        last = self.window_length(entry_locs) - 1
+
+        first = np.minimum(tp_offsets, sl_offsets)
+        hit = first <= last
+        exit_types = np.where(hit, np.where(sl_offsets <= tp_offsets, EXIT_SL, EXIT_TP), EXIT_TIMEOUT)
+        exit_locs = entry_locs + np.where(hit, first, last)
+        return exit_locs, exit_types
+
+    def exits(self, entry_locs, tp_prices, sl_prices) -> Tuple[np.ndarray, np.ndarray]:
+        """Exits for per-entry TP/SL price levels (shape (n,) or (n, k)); returns (n, k) arrays."""
+        tp_offsets = self.first_touch(entry_locs, tp_prices, "high")
+        sl_offsets = self.first_touch(entry_locs, sl_prices, "low")
+        return self.resolve(entry_locs, tp_offsets, sl_offsets)
+
+    def grid(self, entry_locs, entry_prices, tp_points, sl_points) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Exits for every entry across a TP x SL grid given in points from entry.
+
+        Returns:
+            (exit_locs, exit_types), each shaped (n_entries, n_sl, n_tp)
+        """
+        entry_prices = np.asarray(entry_prices, dtype=np.float64)[:, None]
+        tp_points = np.asarray(tp_points, dtype=np.float64)
+        sl_points = np.asarray(sl_points, dtype=np.float64)
+        tp_offsets = self.first_touch(entry_locs, entry_prices + tp_points, "high")
+        sl_offsets = self.first_touch(entry_locs, entry_prices - sl_points, "low")
+        return self.resolve(entry_locs, tp_offsets[:, None, :], sl_offsets[:, :, None])
+
+
+def sequential_entries(signal_locs, release_locs) -> np.ndarray:
+    """
+    Mask of signals taken when only one bracket may be open at a time.
+
+    A signal is skipped while signal_loc <= release_loc of the last taken
+    signal. Each signal's successor is found with one searchsorted, so the walk
+    only visits taken signals.
+
+    Args:
+        signal_locs: Ascending positional signal bars
+        release_locs: Last blocked bar for each signal if it were taken
+
+    Returns:
+        Boolean mask over signal_locs
+    """
+    signal_locs = np.asarray(signal_locs, dtype=np.int64)
+    successor = np.searchsorted(signal_locs, np.asarray(release_locs, dtype=np.int64), side="right")
+    taken = np.zeros(len(signal_locs), dtype=bool)
+    j = 0
+    while j < len(signal_locs):
+        taken[j] = True
+        j = successor[j]
+    return taken
+
+
+def long_bracket_trades(
+    engine: BracketExits,
+    signal_locs,
+    open_prices,
+    tp_points: Iterable[float],
+    sl_points: Iterable[float],
+    slippage: float = 0.0,
+) -> Dict[Tuple[float, float], Dict[str, np.ndarray]]:
+    """
+    One-position-at-a-time long bracket trades for every TP x SL cell.
+
+    Matches the MIDAS backtest loop: entry on the open of the bar after the
+    signal plus slippage, TP/SL booked at their level less slippage, timeouts at
+    the last window close less slippage and counted as max_hold bars, and the
+    next signal must come after entry_loc + bars_held.
+
+    Args:
+        engine: BracketExits over the same bars
+        signal_locs: Ascending positional signal bars
+        open_prices: Bar opens for the whole frame
+        tp_points: Take-profit distances in points
+        sl_points: Stop distances in points
+        slippage: Points lost on entry and on each exit
+
+    Returns:
+        {(sl, tp): dict of arrays signal_loc, entry_loc, exit_loc, entry_price,
+        pnl_points, hold_time, exit_type} for the trades taken in that cell
+    """
+    signal_locs = np.asarray(signal_locs, dtype=np.int64)
+    signal_locs = signal_locs[signal_locs + 1 < len(engine)]
+    entry_locs = signal_locs + 1
+    entry_prices = np.asarray(open_prices, dtype=np.float64)[entry_locs] + slippage
+    tp_points = np.asarray(list(tp_points), dtype=np.float64)
+    sl_points = np.asarray(list(sl_points), dtype=np.float64)
+
+    exit_locs, exit_types = engine.grid(entry_locs, entry_prices, tp_points, sl_points)
+    timeout = exit_types == EXIT_TIMEOUT
+    hold_time = np.where(timeout, engine.max_hold, exit_locs - entry_locs[:, None, None] + 1)
+    timeout_pnl = engine.close[exit_locs] - slippage - entry_prices[:, None, None]
+    pnl_points = np.select(
+        [exit_types == EXIT_TP, exit_types == EXIT_SL],
+        [np.broadcast_to(tp_points - slippage, exit_types.shape), np.broadcast_to(-sl_points[:, None] - slippage, exit_types.shape)],
+        timeout_pnl,
+    )
+
+    cells = {}
+    for s, sl in enumerate(sl_points):
+        for t, tp in enumerate(tp_points):
+            taken = sequential_entries(signal_locs, entry_locs + hold_time[:, s, t])
+            cells[(sl, tp)] = {
+                "signal_loc": signal_locs[taken],
+                "entry_loc": entry_locs[taken],
+                "exit_loc": exit_locs[taken, s, t],
+                "entry_price": entry_prices[taken],
+                "pnl_points": pnl_points[taken, s, t],
+                "hold_time": hold_time[taken, s, t],
+                "exit_type": EXIT_LABELS[exit_types[taken, s, t]],
+            }
+    return cells
@@ -2,27 +2,328 @@
 Data Caching Utility for Magellan
 Stores historical price data locally to avoid repeated API calls during backtesting
 
+Bars live in a partitioned store (one parquet file per symbol/timeframe/month) with a
+coverage manifest of the date ranges already fetched. Any date range is answered from
+the union of existing partitions; only the missing gaps are fetched, and new bars are
+merged into their month partitions. Reads push the date filter and column selection
+down to parquet, so only the needed row groups and columns are loaded.
+
 Cache Structure:
     data/cache/
-        equities/
-            AAPL_1min_20240101_20251231.parquet
-            AAPL_1hour_20240101_20251231.parquet
-            AAPL_1day_20220101_20251231.parquet
-        futures/
-            SIUSD_1hour_20220101_20251231.parquet
-        crypto/
-            BTCUSD_1day_20220101_20251231.parquet
+        bars/
+            equities/
+                AAPL/
+                    1min/
+                        2024-01.parquet
+                        2024-02.parquet
+                        _coverage.json      # fetched date ranges (inclusive)
+                    1day/
+                        ...
+            futures/
+                SIUSD/1hour/...
+        earnings/                           # filename-keyed (symbol_start_end)
+        news/                               # filename-keyed (symbol_start_end)
+
+Legacy filename-keyed bar files (equities/AAPL_1min_20240101_20251231.parquet) can be
+folded into the store with DataCache.import_legacy_files().
 """
 
-import pandas as pd
+import json
+import os
+import re
+import shutil
+from datetime import date, datetime, timedelta
 from pathlib import Path
-from datetime import datetime
-import hashlib
+from typing import Callable, List, Tuple
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+import requests
+
 from src.logger import LOG
 from src.data_handler import AlpacaDataClient
-from alpaca.data.timeframe import TimeFrame
-import requests
-import os
+
+# Legacy cache filename: SYMBOL_timeframe_YYYYMMDD_YYYYMMDD.parquet
+LEGACY_FILENAME = re.compile(r"^(?P<symbol>[A-Z0-9.\-]+)_(?P<timeframe>1min|1hour|1day)_(?P<start>\d{8})_(?P<end>\d{8})$")
+
+
+def _to_date(value) -> date:
+    """Normalize 'YYYY-MM-DD' / 'YYYYMMDD' strings, datetimes and dates to a date."""
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    return pd.Timestamp(value).date()
+
+
+def merge_ranges(ranges: List[Tuple[date, date]]) -> List[Tuple[date, date]]:
+    """
+    Merge overlapping or adjacent inclusive date ranges.
+
+    Args:
+        ranges: List of (start, end) dates, end inclusive
+
+    Returns:
+        Sorted list of disjoint (start, end) ranges
+    """
+    merged = []
+    for start, end in sorted(ranges):
+        if merged and start <= merged[-1][1] + timedelta(days=1):
+            merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+        else:
+            merged.append((start, end))
+    return merged
+
+
+def subtract_ranges(start: date, end: date, covered: List[Tuple[date, date]]) -> List[Tuple[date, date]]:
+    """
+    Return the parts of [start, end] not covered by any range.
+
+    Args:
+        start: First requested date
+        end: Last requested date (inclusive)
+        covered: Disjoint sorted (start, end) ranges
+
+    Returns:
+        List of missing (start, end) gaps, end inclusive
+    """
+    gaps = []
+    cursor = start
+    for covered_start, covered_end in covered:
+        if covered_end < cursor:
+            continue
+        if covered_start > end:
+            break
+        if covered_start > cursor:
+            gaps.append((cursor, min(end, covered_start - timedelta(days=1))))
+        cursor = max(cursor, covered_end + timedelta(days=1))
+        if cursor > end:
+            break
+    if cursor <= end:
+        gaps.append((cursor, end))
+    return gaps
+
+
+def resample_bars(df: pd.DataFrame, timeframe: str) -> pd.DataFrame:
+    """
+    Resample fetched bars to the cache timeframe ('1hour' -> 1h, '1day' -> 1D OHLCV).
+
+    Args:
+        df: Bars indexed by timestamp
+        timeframe: Cache timeframe ('1min' bars are returned unchanged)
+
+    Returns:
+        Resampled DataFrame with open/high/low/close/volume (empty bins dropped)
+    """
+    rule = {"1hour": "1h", "1day": "1D"}.get(timeframe)
+    if rule is None:
+        return df
+    return (
+        df.resample(rule)
+        .agg({"open": "first", "high": "max", "low": "min", "close": "last", "volume": "sum"})
+        .dropna()
+    )
+
+
+class PartitionedBarStore:
+    """
+    Range-aware bar store partitioned by asset type, symbol, timeframe and month.
+
+    Usage:
+        store = PartitionedBarStore("data/cache/bars")
+        df = store.get_or_fetch("equities", "AAPL", "1min", "2024-01-01", "2024-03-31", fetch_fn)
+        store.missing_ranges("equities", "AAPL", "1min", "2024-01-01", "2024-06-30")
+        # [(date(2024, 4, 1), date(2024, 6, 30))]
+    """
+
+    def __init__(self, root="data/cache/bars"):
+        """
+        Initialize PartitionedBarStore.
+
+        Args:
+            root: Store root directory (default: data/cache/bars)
+        """
+        self.root = Path(root)
+
+    def partition_dir(self, asset_type: str, symbol: str, timeframe: str) -> Path:
+        """Directory holding the month partitions of one symbol/timeframe."""
+        return self.root / asset_type / symbol / timeframe
+
+    def _coverage_path(self, asset_type: str, symbol: str, timeframe: str) -> Path:
+        return self.partition_dir(asset_type, symbol, timeframe) / "_coverage.json"
+
+    def coverage(self, asset_type: str, symbol: str, timeframe: str) -> List[Tuple[date, date]]:
+        """
+        Return the date ranges already fetched for a symbol/timeframe.
+
+        Returns:
+            Disjoint sorted (start, end) date ranges, end inclusive
+        """
+        path = self._coverage_path(asset_type, symbol, timeframe)
+        if not path.exists():
+            return []
+        ranges = json.loads(path.read_text())["ranges"]
+        return [(_to_date(start), _to_date(end)) for start, end in ranges]
+
+    def _mark_covered(self, asset_type: str, symbol: str, timeframe: str, start: date, end: date) -> None:
+        """Add [start, end] to the coverage manifest (days from today onward stay uncovered)."""
+        end = min(end, date.today() - timedelta(days=1))
+        if end < start:
+            return
+        ranges = merge_ranges(self.coverage(asset_type, symbol, timeframe) + [(start, end)])
+        path = self._coverage_path(asset_type, symbol, timeframe)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(".json.tmp")
+        tmp_path.write_text(json.dumps({"ranges": [[str(s), str(e)] for s, e in ranges]}))
+        os.replace(tmp_path, path)
+
+    def missing_ranges(self, asset_type: str, symbol: str, timeframe: str, start, end) -> List[Tuple[date, date]]:
+        """
+        Return the gaps in [start, end] that are not in the store yet.
+
+        Args:
+            asset_type: 'equities', 'futures' or 'crypto'
+            symbol: Instrument symbol
+            timeframe: Bar timeframe ('1min', '1hour', '1day')
+            start: First date (inclusive)
+            end: Last date (inclusive)
+
+        Returns:
+            List of missing (start, end) date ranges, end inclusive
+        """
+        return subtract_ranges(_to_date(start), _to_date(end), self.coverage(asset_type, symbol, timeframe))
+
+    def write(self, asset_type: str, symbol: str, timeframe: str, df: pd.DataFrame, start, end) -> None:
+        """
+        Merge bars into their month partitions and mark [start, end] as covered.
+
+        Incoming bars replace stored bars with the same timestamp, so re-fetching a
+        partial day appends the new bars incrementally. Partitions are written
+        atomically (temp file, then replace).
+
+        Args:
+            asset_type: 'equities', 'futures' or 'crypto'
+            symbol: Instrument symbol
+            timeframe: Bar timeframe
+            df: Bars indexed by timezone-naive timestamp (may be empty)
+            start: First date the fetch covered (inclusive)
+            end: Last date the fetch covered (inclusive)
+        """
+        partition_dir = self.partition_dir(asset_type, symbol, timeframe)
+        partition_dir.mkdir(parents=True, exist_ok=True)
+
+        if len(df) > 0:
+            # One timestamp unit across partitions so month files share a schema
+            df = df.set_axis(df.index.astype("datetime64[ns]"))
+            months = df.index.strftime("%Y-%m")
+            for month in months.unique():
+                new_bars = df[months == month]
+                path = partition_dir / f"{month}.parquet"
+                if path.exists():
+                    stored = self._read_partition(path)
+                    new_bars = pd.concat([stored, new_bars])
+                    new_bars = new_bars[~new_bars.index.duplicated(keep="last")]
+                new_bars = new_bars.sort_index()
+
+                tmp_path = path.with_suffix(".parquet.tmp")
+                new_bars.rename_axis("timestamp").reset_index().to_parquet(tmp_path, index=False)
+                os.replace(tmp_path, path)
+
+        self._mark_covered(asset_type, symbol, timeframe, _to_date(start), _to_date(end))
+
+    @staticmethod
+    def _read_partition(path: Path) -> pd.DataFrame:
+        return pd.read_parquet(path).set_index("timestamp")
+
+    def read(self, asset_type: str, symbol: str, timeframe: str, start, end, columns: List[str] = None) -> pd.DataFrame:
+        """
+        Read bars in [start, end] from the store.
+
+        Only the month partitions overlapping the range are opened; the timestamp
+        filter and column projection are pushed down to parquet.
+
+        Args:
+            asset_type: 'equities', 'futures' or 'crypto'
+            symbol: Instrument symbol
+            timeframe: Bar timeframe
+            start: First date (inclusive)
+            end: Last date (inclusive)
+            columns: Columns to load (default: all)
+
+        Returns:
+            DataFrame indexed by timestamp (empty if nothing is stored)
+        """
+        start_ts = pd.Timestamp(_to_date(start))
+        end_ts = pd.Timestamp(_to_date(end)) + pd.Timedelta(days=1)
+
+        partition_dir = self.partition_dir(asset_type, symbol, timeframe)
+        months = pd.period_range(start_ts, end_ts - pd.Timedelta(days=1), freq="M").strftime("%Y-%m")
+        files = [str(path) for path in (partition_dir / f"{month}.parquet" for month in months) if path.exists()]
+        if not files:
+            return pd.DataFrame(columns=columns or [])
+
+        # Month partitions can differ in optional columns (e.g. vwap), so unify schemas
+        schema = pa.unify_schemas([pq.read_schema(path) for path in files])
+        dataset = ds.dataset(files, schema=schema, format="parquet")
+        timestamp_type = schema.field("timestamp").type
+        row_filter = (ds.field("timestamp") >= pa.scalar(start_ts, type=timestamp_type)) & (
+            ds.field("timestamp") < pa.scalar(end_ts, type=timestamp_type)
+        )
+        load_columns = ["timestamp"] + [col for col in (columns or schema.names) if col != "timestamp"]
+
+        df = dataset.to_table(columns=load_columns, filter=row_filter).to_pandas()
+        return df.set_index("timestamp").sort_index()
+
+    def get_or_fetch(
+        self,
+        asset_type: str,
+        symbol: str,
+        timeframe: str,
+        start,
+        end,
+        fetch_fn: Callable[[str, str], pd.DataFrame],
+        columns: List[str] = None,
+        skip_weekends: bool = False,
+    ) -> pd.DataFrame:
+        """
+        Answer [start, end] from the store, fetching only the missing gaps.
+
+        Args:
+            asset_type: 'equities', 'futures' or 'crypto'
+            symbol: Instrument symbol
+            timeframe: Bar timeframe
+            start: First date (inclusive)
+            end: Last date (inclusive)
+            fetch_fn: Called as fetch_fn('YYYY-MM-DD', 'YYYY-MM-DD') for each gap
+                (both dates inclusive); returns bars indexed by timestamp
+            columns: Columns to load (default: all)
+            skip_weekends: Mark weekend-only gaps as covered without fetching
+
+        Returns:
+            DataFrame indexed by timestamp
+        """
+        gaps = self.missing_ranges(asset_type, symbol, timeframe, start, end)
+
+        if not gaps:
+            LOG.info(f"[CACHE HIT] Loading {symbol} {timeframe} from cache")
+        for gap_start, gap_end in gaps:
+            if skip_weekends and not pd.bdate_range(gap_start, gap_end).size:
+                self._mark_covered(asset_type, symbol, timeframe, gap_start, gap_end)
+                continue
+            LOG.info(f"[CACHE MISS] Fetching {symbol} {timeframe} {gap_start} -> {gap_end}")
+            df = fetch_fn(gap_start.strftime("%Y-%m-%d"), gap_end.strftime("%Y-%m-%d"))
+            self.write(asset_type, symbol, timeframe, df, gap_start, gap_end)
+            LOG.success(f"[CACHE SAVED] {symbol} {timeframe} {gap_start} -> {gap_end} ({len(df)} bars)")
+
+        return self.read(asset_type, symbol, timeframe, start, end, columns=columns)
+
+    def clear(self, asset_type: str = None) -> None:
+        """Delete stored partitions and coverage for one asset type or all."""
+        target = self.root / asset_type if asset_type else self.root
+        if target.exists():
+            shutil.rmtree(target)
 
 
 class DataCache:
@@ -39,6 +340,9 @@ class DataCache:
         (self.cache_dir / "earnings").mkdir(exist_ok=True)
         (self.cache_dir / "news").mkdir(exist_ok=True)
 
+        # Range-aware bar store (equities/futures/crypto)
+        self.bars = PartitionedBarStore(self.cache_dir / "bars")
+
     def _get_cache_path(self, symbol, timeframe, start, end, asset_type="equity"):
         """Generate cache file path"""
         # Normalize dates
@@ -50,89 +354,87 @@ class DataCache:
 
         return self.cache_dir / asset_type / filename
 
-    def get_or_fetch_equity(self, symbol, timeframe, start, end, feed="sip"):
-        """Get equity data from cache or fetch from Alpaca"""
-
-        cache_path = self._get_cache_path(symbol, timeframe, start, end, "equities")
-
-        # Check cache
-        if cache_path.exists():
-            LOG.info(f"[CACHE HIT] Loading {symbol} {timeframe} from cache")
-            return pd.read_parquet(cache_path)
-
-        # Cache miss - fetch from API
-        LOG.info(f"[CACHE MISS] Fetching {symbol} {timeframe} from Alpaca")
-        client = AlpacaDataClient()
+    def get_or_fetch_equity(self, symbol, timeframe, start, end, feed="sip", columns=None):
+        """Get equity bars for [start, end] from the bar store, fetching only missing gaps from Alpaca"""
 
+        # AlpacaDataClient takes Alpaca timeframe strings (an alpaca-py TimeFrame falls back to minutes)
         if timeframe == "1min":
-            tf = TimeFrame.Minute
+            tf = "1Min"
         elif timeframe == "1hour":
-            tf = TimeFrame.Hour
+            tf = "1Hour"
         elif timeframe == "1day":
-            tf = TimeFrame.Day
+            tf = "1Day"
         else:
             raise ValueError(f"Unsupported timeframe: {timeframe}")
 
-        df = client.fetch_historical_bars(symbol=symbol, timeframe=tf, start=start, end=end, feed=feed)
-
-        # Resample to ensure correct timeframe
-        if timeframe == "1day":
-            df = (
-                df.resample("1D")
-                .agg({"open": "first", "high": "max", "low": "min", "close": "last", "volume": "sum"})
-                .dropna()
-            )
-        elif timeframe == "1hour":
-            df = (
-                df.resample("1H")
-                .agg({"open": "first", "high": "max", "low": "min", "close": "last", "volume": "sum"})
-                .dropna()
-            )
-
-        # Save to cache
-        df.to_parquet(cache_path)
-        LOG.success(f"[CACHE SAVED] {cache_path}")
-
-        return df
+        client = None
 
-    def get_or_fetch_futures(self, symbol, timeframe, start, end):
-        """Get futures/commodity data from cache or fetch from FMP"""
+        def fetch(gap_start, gap_end):
+            nonlocal client
+            if client is None:
+                client = AlpacaDataClient()
+            df = client.fetch_historical_bars(symbol=symbol, timeframe=tf, start=gap_start, end=gap_end, feed=feed)
+            return resample_bars(df, timeframe)
 
-        cache_path = self._get_cache_path(symbol, timeframe, start, end, "futures")
+        return self.bars.get_or_fetch(
+            "equities", symbol, timeframe, start, end, fetch, columns=columns, skip_weekends=True
+        )
 
-        # Check cache
-        if cache_path.exists():
-            LOG.info(f"[CACHE HIT] Loading {symbol} {timeframe} from cache")
-            return pd.read_parquet(cache_path)
+    def get_or_fetch_futures(self, symbol, timeframe, start, end, columns=None):
+        """Get futures/commodity bars for [start, end] from the bar store, fetching only missing gaps from FMP"""
 
-        # Cache miss - fetch from API
-        LOG.info(f"[CACHE MISS] Fetching {symbol} {timeframe} from FMP")
         api_key = os.getenv("FMP_API_KEY")
 
         if timeframe == "1hour":
             url = "https://financialmodelingprep.com/stable/historical-chart/1hour"
-            params = {"symbol": symbol, "from": start, "to": end, "apikey": api_key}
         elif timeframe == "1day":
             # Use stable EOD full endpoint
             url = "https://financialmodelingprep.com/stable/historical-price-eod/full"
-            params = {"symbol": symbol, "from": start, "to": end, "apikey": api_key}
         else:
             raise ValueError(f"Unsupported timeframe: {timeframe}")
 
-        response = requests.get(url, params=params)
-        response.raise_for_status()
-
-        data = response.json()
-        df = pd.DataFrame(data)
-        df["date"] = pd.to_datetime(df["date"])
-        df = df.set_index("date").sort_index()
-        df = df[["open", "high", "low", "close", "volume"]]
-
-        # Save to cache
-        df.to_parquet(cache_path)
-        LOG.success(f"[CACHE SAVED] {cache_path}")
-
-        return df
+        def fetch(gap_start, gap_end):
+            params = {"symbol": symbol, "from": gap_start, "to": gap_end, "apikey": api_key}
+            response = requests.get(url, params=params)
+            response.raise_for_status()
+
+            data = response.json()
+            if not data:
+                return pd.DataFrame(columns=["open", "high", "low", "close", "volume"])
+            df = pd.DataFrame(data)
+            df["date"] = pd.to_datetime(df["date"])
+            df = df.set_index("date").sort_index()
+            return df[["open", "high", "low", "close", "volume"]]
+
+        return self.bars.get_or_fetch("futures", symbol, timeframe, start, end, fetch, columns=columns)
+
+    def import_legacy_files(self, asset_type="equities", remove=False):
+        """
+        Fold legacy filename-keyed bar files (SYMBOL_timeframe_YYYYMMDD_YYYYMMDD.parquet)
+        into the partitioned bar store.
+
+        Args:
+            asset_type: Legacy subdirectory to scan ('equities' or 'futures')
+            remove: Delete each legacy file once imported
+
+        Returns:
+            Number of files imported
+        """
+        imported = 0
+        for path in sorted((self.cache_dir / asset_type).glob("*.parquet")):
+            match = LEGACY_FILENAME.match(path.stem)
+            if not match:
+                continue
+            df = pd.read_parquet(path)
+            if not isinstance(df.index, pd.DatetimeIndex):
+                continue
+            self.bars.write(asset_type, match["symbol"], match["timeframe"], df, match["start"], match["end"])
+            imported += 1
+            if remove:
+                path.unlink()
+
+        LOG.info(f"[CACHE IMPORT] {imported} legacy {asset_type} files folded into {self.bars.root}")
+        return imported
 
     def get_or_fetch_earnings_calendar(self, symbol, start, end):
         """Get earnings calendar from cache or fetch from FMP"""
@@ -211,6 +513,7 @@ class DataCache:
 
     def clear_cache(self, asset_type=None):
         """Clear cache for specific asset type or all"""
+        self.bars.clear(asset_type)
         if asset_type:
             cache_path = self.cache_dir / asset_type
             for file in cache_path.glob("*.parquet"):
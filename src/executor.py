@@ -34,7 +34,7 @@ class AlpacaTradingClient:
     # PDT threshold
     PDT_EQUITY_THRESHOLD = 25000.0
 
-    def __init__(self):
+    def __init__(self, api=None):
         """
         Initialize the Alpaca Trading Client.
 
@@ -43,8 +43,11 @@ class AlpacaTradingClient:
         - APCA_API_SECRET_KEY: Alpaca secret key
 
         Uses Paper Trading endpoint by default.
+
+        Args:
+            api: Optional pre-built REST-compatible client (e.g. src.order_manager.FakeBroker)
         """
-        self.api = REST(base_url="https://paper-api.alpaca.markets")
+        self.api = api if api is not None else REST(base_url="https://paper-api.alpaca.markets")
         self.logger = _setup_live_logger()
 
         # Validate connection
@@ -325,43 +328,22 @@ def get_asymmetric_allocation(iwm_returns: list = None, vss_returns: list = None
     return result
 
 
-def execute_trade(
+def _prepare_trade(
     client: AlpacaTradingClient,
     signal: int,
-    symbol: str = "SPY",
-    allocation_pct: float = 0.25,
-    ticker_config: dict = None,
-    damping_factor: float = 1.0,
-) -> dict:
+    symbol: str,
+    allocation_pct: float,
+    ticker_config: Optional[dict],
+    damping_factor: float,
+) -> tuple[dict, bool]:
     """
-    Execute a trade based on the alpha signal with position-aware logic.
-
-    Uses "Marketable Limit" strategy for institutional-grade execution:
-    - Buy: Limit at ask_price + $0.01 (ensures fill with slippage protection)
-    - Sell: Limit at bid_price - $0.01 (ensures fill with slippage protection)
-
-    Position-Aware Logic:
-    - If signal == BUY and already LONG: Do nothing (already positioned)
-    - If signal == SELL and already LONG: Sell everything to go flat
-    - If signal == BUY and FLAT: Execute buy
-    - If signal == SELL and FLAT: Do nothing (no position to sell)
-
-    Dynamic Position Sizing:
-    - Final_Size = Base_Size * damping_factor
-    - damping_factor: Float 0.0-1.0 (from volatility targeting or other risk management)
-    - If damping_factor missing, defaults to 1.0 (full size)
-    - NOTE: LAM damping deprecated, use src/risk_manager.py for volatility targeting
+    Pre-trade checks and sizing shared by the polling and event-driven paths.
 
-    Args:
-        client: AlpacaTradingClient instance
-        signal: 1 for BUY, -1 for SELL
-        symbol: Stock symbol (default 'SPY')
-        allocation_pct: Fraction of equity to allocate (default 0.25 = 25%)
-        ticker_config: Optional ticker-specific config with 'position_cap_usd' key
-        damping_factor: Position sizing scalar (default 1.0 = full size)
+    Runs the position-aware logic, PDT and buying power checks, quote fetch and
+    position sizing for execute_trade (see its docstring for the rules).
 
     Returns:
-        Dict with order details or rejection reason
+        Tuple of (result dict with side / qty / limit_price filled in, ready_to_submit: bool)
     """
     result = {
         "timestamp": datetime.utcnow().isoformat(),
@@ -378,7 +360,7 @@ def execute_trade(
     # Validate signal
     if signal not in [1, -1]:
         result["rejection_reason"] = f"Invalid signal: {signal}. Must be 1 (BUY) or -1 (SELL)"
-        return result
+        return result, False
 
     side = "buy" if signal == 1 else "sell"
     result["side"] = side
@@ -402,14 +384,14 @@ def execute_trade(
             # Already long - do nothing
             result["rejection_reason"] = f"Already LONG {current_position_qty} shares. No action needed."
             print(f"[EXECUTOR] ⏸ {result['rejection_reason']}")
-            return result
+            return result, False
         # Else: we are flat, proceed to buy
     else:  # SELL signal
         if current_position_qty <= 0:
             # Already flat - nothing to sell
             result["rejection_reason"] = f"Already FLAT. No position to sell."
             print(f"[EXECUTOR] ⏸ {result['rejection_reason']}")
-            return result
+            return result, False
         # Else: we have a position, proceed to sell
 
     # Safety Check 1: PDT Protection
@@ -418,7 +400,7 @@ def execute_trade(
     if not pdt_ok:
         result["rejection_reason"] = pdt_msg
         client._log_trade("REJECTED", symbol, side, 0, 0.0, pdt_msg)
-        return result
+        return result, False
 
     # Get current market quote
     try:
@@ -428,7 +410,7 @@ def execute_trade(
         print(f"[EXECUTOR] Quote: Bid=${bid_price:.2f}, Ask=${ask_price:.2f}")
     except Exception as e:
         result["rejection_reason"] = f"Failed to get quote: {e}"
-        return result
+        return result, False
 
     # Calculate limit price (Marketable Limit strategy)
     if signal == 1:  # BUY
@@ -486,7 +468,7 @@ def execute_trade(
         qty = int(allocated_capital / ask_price)
         if qty <= 0:
             result["rejection_reason"] = f"Insufficient funds for even 1 share (allocated ${allocated_capital:,.2f})"
-            return result
+            return result, False
 
         # EXECUTION TELEMETRY (ASCII ONLY)
         final_size_usd = qty * ask_price
@@ -505,7 +487,53 @@ def execute_trade(
         if not bp_ok:
             result["rejection_reason"] = bp_msg
             client._log_trade("REJECTED", symbol, side, qty, limit_price, bp_msg)
-            return result
+            return result, False
+
+    return result, True
+
+
+def execute_trade(
+    client: AlpacaTradingClient,
+    signal: int,
+    symbol: str = "SPY",
+    allocation_pct: float = 0.25,
+    ticker_config: dict = None,
+    damping_factor: float = 1.0,
+) -> dict:
+    """
+    Execute a trade based on the alpha signal with position-aware logic.
+
+    Uses "Marketable Limit" strategy for institutional-grade execution:
+    - Buy: Limit at ask_price + $0.01 (ensures fill with slippage protection)
+    - Sell: Limit at bid_price - $0.01 (ensures fill with slippage protection)
+
+    Position-Aware Logic:
+    - If signal == BUY and already LONG: Do nothing (already positioned)
+    - If signal == SELL and already LONG: Sell everything to go flat
+    - If signal == BUY and FLAT: Execute buy
+    - If signal == SELL and FLAT: Do nothing (no position to sell)
+
+    Dynamic Position Sizing:
+    - Final_Size = Base_Size * damping_factor
+    - damping_factor: Float 0.0-1.0 (from volatility targeting or other risk management)
+    - If damping_factor missing, defaults to 1.0 (full size)
+    - NOTE: LAM damping deprecated, use src/risk_manager.py for volatility targeting
+
+    Args:
+        client: AlpacaTradingClient instance
+        signal: 1 for BUY, -1 for SELL
+        symbol: Stock symbol (default 'SPY')
+        allocation_pct: Fraction of equity to allocate (default 0.25 = 25%)
+        ticker_config: Optional ticker-specific config with 'position_cap_usd' key
+        damping_factor: Position sizing scalar (default 1.0 = full size)
+
+    Returns:
+        Dict with order details or rejection reason
+    """
+    result, ready = _prepare_trade(client, signal, symbol, allocation_pct, ticker_config, damping_factor)
+    if not ready:
+        return result
+    side, qty, limit_price = result["side"], result["qty"], result["limit_price"]
 
     # Submit the order
     print(f"[EXECUTOR] Submitting {side.upper()} LIMIT order: {qty} x {symbol} @ ${limit_price:.2f}")
@@ -608,12 +636,19 @@ async def async_execute_trade(
     allocation_pct: float = 0.25,
     ticker_config: dict = None,
     damping_factor: float = 1.0,
+    order_manager=None,
+    fill_timeout: float = 10.0,
 ) -> dict:
     """
-    Async wrapper for execute_trade using thread pool to avoid blocking.
+    Async execute_trade for concurrent multi-symbol baskets.
 
-    Alpaca's REST client is synchronous, so this wraps execute_trade in
-    asyncio.to_thread() to enable concurrent order processing for multi-symbol baskets.
+    Without an order manager, execute_trade (including its 1-second fill polling)
+    runs in a worker thread via asyncio.to_thread(). With one, only the REST
+    pre-trade checks run in a thread; the order is submitted through the
+    src.order_manager.OrderManager and its fill arrives on the trade-updates
+    stream, so waiting for it holds no thread and makes no get_order calls. If the
+    manager's trade-updates stream is dead or unauthenticated, the order falls
+    back to the execute_trade polling path.
 
     Args:
         client: AlpacaTradingClient instance
@@ -622,11 +657,71 @@ async def async_execute_trade(
         allocation_pct: Fraction of equity to allocate per ticker (default 0.25 = 25%)
         ticker_config: Optional ticker-specific config with 'position_cap_usd' key
         damping_factor: LAM metabolism scaling factor (default 1.0 = full size)
+        order_manager: Optional started OrderManager (event-driven fills)
+        fill_timeout: Seconds to wait for a fill before cancelling (order manager only)
 
     Returns:
         Dict with order details or rejection reason
     """
-    return await asyncio.to_thread(execute_trade, client, signal, symbol, allocation_pct, ticker_config, damping_factor)
+    if order_manager is not None and not order_manager.stream_alive():
+        print(f"[EXECUTOR] Trade-updates stream down - polling for {symbol} fill")
+        order_manager = None
+    if order_manager is None:
+        return await asyncio.to_thread(
+            execute_trade, client, signal, symbol, allocation_pct, ticker_config, damping_factor
+        )
+
+    result, ready = await asyncio.to_thread(
+        _prepare_trade, client, signal, symbol, allocation_pct, ticker_config, damping_factor
+    )
+    if not ready:
+        return result
+    side, qty, limit_price = result["side"], result["qty"], result["limit_price"]
+
+    print(f"[EXECUTOR] Submitting {side.upper()} LIMIT order: {qty} x {symbol} @ ${limit_price:.2f}")
+    try:
+        outcome = await order_manager.submit(symbol, qty, side, limit_price=limit_price, timeout=fill_timeout)
+    except Exception as e:
+        result["rejection_reason"] = f"Order submission failed: {e}"
+        client._log_trade("FAILED", symbol, side, qty, limit_price, str(e))
+        print(f"[EXECUTOR] ✗ Order failed: {e}")
+        return result
+
+    order_id = outcome["order_id"]
+    result["executed"] = True
+    result["order_id"] = order_id
+    client._log_trade(order_id, symbol, side, qty, limit_price, outcome["submitted_status"])
+
+    status = outcome["status"]
+    if status == "filled":
+        filled_avg_price = float(outcome["filled_avg_price"]) if outcome["filled_avg_price"] else limit_price
+        filled_qty = int(float(outcome["filled_qty"]))
+        print(f"[EXECUTOR] ✓ Order FILLED: {filled_qty} @ ${filled_avg_price:.2f} ({outcome['latency']:.2f}s)")
+        client._log_trade(
+            order_id,
+            symbol,
+            side,
+            qty,
+            limit_price,
+            "filled",
+            filled_avg_price=filled_avg_price,
+            filled_qty=filled_qty,
+            filled_at=str(outcome["filled_at"]),
+        )
+        result["limit_price"] = filled_avg_price  # Update to actual execution price
+        result["status"] = "FILLED"
+    elif outcome["timed_out"]:
+        print(f"[EXECUTOR] ⏱ Timeout ({fill_timeout:.0f}s) - Order cancelled")
+        client._log_trade(order_id, symbol, side, qty, limit_price, "TIMEOUT_REJECTION")
+        result["status"] = "TIMEOUT"
+        result["rejection_reason"] = f"Order TIMEOUT ({fill_timeout:.0f}s) - Cancelled to prevent zombie fill"
+    else:
+        print(f"[EXECUTOR] ✗ Order {status.upper()}")
+        client._log_trade(order_id, symbol, side, qty, limit_price, status)
+        result["status"] = status.upper()
+        result["rejection_reason"] = f"Order {status}"
+
+    return result
 
 
 def main():
@@ -4,11 +4,22 @@ Calculates alpha factors and merges multi-source data for quantitative analysis.
 """
 
 import time
-from typing import Dict
+from collections import OrderedDict
+from typing import Dict, Optional
 import pandas as pd
 import numpy as np
-from textblob import TextBlob
 from src.logger import LOG
+from src.hysteresis import fermi_hysteresis_kernel, schmitt_trigger, state_labels
+from src.rolling_stats import rolling_minmax_normalize, rolling_volatility, thermal_state
+from src.sentiment_cache import sentiment_cache
+
+# P1 REMEDIATION: Rolling normalization (look-back only, no future data)
+NORM_WINDOW = 252  # ~1 trading day of 1-minute bars
+NORM_FEATURES = ["rsi_14", "volume_zscore", "sentiment"]
+
+# Multi-timeframe RSI cache (keyed by bar content, see multi_timeframe_rsi)
+MTF_CACHE_SIZE = 16
+_MTF_RSI_CACHE: "OrderedDict[tuple, Optional[pd.Series]]" = OrderedDict()
 
 
 class FeatureEngineer:
@@ -201,6 +212,7 @@ def add_technical_indicators(df: pd.DataFrame, node_config: dict = None) -> pd.D
     - RSI: Relative Strength Index using Wilder's smoothing (period from node_config)
     - Volatility (14): Rolling standard deviation of log returns
     - Volume Z-Score (20): Standardized volume deviation
+    - Normalized alpha factors (<col>_norm) via add_normalized_features()
 
     Args:
         df: DataFrame with 'close', 'volume', and 'log_return' columns
@@ -249,16 +261,73 @@ def add_technical_indicators(df: pd.DataFrame, node_config: dict = None) -> pd.D
     # Handle division by zero (constant volume)
     df.loc[vol_std == 0, "volume_zscore"] = 0.0
 
+    # Attach rolling-normalized alpha factors once for all downstream consumers
+    add_normalized_features(df)
+
+    return df
+
+
+def add_normalized_features(df: pd.DataFrame, feature_cols: list = None, window: int = NORM_WINDOW) -> pd.DataFrame:
+    """
+    Attach rolling min-max normalized alpha factors as '<col>_norm' columns.
+
+    This is the single normalization stage shared by generate_master_signal,
+    optimize_alpha_weights and calculate_alpha_with_weights: each column is
+    normalized once per frame (O(n) rolling min/max, look-back only) and
+    consumers read the attached columns instead of rerunning rolling windows.
+    Re-run it if a source column is modified afterwards.
+
+    Args:
+        df: DataFrame with the feature columns (missing columns are skipped)
+        feature_cols: Columns to normalize (default: NORM_FEATURES)
+        window: Look-back window in bars (default: NORM_WINDOW)
+
+    Returns:
+        DataFrame with '<col>_norm' columns added (modified in place)
+    """
+    if feature_cols is None:
+        feature_cols = NORM_FEATURES
+
+    for col in feature_cols:
+        if col in df.columns:
+            df[f"{col}_norm"] = rolling_minmax_normalize(df[col], window=window, min_periods=20)
+
     return df
 
 
-def calculate_rsi(close_series: pd.Series, period: int = 14) -> pd.Series:
+def get_normalized_features(df: pd.DataFrame, feature_cols: list) -> pd.DataFrame:
+    """
+    Return normalized feature columns, reusing attached '<col>_norm' columns.
+
+    Columns not normalized yet (frames that skipped add_normalized_features) are
+    computed on the fly with the same rolling min-max normalization.
+
+    Args:
+        df: DataFrame with feature columns and optionally '<col>_norm' columns
+        feature_cols: Feature column names
+
+    Returns:
+        DataFrame of normalized values (0-1) with the original column names
+    """
+    normalized = {}
+    for col in feature_cols:
+        norm_col = f"{col}_norm"
+        if norm_col in df.columns:
+            normalized[col] = df[norm_col]
+        else:
+            normalized[col] = rolling_minmax_normalize(df[col], window=NORM_WINDOW, min_periods=20)
+    return pd.DataFrame(normalized, index=df.index)
+
+
+def calculate_rsi(close_series: pd.Series, period: int = 14, wilder: bool = False) -> pd.Series:
     """
     Calculate RSI for a given close price series.
 
     Args:
         close_series: Series of close prices
         period: RSI lookback period (default 14)
+        wilder: Smooth with Wilder's alpha = 1/period instead of the EMA
+            span = period (default False, the production RSI)
 
     Returns:
         Series of RSI values (0-100)
@@ -267,8 +336,9 @@ def calculate_rsi(close_series: pd.Series, period: int = 14) -> pd.Series:
     gains = delta.where(delta > 0, 0.0)
     losses = (-delta).where(delta < 0, 0.0)
 
-    avg_gain = gains.ewm(span=period, adjust=False).mean()
-    avg_loss = losses.ewm(span=period, adjust=False).mean()
+    smoothing = {"alpha": 1.0 / period} if wilder else {"span": period}
+    avg_gain = gains.ewm(adjust=False, **smoothing).mean()
+    avg_loss = losses.ewm(adjust=False, **smoothing).mean()
 
     rs = avg_gain / avg_loss.replace(0, np.inf)
     rsi = 100 - (100 / (1 + rs))
@@ -281,6 +351,54 @@ def calculate_rsi(close_series: pd.Series, period: int = 14) -> pd.Series:
     return rsi
 
 
+def _timeframe_rsi(close: pd.Series, rule: Optional[str], period: int) -> Optional[pd.Series]:
+    """RSI of `close` at `rule` (None = native), aligned back onto close.index."""
+    if rule is None:
+        return calculate_rsi(close, period=period)
+    resampled = close.resample(rule).last().dropna()
+    if len(resampled) < period:
+        return None
+    # Upsample back to native resolution for alignment
+    return calculate_rsi(resampled, period=period).reindex(close.index, method="ffill")
+
+
+def multi_timeframe_rsi(close: pd.Series, rules=(None, "60Min"), period: int = 14) -> Dict:
+    """
+    RSI of one close series at several resolutions, aligned to its index.
+
+    Each coarser resolution resamples the closes (last close per bucket), computes
+    the RSI there and forward-fills it back onto the native index. Results are
+    cached by bar content (index + closes), so add_wavelet_signals,
+    carrier_wave_confluence and generate_master_signal share one resample and RSI
+    per frame instead of recomputing it each.
+
+    Args:
+        close: Close price Series with a DatetimeIndex
+        rules: Resample rules, e.g. (None, "15Min", "60Min"); None = native resolution
+        period: RSI lookback period
+
+    Returns:
+        Dict rule -> RSI Series (0-100, NaN before the first value), or None when the
+        resampled series has fewer than `period` bars (callers apply their neutral fallback)
+    """
+    values = close.to_numpy(dtype=np.float64)
+    fingerprint = (len(values), hash(close.index.asi8.tobytes()), hash(values.tobytes()))
+
+    result = {}
+    for rule in rules:
+        key = (rule, period) + fingerprint
+        if key in _MTF_RSI_CACHE:
+            _MTF_RSI_CACHE.move_to_end(key)
+            rsi = _MTF_RSI_CACHE[key]
+        else:
+            rsi = _timeframe_rsi(close, rule, period)
+            _MTF_RSI_CACHE[key] = rsi
+            if len(_MTF_RSI_CACHE) > MTF_CACHE_SIZE:
+                _MTF_RSI_CACHE.popitem(last=False)
+        result[rule] = None if rsi is None else rsi.copy()
+    return result
+
+
 def get_damping_factor(df: pd.DataFrame, ticker: str = None, node_config: dict = None) -> dict:
     """
     DEPRECATED: LAM damping replaced with volatility targeting.
@@ -334,26 +452,11 @@ def add_wavelet_signals(df: pd.DataFrame, ticker: str = None, node_config: dict
         LOG.warning(f"[WAVELET] {ticker} Insufficient data for wavelet decomposition")
         return df
 
-    # RSI at 5-minute scale (native resolution)
-    rsi_5 = calculate_rsi(df["close"], period=14)
-
-    # RSI at 15-minute scale (resample 5Min -> 15Min)
-    df_15min = df["close"].resample("15Min").last().dropna()
-    if len(df_15min) >= 14:
-        rsi_15_raw = calculate_rsi(df_15min, period=14)
-        # Upsample back to 5Min resolution for alignment
-        rsi_15 = rsi_15_raw.reindex(df.index, method="ffill")
-    else:
-        rsi_15 = pd.Series(50.0, index=df.index)  # Neutral fallback
-
-    # RSI at 60-minute scale (resample 5Min -> 60Min)
-    df_60min = df["close"].resample("60Min").last().dropna()
-    if len(df_60min) >= 14:
-        rsi_60_raw = calculate_rsi(df_60min, period=14)
-        # Upsample back to 5Min resolution for alignment
-        rsi_60 = rsi_60_raw.reindex(df.index, method="ffill")
-    else:
-        rsi_60 = pd.Series(50.0, index=df.index)  # Neutral fallback
+    # RSI at 5Min (native), 15Min and 60Min (resampled, upsampled back to 5Min)
+    rsi = multi_timeframe_rsi(df["close"], rules=(None, "15Min", "60Min"), period=14)
+    rsi_5 = rsi[None]
+    rsi_15 = rsi["15Min"] if rsi["15Min"] is not None else pd.Series(50.0, index=df.index)  # Neutral fallback
+    rsi_60 = rsi["60Min"] if rsi["60Min"] is not None else pd.Series(50.0, index=df.index)  # Neutral fallback
 
     # Fill NaN values with neutral 50
     rsi_5 = rsi_5.fillna(50.0)
@@ -421,67 +524,29 @@ def carrier_wave_confluence(df: pd.DataFrame, ticker: str = None, node_config: d
         LOG.warning(f"[SIGNAL] {ticker} Insufficient data for carrier wave analysis")
         return df
 
-    # Calculate 5-minute Alpha (The Signal) using RSI
-    rsi_5 = calculate_rsi(df["close"], period=14)
-    signal_alpha = rsi_5 / 100.0  # Normalize to 0-1
-    signal_alpha = signal_alpha.fillna(0.5)
-
-    # Calculate 60-minute Alpha (The Carrier) using resampled RSI
-    df_60min = df["close"].resample("60Min").last().dropna()
-    if len(df_60min) >= 14:
-        rsi_60_raw = calculate_rsi(df_60min, period=14)
-        # Upsample back to 5Min resolution for alignment
-        carrier_alpha = rsi_60_raw.reindex(df.index, method="ffill") / 100.0
+    # 5-minute Alpha (The Signal) and 60-minute Alpha (The Carrier) from RSI
+    rsi = multi_timeframe_rsi(df["close"], rules=(None, "60Min"), period=14)
+    signal_alpha = (rsi[None] / 100.0).fillna(0.5).to_numpy()  # Normalize to 0-1
+    if rsi["60Min"] is not None:
+        carrier_alpha = (rsi["60Min"] / 100.0).fillna(0.5).to_numpy()
     else:
-        carrier_alpha = pd.Series(0.5, index=df.index)  # Neutral fallback
-
-    carrier_alpha = carrier_alpha.fillna(0.5)
+        carrier_alpha = np.full(len(df), 0.5)  # Neutral fallback
 
     # Determine polarities (centered at 0.5)
     # Polarity: +1 if > 0.5 (bullish), -1 if < 0.5 (bearish), 0 if exactly 0.5
     signal_polarity = np.sign(signal_alpha - 0.5)
     carrier_polarity = np.sign(carrier_alpha - 0.5)
 
-    # Initialize carrier_signal column
-    df["carrier_signal"] = 0
+    # Opposite signs = SILENCE; both positive, both negative, or either neutral (0) = PASS
+    polarities_conflict = (signal_polarity * carrier_polarity) < 0
 
-    # Counters for telemetry
-    pass_count = 0
-    silence_count = 0
-
-    # Apply carrier wave filter
-    for idx in df.index:
-        sig_pol = signal_polarity.loc[idx]
-        car_pol = carrier_polarity.loc[idx]
-        sig_val = signal_alpha.loc[idx]
-        car_val = carrier_alpha.loc[idx]
-
-        # Check polarity alignment
-        # Both positive, both negative, or either is neutral (0) = PASS
-        # Opposite signs = SILENCE
-        polarities_conflict = (sig_pol * car_pol) < 0
-
-        if polarities_conflict:
-            # Opposite polarities - SILENCE
-            df.loc[idx, "carrier_signal"] = 0
-            action = "SILENCE"
-            silence_count += 1
-        else:
-            # Aligned or neutral - PASS through signal
-            # Convert alpha to directional signal: > 0.6 = BUY, < 0.4 = SELL, else HOLD
-            if sig_val > 0.6:
-                df.loc[idx, "carrier_signal"] = 1
-                action = "BUY"
-            elif sig_val < 0.4:
-                df.loc[idx, "carrier_signal"] = -1
-                action = "SELL"
-            else:
-                df.loc[idx, "carrier_signal"] = 0
-                action = "HOLD"
-            pass_count += 1
+    # Aligned or neutral: > 0.6 = BUY, < 0.4 = SELL, else HOLD
+    direction = np.where(signal_alpha > 0.6, 1, np.where(signal_alpha < 0.4, -1, 0))
+    df["carrier_signal"] = np.where(polarities_conflict, 0, direction)
 
-        # Per-bar telemetry (ASCII only)
-        LOG.info(f"[SIGNAL] Carrier Alignment: {car_val:.4f} | Signal: {sig_val:.4f} | Result: {action}")
+    # Counters for telemetry
+    silence_count = int(polarities_conflict.sum())
+    pass_count = len(df) - silence_count
 
     # Summary telemetry
     LOG.info(f"[SIGNAL] Carrier Wave Summary: {pass_count} PASS, {silence_count} SILENCE")
@@ -489,8 +554,86 @@ def carrier_wave_confluence(df: pd.DataFrame, ticker: str = None, node_config: d
     return df
 
 
+def _pit_window_stats(
+    bar_index: pd.DatetimeIndex, published: pd.Series, sentiment: pd.Series, lookback_delta
+) -> tuple:
+    """
+    Per-bar news count and mean sentiment over [bar_time - lookback, bar_time).
+
+    Sorted-merge implementation: two searchsorted passes locate each bar's window
+    bounds in the sorted publish times, and a cumulative sum of sentiment turns each
+    window mean into a difference of two prefix sums. O((bars + articles) log n).
+
+    Args:
+        bar_index: Bar timestamps (timezone-naive UTC)
+        published: Article publish times, sorted ascending
+        sentiment: Article sentiment aligned with published
+        lookback_delta: Lookback window as a timedelta
+
+    Returns:
+        Tuple of (news_counts ndarray, mean_sentiment ndarray with NaN where count == 0)
+    """
+    # Articles without a publish time never fall inside a window
+    valid = published.notna().to_numpy()
+    pub_ns = pd.DatetimeIndex(published[valid]).as_unit("ns").asi8
+    sent_values = sentiment.to_numpy(dtype=float)[valid]
+
+    bars = pd.DatetimeIndex(bar_index).as_unit("ns")
+
+    # Strict PIT: window_start <= publishedDate < bar_time
+    window_end = np.searchsorted(pub_ns, bars.asi8, side="left")
+    window_start = np.searchsorted(pub_ns, (bars - lookback_delta).asi8, side="left")
+
+    news_counts = window_end - window_start
+
+    sent_cumsum = np.concatenate([[0.0], np.cumsum(sent_values)])
+    window_sum = sent_cumsum[window_end] - sent_cumsum[window_start]
+
+    mean_sentiment = np.full(len(bars), np.nan)
+    has_news = news_counts > 0
+    mean_sentiment[has_news] = window_sum[has_news] / news_counts[has_news]
+
+    return news_counts, mean_sentiment
+
+
+def _pit_window_stats_legacy(
+    bar_index: pd.DatetimeIndex, published: pd.Series, sentiment: pd.Series, lookback_delta
+) -> tuple:
+    """
+    Legacy per-bar boolean-mask implementation of _pit_window_stats (O(bars x articles)).
+
+    Kept as the reference path for merge_news_pit(pit_method='legacy' / 'compare').
+    """
+    sentiments = []
+    news_counts = []
+
+    for bar_time in bar_index:
+        # Find news published before this bar, within lookback window
+        window_start = bar_time - lookback_delta
+
+        # Filter news: window_start <= publishedDate < bar_time (strict PIT)
+        mask = (published >= window_start) & (published < bar_time)
+        recent_sentiment = sentiment.loc[mask]
+
+        news_count = len(recent_sentiment)
+        news_counts.append(news_count)
+
+        if news_count > 0:
+            avg_sent = recent_sentiment.mean()
+        else:
+            avg_sent = np.nan  # Will forward-fill later
+
+        sentiments.append(avg_sent)
+
+    return np.array(news_counts, dtype=np.int64), np.array(sentiments, dtype=float)
+
+
 def merge_news_pit(
-    price_df: pd.DataFrame, news_list: list, lookback_hours: int = 4, ticker: str = None
+    price_df: pd.DataFrame,
+    news_list: list,
+    lookback_hours: int = 4,
+    ticker: str = None,
+    pit_method: str = "sorted",
 ) -> pd.DataFrame:
     """
     Point-in-Time sentiment alignment - only uses news available at each bar timestamp.
@@ -504,6 +647,8 @@ def merge_news_pit(
         news_list: List of dicts with 'publishedDate' and 'sentiment' keys
         lookback_hours: Hours to look back for recent news (default: 4)
         ticker: Symbol being processed (optional, used for control tests like SPY bypass)
+        pit_method: Window aggregation path - 'sorted' (searchsorted/cumsum, default),
+                    'legacy' (per-bar mask) or 'compare' (run both, log max deviation)
 
     Returns:
         DataFrame with 'sentiment' column added
@@ -525,30 +670,40 @@ def merge_news_pit(
     news_df = news_df.sort_values("publishedDate").reset_index(drop=True)
 
     # Local NLP Fallback: If API sentiment is MISSING, calculate via TextBlob
+    # Scores are cached per article hash, so each article pays the NLP cost once
     nlp_start = time.perf_counter()
-    nlp_engaged = False
-
-    for idx, row in news_df.iterrows():
-        # Only run NLP if sentiment field is truly missing
-        if "sentiment" not in row or row["sentiment"] is None or pd.isna(row["sentiment"]):
-            nlp_engaged = True
-            # Concatenate title and text/summary for full context
-            title = str(row.get("title", ""))
-            text = str(row.get("text", row.get("summary", "")))
-            full_text = f"{title} {text}".strip()
-
-            if full_text:
-                # TextBlob polarity returns -1.0 to 1.0
-                news_df.at[idx, "sentiment"] = TextBlob(full_text).sentiment.polarity
-            else:
-                news_df.at[idx, "sentiment"] = 0.0  # Fallback for empty text
+
+    if "sentiment" in news_df.columns:
+        nlp_mask = news_df["sentiment"].isna()
+    else:
+        nlp_mask = pd.Series(True, index=news_df.index)
+
+    nlp_engaged = bool(nlp_mask.any())
+
+    if nlp_engaged:
+        # Concatenate title and text/summary for full context
+        missing = news_df.loc[nlp_mask]
+        titles = missing["title"].map(str) if "title" in missing.columns else pd.Series("", index=missing.index)
+        if "text" in missing.columns:
+            bodies = missing["text"].map(str)
+        elif "summary" in missing.columns:
+            bodies = missing["summary"].map(str)
+        else:
+            bodies = pd.Series("", index=missing.index)
+        full_texts = [f"{title} {text}".strip() for title, text in zip(titles, bodies)]
+
+        # TextBlob polarity returns -1.0 to 1.0 (0.0 fallback for empty text)
+        hits_before = sentiment_cache.hits
+        news_df.loc[nlp_mask, "sentiment"] = sentiment_cache.score(full_texts)
+        cache_hits = sentiment_cache.hits - hits_before
 
     nlp_end = time.perf_counter()
     calc_time = nlp_end - nlp_start
 
     if nlp_engaged:
         LOG.warning(
-            f"[PIT] API sentiment missing. Local NLP engaged for {len(news_df)} articles. Latency: {calc_time:.4f}s"
+            f"[PIT] API sentiment missing. Local NLP engaged for {int(nlp_mask.sum())} articles "
+            f"({cache_hits} cached). Latency: {calc_time:.4f}s"
         )
 
     # Check if all sentiment values are constant (API data quality issue)
@@ -559,26 +714,30 @@ def merge_news_pit(
         LOG.info("[PIT] All news sentiment values are constant after NLP - using news frequency as proxy")
 
     lookback_delta = timedelta(hours=lookback_hours)
-    sentiments = []
-    news_counts = []
-
-    for bar_time in df.index:
-        # Find news published before this bar, within lookback window
-        window_start = bar_time - lookback_delta
-
-        # Filter news: window_start <= publishedDate < bar_time (strict PIT)
-        mask = (news_df["publishedDate"] >= window_start) & (news_df["publishedDate"] < bar_time)
-        recent_news = news_df.loc[mask]
-
-        news_count = len(recent_news)
-        news_counts.append(news_count)
-
-        if news_count > 0:
-            avg_sent = recent_news["sentiment"].mean()
-        else:
-            avg_sent = np.nan  # Will forward-fill later
 
-        sentiments.append(avg_sent)
+    if pit_method == "legacy":
+        news_counts, sentiments = _pit_window_stats_legacy(
+            df.index, news_df["publishedDate"], news_df["sentiment"], lookback_delta
+        )
+    elif pit_method in ("sorted", "compare"):
+        news_counts, sentiments = _pit_window_stats(
+            df.index, news_df["publishedDate"], news_df["sentiment"], lookback_delta
+        )
+        if pit_method == "compare":
+            legacy_counts, legacy_sentiments = _pit_window_stats_legacy(
+                df.index, news_df["publishedDate"], news_df["sentiment"], lookback_delta
+            )
+            count_mismatch = int((legacy_counts != news_counts).sum())
+            nan_mismatch = int((np.isnan(legacy_sentiments) != np.isnan(sentiments)).sum())
+            max_sent_diff = np.nanmax(np.abs(legacy_sentiments - sentiments), initial=0.0)
+            LOG.info(
+                f"[PIT] Legacy compare: count_mismatch={count_mismatch}, nan_mismatch={nan_mismatch}, "
+                f"max_sentiment_diff={max_sent_diff:.3e}"
+            )
+            if count_mismatch or nan_mismatch or max_sent_diff > 1e-9:
+                LOG.warning(f"[PIT] Sorted PIT aggregation deviates from legacy path for {ticker}")
+    else:
+        raise ValueError(f"Unknown pit_method: {pit_method}")
 
     if use_frequency_proxy:
         # Use news count as sentiment proxy: normalize to roughly -0.5 to +0.5 range
@@ -662,21 +821,10 @@ def generate_master_signal(df: pd.DataFrame, node_config: dict = None, ticker: s
     rsi_norm = df["rsi_14"] / 100.0
 
     # P1 REMEDIATION: Rolling normalization (look-back only, no future data)
-    NORM_WINDOW = 252  # ~1 trading day of 1-minute bars
-
-    # Normalize Volume Z-Score (rolling min-max to 0-1)
-    vol_rolling_min = df["volume_zscore"].rolling(window=NORM_WINDOW, min_periods=20).min()
-    vol_rolling_max = df["volume_zscore"].rolling(window=NORM_WINDOW, min_periods=20).max()
-    vol_range = vol_rolling_max - vol_rolling_min
-    vol_norm = (df["volume_zscore"] - vol_rolling_min) / vol_range.replace(0, np.inf)
-    vol_norm = vol_norm.fillna(0.5)  # Warmup period fallback
-
-    # Normalize Sentiment (rolling min-max to 0-1)
-    sent_rolling_min = df["sentiment"].rolling(window=NORM_WINDOW, min_periods=20).min()
-    sent_rolling_max = df["sentiment"].rolling(window=NORM_WINDOW, min_periods=20).max()
-    sent_range = sent_rolling_max - sent_rolling_min
-    sent_norm = (df["sentiment"] - sent_rolling_min) / sent_range.replace(0, np.inf)
-    sent_norm = sent_norm.fillna(0.5)  # Warmup period fallback
+    # Volume Z-Score and Sentiment (rolling min-max to 0-1) from the shared normalization stage
+    normalized = get_normalized_features(df, ["volume_zscore", "sentiment"])
+    vol_norm = normalized["volume_zscore"]
+    sent_norm = normalized["sentiment"]
 
     # Calculate weighted alpha score
     df["alpha_score"] = (rsi_wt * rsi_norm) + (vol_wt * vol_norm) + (sent_wt * sent_norm)
@@ -697,36 +845,10 @@ def generate_master_signal(df: pd.DataFrame, node_config: dict = None, ticker: s
         # State: 0 = FLAT, 1 = LONG, -1 = SHORT (but config may force long-only)
         allow_shorts = node_config.get("allow_shorts", False)
 
-        position_state = np.zeros(len(df))  # State column
-        hysteresis_signal = np.zeros(len(df))  # Signal column (0 = flat, 1 = long, -1 = short)
-
-        current_state = 0  # Start FLAT
-
-        # Schmidt Trigger State Machine (forward iteration, no lookahead)
-        for i, (idx, row) in enumerate(df.iterrows()):
-            rsi_value = row["rsi_14"]
-
-            # State transitions
-            if current_state == 0:  # Currently FLAT
-                if rsi_value > upper_threshold:
-                    current_state = 1  # Enter LONG
-                elif allow_shorts and rsi_value < lower_threshold:
-                    current_state = -1  # Enter SHORT (if allowed)
-                # else: stay FLAT
-
-            elif current_state == 1:  # Currently LONG
-                if rsi_value < lower_threshold:
-                    current_state = 0  # Exit to FLAT
-                # else: hold LONG (quiet zone 45-55 does nothing)
-
-            elif current_state == -1:  # Currently SHORT
-                if rsi_value > upper_threshold:
-                    current_state = 0  # Exit to FLAT
-                # else: hold SHORT (quiet zone 45-55 does nothing)
-
-            # Record state
-            position_state[i] = current_state
-            hysteresis_signal[i] = current_state
+        # Schmidt Trigger State Machine (forward iteration, no lookahead; see src/hysteresis.py)
+        # FLAT -> LONG above upper, LONG -> FLAT below lower, SHORT (if allowed) mirrors it
+        position_state = schmitt_trigger(df["rsi_14"], upper_threshold, lower_threshold, allow_shorts).astype(float)
+        hysteresis_signal = position_state.copy()  # Signal column (0 = flat, 1 = long, -1 = short)
 
         # Store in DataFrame
         df["position_state"] = position_state
@@ -757,11 +879,10 @@ def generate_master_signal(df: pd.DataFrame, node_config: dict = None, ticker: s
     # Calculate Alpha_5M (current resolution RSI normalized to -0.5 to +0.5 scale)
     alpha_5m = rsi_norm - 0.5  # Centered: >0 = bullish, <0 = bearish
 
-    # Calculate Alpha_60M (60-minute resampled RSI)
-    df_60min = df["close"].resample("60Min").last().dropna()
-    if len(df_60min) >= 14:
-        rsi_60_raw = calculate_rsi(df_60min, period=14)
-        rsi_60_aligned = rsi_60_raw.reindex(df.index, method="ffill") / 100.0
+    # Calculate Alpha_60M (60-minute resampled RSI, shared with the carrier/wavelet filters)
+    rsi_60 = multi_timeframe_rsi(df["close"], rules=("60Min",), period=14)["60Min"]
+    if rsi_60 is not None:
+        rsi_60_aligned = rsi_60 / 100.0
         alpha_60m = rsi_60_aligned.fillna(0.5) - 0.5  # Centered
     else:
         alpha_60m = pd.Series(0.0, index=df.index)  # Neutral fallback
@@ -810,7 +931,7 @@ def generate_master_signal(df: pd.DataFrame, node_config: dict = None, ticker: s
     haw_active = False
     if ticker == "IWM" and "log_return" in df.columns:
         # Rolling 1H volatility = 12 bars of 5Min data
-        rolling_vol_1h = df["log_return"].rolling(window=12).std()
+        rolling_vol_1h = rolling_volatility(df["log_return"], window=12)
         vol_baseline = rolling_vol_1h.mean()
 
         # Check if current volatility exceeds 2x baseline
@@ -830,25 +951,21 @@ def generate_master_signal(df: pd.DataFrame, node_config: dict = None, ticker: s
     # -------------------------------------------------------------------------
     cryo_active = False
     cryo_mask = pd.Series(False, index=df.index)
+    cryo_scaling = np.ones(len(df))
 
     if ticker == "VSS" and "high" in df.columns and "low" in df.columns:
-        # Calculate ATR (Average True Range) for volatility temperature
-        high_low = df["high"] - df["low"]
-        high_close = (df["high"] - df["close"].shift(1)).abs()
-        low_close = (df["low"] - df["close"].shift(1)).abs()
-        true_range = pd.concat([high_low, high_close, low_close], axis=1).max(axis=1)
-
-        # Vol_Temp = Rolling 20-period ATR
-        vol_temp = true_range.rolling(window=20).mean()
-
-        # Baseline_Temp = 200-period Rolling Median of ATR
-        baseline_temp = vol_temp.rolling(window=200).median()
+        # Vol_Temp = Rolling 20-period ATR, Baseline_Temp = 200-period Rolling Median of ATR
+        # Temperature, baseline and damping ratio are computed once as columns
+        thermal = thermal_state(df["high"], df["low"], df["close"], atr_window=20, baseline_window=200)
 
         # Store for telemetry
-        df["vol_temp"] = vol_temp
+        df["vol_temp"] = thermal["vol_temp"]
+        df["baseline_temp"] = thermal["baseline_temp"]
+        df["cryo_scaling"] = thermal["cryo_scaling"]
 
         # RULE: If Vol_Temp > 1.5 * Baseline_Temp, signal = 0 (Too Hot)
-        cryo_mask = vol_temp > (1.5 * baseline_temp)
+        cryo_mask = thermal["cryo_hot"]
+        cryo_scaling = thermal["cryo_scaling"].to_numpy()
         cryo_count = cryo_mask.sum()
 
         if cryo_count > 0:
@@ -868,173 +985,34 @@ def generate_master_signal(df: pd.DataFrame, node_config: dict = None, ticker: s
     HYSTERESIS_DEADBAND = 0.05
 
     # Apply High-Pass Gate with directional signals
-    fire_buy_count = 0
-    fire_sell_count = 0
-    filter_count = 0
-    phase_lock_silence = 0
-    cryo_silence_count = 0
-
-    # Create signal column and state tracking
-    df["signal"] = 0
-    df["prev_state"] = "FILTER"  # Initialize state tracking
-
-    # Track previous state for hysteresis
-    prev_state = "FILTER"
-
-    for idx in df.index:
-        score = df.loc[idx, "alpha_score"]
-        c_score = df.loc[idx, "carrier_score"]
-        is_vetoed = carrier_conflict.loc[idx] if idx in carrier_conflict.index else False
-        is_cryo_hot = cryo_mask.loc[idx] if idx in cryo_mask.index else False
-
-        # Get vol_temp for telemetry (VSS only)
-        temp_val = df.loc[idx, "vol_temp"] if "vol_temp" in df.columns else 0.0
-
-        # CRYOGENIC COOLING (VSS): Apply proportional damping instead of hard veto
-        # Damping scaled by temperature excess ratio
-        if ticker == "VSS" and is_cryo_hot:
-            # Calculate damping factor from temperature excess
-            temp_baseline = (
-                df["vol_temp"].rolling(window=200).median().loc[idx] if "vol_temp" in df.columns else temp_val
-            )
-            if temp_baseline > 0 and pd.notna(temp_baseline):
-                temp_ratio = temp_val / temp_baseline
-                cryo_damping = min((temp_ratio - 1.0), 0.80) if temp_ratio > 1.0 else 0.0
-            else:
-                cryo_damping = 0.50  # Default 50% damping if baseline unavailable
-
-            cryo_scaling = 1.0 - cryo_damping
-            cryo_metabolism = int(cryo_scaling * 100)
-
-            # Store damped score instead of zeroing
-            df.loc[idx, "signal"] = 0  # Signal still 0 but with damping metadata
-            df.loc[idx, "damping_factor"] = cryo_scaling
-            action = "DAMP"
-            cryo_silence_count += 1
-            # LOG.cryogen(f"[CRYOGEN] VSS Temp: {temp_val:.4f} | Status: {action} | Metabolism: {cryo_metabolism}%")
-            LOG.info(f"[LAM] Damping Active | Metabolism: {cryo_metabolism}%")
-            prev_state = "FILTER"
-            df.loc[idx, "prev_state"] = prev_state
-            continue
-
-        # CARRIER DAMPING: Apply proportional reduction instead of hard veto
-        # WITH HYSTERESIS DEADBAND
-        if is_vetoed:
-            # Calculate carrier damping based on misalignment severity
-            carrier_gate = 0.5
-            carrier_shortfall = abs(c_score - carrier_gate)
-            carrier_damping_val = min(carrier_shortfall * 2.0, 0.80)  # Scale shortfall to damping
-            carrier_scaling = 1.0 - carrier_damping_val
-            carrier_metabolism = int(carrier_scaling * 100)
-
-            # HYSTERESIS LOGIC: Apply deadband to prevent chatter
-            # If prev_state is FILTER, need Carrier > (Gate + 0.02) to flip to BUY
-            # If prev_state is BUY, need Carrier < (Gate - 0.02) to flip to FILTER
-            if prev_state == "FILTER":
-                # Require extra margin to enter BUY state
-                if c_score > (carrier_gate + HYSTERESIS_DEADBAND):
-                    if score > fermi_gate:
-                        damped_signal = 1
-                        action = "DAMP-BUY"
-                        prev_state = "BUY"
-                    else:
-                        damped_signal = 0
-                        action = "DAMP-HOLD"
-                else:
-                    damped_signal = 0
-                    action = "FILTER"
-            elif prev_state == "BUY":
-                # Require extra margin to exit BUY state
-                if c_score < (carrier_gate - HYSTERESIS_DEADBAND):
-                    damped_signal = 0
-                    action = "FILTER"
-                    prev_state = "FILTER"
-                else:
-                    # Stay in BUY state
-                    damped_signal = 1
-                    action = "BUY"
-            else:
-                # Default fallback
-                if score > fermi_gate:
-                    damped_signal = 1
-                    action = "DAMP-BUY"
-                elif score < -fermi_gate:
-                    damped_signal = -1
-                    action = "DAMP-SELL"
-                else:
-                    damped_signal = 0
-                    action = "DAMP-HOLD"
-
-            df.loc[idx, "signal"] = damped_signal
-            df.loc[idx, "damping_factor"] = carrier_scaling
-            df.loc[idx, "prev_state"] = prev_state
-            phase_lock_silence += 1
-            # LOG.phase_lock(f"[PHASE-LOCK] Ticker: {ticker} | Carrier: {c_score:.4f} | Gate: {carrier_gate:.2f} | Status: {action}")
-            LOG.info(f"[LAM] Damping Active | Metabolism: {carrier_metabolism}%")
-            continue
-
-        # FERMI LOGIC: directional threshold applies WITH HYSTERESIS
-        # If prev_state is FILTER, need score > (fermi_gate + DEADBAND) to flip to BUY
-        # If prev_state is BUY, need score < (fermi_gate - DEADBAND) to flip to FILTER
-        if prev_state == "FILTER":
-            if score > (fermi_gate + HYSTERESIS_DEADBAND):
-                df.loc[idx, "signal"] = 1
-                action = "BUY"
-                prev_state = "BUY"
-                fire_buy_count += 1
-            elif score < -(fermi_gate + HYSTERESIS_DEADBAND):
-                df.loc[idx, "signal"] = -1
-                action = "SELL"
-                prev_state = "SELL"
-                fire_sell_count += 1
-            else:
-                df.loc[idx, "signal"] = 0
-                action = "FILTER"
-                filter_count += 1
-        elif prev_state == "BUY":
-            if score < (fermi_gate - HYSTERESIS_DEADBAND):
-                df.loc[idx, "signal"] = 0
-                action = "FILTER"
-                prev_state = "FILTER"
-                filter_count += 1
-            else:
-                df.loc[idx, "signal"] = 1
-                action = "BUY"
-                fire_buy_count += 1
-        elif prev_state == "SELL":
-            if score > -(fermi_gate - HYSTERESIS_DEADBAND):
-                df.loc[idx, "signal"] = 0
-                action = "FILTER"
-                prev_state = "FILTER"
-                filter_count += 1
-            else:
-                df.loc[idx, "signal"] = -1
-                action = "SELL"
-                fire_sell_count += 1
-        else:
-            # Default fallback for first iteration
-            if score > (fermi_gate + HYSTERESIS_DEADBAND):
-                df.loc[idx, "signal"] = 1
-                action = "BUY"
-                prev_state = "BUY"
-                fire_buy_count += 1
-            elif score < -(fermi_gate + HYSTERESIS_DEADBAND):
-                df.loc[idx, "signal"] = -1
-                action = "SELL"
-                prev_state = "SELL"
-                fire_sell_count += 1
-            else:
-                df.loc[idx, "signal"] = 0
-                action = "FILTER"
-                filter_count += 1
-
-        df.loc[idx, "prev_state"] = prev_state
+    # Single-pass state machine over NumPy buffers (see src/hysteresis.py)
+    kernel = fermi_hysteresis_kernel(
+        alpha_score=df["alpha_score"].to_numpy(),
+        carrier_score=df["carrier_score"].to_numpy(),
+        carrier_conflict=carrier_conflict.to_numpy(),
+        cryo_hot=cryo_mask.to_numpy(),
+        cryo_scaling=cryo_scaling,
+        fermi_gate=fermi_gate,
+        deadband=HYSTERESIS_DEADBAND,
+    )
 
-        # PHASE-LOCK TELEMETRY: Report per-bar decision for observability
-        if ticker == "VSS":
-            pass  # LOG.cryogen(f"[CRYOGEN] VSS Temp: {temp_val:.4f} | Status: {action}")
-        else:
-            pass  # LOG.phase_lock(f"[PHASE-LOCK] Ticker: {ticker} | Carrier: {c_score:.4f} | Status: {action}")
+    df["signal"] = kernel["signal"]
+    df["prev_state"] = state_labels(kernel["state"])
+
+    # damping_factor only exists on frames where damping was applied (NaN elsewhere)
+    damping = kernel["damping_factor"]
+    damped_mask = ~np.isnan(damping)
+    if damped_mask.any():
+        df.loc[damped_mask, "damping_factor"] = damping[damped_mask]
+        metabolism = (damping[damped_mask] * 100).astype(int)
+        LOG.info(f"[LAM] Damping Active | Bars: {damped_mask.sum()} | Mean Metabolism: {metabolism.mean():.0f}%")
+
+    counts = kernel["counts"]
+    fire_buy_count = counts["buy"]
+    fire_sell_count = counts["sell"]
+    filter_count = counts["filter"]
+    phase_lock_silence = counts["phase_lock"]
+    cryo_silence_count = counts["cryo"]
 
     # Summary Telemetry
     LOG.stats(
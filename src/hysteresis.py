@@ -0,0 +1,244 @@
+"""
+Hysteresis State-Machine Kernels
+Array-based replacements for the per-bar state machines in signal generation.
+
+The Fermi/Carrier/Cryogenic state machine in generate_master_signal() is
+path-dependent (each bar's state depends on the previous bar), so it cannot be
+expressed as a single elementwise operation. These kernels run the transition
+logic once over plain NumPy buffers instead of issuing df.loc reads/writes per
+bar, and hand back whole columns for the caller to attach in one assignment.
+
+The long-only RSI Schmitt trigger (Variant F / Daily Trend / Hourly Swing) is a
+set/reset latch, which latch_states() evaluates for whole (bars x parameter set)
+matrices without a time loop; src.hysteresis_sweep builds parameter sweeps on it.
+"""
+
+from typing import Dict
+
+import numpy as np
+
+# State encoding used inside the kernels (prev_state column is rendered back to strings)
+STATE_SELL = -1
+STATE_FILTER = 0
+STATE_BUY = 1
+
+STATE_LABELS = np.array(["SELL", "FILTER", "BUY"], dtype=object)
+
+
+def fermi_hysteresis_kernel(
+    alpha_score: np.ndarray,
+    carrier_score: np.ndarray,
+    carrier_conflict: np.ndarray,
+    cryo_hot: np.ndarray,
+    cryo_scaling: np.ndarray,
+    fermi_gate: float,
+    deadband: float = 0.05,
+    carrier_gate: float = 0.5,
+) -> Dict:
+    """
+    Run the Fermi Gate / Carrier Damping / Cryogenic Damping state machine in one pass.
+
+    Transition rules are identical to the legacy per-bar loop in generate_master_signal():
+    - Cryo-hot bars: signal 0, damping from cryo_scaling, state reset to FILTER
+    - Carrier-vetoed bars: carrier hysteresis (gate +/- deadband), damping from carrier shortfall
+    - All other bars: Fermi hysteresis (fermi_gate +/- deadband) over BUY/SELL/FILTER
+
+    Args:
+        alpha_score: Weighted alpha score per bar
+        carrier_score: 60-minute carrier score per bar (0-1 scale)
+        carrier_conflict: Boolean mask of 5M/60M polarity conflicts
+        cryo_hot: Boolean mask of cryogenic (too hot) bars - all False outside VSS
+        cryo_scaling: Cryogenic scaling factor per bar (only read where cryo_hot)
+        fermi_gate: Fermi Gate threshold (mean + sigma * std of alpha_score)
+        deadband: Hysteresis deadband (default: 0.05)
+        carrier_gate: Carrier polarity gate (default: 0.5)
+
+    Returns:
+        Dict with:
+        - 'signal': int64 array of -1/0/+1 signals
+        - 'state': int8 array of post-bar states (STATE_SELL/FILTER/BUY)
+        - 'damping_factor': float64 array (NaN where no damping was applied)
+        - 'counts': telemetry counters (buy, sell, filter, phase_lock, cryo)
+    """
+    n = len(alpha_score)
+
+    signal = np.zeros(n, dtype=np.int64)
+    state = np.zeros(n, dtype=np.int8)
+    damping_factor = np.full(n, np.nan)
+
+    # Python scalars iterate far faster than NumPy element access
+    scores = np.asarray(alpha_score, dtype=float).tolist()
+    c_scores = np.asarray(carrier_score, dtype=float).tolist()
+    vetoed = np.asarray(carrier_conflict, dtype=bool).tolist()
+    hot = np.asarray(cryo_hot, dtype=bool).tolist()
+    cryo_scale = np.asarray(cryo_scaling, dtype=float).tolist()
+
+    # Thresholds evaluated exactly as in the legacy loop (same float expressions)
+    fermi_entry = fermi_gate + deadband
+    fermi_exit = fermi_gate - deadband
+    carrier_entry = carrier_gate + deadband
+    carrier_exit = carrier_gate - deadband
+
+    buy_count = 0
+    sell_count = 0
+    filter_count = 0
+    phase_lock_count = 0
+    cryo_count = 0
+
+    prev = STATE_FILTER
+
+    for i in range(n):
+        # CRYOGENIC COOLING: proportional damping, forced back to FILTER
+        if hot[i]:
+            damping_factor[i] = cryo_scale[i]
+            prev = STATE_FILTER
+            state[i] = prev
+            cryo_count += 1
+            continue
+
+        score = scores[i]
+
+        # CARRIER DAMPING with deadband
+        if vetoed[i]:
+            c_score = c_scores[i]
+            carrier_damping = min(abs(c_score - carrier_gate) * 2.0, 0.80)
+
+            if prev == STATE_FILTER:
+                if c_score > carrier_entry and score > fermi_gate:
+                    signal[i] = 1
+                    prev = STATE_BUY
+            elif prev == STATE_BUY:
+                if c_score < carrier_exit:
+                    prev = STATE_FILTER
+                else:
+                    signal[i] = 1
+            else:
+                # SELL state is held through carrier damping (legacy fallback branch)
+                if score > fermi_gate:
+                    signal[i] = 1
+                elif score < -fermi_gate:
+                    signal[i] = -1
+
+            damping_factor[i] = 1.0 - carrier_damping
+            state[i] = prev
+            phase_lock_count += 1
+            continue
+
+        # FERMI LOGIC with deadband
+        if prev == STATE_FILTER:
+            if score > fermi_entry:
+                signal[i] = 1
+                prev = STATE_BUY
+                buy_count += 1
+            elif score < -fermi_entry:
+                signal[i] = -1
+                prev = STATE_SELL
+                sell_count += 1
+            else:
+                filter_count += 1
+        elif prev == STATE_BUY:
+            if score < fermi_exit:
+                prev = STATE_FILTER
+                filter_count += 1
+            else:
+                signal[i] = 1
+                buy_count += 1
+        else:
+            if score > -fermi_exit:
+                prev = STATE_FILTER
+                filter_count += 1
+            else:
+                signal[i] = -1
+                sell_count += 1
+
+        state[i] = prev
+
+    return {
+        "signal": signal,
+        "state": state,
+        "damping_factor": damping_factor,
+        "counts": {
+            "buy": buy_count,
+            "sell": sell_count,
+            "filter": filter_count,
+            "phase_lock": phase_lock_count,
+            "cryo": cryo_count,
+        },
+    }
+
+
+def state_labels(state: np.ndarray) -> np.ndarray:
+    """
+    Render encoded kernel states as the 'BUY'/'SELL'/'FILTER' labels used by prev_state.
+
+    Args:
+        state: Array of STATE_SELL/STATE_FILTER/STATE_BUY codes
+
+    Returns:
+        Object array of state labels
+    """
+    return STATE_LABELS[np.asarray(state, dtype=np.int64) + 1]
+
+
+def latch_states(set_mask: np.ndarray, reset_mask: np.ndarray) -> np.ndarray:
+    """
+    Batched set/reset latch: long from a set bar until the next reset bar.
+
+    The long-only Schmitt trigger holds its state until the opposite event, so
+    the state at bar t is simply "the last set event is more recent than the
+    last reset event". That is two running maxima of event indices down the
+    time axis, which evaluates every column (parameter set) at once.
+
+    Args:
+        set_mask: Boolean (n,) or (n, k) mask of entry events (e.g. RSI > upper)
+        reset_mask: Boolean mask of exit events, same shape; must not share
+            bars with set_mask (true for any lower <= upper band pair)
+
+    Returns:
+        Boolean array of the same shape, True while long (starts flat)
+    """
+    set_mask = np.asarray(set_mask, dtype=bool)
+    reset_mask = np.asarray(reset_mask, dtype=bool)
+    n = set_mask.shape[0]
+    steps = np.arange(n, dtype=np.int32 if n < 2**31 else np.int64).reshape((n,) + (1,) * (set_mask.ndim - 1))
+    last_set = np.maximum.accumulate(np.where(set_mask, steps, -1), axis=0)
+    last_reset = np.maximum.accumulate(np.where(reset_mask, steps, -1), axis=0)
+    return last_set > last_reset
+
+
+def schmitt_trigger(values: np.ndarray, upper: float, lower: float, allow_shorts: bool = False) -> np.ndarray:
+    """
+    RSI hysteresis (Schmitt trigger) position states for one parameter set.
+
+    FLAT -> LONG above upper, LONG -> FLAT below lower; with allow_shorts,
+    FLAT -> SHORT below lower and SHORT -> FLAT above upper. NaN bars hold the
+    current state.
+
+    Args:
+        values: Indicator values per bar (e.g. raw RSI)
+        upper: Long entry / short exit threshold
+        lower: Long exit / short entry threshold
+        allow_shorts: Enable the SHORT state (default: False)
+
+    Returns:
+        int8 array of -1/0/+1 states after each bar
+    """
+    values = np.asarray(values, dtype=float)
+    if not allow_shorts and lower <= upper:
+        return latch_states(values > upper, values < lower).astype(np.int8)
+
+    state = np.zeros(len(values), dtype=np.int8)
+    current = 0
+    for i, value in enumerate(values.tolist()):
+        if current == 0:
+            if value > upper:
+                current = 1
+            elif allow_shorts and value < lower:
+                current = -1
+        elif current == 1:
+            if value < lower:
+                current = 0
+        elif value > upper:
+            current = 0
+        state[i] = current
+    return state
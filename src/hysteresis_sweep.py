@@ -0,0 +1,137 @@
+"""
+RSI Hysteresis Sweep Module
+Batched parameter sweeps for the long-only RSI Schmitt-trigger strategies.
+
+RSI is computed once per period; every valid (upper, lower) band pair for that
+period is then evaluated as one column of a (bars x pairs) latch matrix
+(src.hysteresis.latch_states), and friction levels reuse the same gross returns
+and turnover. This replaces one df.iloc state-machine loop per parameter set.
+
+Accounting (per bar, close-to-close):
+- position is the latch state after bar t, held over bar t + 1
+- net return = position[t-1] * pct_change[t] - friction * |position[t] - position[t-1]|
+- trades = number of entries; an open position at the end is marked to market
+
+Consumers:
+- research/testing/perturbations: Daily Trend / Hourly Swing band and friction sweeps
+- research/testing/benchmarks/benchmark_hysteresis_sweep.py
+"""
+
+from typing import Callable, Iterable, Optional
+
+import numpy as np
+import pandas as pd
+
+from src.features import calculate_rsi
+from src.hysteresis import latch_states
+
+SWEEP_INDEX = ["rsi_period", "upper", "lower", "friction_bps"]
+SWEEP_METRICS = ["sharpe", "total_return", "trades"]
+
+# Band pairs per latch block (block memory ~ bars * BLOCK_PAIRS * 8 bytes)
+BLOCK_PAIRS = 1024
+
+
+def band_pairs(uppers: Iterable[float], lowers: Iterable[float]) -> np.ndarray:
+    """
+    All (upper, lower) combinations with lower < upper.
+
+    Args:
+        uppers: Long entry thresholds
+        lowers: Long exit thresholds
+
+    Returns:
+        (k, 2) float array of [upper, lower] rows
+    """
+    grid = np.array([(u, l) for u in uppers for l in lowers if l < u], dtype=np.float64)
+    return grid.reshape(-1, 2)
+
+
+def sweep_metrics(
+    positions: np.ndarray, returns: np.ndarray, frictions_bps: Iterable[float], periods_per_year: float
+) -> np.ndarray:
+    """
+    Metrics for a block of position columns at each friction level.
+
+    Args:
+        positions: (n, k) 0/1 positions after each bar
+        returns: (n,) close-to-close returns (0 on the first bar)
+        frictions_bps: Cost per position change in basis points
+        periods_per_year: Bars per year for Sharpe annualization
+
+    Returns:
+        (k, n_frictions, 3) array of sharpe, total_return, trades
+    """
+    positions = positions.astype(np.float64)
+    held = np.vstack([np.zeros((1, positions.shape[1])), positions[:-1]])
+    gross = held * returns[:, None]
+    turnover = np.abs(positions - held)
+    trades = np.count_nonzero(positions > held, axis=0)
+
+    frictions = np.asarray(list(frictions_bps), dtype=np.float64)
+    out = np.empty((positions.shape[1], len(frictions), len(SWEEP_METRICS)))
+    for f, bps in enumerate(frictions):
+        net = gross - (bps / 10000.0) * turnover
+        std = net.std(axis=0, ddof=1)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            sharpe = np.where(std > 0, net.mean(axis=0) / std * np.sqrt(periods_per_year), 0.0)
+        out[:, f, 0] = sharpe
+        out[:, f, 1] = np.prod(1.0 + net, axis=0) - 1.0
+        out[:, f, 2] = trades
+    return out
+
+
+def rsi_hysteresis_sweep(
+    close: pd.Series,
+    periods: Iterable[int],
+    uppers: Iterable[float],
+    lowers: Iterable[float],
+    frictions_bps: Iterable[float] = (0.0,),
+    periods_per_year: float = 252,
+    rsi_fn: Optional[Callable[[pd.Series, int], pd.Series]] = None,
+) -> pd.DataFrame:
+    """
+    Sweep RSI period x upper x lower x friction for the long-only RSI hysteresis strategy.
+
+    Args:
+        close: Close prices
+        periods: RSI periods
+        uppers: Long entry thresholds (RSI > upper)
+        lowers: Long exit thresholds (RSI < lower); pairs with lower >= upper are skipped
+        frictions_bps: Cost per position change in basis points (default: 0)
+        periods_per_year: Bars per year for Sharpe (252 daily, 252 * 6.5 hourly RTH)
+        rsi_fn: RSI function (close, period) -> Series (default: src.features.calculate_rsi)
+
+    Returns:
+        Tidy DataFrame indexed by (rsi_period, upper, lower, friction_bps) with
+        sharpe, total_return and trades columns; unstack the index levels for a
+        cube view
+    """
+    if rsi_fn is None:
+        rsi_fn = lambda prices, period: calculate_rsi(prices, period=period)
+
+    frictions = [float(f) for f in frictions_bps]
+    pairs = band_pairs(uppers, lowers)
+    returns = close.pct_change().fillna(0.0).to_numpy(dtype=np.float64)
+
+    frames = []
+    for period in periods:
+        # RSI once per period; every band pair reads the same column
+        rsi = np.asarray(rsi_fn(close, period), dtype=np.float64)[:, None]
+        for start in range(0, len(pairs), BLOCK_PAIRS):
+            block = pairs[start:start + BLOCK_PAIRS]
+            positions = latch_states(rsi > block[:, 0], rsi < block[:, 1])
+            metrics = sweep_metrics(positions, returns, frictions, periods_per_year)
+            k = len(block)
+            frame = pd.DataFrame(metrics.reshape(k * len(frictions), len(SWEEP_METRICS)), columns=SWEEP_METRICS)
+            frame.insert(0, "friction_bps", np.tile(frictions, k))
+            frame.insert(0, "lower", np.repeat(block[:, 1], len(frictions)))
+            frame.insert(0, "upper", np.repeat(block[:, 0], len(frictions)))
+            frame.insert(0, "rsi_period", period)
+            frames.append(frame)
+
+    if not frames:
+        return pd.DataFrame(columns=SWEEP_INDEX + SWEEP_METRICS).set_index(SWEEP_INDEX)
+    result = pd.concat(frames, ignore_index=True)
+    result["trades"] = result["trades"].astype(np.int64)
+    return result.set_index(SWEEP_INDEX)
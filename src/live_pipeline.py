@@ -0,0 +1,285 @@
+"""
+Live Pipeline Module
+Concurrent per-ticker stages for the minute loop in main.live_trading_loop.
+
+The Alpaca and FMP data clients are synchronous REST clients, so calling them
+inside process_ticker serialized the whole basket even under asyncio.gather.
+LivePipeline offloads the blocking fetches to a bounded thread pool (I/O for
+all tickers overlaps without opening an unbounded number of connections) and
+the pandas feature engineering / signal stage to a process pool, leaving the
+event loop free to await order fills. Every stage is timed per ticker, and
+IterationTimings summarizes one pass of the loop against its 60s budget.
+
+- fetch_bars: Alpaca bars + interval verification (thread pool)
+- compute_live_signal: feature engineering + signal (process pool worker)
+- LivePipeline: owns the executors and runs timed stages
+- IterationTimings: per-stage wall time across the basket
+
+Consumers:
+- main.process_ticker
+- main.live_trading_loop
+"""
+
+import asyncio
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import partial
+from typing import Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from src.logger import LOG
+
+# Stages in pipeline order (keys of a ticker's timings dict)
+STAGES = ("bars", "fundamentals", "news", "features", "execution")
+
+# Seconds the minute loop has to process the whole basket
+ITERATION_BUDGET = 60.0
+
+
+def fetch_bars(alpaca_client, ticker: str, interval_str: str, timeframe, bar_start: str, bar_end: str, warmup_buffer: int) -> pd.DataFrame:
+    """
+    Fetch bars with a warmup buffer and force-verify their interval (blocking).
+
+    Args:
+        alpaca_client: AlpacaDataClient instance
+        ticker: Symbol to fetch
+        interval_str: Requested interval string (e.g. '1Min')
+        timeframe: Alpaca TimeFrame for the interval
+        bar_start: Bar window start date (YYYY-MM-DD)
+        bar_end: Bar window end date (YYYY-MM-DD)
+        warmup_buffer: Trailing bars to prepend for indicator warmup
+
+    Returns:
+        OHLCV DataFrame at the requested interval
+    """
+    from src.data_handler import force_resample_ohlcv
+
+    bars = alpaca_client.fetch_historical_bars(
+        symbol=ticker,
+        timeframe=timeframe,
+        start=bar_start,
+        end=bar_end,
+        feed="sip",
+        lookback_buffer=warmup_buffer,
+    )
+    LOG.info(f"[{ticker}] Fetched {len(bars)} bars (includes {warmup_buffer} warmup)")
+
+    # FORCE-VERIFY: Resample if fetched data doesn't match requested interval
+    bars, was_resampled, actual_secs, expected_secs = force_resample_ohlcv(bars, interval_str, ticker=ticker)
+    if was_resampled:
+        LOG.info(f"[{ticker}] Resampled to {len(bars)} bars at {interval_str}")
+    else:
+        LOG.info(f"[VALIDATION] [OK] Frequency verified: {interval_str} ({int(actual_secs)}s delta)")
+    return bars
+
+
+def compute_live_signal(
+    bars: pd.DataFrame,
+    fmp_metrics: dict,
+    news_list: list,
+    node_config: dict,
+    ticker: str,
+    warmup_buffer: int,
+) -> dict:
+    """
+    Feature engineering and signal generation for one ticker (process pool worker).
+
+    Args:
+        bars: OHLCV DataFrame from fetch_bars
+        fmp_metrics: Dict with 'mktCap', 'pe', 'avgVolume'
+        news_list: FMP news items for the point-in-time sentiment merge
+        node_config: Ticker-specific configuration dict
+        ticker: Symbol (for logging and the sentry gate)
+        warmup_buffer: Warmup bars to strip before the trading window
+
+    Returns:
+        Dict with 'signal' (1 / -1, None on error), 'strategy' and 'error'
+    """
+    from src.discovery import trim_warmup_period
+    from src.features import FeatureEngineer, add_technical_indicators, generate_master_signal, merge_news_pit
+    from src.optimizer import calculate_alpha_with_weights
+
+    feature_engineer = FeatureEngineer(node_config)
+    df = bars.copy()
+    df["log_return"] = feature_engineer.calculate_log_return(df)
+    df["rvol"] = feature_engineer.calculate_rvol(df, window=20)
+    df["parkinson_vol"] = feature_engineer.calculate_parkinson_vol(df)
+    df["mktCap"] = fmp_metrics["mktCap"]
+    df["pe"] = fmp_metrics["pe"]
+    df["avgVolume_fmp"] = fmp_metrics["avgVolume"]
+
+    feature_matrix_live = merge_news_pit(df, news_list, lookback_hours=4, ticker=ticker)
+
+    # Add technical indicators (with node_config for RSI lookback)
+    add_technical_indicators(feature_matrix_live, node_config=node_config)
+
+    # Generate master alpha signal (with node_config for weights and sentry gate)
+    generate_master_signal(feature_matrix_live, node_config=node_config, ticker=ticker)
+
+    feature_matrix_live = trim_warmup_period(feature_matrix_live, warmup_rows=20)
+
+    # HOT START: Strip warmup buffer for live trading
+    # Ensure signal generation only uses fully-warmed normalization windows
+    if len(feature_matrix_live) > warmup_buffer:
+        LOG.info(f"[HOT START] [{ticker}] Isolating {warmup_buffer} warmup bars from live trading window")
+        feature_matrix_live = feature_matrix_live.iloc[warmup_buffer:].copy()
+        LOG.success(f"[HOT START: ARMED] [{ticker}] Rolling normalization fully populated. Trading bars: {len(feature_matrix_live)}")
+
+    # AG: TEMPORAL LEAK PATCH - Feature Isolation
+    # CRITICAL: Ensure 'forward_return' is NEVER in feature set for signal generation
+    cols_needed = ["rsi_14", "volume_zscore", "sentiment", "log_return", "close"]
+    # Carry the shared normalization stage so calculate_alpha_with_weights reuses it
+    cols_needed += [col for col in feature_matrix_live.columns if col.endswith("_norm")]
+    if "signal" in feature_matrix_live.columns:
+        cols_needed.append("signal")
+
+    # Safety check: Explicitly exclude forward_return if somehow present
+    cols_needed = [col for col in cols_needed if col != "forward_return"]
+    working_df = feature_matrix_live[cols_needed].copy()
+    working_df["forward_return"] = working_df["log_return"].shift(-15)
+    working_df = working_df.dropna()
+
+    if len(working_df) < 50:
+        return {"signal": None, "strategy": None, "error": f"Insufficient data ({len(working_df)} rows)"}
+
+    split_idx = int(len(working_df) * 0.70)
+    out_sample = working_df.iloc[split_idx:].copy()
+    in_sample = working_df.iloc[:split_idx].copy()
+
+    # STRATEGY SELECTION: Validated Hysteresis vs Legacy Alpha
+    if "signal" in out_sample.columns and node_config.get("enable_hysteresis", False):
+        # VALIDATED STRATEGY: Use the pre-calculated Hysteresis signal
+        return {"signal": int(out_sample["signal"].iloc[-1]), "strategy": "hysteresis", "error": None}
+
+    # LEGACY STRATEGY: Use alpha weights for adaptive thresholding
+    alpha_weights = node_config.get("alpha_weights", {"rsi_14": 0.4, "volume_zscore": 0.3, "sentiment": 0.3})
+    opt_alpha = calculate_alpha_with_weights(out_sample, alpha_weights)
+    in_alpha = calculate_alpha_with_weights(in_sample, alpha_weights)
+    threshold = in_alpha.median()
+    signal = np.where(opt_alpha > threshold, 1, -1)
+    return {"signal": int(signal[-1]), "strategy": "alpha_weights", "error": None}
+
+
+class LivePipeline:
+    """
+    Executors and stage timing for concurrent per-ticker processing.
+
+    Usage:
+        pipeline = LivePipeline(n_tickers=len(TICKERS))
+        bars = await pipeline.io(timings, "bars", fetch_bars, alpaca_client, ...)
+        signal = await pipeline.cpu(timings, "features", compute_live_signal, bars, ...)
+        pipeline.shutdown()
+
+    With inline=True every stage runs synchronously in the calling coroutine
+    (the pre-pipeline behavior), which serializes the basket; useful as a
+    baseline and for debugging.
+    """
+
+    def __init__(self, n_tickers: int = 1, io_workers: Optional[int] = None, cpu_workers: Optional[int] = None, inline: bool = False):
+        """
+        Initialize LivePipeline.
+
+        Args:
+            n_tickers: Basket size, used to size the default pools
+            io_workers: Thread pool size (default: 3 blocking calls per ticker, max 32)
+            cpu_workers: Process pool size (default: one per ticker, capped at CPU count)
+            inline: Run stages in the calling coroutine instead of the pools
+        """
+        self.inline = inline
+        self.io_workers = io_workers or min(32, 3 * n_tickers)
+        self.cpu_workers = cpu_workers or max(1, min(n_tickers, os.cpu_count() or 1))
+        self.io_executor = None if inline else ThreadPoolExecutor(max_workers=self.io_workers, thread_name_prefix="live-io")
+        self.cpu_executor = None if inline else self._start_cpu_pool()
+
+    def _start_cpu_pool(self) -> ProcessPoolExecutor:
+        # Fork the workers now, before the caller starts stream / I/O threads
+        executor = ProcessPoolExecutor(max_workers=self.cpu_workers)
+        executor.submit(int).result()
+        return executor
+
+    async def _timed(self, timings: Dict[str, float], stage: str, executor, fn, *args, **kwargs):
+        start = time.perf_counter()
+        try:
+            if executor is None:
+                return fn(*args, **kwargs)
+            return await asyncio.get_running_loop().run_in_executor(executor, partial(fn, *args, **kwargs))
+        finally:
+            timings[stage] = timings.get(stage, 0.0) + time.perf_counter() - start
+
+    async def io(self, timings: Dict[str, float], stage: str, fn, *args, **kwargs):
+        """Run a blocking I/O call on the thread pool, adding its wall time to timings[stage]."""
+        return await self._timed(timings, stage, self.io_executor, fn, *args, **kwargs)
+
+    async def cpu(self, timings: Dict[str, float], stage: str, fn, *args, **kwargs):
+        """Run a picklable CPU-bound function on the process pool, adding its wall time to timings[stage]."""
+        try:
+            return await self._timed(timings, stage, self.cpu_executor, fn, *args, **kwargs)
+        except BrokenProcessPool:
+            # A dead worker poisons the pool; replace it so the next iteration recovers
+            LOG.error("[PIPELINE] Process pool broken - restarting workers")
+            self.cpu_executor.shutdown(wait=False, cancel_futures=True)
+            self.cpu_executor = self._start_cpu_pool()
+            raise
+
+    async def timed(self, timings: Dict[str, float], stage: str, awaitable):
+        """Await a coroutine, adding its wall time to timings[stage]."""
+        start = time.perf_counter()
+        try:
+            return await awaitable
+        finally:
+            timings[stage] = timings.get(stage, 0.0) + time.perf_counter() - start
+
+    def shutdown(self) -> None:
+        """Stop both pools (pending work is cancelled)."""
+        for executor in (self.io_executor, self.cpu_executor):
+            if executor is not None:
+                executor.shutdown(wait=False, cancel_futures=True)
+
+
+class IterationTimings:
+    """
+    Per-stage wall time for one pass of the minute loop.
+
+    Stage figures are the slowest ticker (the stage's critical path) and the
+    sum across tickers (the work a serial loop would have done).
+
+    Usage:
+        summary = IterationTimings(results, wall_time)
+        LOG.info(summary.format())
+    """
+
+    __slots__ = ("wall", "n_tickers", "max_by_stage", "sum_by_stage")
+
+    def __init__(self, results: List, wall: float):
+        """
+        Initialize IterationTimings.
+
+        Args:
+            results: process_ticker result dicts (exceptions are skipped)
+            wall: Wall time of the whole iteration in seconds
+        """
+        timings = [r.get("timings", {}) for r in results if isinstance(r, dict)]
+        self.wall = wall
+        self.n_tickers = len(timings)
+        self.max_by_stage = {s: max((t.get(s, 0.0) for t in timings), default=0.0) for s in STAGES}
+        self.sum_by_stage = {s: sum(t.get(s, 0.0) for t in timings) for s in STAGES}
+
+    @property
+    def serial_estimate(self) -> float:
+        """Seconds the same work would take with tickers processed one after another."""
+        return sum(self.sum_by_stage.values())
+
+    @property
+    def over_budget(self) -> bool:
+        return self.wall > ITERATION_BUDGET
+
+    def format(self) -> str:
+        stages = " | ".join(f"{s} {self.max_by_stage[s]:.2f}s" for s in STAGES)
+        return (
+            f"[TIMING] {self.n_tickers} tickers in {self.wall:.2f}s "
+            f"(serial est. {self.serial_estimate:.2f}s, budget {ITERATION_BUDGET:.0f}s) | slowest: {stages}"
+        )
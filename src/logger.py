@@ -7,14 +7,131 @@ Provides three verbosity levels:
 - VERBOSE (2): Detailed step-by-step flow
 
 All debug/backend details are redirected to debug_vault.log
+
+Debug-vault writes are non-blocking: records are queued and a background
+thread appends them in batches through one open file handle (flushed after
+every batch, drained at exit). Messages accept %-style args that are only
+formatted when the record is printed or written, and enabled() lets hot loops
+skip building a message at all when nothing would consume it. Set
+MAGELLAN_DEBUG_VAULT=0 (or set_debug_file(False)) to turn the file off.
 """
 
+import atexit
+import multiprocessing.util
 import os
+import queue
 import sys
+import threading
+import time
 from datetime import datetime
 from typing import Optional
 
 
+class DebugVaultWriter:
+    """
+    Background writer that appends queued debug records to the vault file.
+
+    Records are (epoch_seconds, tag, message, args) tuples; timestamps and
+    %-formatting happen on the writer thread, so the caller only pays for a
+    queue put. The thread starts lazily and restarts after a fork.
+    """
+
+    def __init__(self, path: str, batch_size: int = 4096):
+        self.path = path
+        self.batch_size = batch_size
+        self._queue = queue.SimpleQueue()
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        self._closed = False
+        self._stamp_second = None
+        self._stamp = ""
+        if hasattr(os, "register_at_fork"):
+            os.register_at_fork(after_in_child=self._after_fork)
+        multiprocessing.util.register_after_fork(self, DebugVaultWriter._finalize_in_worker)
+
+    def _after_fork(self):
+        """Forked children get a fresh queue; the parent's thread does not exist there."""
+        self._queue = queue.SimpleQueue()
+        self._thread = None
+        self._lock = threading.Lock()
+
+    def _finalize_in_worker(self):
+        """multiprocessing workers leave via os._exit (no atexit) but run their finalizers."""
+        multiprocessing.util.Finalize(self, self.close, exitpriority=0)
+
+    def put(self, record: tuple):
+        """Queue one record (starts the writer thread on first use)."""
+        if self._closed:
+            return
+        if self._thread is None:
+            with self._lock:
+                if self._thread is None:
+                    self._thread = threading.Thread(target=self._run, name="debug-vault-writer", daemon=True)
+                    self._thread.start()
+        self._queue.put(record)
+
+    def _format(self, record: tuple) -> str:
+        created, tag, message, args = record
+        if args:
+            try:
+                message = message % args
+            except Exception:
+                message = f"{message} {args!r}"
+        # Timestamps have 1s resolution: format each second once
+        second = int(created)
+        if second != self._stamp_second:
+            self._stamp_second = second
+            self._stamp = datetime.fromtimestamp(second).strftime("%Y-%m-%d %H:%M:%S")
+        return f"{self._stamp} [{tag}] {message}\n"
+
+    def _run(self):
+        """Drain the queue in batches: one write() and one flush() per batch."""
+        get, get_nowait = self._queue.get, self._queue.get_nowait
+        try:
+            f = open(self.path, "a")
+        except Exception:
+            f = None
+        while True:
+            batch = [get()]
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(get_nowait())
+                except queue.Empty:
+                    break
+
+            # None stops the writer; Events are flush barriers
+            markers = [r for r in batch if not isinstance(r, tuple)]
+            if f is not None:
+                try:
+                    f.write("".join(self._format(r) for r in batch if isinstance(r, tuple)))
+                    f.flush()
+                except Exception:
+                    pass  # Fail silently if debug log fails
+            for marker in markers:
+                if marker is not None:
+                    marker.set()
+            if None in markers:
+                if f is not None:
+                    f.close()
+                return
+
+    def flush(self):
+        """Block until every queued record has been written."""
+        if self._thread is not None and self._thread.is_alive():
+            written = threading.Event()
+            self._queue.put(written)
+            written.wait()
+
+    def close(self):
+        """Write out queued records and stop the writer thread."""
+        if self._closed:
+            return
+        self._closed = True
+        if self._thread is not None and self._thread.is_alive():
+            self._queue.put(None)
+            self._thread.join()
+
+
 class SystemLogger:
     """
     Optimized logging with clear hierarchy and minimal noise.
@@ -31,13 +148,21 @@ class SystemLogger:
     NORMAL = 1  # + Major events (initialization, completion)
     VERBOSE = 2  # + Process flow (what's happening step-by-step)
 
-    def __init__(self, verbosity: int = NORMAL):
+    def __init__(self, verbosity: int = NORMAL, debug_file: Optional[bool] = None):
         self.verbosity = verbosity
         self.debug_file_path = os.path.join(os.getcwd(), "debug_vault.log")
+        if debug_file is None:
+            debug_file = os.environ.get("MAGELLAN_DEBUG_VAULT", "1") != "0"
+        self.debug_to_file = debug_file
 
         # Initialize/Clear debug file
-        with open(self.debug_file_path, "w") as f:
-            f.write(f"=== Magellan Debug Log - {datetime.now().isoformat()} ===\n\n")
+        if self.debug_to_file:
+            with open(self.debug_file_path, "w") as f:
+                f.write(f"=== Magellan Debug Log - {datetime.now().isoformat()} ===\n\n")
+
+        # Batched background writes, drained at interpreter exit
+        self._writer = DebugVaultWriter(self.debug_file_path)
+        atexit.register(self.close)
 
         # Track state changes for edge-triggered logging
         self.last_status = {}
@@ -50,6 +175,27 @@ class SystemLogger:
         elif level == self.VERBOSE:
             self.event("[LOG] Verbose mode enabled (detailed flow)")
 
+    def set_debug_file(self, enabled: bool):
+        """Enable/disable writing to debug_vault.log."""
+        self.debug_to_file = enabled
+
+    def enabled(self, level: int = VERBOSE) -> bool:
+        """
+        True if a message at this terminal level would be printed or written.
+
+        Hot loops can guard per-bar telemetry with
+        `if LOG.enabled(LOG.VERBOSE): ...` to skip building the message.
+        """
+        return self.debug_to_file or self.verbosity >= level
+
+    def flush(self):
+        """Block until queued debug records are on disk."""
+        self._writer.flush()
+
+    def close(self):
+        """Flush and stop the debug writer (registered to run at exit)."""
+        self._writer.close()
+
     def _clean_ascii(self, text: str) -> str:
         """Ensure ASCII-only output."""
         return text.encode("ascii", "ignore").decode("ascii")
@@ -62,82 +208,82 @@ class SystemLogger:
     # TERMINAL OUTPUT (based on verbosity level)
     # =========================================================================
 
-    def critical(self, message: str):
+    def critical(self, message: str, *args):
         """
         ALWAYS shown: Errors, warnings, trade execution.
         Verbosity level: 0+
         """
-        print(self._clean_ascii(message))
-        self._write_debug(f"[CRITICAL] {message}")
+        print(self._clean_ascii(message % args if args else message))
+        self._write_debug("CRITICAL", message, args)
 
-    def event(self, message: str):
+    def event(self, message: str, *args):
         """
         Major milestones: Initialization, ticker completion, reports.
         Verbosity level: 1+ (NORMAL)
         """
         if self.verbosity >= self.NORMAL:
-            print(self._clean_ascii(message))
-        self._write_debug(f"[EVENT] {message}")
+            print(self._clean_ascii(message % args if args else message))
+        self._write_debug("EVENT", message, args)
 
-    def flow(self, message: str):
+    def flow(self, message: str, *args):
         """
         Process flow: Step-by-step progress updates.
         Verbosity level: 2+ (VERBOSE)
         """
         if self.verbosity >= self.VERBOSE:
-            print(self._clean_ascii(message))
-        self._write_debug(f"[FLOW] {message}")
+            print(self._clean_ascii(message % args if args else message))
+        self._write_debug("FLOW", message, args)
 
-    def debug(self, message: str):
+    def debug(self, message: str, *args):
         """
         Backend details: API calls, data transformations, internals.
         NEVER shown in terminal, always written to debug_vault.log
         """
-        self._write_debug(f"[DEBUG] {message}")
+        self._write_debug("DEBUG", message, args)
 
     # =========================================================================
     # BACKWARDS COMPATIBILITY ALIASES (for gradual migration)
     # =========================================================================
 
-    def info(self, message: str):
+    def info(self, message: str, *args):
         """Alias: Maps to flow() for backwards compat."""
-        self.flow(message)
+        self.flow(message, *args)
 
-    def warning(self, message: str):
+    def warning(self, message: str, *args):
         """Alias: Maps to critical()."""
-        self.critical(f"⚠️  {message}")
+        self.critical("⚠️  " + message, *args)
 
-    def error(self, message: str):
+    def error(self, message: str, *args):
         """Alias: Maps to critical()."""
-        self.critical(f"❌ {message}")
+        self.critical("❌ " + message, *args)
 
-    def success(self, message: str):
+    def success(self, message: str, *args):
         """Alias: Maps to event()."""
-        self.event(f"✓ {message}")
+        self.event("✓ " + message, *args)
 
-    def system(self, message: str):
+    def system(self, message: str, *args):
         """Alias: Maps to event()."""
-        self.event(message)
+        self.event(message, *args)
 
-    def stats(self, message: str):
+    def stats(self, message: str, *args):
         """Alias: Maps to critical() (trade stats are important)."""
-        self.critical(message)
+        self.critical(message, *args)
 
-    def config(self, message: str):
+    def config(self, message: str, *args):
         """Alias: Maps to debug() (config details are backend noise)."""
-        self.debug(message)
+        self.debug(message, *args)
 
-    def metric(self, message: str):
+    def metric(self, message: str, *args):
         """Alias: Maps to debug()."""
-        self.debug(message)
+        self.debug(message, *args)
 
-    def ic_matrix(self, message: str):
+    def ic_matrix(self, message: str, *args):
         """Alias: Maps to debug()."""
-        self.debug(message)
+        self.debug(message, *args)
 
-    def ensemble(self, message: str):
+    def ensemble(self, message: str, *args):
         """Alias: Maps to event()."""
-        self.event(message)
+        self.event(message, *args)
 
     def phase_lock(self, message: str):
         """
@@ -200,21 +346,18 @@ class SystemLogger:
             if "Status: BUY" in message or "Status: SELL" in message:
                 self.critical(message)
 
-    def symmetry(self, message: str):
+    def symmetry(self, message: str, *args):
         """Alias: Maps to event()."""
-        self.event(message)
+        self.event(message, *args)
 
     # =========================================================================
     # INTERNAL HELPERS
     # =========================================================================
 
-    def _write_debug(self, message: str):
-        """Write to debug log file."""
-        try:
-            with open(self.debug_file_path, "a") as f:
-                f.write(f"{self._timestamp()} {message}\n")
-        except Exception:
-            pass  # Fail silently if debug log fails
+    def _write_debug(self, tag: str, message: str, args: tuple = ()):
+        """Queue a record for the debug log file (formatted on the writer thread)."""
+        if self.debug_to_file:
+            self._writer.put((time.time(), tag, message, args))
 
 
 # Global instance (backwards compatible)
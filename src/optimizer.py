@@ -3,17 +3,163 @@ Dynamic Weight Optimizer
 Finds optimal alpha factor weights for current market conditions using grid search.
 """
 
+import itertools
+
 import pandas as pd
 import numpy as np
 from typing import Dict, Tuple, List
-from scipy.stats import spearmanr
 
 from src.config_loader import EngineConfig
+from src.features import get_normalized_features
 
 # Retrain interval for weight optimization (trading days) - loaded from config
 RETRAIN_INTERVAL = EngineConfig().get("RETRAIN_INTERVAL", strict=True)
 
 
+# Upper bound on combos x bars scored per block in optimize_alpha_weights (keeps blocks cache-sized)
+MAX_GRID_CELLS = 2**18
+
+
+def generate_weight_grid(n_features: int, weight_step: float = 0.1) -> List[Tuple[float, ...]]:
+    """
+    Generate weight combinations on the simplex (weights sum to 1.0).
+
+    The last weight is 1.0 minus the others; every weight is rounded to 2 decimals
+    and duplicates are removed.
+
+    Args:
+        n_features: Number of features to weight
+        weight_step: Step size for grid search (default: 0.1 = 10% increments)
+
+    Returns:
+        List of weight tuples, one entry per feature
+    """
+    weight_options = np.arange(0.0, 1.0 + weight_step, weight_step)
+    weight_combos = []
+
+    for free_weights in itertools.product(weight_options, repeat=n_features - 1):
+        last_weight = 1.0
+        for w in free_weights:
+            last_weight = last_weight - w
+        if 0.0 <= last_weight <= 1.0:
+            # Round to avoid floating point issues
+            weight_combos.append(tuple(round(w, 2) for w in free_weights) + (round(last_weight, 2),))
+
+    # Remove duplicates
+    return list(set(weight_combos))
+
+
+def weighted_alpha_matrix(feature_matrix: np.ndarray, weight_matrix: np.ndarray) -> np.ndarray:
+    """
+    Calculate alpha scores for many weight combinations at once.
+
+    Equivalent to weight_matrix @ feature_matrix.T, accumulated feature by feature
+    so every row equals the per-combination weighted sum exactly.
+
+    Args:
+        feature_matrix: Normalized features (n_bars, n_features)
+        weight_matrix: Weight combinations (n_combos, n_features)
+
+    Returns:
+        Alpha matrix (n_combos, n_bars), one row per weight combination
+    """
+    alpha_matrix = np.multiply(weight_matrix[:, 0:1], feature_matrix[:, 0])
+    weighted_feature = np.empty_like(alpha_matrix)
+    for i in range(1, feature_matrix.shape[1]):
+        np.multiply(weight_matrix[:, i : i + 1], feature_matrix[:, i], out=weighted_feature)
+        alpha_matrix += weighted_feature
+    return alpha_matrix
+
+
+def row_medians(sorted_matrix: np.ndarray) -> np.ndarray:
+    """Median of every row of an already row-sorted matrix (same value as np.median)."""
+    n = sorted_matrix.shape[1]
+    mid = n // 2
+    if n % 2:
+        return sorted_matrix[:, mid].copy()
+    return (sorted_matrix[:, mid - 1] + sorted_matrix[:, mid]) / 2
+
+
+def average_ranks(matrix: np.ndarray) -> np.ndarray:
+    """
+    Rank every row (1-based, ties get their average rank, as rankdata does).
+
+    Args:
+        matrix: Values (n_rows, n_cols)
+
+    Returns:
+        Float ranks with the same shape as matrix
+    """
+    n = matrix.shape[1]
+    order = np.argsort(matrix, axis=1)
+    sorted_values = np.take_along_axis(matrix, order, axis=1)
+
+    # Tie groups: first and last sorted position of each run of equal values
+    positions = np.arange(n)
+    group_start = np.ones(matrix.shape, dtype=bool)
+    group_start[:, 1:] = sorted_values[:, 1:] != sorted_values[:, :-1]
+    group_end = np.ones(matrix.shape, dtype=bool)
+    group_end[:, :-1] = group_start[:, 1:]
+
+    first = np.maximum.accumulate(np.where(group_start, positions, 0), axis=1)
+    last = np.minimum.accumulate(np.where(group_end, positions, n - 1)[:, ::-1], axis=1)[:, ::-1]
+
+    ranks = np.empty(matrix.shape, dtype=float)
+    np.put_along_axis(ranks, order, (first + last) / 2 + 1, axis=1)
+    return ranks
+
+
+def median_hit_rates(alpha_matrix: np.ndarray, forward_return: np.ndarray) -> np.ndarray:
+    """
+    Hit rate of the median-threshold signal for every alpha row.
+
+    Signal is +1 above the row median, -1 otherwise; a hit is a signal with the
+    same sign as the forward return (zero returns are never hits). Hits are
+    counted with two matrix-vector products instead of a per-combination loop.
+
+    Args:
+        alpha_matrix: Alpha scores (n_combos, n_bars)
+        forward_return: Forward returns (n_bars,)
+
+    Returns:
+        Hit rates (n_combos,)
+    """
+    median_alpha = row_medians(np.sort(alpha_matrix, axis=1))
+    above = alpha_matrix > median_alpha[:, np.newaxis]
+
+    up_moves = (forward_return > 0).astype(float)
+    down_moves = (forward_return < 0).astype(float)
+    hits = above @ up_moves + (~above) @ down_moves
+    return hits / alpha_matrix.shape[1]
+
+
+def rank_ics(alpha_matrix: np.ndarray, forward_return: np.ndarray) -> np.ndarray:
+    """
+    Spearman rank IC of every alpha row against forward returns.
+
+    Rows are ranked together (average ranks for ties, as spearmanr does) and
+    correlated with the forward-return ranks. Constant rows score 0.0.
+
+    Args:
+        alpha_matrix: Alpha scores (n_combos, n_bars)
+        forward_return: Forward returns (n_bars,)
+
+    Returns:
+        Information coefficients (n_combos,)
+    """
+    alpha_ranks = average_ranks(alpha_matrix)
+    alpha_ranks -= alpha_ranks.mean(axis=1, keepdims=True)
+    return_ranks = average_ranks(forward_return[np.newaxis, :])[0]
+    return_ranks -= return_ranks.mean()
+
+    covariance = alpha_ranks @ return_ranks
+    denominator = np.sqrt(np.einsum("ij,ij->i", alpha_ranks, alpha_ranks) * (return_ranks @ return_ranks))
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        ic = covariance / denominator
+    return np.where(denominator > 0, np.clip(ic, -1.0, 1.0), 0.0)
+
+
 def optimize_alpha_weights(
     df: pd.DataFrame,
     feature_cols: List[str] = None,
@@ -26,6 +172,7 @@ def optimize_alpha_weights(
     Find optimal weights for alpha factors using grid search.
 
     Searches weight combinations that sum to 1.0 and maximizes the target metric.
+    All combinations are scored together as rows of one alpha matrix.
 
     Args:
         df: DataFrame with feature and target columns
@@ -44,7 +191,8 @@ def optimize_alpha_weights(
     # Create working copy with forward returns
     working_df = df[feature_cols + [target_col]].copy()
     working_df["forward_return"] = working_df[target_col].shift(-horizon)
-    working_df = working_df.dropna()
+    valid_rows = working_df.notna().all(axis=1)
+    working_df = working_df[valid_rows]
 
     if len(working_df) < 50:
         # print("[OPTIMIZER] Insufficient data for optimization")
@@ -55,57 +203,31 @@ def optimize_alpha_weights(
         }
 
     # P1 REMEDIATION: Rolling normalization (look-back only, no future data)
-    NORM_WINDOW = 252  # ~1 trading day of 1-minute bars
-
-    normalized = {}
-    for col in feature_cols:
-        rolling_min = working_df[col].rolling(window=NORM_WINDOW, min_periods=20).min()
-        rolling_max = working_df[col].rolling(window=NORM_WINDOW, min_periods=20).max()
-        col_range = rolling_max - rolling_min
-        normalized[col] = (working_df[col] - rolling_min) / col_range.replace(0, np.inf)
-        normalized[col] = normalized[col].fillna(0.5)  # Warmup period fallback
-
-    # Generate weight combinations that sum to 1.0
-    weight_options = np.arange(0.0, 1.0 + weight_step, weight_step)
-    weight_combos = []
-
-    for w1 in weight_options:
-        for w2 in weight_options:
-            w3 = 1.0 - w1 - w2
-            if 0.0 <= w3 <= 1.0:
-                # Round to avoid floating point issues
-                w3 = round(w3, 2)
-                weight_combos.append((round(w1, 2), round(w2, 2), w3))
-
-    # Remove duplicates
-    weight_combos = list(set(weight_combos))
-
-    best_metric = -999
-    best_weights = None
-    results_log = []
-
-    for weights in weight_combos:
-        # Calculate weighted alpha score
-        alpha_score = sum(weights[i] * normalized[feature_cols[i]] for i in range(len(feature_cols)))
-
-        # Calculate metric
+    # Reuse the frame's shared normalization stage instead of rerunning rolling windows
+    normalized = get_normalized_features(df, feature_cols)[valid_rows]
+
+    # Stack normalized features once: (n_bars, n_features)
+    feature_matrix = normalized.to_numpy(dtype=float)
+    forward_return = working_df["forward_return"].to_numpy(dtype=float)
+
+    # Generate weight combinations that sum to 1.0: (n_combos, n_features)
+    weight_combos = generate_weight_grid(len(feature_cols), weight_step)
+    weight_matrix = np.array(weight_combos, dtype=float).reshape(len(weight_combos), len(feature_cols))
+
+    # Score every combination in row blocks (bounded memory for long windows)
+    scores = np.empty(len(weight_combos), dtype=float)
+    block_size = max(1, MAX_GRID_CELLS // len(working_df))
+    for start in range(0, len(weight_combos), block_size):
+        alpha_matrix = weighted_alpha_matrix(feature_matrix, weight_matrix[start : start + block_size])
         if metric == "hit_rate":
-            # Signal direction based on median
-            median_alpha = alpha_score.median()
-            signal = np.where(alpha_score > median_alpha, 1, -1)
-            correct = (signal * working_df["forward_return"].values) > 0
-            score = correct.mean()
+            scores[start : start + block_size] = median_hit_rates(alpha_matrix, forward_return)
         else:  # 'ic'
-            # Spearman correlation
-            score, _ = spearmanr(alpha_score, working_df["forward_return"])
-            if pd.isna(score):
-                score = 0.0
-
-        results_log.append({"weights": weights, "score": score})
+            scores[start : start + block_size] = rank_ics(alpha_matrix, forward_return)
 
-        if score > best_metric:
-            best_metric = score
-            best_weights = weights
+    # First combination with the highest score (same tie-break as a strict '>' scan)
+    best_idx = int(np.argmax(scores))
+    best_metric = scores[best_idx]
+    best_weights = weight_combos[best_idx]
 
     # Build result
     optimal_weights = {feature_cols[i]: best_weights[i] for i in range(len(feature_cols))}
@@ -133,15 +255,8 @@ def calculate_alpha_with_weights(df: pd.DataFrame, weights: Dict[str, float]) ->
     feature_cols = list(weights.keys())
 
     # P1 REMEDIATION: Rolling normalization (look-back only, no future data)
-    NORM_WINDOW = 252  # ~1 trading day of 1-minute bars
-
-    normalized = {}
-    for col in feature_cols:
-        rolling_min = df[col].rolling(window=NORM_WINDOW, min_periods=20).min()
-        rolling_max = df[col].rolling(window=NORM_WINDOW, min_periods=20).max()
-        col_range = rolling_max - rolling_min
-        normalized[col] = (df[col] - rolling_min) / col_range.replace(0, np.inf)
-        normalized[col] = normalized[col].fillna(0.5)  # Warmup period fallback
+    # Reuse the frame's shared normalization stage instead of rerunning rolling windows
+    normalized = get_normalized_features(df, feature_cols)
 
     # Calculate weighted sum
     alpha_score = sum(weights[col] * normalized[col] for col in feature_cols)
@@ -0,0 +1,469 @@
+"""
+Order Manager Module
+Event-driven order lifecycle for the live executor.
+
+Orders are submitted once over REST; their fills arrive on the Alpaca
+trade-updates stream. Each submitted order gets an asyncio Future that the
+stream handler resolves when a terminal event (fill, canceled, expired,
+rejected, done_for_day) arrives, so waiting on an order holds no worker thread
+and makes no get_order calls. An order still open at its timeout is canceled
+over REST and resolved by the resulting event; if none arrives (a dropped
+event or a dead stream), one get_order call reconciles it.
+
+The stream runs in its own thread (it owns an event loop, as in
+alpaca_trade_api) and hands events to the manager's loop. Events for an order
+that arrive before submit_order has returned are kept until it is registered.
+stream_alive() reports whether that thread is running and authenticated, so
+callers can fall back to polling when it is not.
+
+- OrderManager: submit() / submit_batch() returning fill outcomes
+- FakeBroker: local stand-in for the REST API and the trade-updates stream
+  that emits scripted fill events (for tests and benchmarks)
+
+Consumers:
+- src.executor.async_execute_trade (when given an order manager)
+- main.live_trading_loop
+"""
+
+import asyncio
+import itertools
+import threading
+import time
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from typing import Dict, List, Optional
+
+from src.logger import LOG
+
+# Trade-update events after which an order can no longer fill
+TERMINAL_EVENTS = {"fill", "canceled", "expired", "rejected", "done_for_day"}
+
+# Buffered events for an unregistered order are dropped after this long
+STALE_EVENT_SECONDS = 60.0
+
+
+def _order_field(order, name: str):
+    """Read a field from an order given as an Entity/object or a raw dict."""
+    return order.get(name) if isinstance(order, dict) else getattr(order, name, None)
+
+
+def _stream_authenticated(stream) -> bool:
+    """Whether a running trade-updates stream has authenticated and subscribed."""
+    trading_ws = getattr(stream, "_trading_ws", None)
+    if trading_ws is not None:
+        # alpaca_trade_api Stream: set after the auth handshake, cleared on disconnect
+        return bool(trading_ws._running)
+    return stream.is_authenticated()
+
+
+class OrderManager:
+    """
+    Resolves order futures from trade-update events.
+
+    Usage:
+        manager = OrderManager(client.api, Stream(...))
+        await manager.start()
+        outcome = await manager.submit("AAPL", 10, "buy", limit_price=190.01)
+        outcomes = await manager.submit_batch([{"symbol": "AAPL", ...}, {"symbol": "MSFT", ...}])
+        manager.stop()
+    """
+
+    def __init__(self, api, stream, cancel_grace: float = 2.0, connect_timeout: float = 5.0):
+        """
+        Initialize OrderManager.
+
+        Args:
+            api: REST client with submit_order / get_order / cancel_order (alpaca_trade_api REST or FakeBroker)
+            stream: Trade-updates source with subscribe_trade_updates(async handler), run(), stop()
+            cancel_grace: Seconds to wait for the cancel (or a late fill) event after a timeout
+            connect_timeout: Seconds start() waits for the stream to authenticate
+        """
+        self.api = api
+        self.stream = stream
+        self.cancel_grace = cancel_grace
+        self.connect_timeout = connect_timeout
+        self.rest_calls = 0
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._pending: Dict[str, asyncio.Future] = {}
+        self._events: Dict[str, List[dict]] = {}
+
+    @classmethod
+    def for_alpaca(cls, api, base_url: str = "https://paper-api.alpaca.markets", **kwargs) -> "OrderManager":
+        """Build a manager on the alpaca_trade_api trade-updates stream (credentials from APCA_* env vars)."""
+        from alpaca_trade_api.common import URL
+        from alpaca_trade_api.stream import Stream
+
+        return cls(api, Stream(base_url=URL(base_url)), **kwargs)
+
+    async def start(self) -> bool:
+        """
+        Subscribe to trade updates and run the stream in a background thread.
+
+        Returns:
+            True once the stream has authenticated; False if the thread died or
+            did not authenticate within connect_timeout (see stream_alive())
+        """
+        if self._thread is not None:
+            return self.stream_alive()
+        self._loop = asyncio.get_running_loop()
+        self.stream.subscribe_trade_updates(self._on_trade_update)
+        self._thread = threading.Thread(target=self.stream.run, name="trade-updates", daemon=True)
+        self._thread.start()
+
+        deadline = self._loop.time() + self.connect_timeout
+        while not self.stream_alive() and self._thread.is_alive() and self._loop.time() < deadline:
+            await asyncio.sleep(0.05)
+        if not self.stream_alive():
+            LOG.error("[ORDERS] Trade-updates stream is not running/authenticated - fills fall back to polling")
+            return False
+        return True
+
+    def stream_alive(self) -> bool:
+        """Whether the trade-updates thread is running and its stream is authenticated."""
+        return self._thread is not None and self._thread.is_alive() and _stream_authenticated(self.stream)
+
+    def stop(self) -> None:
+        """Stop the stream; orders still pending are left unresolved."""
+        if self._thread is None:
+            return
+        self.stream.stop()
+        self._thread.join(timeout=5)
+        self._thread = None
+
+    async def _on_trade_update(self, update) -> None:
+        """Stream handler (runs on the stream's loop): forward the event to the manager's loop."""
+        order = update.order
+        event = {
+            "event": update.event,
+            "order_id": str(_order_field(order, "id")),
+            "status": _order_field(order, "status"),
+            "filled_qty": _order_field(order, "filled_qty"),
+            "filled_avg_price": _order_field(order, "filled_avg_price"),
+            "filled_at": _order_field(order, "filled_at"),
+            "received_at": time.time(),
+        }
+        self._loop.call_soon_threadsafe(self._dispatch, event)
+
+    def _dispatch(self, event: dict) -> None:
+        order_id = event["order_id"]
+        # Drop events of orders this manager never registered (submitted elsewhere on the account)
+        stale = [
+            oid for oid, events in self._events.items()
+            if oid not in self._pending and event["received_at"] - events[-1]["received_at"] > STALE_EVENT_SECONDS
+        ]
+        for oid in stale:
+            del self._events[oid]
+        self._events.setdefault(order_id, []).append(event)
+        future = self._pending.get(order_id)
+        if future is not None and event["event"] in TERMINAL_EVENTS and not future.done():
+            future.set_result(event)
+
+    def _register(self, order_id: str) -> asyncio.Future:
+        future = self._loop.create_future()
+        self._pending[order_id] = future
+        # Events that raced ahead of submit_order's response
+        for event in self._events.get(order_id, []):
+            if event["event"] in TERMINAL_EVENTS:
+                future.set_result(event)
+                break
+        return future
+
+    async def _reconcile(self, order_id: str) -> Optional[dict]:
+        """Read the order once over REST when no terminal event arrived (dropped event or dead stream)."""
+        try:
+            self.rest_calls += 1
+            order = await asyncio.to_thread(self.api.get_order, order_id)
+        except Exception as e:
+            LOG.error(f"[ORDERS] Failed to reconcile {order_id}: {e}")
+            return None
+        status = _order_field(order, "status")
+        LOG.warning(f"[ORDERS] No terminal event for {order_id} - REST status is {status}")
+        return {
+            "event": "fill" if status == "filled" else status,
+            "order_id": order_id,
+            "status": status,
+            "filled_qty": _order_field(order, "filled_qty"),
+            "filled_avg_price": _order_field(order, "filled_avg_price"),
+            "filled_at": _order_field(order, "filled_at"),
+            "received_at": time.time(),
+            "reconciled": True,
+        }
+
+    async def submit(
+        self,
+        symbol: str,
+        qty: int,
+        side: str,
+        limit_price: Optional[float] = None,
+        type: str = "limit",
+        time_in_force: str = "day",
+        timeout: float = 10.0,
+    ) -> Dict:
+        """
+        Submit an order and wait for its terminal trade update.
+
+        Args:
+            symbol: Trading symbol
+            qty: Order quantity
+            side: 'buy' or 'sell'
+            limit_price: Limit price (limit orders)
+            type: Order type (default 'limit')
+            time_in_force: Time in force (default 'day')
+            timeout: Seconds to wait for a fill before canceling
+
+        Returns:
+            Dict with order_id, status ('filled', 'canceled', 'expired', 'rejected',
+            'done_for_day' or 'timeout'), filled_qty, filled_avg_price, filled_at,
+            timed_out, reconciled (status read via get_order), latency (seconds
+            from submit to resolution) and events
+        """
+        if self._loop is None:
+            await self.start()
+
+        started = time.time()
+        self.rest_calls += 1
+        order = await asyncio.to_thread(
+            self.api.submit_order,
+            symbol=symbol,
+            qty=qty,
+            side=side,
+            type=type,
+            time_in_force=time_in_force,
+            limit_price=limit_price,
+        )
+        order_id = str(order.id)
+        future = self._register(order_id)
+
+        timed_out = False
+        try:
+            event = await asyncio.wait_for(asyncio.shield(future), timeout)
+        except asyncio.TimeoutError:
+            timed_out = True
+            LOG.warning(f"[ORDERS] {symbol} order {order_id} not filled in {timeout:.0f}s - cancelling")
+            try:
+                self.rest_calls += 1
+                await asyncio.to_thread(self.api.cancel_order, order_id)
+            except Exception as e:
+                LOG.error(f"[ORDERS] Failed to cancel {order_id}: {e}")
+            try:
+                event = await asyncio.wait_for(asyncio.shield(future), self.cancel_grace)
+            except asyncio.TimeoutError:
+                event = await self._reconcile(order_id)
+        finally:
+            self._pending.pop(order_id, None)
+
+        # A fill can still land between the timeout and the cancel
+        if event is None or event["event"] not in TERMINAL_EVENTS:
+            status = "timeout"  # Still open at the broker (or unknown) after the cancel
+        else:
+            status = "filled" if event["event"] == "fill" else event["event"]
+        return {
+            "order_id": order_id,
+            "symbol": symbol,
+            "side": side,
+            "qty": qty,
+            "limit_price": limit_price,
+            "submitted_status": order.status,
+            "status": status,
+            "filled_qty": None if event is None else event["filled_qty"],
+            "filled_avg_price": None if event is None else event["filled_avg_price"],
+            "filled_at": None if event is None else event["filled_at"],
+            "timed_out": timed_out,
+            "reconciled": event is not None and event.get("reconciled", False),
+            "latency": time.time() - started,
+            "events": [e["event"] for e in self._events.pop(order_id, [])],
+        }
+
+    async def submit_batch(self, orders: List[Dict], timeout: float = 10.0) -> List[Dict]:
+        """
+        Submit a basket of orders together and wait for all of them.
+
+        Args:
+            orders: Dicts of submit() keyword arguments (symbol, qty, side, limit_price, ...)
+            timeout: Per-order fill timeout
+
+        Returns:
+            Outcomes in order; a failed submission is {'symbol', 'status': 'error', 'error'}
+        """
+        results = await asyncio.gather(
+            *(self.submit(**{"timeout": timeout, **order}) for order in orders), return_exceptions=True
+        )
+        return [
+            {"symbol": order["symbol"], "status": "error", "error": str(result)} if isinstance(result, Exception) else result
+            for order, result in zip(orders, results)
+        ]
+
+
+class FakeBroker:
+    """
+    Local stand-in for the Alpaca REST API and trade-updates stream.
+
+    Every submitted order is accepted ('new' event), then follows its symbol's
+    script: a list of (delay_seconds, event, qty, price) steps, where qty/price
+    None mean the full order at its limit price. Unscripted symbols fill in full
+    after `latency`. An empty script leaves the order open until it is canceled.
+    Events listed in `dropped` for a symbol update the order but are never
+    delivered on the stream.
+
+    Usage:
+        broker = FakeBroker(latency=0.05, script={"TSLA": [(0.1, "partial_fill", 5, None), (0.3, "fill", None, None)]})
+        manager = OrderManager(broker, broker)
+    """
+
+    def __init__(
+        self,
+        latency: float = 0.05,
+        script: Optional[Dict[str, list]] = None,
+        quotes: Optional[Dict[str, tuple]] = None,
+        equity: float = 100000.0,
+        dropped: Optional[Dict[str, set]] = None,
+    ):
+        """
+        Initialize FakeBroker.
+
+        Args:
+            latency: Default seconds from submission to fill
+            script: Dict of symbol -> list of (delay_seconds, event, qty, price) steps
+            quotes: Dict of symbol -> (bid, ask) for get_latest_quote
+            equity: Account equity (buying power is 4x, cash equals equity)
+            dropped: Dict of symbol -> events applied to the order but not delivered
+        """
+        self.latency = latency
+        self.script = script or {}
+        self.quotes = quotes or {}
+        self.equity = equity
+        self.dropped = dropped or {}
+        self.orders: Dict[str, dict] = {}
+        self.positions: Dict[str, int] = {}
+        self.calls: Dict[str, int] = {}
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+        self._handler = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._queued: List[str] = []
+        self._stopped: Optional[asyncio.Event] = None
+        self._ready = threading.Event()
+
+    def _count(self, name: str) -> None:
+        self.calls[name] = self.calls.get(name, 0) + 1
+
+    # ----- REST surface -----
+
+    def submit_order(self, symbol, qty=None, side="buy", type="market", time_in_force="day", limit_price=None, **kwargs):
+        self._count("submit_order")
+        with self._lock:
+            order_id = f"fake-{next(self._ids):06d}"
+            order = {
+                "id": order_id,
+                "symbol": symbol,
+                "qty": str(qty),
+                "side": side,
+                "type": type,
+                "limit_price": None if limit_price is None else str(limit_price),
+                "status": "accepted",
+                "filled_qty": "0",
+                "filled_avg_price": None,
+                "filled_at": None,
+            }
+            self.orders[order_id] = order
+            if self._loop is None:
+                self._queued.append(order_id)
+            else:
+                self._loop.call_soon_threadsafe(self._schedule, order_id)
+        return SimpleNamespace(**order)
+
+    def get_order(self, order_id):
+        self._count("get_order")
+        with self._lock:
+            return SimpleNamespace(**self.orders[order_id])
+
+    def cancel_order(self, order_id):
+        self._count("cancel_order")
+        with self._lock:
+            if self.orders[order_id]["status"] in ("filled", "canceled", "expired", "rejected"):
+                raise ValueError(f"order {order_id} is already {self.orders[order_id]['status']}")
+        self._loop.call_soon_threadsafe(self._emit, order_id, "canceled", None, None)
+
+    def get_position(self, symbol):
+        self._count("get_position")
+        if not self.positions.get(symbol):
+            raise ValueError(f"position does not exist: {symbol}")
+        return SimpleNamespace(symbol=symbol, qty=str(self.positions[symbol]))
+
+    def list_positions(self):
+        return [SimpleNamespace(symbol=s, qty=str(q)) for s, q in self.positions.items() if q]
+
+    def get_account(self):
+        self._count("get_account")
+        return SimpleNamespace(
+            equity=str(self.equity), buying_power=str(self.equity * 4), cash=str(self.equity),
+            status="ACTIVE", pattern_day_trader=False, daytrade_count=0,
+        )
+
+    def get_latest_quote(self, symbol):
+        bid, ask = self.quotes.get(symbol, (100.0, 100.02))
+        return SimpleNamespace(bid_price=bid, ask_price=ask, bid_size=100, ask_size=100)
+
+    # ----- Trade-updates stream surface -----
+
+    def subscribe_trade_updates(self, handler) -> None:
+        self._handler = handler
+
+    def run(self) -> None:
+        """Dispatch scripted trade updates until stop() is called."""
+        asyncio.run(self._run_forever())
+
+    async def _run_forever(self) -> None:
+        self._stopped = asyncio.Event()
+        with self._lock:
+            self._loop = asyncio.get_running_loop()
+            queued, self._queued = self._queued, []
+        for order_id in queued:
+            self._schedule(order_id)
+        self._ready.set()
+        await self._stopped.wait()
+        with self._lock:
+            # Orders submitted between runs are queued for the next one
+            self._loop = None
+            self._ready.clear()
+
+    def stop(self) -> None:
+        if self._loop is not None and self._stopped is not None:
+            self._loop.call_soon_threadsafe(self._stopped.set)
+
+    def wait_ready(self, timeout: float = 5.0) -> bool:
+        """Block until run() is dispatching events."""
+        return self._ready.wait(timeout)
+
+    def is_authenticated(self) -> bool:
+        return self._ready.is_set()
+
+    def _schedule(self, order_id: str) -> None:
+        symbol = self.orders[order_id]["symbol"]
+        self._emit(order_id, "new", None, None)
+        for delay, event, qty, price in self.script.get(symbol, [(self.latency, "fill", None, None)]):
+            self._loop.call_later(delay, self._emit, order_id, event, qty, price)
+
+    def _emit(self, order_id: str, event: str, qty, price) -> None:
+        with self._lock:
+            order = self.orders[order_id]
+            if order["status"] in ("filled", "canceled", "expired", "rejected"):
+                return  # No events after a terminal one
+            if event in ("fill", "partial_fill"):
+                fill_qty = float(order["qty"]) if qty is None else float(qty)
+                fill_price = float(order["limit_price"] or 0.0) if price is None else float(price)
+                order["filled_qty"] = str(int(fill_qty))
+                order["filled_avg_price"] = str(fill_price)
+                order["filled_at"] = datetime.now(timezone.utc).isoformat()
+                order["status"] = "filled" if event == "fill" else "partially_filled"
+                if event == "fill":
+                    signed = int(fill_qty) if order["side"] == "buy" else -int(fill_qty)
+                    self.positions[order["symbol"]] = self.positions.get(order["symbol"], 0) + signed
+            elif event != "new":
+                order["status"] = event
+            update = SimpleNamespace(event=event, order=dict(order), timestamp=datetime.now(timezone.utc))
+            if event in self.dropped.get(order["symbol"], ()):
+                return
+        if self._handler is not None:
+            asyncio.ensure_future(self._handler(update))
@@ -5,105 +5,107 @@ Simulates portfolio performance using trading signals as if using real capital.
 
 import pandas as pd
 import numpy as np
-from typing import Dict
+from typing import Dict, List
 
 
-def simulate_portfolio(
-    df: pd.DataFrame, initial_capital: float = 100000.0, friction_bps: float = 0.0, max_position_dollars: float = None
-) -> Dict:
+def equity_kernel(
+    net_returns: np.ndarray, initial_capital: float = 100000.0, max_position_dollars: float = None
+) -> np.ndarray:
     """
-    Simulate portfolio performance using signal column to buy/sell SPY.
+    Compound net log returns into equity with an optional position cap.
 
-    Process:
-    1. Use signal column (-1, 0, +1) to determine position direction
-    2. Calculate position-adjusted returns (signal * log_return)
-    3. Apply friction (transaction costs) on every executed trade
-    4. Cap position size to max_position_dollars if specified
-    5. Track cumulative equity starting from initial_capital
-    6. Compute performance metrics: returns, drawdown, Sharpe ratio
+    Per bar: position = min(equity, max_position_dollars), then
+    equity += position * (exp(net_return) - 1). The recurrence is evaluated in
+    the same order as the original per-row loop, so results are bit-identical.
 
     Args:
-        df: DataFrame with 'close', 'signal', and 'log_return' columns
+        net_returns: Net log returns, shape (n_bars,) or (n_bars, n_variants)
         initial_capital: Starting portfolio value in dollars
-        friction_bps: Transaction cost in basis points (e.g., 1.5 for 1.5 bps)
         max_position_dollars: Maximum dollar amount for any single position (None = no cap)
 
     Returns:
-        Dict with performance metrics and equity curve
+        Equity array with the same shape as net_returns
     """
-    # Create working copy
-    working_df = df[["close", "signal", "log_return"]].copy()
-    working_df = working_df.dropna()
+    net_returns = np.asarray(net_returns, dtype=float)
+    is_vector = net_returns.ndim == 1
+    if is_vector:
+        net_returns = net_returns[:, np.newaxis]
+
+    # net_return is in log-return space, convert to simple return once for all bars
+    simple_returns = np.exp(net_returns) - 1
+    n_bars, n_variants = simple_returns.shape
+    equity = np.empty((n_bars, n_variants), dtype=float)
+
+    if n_variants == 1:
+        # Single variant: scalar recurrence over plain floats
+        equity_values = []
+        current_equity = float(initial_capital)
+        for simple_return in simple_returns[:, 0].tolist():
+            if max_position_dollars is not None:
+                position_size = min(current_equity, max_position_dollars)
+            else:
+                position_size = current_equity
+            current_equity = current_equity + position_size * simple_return
+            equity_values.append(current_equity)
+        equity[:, 0] = equity_values
+    else:
+        # Many variants: step through time, update every variant at once
+        current_equity = np.full(n_variants, float(initial_capital))
+        for t in range(n_bars):
+            if max_position_dollars is not None:
+                position_size = np.minimum(current_equity, max_position_dollars)
+            else:
+                position_size = current_equity
+            current_equity = current_equity + position_size * simple_returns[t]
+            equity[t] = current_equity
 
-    if len(working_df) == 0:
-        return {
-            "initial_capital": initial_capital,
-            "final_equity": initial_capital,
-            "total_return_dollars": 0.0,
-            "total_return_pct": 0.0,
-            "max_drawdown_pct": 0.0,
-            "sharpe_ratio": 0.0,
-            "num_trades": 0,
-            "equity_curve": pd.Series(dtype=float),
-        }
+    return equity[:, 0] if is_vector else equity
 
-    # Convert friction from bps to decimal (e.g., 1.5 bps = 0.00015)
-    friction_decimal = friction_bps / 10000.0
 
+def _net_returns(signals: np.ndarray, log_return: np.ndarray, friction_decimal: float):
+    """
+    Shift signals for execution and compute friction-adjusted net returns.
+
+    Args:
+        signals: Signal matrix (n_bars, n_variants) with values -1, 0, +1
+        log_return: Log returns (n_bars,)
+        friction_decimal: Friction per executed trade (decimal, not bps)
+
+    Returns:
+        Tuple of (net_returns, signal_change) matrices
+    """
     # P0 REMEDIATION: Shift signal by 1 bar for realistic execution timing
     # Signal generated at bar t can only be executed at bar t+1
-    working_df["signal_execution"] = working_df["signal"].shift(1).fillna(0)
+    signal_execution = np.zeros(signals.shape, dtype=float)
+    signal_execution[1:] = signals[:-1]
 
     # Detect trade executions (signal changes) - using SHIFTED signal
-    working_df["signal_change"] = working_df["signal_execution"].diff().fillna(0) != 0
+    signal_change = np.zeros(signals.shape, dtype=bool)
+    signal_change[1:] = np.diff(signal_execution, axis=0) != 0
 
-    # Calculate position-adjusted returns
     # P0 FIX: Signal[t-1] is applied to return[t] (no instantaneous fill)
-    # When signal_execution = 1 (long), we earn +log_return
-    # When signal_execution = -1 (short), we earn -log_return
-    # When signal_execution = 0 (neutral), we earn 0
-    working_df["position_return"] = working_df["signal_execution"] * working_df["log_return"]
+    position_return = signal_execution * log_return[:, np.newaxis]
 
     # Apply friction: subtract friction_decimal from return on every executed trade
-    # Friction applies when signal changes (new trade execution)
-    working_df["friction_cost"] = working_df["signal_change"] * friction_decimal
-    working_df["net_return"] = working_df["position_return"] - working_df["friction_cost"]
-
-    # Calculate equity bar-by-bar with position cap
-    equity_series = []
-    current_equity = initial_capital
-
-    for idx, row in working_df.iterrows():
-        # Determine position size
-        if max_position_dollars is not None:
-            # Cap the position to max_position_dollars
-            position_size = min(current_equity, max_position_dollars)
-        else:
-            # Use full equity
-            position_size = current_equity
-
-        # Calculate dollar return on this bar
-        # net_return is already in log-return space, convert to simple return
-        simple_return = np.exp(row["net_return"]) - 1
-        dollar_return = position_size * simple_return
-
-        # Update equity
-        current_equity = current_equity + dollar_return
-        equity_series.append(current_equity)
-
-    # Create equity curve
-    equity_curve = pd.Series(equity_series, index=working_df.index)
-
-    # Calculate metrics
+    friction_cost = signal_change * friction_decimal
+    return position_return - friction_cost, signal_change
+
+
+def _portfolio_metrics(
+    equity: np.ndarray, net_return: np.ndarray, signal_change: np.ndarray, index: pd.Index, initial_capital: float
+) -> Dict:
+    """Build the simulate_portfolio() result dict for a single variant."""
+    equity_curve = pd.Series(equity, index=index)
+
     final_equity = equity_curve.iloc[-1]
     total_return_dollars = final_equity - initial_capital
     total_return_pct = (total_return_dollars / initial_capital) * 100
 
     max_drawdown_pct = calculate_max_drawdown(equity_curve)
-    sharpe_ratio = calculate_sharpe_ratio(working_df["net_return"])
+    sharpe_ratio = calculate_sharpe_ratio(pd.Series(net_return, index=index))
 
     # Count trades (signal changes)
-    num_trades = working_df["signal_change"].sum()
+    num_trades = signal_change.sum()
 
     return {
         "initial_capital": initial_capital,
@@ -117,6 +119,112 @@ def simulate_portfolio(
     }
 
 
+def _empty_metrics(initial_capital: float) -> Dict:
+    """Result dict for a simulation with no valid bars."""
+    return {
+        "initial_capital": initial_capital,
+        "final_equity": initial_capital,
+        "total_return_dollars": 0.0,
+        "total_return_pct": 0.0,
+        "max_drawdown_pct": 0.0,
+        "sharpe_ratio": 0.0,
+        "num_trades": 0,
+        "equity_curve": pd.Series(dtype=float),
+    }
+
+
+def simulate_portfolio(
+    df: pd.DataFrame, initial_capital: float = 100000.0, friction_bps: float = 0.0, max_position_dollars: float = None
+) -> Dict:
+    """
+    Simulate portfolio performance using signal column to buy/sell SPY.
+
+    Process:
+    1. Use signal column (-1, 0, +1) to determine position direction
+    2. Calculate position-adjusted returns (signal * log_return)
+    3. Apply friction (transaction costs) on every executed trade
+    4. Cap position size to max_position_dollars if specified
+    5. Track cumulative equity starting from initial_capital
+    6. Compute performance metrics: returns, drawdown, Sharpe ratio
+
+    Args:
+        df: DataFrame with 'close', 'signal', and 'log_return' columns
+        initial_capital: Starting portfolio value in dollars
+        friction_bps: Transaction cost in basis points (e.g., 1.5 for 1.5 bps)
+        max_position_dollars: Maximum dollar amount for any single position (None = no cap)
+
+    Returns:
+        Dict with performance metrics and equity curve
+    """
+    # Create working copy
+    working_df = df[["close", "signal", "log_return"]].copy()
+    working_df = working_df.dropna()
+
+    if len(working_df) == 0:
+        return _empty_metrics(initial_capital)
+
+    return simulate_signal_matrix(
+        working_df,
+        working_df["signal"].to_numpy(dtype=float)[:, np.newaxis],
+        initial_capital=initial_capital,
+        friction_bps=friction_bps,
+        max_position_dollars=max_position_dollars,
+    )[0]
+
+
+def simulate_signal_matrix(
+    df: pd.DataFrame,
+    signals: np.ndarray,
+    initial_capital: float = 100000.0,
+    friction_bps: float = 0.0,
+    max_position_dollars: float = None,
+) -> List[Dict]:
+    """
+    Simulate many signal variants over the same bars in one call.
+
+    Each column of signals is treated exactly like the 'signal' column of
+    simulate_portfolio(): shifted one bar for execution, charged friction on every
+    change, and compounded with the same position cap.
+
+    Args:
+        df: DataFrame with 'close' and 'log_return' columns
+        signals: Signal matrix (len(df), n_variants) or vector (len(df),)
+        initial_capital: Starting portfolio value in dollars
+        friction_bps: Transaction cost in basis points (e.g., 1.5 for 1.5 bps)
+        max_position_dollars: Maximum dollar amount for any single position (None = no cap)
+
+    Returns:
+        List of simulate_portfolio()-style dicts, one per signal column.
+        Rows missing close/log_return or any signal are dropped for every variant.
+    """
+    signals = np.asarray(signals, dtype=float)
+    if signals.ndim == 1:
+        signals = signals[:, np.newaxis]
+    if len(signals) != len(df):
+        raise ValueError(f"signals has {len(signals)} rows but df has {len(df)}")
+
+    valid = df[["close", "log_return"]].notna().all(axis=1).to_numpy() & ~np.isnan(signals).any(axis=1)
+    signals = signals[valid]
+    n_variants = signals.shape[1]
+
+    if len(signals) == 0:
+        return [_empty_metrics(initial_capital) for _ in range(n_variants)]
+
+    index = df.index[valid]
+    log_return = df["log_return"].to_numpy(dtype=float)[valid]
+
+    # Convert friction from bps to decimal (e.g., 1.5 bps = 0.00015)
+    friction_decimal = friction_bps / 10000.0
+
+    net_returns, signal_change = _net_returns(signals, log_return, friction_decimal)
+    equity = equity_kernel(net_returns, initial_capital=initial_capital, max_position_dollars=max_position_dollars)
+
+    return [
+        _portfolio_metrics(equity[:, k], net_returns[:, k], signal_change[:, k], index, initial_capital)
+        for k in range(n_variants)
+    ]
+
+
 def calculate_max_drawdown(equity_curve: pd.Series) -> float:
     """
     Calculate maximum drawdown as peak-to-trough decline.
@@ -0,0 +1,380 @@
+"""
+Bulk Prefetch Engine
+Warms the partitioned bar store for a whole universe concurrently.
+
+All symbol/timeframe/date gaps are planned up front against the store's coverage
+manifest and split into month-sized tasks (one per partition). Tasks run on a thread
+pool over one pooled HTTP session per provider; every request first takes a token
+from that provider's token bucket, so the pool runs at the provider's rate limit
+instead of sleeping a fixed second per dataset. 429 responses are retried with
+backoff. Results go through PartitionedBarStore.write (atomic partition replace).
+
+Providers:
+- alpaca: https://data.alpaca.markets/v2/stocks/{symbol}/bars (paginated)
+- fmp:    https://financialmodelingprep.com/stable historical-chart / historical-price-eod
+
+Base URLs are constructor arguments, so the engine can run against a local HTTP stub.
+"""
+
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import date, timedelta
+from typing import Dict, List, Tuple
+
+import pandas as pd
+import requests
+from requests.adapters import HTTPAdapter
+
+from src.data_cache import PartitionedBarStore, resample_bars
+
+# Requests per minute and burst size per provider (Alpaca Basic data plan, FMP Starter)
+PROVIDER_LIMITS = {
+    "alpaca": {"per_minute": 200, "burst": 10},
+    "fmp": {"per_minute": 300, "burst": 10},
+}
+
+# Asset type -> provider that serves its bars
+ASSET_PROVIDERS = {"equities": "alpaca", "futures": "fmp"}
+
+# Cache timeframe -> Alpaca bar timeframe (same bars DataCache.get_or_fetch_equity requests)
+ALPACA_TIMEFRAMES = {"1min": "1Min", "1hour": "1Hour", "1day": "1Day"}
+
+BAR_COLUMNS = {"o": "open", "h": "high", "l": "low", "c": "close", "v": "volume", "n": "trade_count", "vw": "vwap"}
+
+MAX_RETRIES = 4
+
+
+class TokenBucket:
+    """
+    Thread-safe token-bucket rate limiter.
+
+    Tokens refill continuously at `rate` per second up to `capacity`. acquire()
+    reserves a token immediately (the balance may go negative) and sleeps until
+    the reservation is due, so concurrent callers are served in arrival order.
+
+    Usage:
+        bucket = TokenBucket(rate=200 / 60, capacity=10)
+        bucket.acquire()  # blocks while over budget
+    """
+
+    def __init__(self, rate: float, capacity: float = 1.0, clock=time.monotonic, sleep=time.sleep):
+        """
+        Initialize TokenBucket (starts full).
+
+        Args:
+            rate: Tokens added per second
+            capacity: Maximum burst size
+            clock: Monotonic clock (injectable for tests)
+            sleep: Sleep function (injectable for tests)
+        """
+        self.rate = rate
+        self.capacity = capacity
+        self._clock = clock
+        self._sleep = sleep
+        self._tokens = capacity
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    def acquire(self, tokens: float = 1.0) -> float:
+        """
+        Take tokens, waiting until they are available.
+
+        Returns:
+            Seconds waited
+        """
+        with self._lock:
+            now = self._clock()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= tokens
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+
+        if wait > 0:
+            self._sleep(wait)
+        return wait
+
+
+def month_chunks(start: date, end: date) -> List[Tuple[date, date]]:
+    """
+    Split an inclusive date range at calendar-month boundaries.
+
+    Args:
+        start: First date
+        end: Last date (inclusive)
+
+    Returns:
+        List of (start, end) ranges, one per month touched
+    """
+    chunks = []
+    cursor = start
+    while cursor <= end:
+        next_month = (cursor.replace(day=1) + timedelta(days=32)).replace(day=1)
+        chunk_end = min(end, next_month - timedelta(days=1))
+        chunks.append((cursor, chunk_end))
+        cursor = next_month
+    return chunks
+
+
+def _pooled_session(pool_size: int) -> requests.Session:
+    """Session whose connection pool can hold one connection per worker."""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+class PrefetchEngine:
+    """
+    Plans and runs concurrent bar prefetches into a PartitionedBarStore.
+
+    Usage:
+        engine = PrefetchEngine(workers=16)
+        jobs = [("equities", symbol, "1min", "2024-11-01", "2025-01-17") for symbol in universe]
+        report = engine.run(jobs)
+        report["bars"], report["errors"]
+    """
+
+    def __init__(
+        self,
+        store: PartitionedBarStore = None,
+        workers: int = 16,
+        limits: Dict = None,
+        alpaca_data_url: str = None,
+        fmp_url: str = None,
+        feed: str = "sip",
+    ):
+        """
+        Initialize PrefetchEngine.
+
+        Args:
+            store: Target bar store (default: the DataCache store under data/cache/bars)
+            workers: Concurrent fetch threads (default: 16)
+            limits: Per-provider overrides of PROVIDER_LIMITS
+            alpaca_data_url: Alpaca market data base URL (default: APCA_DATA_URL or data.alpaca.markets)
+            fmp_url: FMP stable API base URL (default: financialmodelingprep.com/stable)
+            feed: Alpaca data feed (default: 'sip')
+        """
+        self.store = store or PartitionedBarStore("data/cache/bars")
+        self.workers = workers
+        self.feed = feed
+        self.alpaca_data_url = (
+            alpaca_data_url or os.getenv("APCA_DATA_URL", "https://data.alpaca.markets")
+        ).rstrip("/")
+        self.fmp_url = (fmp_url or "https://financialmodelingprep.com/stable").rstrip("/")
+
+        limits = limits or {}
+        limits = {provider: {**default, **limits.get(provider, {})} for provider, default in PROVIDER_LIMITS.items()}
+        self.buckets = {
+            provider: TokenBucket(rate=limit["per_minute"] / 60.0, capacity=limit["burst"])
+            for provider, limit in limits.items()
+        }
+        self.sessions = {provider: _pooled_session(workers) for provider in PROVIDER_LIMITS}
+        self.sessions["alpaca"].headers.update(
+            {
+                "APCA-API-KEY-ID": os.getenv("APCA_API_KEY_ID", ""),
+                "APCA-API-SECRET-KEY": os.getenv("APCA_API_SECRET_KEY", ""),
+            }
+        )
+        self.fmp_api_key = os.getenv("FMP_API_KEY", "")
+
+        # One writer at a time per symbol/timeframe (partitions and coverage manifest)
+        self._write_locks = {}
+        self._write_locks_guard = threading.Lock()
+
+        self.requests_made = {provider: 0 for provider in PROVIDER_LIMITS}
+        self._stats_lock = threading.Lock()
+
+    def _get(self, provider: str, url: str, params: Dict) -> object:
+        """Rate-limited GET returning parsed JSON (429/5xx are retried with backoff)."""
+        session = self.sessions[provider]
+        for attempt in range(MAX_RETRIES + 1):
+            self.buckets[provider].acquire()
+            with self._stats_lock:
+                self.requests_made[provider] += 1
+            response = session.get(url, params=params, timeout=30)
+            if response.status_code == 429 or response.status_code >= 500:
+                if attempt == MAX_RETRIES:
+                    response.raise_for_status()
+                retry_after = response.headers.get("Retry-After")
+                time.sleep(float(retry_after) if retry_after else 0.5 * 2**attempt)
+                continue
+            response.raise_for_status()
+            return response.json()
+
+    def fetch_alpaca_bars(self, symbol: str, timeframe: str, start: str, end: str) -> pd.DataFrame:
+        """
+        Fetch equity bars for [start, end] from Alpaca (all pages).
+
+        Bars are requested in the target timeframe and normalized with
+        resample_bars, exactly like DataCache.get_or_fetch_equity, so both paths
+        write the same bars (Alpaca's daily bars follow the New York session, so
+        after-hours minutes past midnight UTC stay on their trading day).
+
+        Returns:
+            DataFrame indexed by timezone-naive UTC timestamp
+        """
+        if timeframe not in ALPACA_TIMEFRAMES:
+            raise ValueError(f"Unsupported timeframe: {timeframe}")
+
+        url = f"{self.alpaca_data_url}/v2/stocks/{symbol}/bars"
+        params = {
+            "timeframe": ALPACA_TIMEFRAMES[timeframe],
+            "start": start,
+            "end": end,
+            "limit": 10000,
+            "feed": self.feed,
+            "adjustment": "raw",
+        }
+
+        rows = []
+        while True:
+            payload = self._get("alpaca", url, params)
+            rows.extend(payload.get("bars") or [])
+            page_token = payload.get("next_page_token")
+            if not page_token:
+                break
+            params = {**params, "page_token": page_token}
+
+        if not rows:
+            return pd.DataFrame(columns=list(BAR_COLUMNS.values()))
+
+        df = pd.DataFrame(rows).rename(columns=BAR_COLUMNS)
+        timestamps = pd.to_datetime(df.pop("t"), utc=True).dt.tz_localize(None)
+        df.index = pd.DatetimeIndex(timestamps, name="timestamp")
+        return resample_bars(df[[col for col in BAR_COLUMNS.values() if col in df.columns]], timeframe)
+
+    def fetch_fmp_bars(self, symbol: str, timeframe: str, start: str, end: str) -> pd.DataFrame:
+        """
+        Fetch futures/commodity bars for [start, end] from FMP.
+
+        Returns:
+            DataFrame indexed by timestamp with OHLCV columns
+        """
+        if timeframe == "1hour":
+            url = f"{self.fmp_url}/historical-chart/1hour"
+        elif timeframe == "1day":
+            url = f"{self.fmp_url}/historical-price-eod/full"
+        else:
+            raise ValueError(f"Unsupported timeframe: {timeframe}")
+
+        data = self._get("fmp", url, {"symbol": symbol, "from": start, "to": end, "apikey": self.fmp_api_key})
+        if not data:
+            return pd.DataFrame(columns=["open", "high", "low", "close", "volume"])
+
+        df = pd.DataFrame(data)
+        df.index = pd.DatetimeIndex(pd.to_datetime(df.pop("date")), name="timestamp")
+        return df.sort_index()[["open", "high", "low", "close", "volume"]]
+
+    def plan(self, jobs: List[Tuple]) -> List[Dict]:
+        """
+        Plan month-sized fetch tasks for every gap not yet in the store.
+
+        Args:
+            jobs: List of (asset_type, symbol, timeframe, start, end) tuples, end inclusive
+
+        Returns:
+            List of task dicts with asset_type, symbol, timeframe, start, end, provider
+            (weekend-only equity chunks are dropped)
+        """
+        tasks = []
+        seen = set()
+        for asset_type, symbol, timeframe, start, end in jobs:
+            provider = ASSET_PROVIDERS[asset_type]
+            for gap_start, gap_end in self.store.missing_ranges(asset_type, symbol, timeframe, start, end):
+                for chunk_start, chunk_end in month_chunks(gap_start, gap_end):
+                    if asset_type == "equities" and not pd.bdate_range(chunk_start, chunk_end).size:
+                        continue
+                    key = (asset_type, symbol, timeframe, chunk_start, chunk_end)
+                    if key in seen:
+                        continue
+                    seen.add(key)
+                    tasks.append(
+                        {
+                            "asset_type": asset_type,
+                            "symbol": symbol,
+                            "timeframe": timeframe,
+                            "start": chunk_start,
+                            "end": chunk_end,
+                            "provider": provider,
+                        }
+                    )
+        return tasks
+
+    def _write_lock(self, task: Dict) -> threading.Lock:
+        key = (task["asset_type"], task["symbol"], task["timeframe"])
+        with self._write_locks_guard:
+            return self._write_locks.setdefault(key, threading.Lock())
+
+    def _run_task(self, task: Dict) -> int:
+        """Fetch one task's bars and merge them into the store; returns the bar count."""
+        fetch = self.fetch_alpaca_bars if task["provider"] == "alpaca" else self.fetch_fmp_bars
+        df = fetch(task["symbol"], task["timeframe"], task["start"].isoformat(), task["end"].isoformat())
+        with self._write_lock(task):
+            self.store.write(task["asset_type"], task["symbol"], task["timeframe"], df, task["start"], task["end"])
+        return len(df)
+
+    def run(self, jobs: List[Tuple], progress: bool = True) -> Dict:
+        """
+        Plan and execute all fetches concurrently.
+
+        Args:
+            jobs: List of (asset_type, symbol, timeframe, start, end) tuples, end inclusive
+            progress: Print one line per completed task
+
+        Returns:
+            Dict with 'tasks', 'completed', 'bars', 'requests' (per provider),
+            'errors' (list of (task, message)) and 'elapsed_sec'
+        """
+        started = time.perf_counter()
+        tasks = self.plan(jobs)
+        if progress:
+            print(f"[PREFETCH] {len(jobs)} jobs -> {len(tasks)} missing month chunks | Workers: {self.workers}")
+
+        completed = 0
+        total_bars = 0
+        errors = []
+        with ThreadPoolExecutor(max_workers=self.workers) as pool:
+            futures = {pool.submit(self._run_task, task): task for task in tasks}
+            for future in as_completed(futures):
+                task = futures[future]
+                label = f"{task['symbol']:6} {task['timeframe']:5} {task['start']} -> {task['end']}"
+                try:
+                    bars = future.result()
+                except Exception as e:
+                    errors.append((task, str(e)))
+                    if progress:
+                        print(f"✗ {label} ERROR: {e}")
+                    continue
+                completed += 1
+                total_bars += bars
+                if progress:
+                    print(f"✓ {label} {bars:7} bars")
+
+        return {
+            "tasks": len(tasks),
+            "completed": completed,
+            "bars": total_bars,
+            "requests": dict(self.requests_made),
+            "errors": errors,
+            "elapsed_sec": time.perf_counter() - started,
+        }
+
+
+def prefetch(jobs: List[Tuple], workers: int = 16, cache_dir: str = "data/cache", **engine_kwargs) -> Dict:
+    """
+    Warm the DataCache bar store for a list of jobs.
+
+    Args:
+        jobs: List of (asset_type, symbol, timeframe, start, end) tuples, end inclusive
+        workers: Concurrent fetch threads (default: 16)
+        cache_dir: DataCache root (default: data/cache)
+        **engine_kwargs: Extra PrefetchEngine arguments (limits, base URLs, feed)
+
+    Returns:
+        Dict returned from PrefetchEngine.run()
+    """
+    store = PartitionedBarStore(os.path.join(cache_dir, "bars"))
+    return PrefetchEngine(store=store, workers=workers, **engine_kwargs).run(jobs)
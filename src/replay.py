@@ -0,0 +1,757 @@
+"""
+Replay Backtest Module
+Runs the production strategy classes unmodified against cached bars.
+
+The prod runners (prod/<strategy>/strategy.py) build their own Alpaca
+TradingClient / StockHistoricalDataClient and read the wall clock through
+datetime.now. A replay loads the strategy module privately, swaps those module
+names for local stand-ins, and steps a simulated clock through the cadence of
+the strategy's runner loop:
+
+- ReplayClock: simulated UTC time; its datetime subclass answers datetime.now
+  in the strategy module, src.bar_buffer and src.trade_logger
+- ReplayDataClient: get_stock_bars / get_stock_latest_quote served from
+  in-memory bars, never past the clock (a bar is served once it has closed;
+  timeframes derived from finer base bars also include the forming bar), plus
+  the PartitionedBarStore.read surface used to seed BarBuffers
+- ReplayTradingClient: market orders fill at the open of the next bar (plus
+  slippage), with positions, cash, equity and a fill ledger; account, order and
+  position fields are strings like the Alpaca models
+
+replay_strategy() runs one task (strategy, symbols, date range) in-process;
+run_replays() fans tasks out over a process pool, e.g. one task per symbol-day
+from symbol_day_tasks(). No network access is made.
+
+Consumers:
+- research/testing/benchmarks/benchmark_replay.py
+"""
+
+import copy
+import importlib.util
+import json
+import os
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import datetime, timedelta
+from functools import partial
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional
+
+import numpy as np
+import pandas as pd
+
+import src.bar_buffer as bar_buffer_module
+import src.trade_logger as trade_logger_module
+from src.bar_buffer import _to_utc_ns
+from src.bar_fetch import BAR_FIELDS
+from src.bar_stream import StreamBar
+from src.data_cache import resample_bars
+from src.logger import LOG
+
+project_root = Path(__file__).resolve().parent.parent
+
+# Deployment root hard-coded in the hourly/daily runners (redirected into the run directory)
+DEPLOY_ROOT = "/home/ssm-user/magellan"
+
+# Alpaca TimeFrame string -> cache timeframe, and cache timeframe -> bar duration
+TIMEFRAME_KEYS = {"1Min": "1min", "1Hour": "1hour", "1Day": "1day"}
+TIMEFRAME_DURATIONS = {"1min": pd.Timedelta(minutes=1), "1hour": pd.Timedelta(hours=1), "1day": pd.Timedelta(days=1)}
+RESAMPLE_RULES = {"1hour": "1h", "1day": "1D"}
+
+
+class ReplayClock:
+    """
+    Simulated clock for a replay.
+
+    Usage:
+        clock = ReplayClock()
+        clock.set("2024-04-09 14:31")      # naive = UTC
+        module.datetime = clock.datetime   # datetime.now() now reads the clock
+    """
+
+    def __init__(self, start=None, local_tz=None):
+        """
+        Initialize ReplayClock.
+
+        Args:
+            start: Initial time (naive = UTC; default: epoch)
+            local_tz: Zone of naive datetime.now() (default: this machine's local
+                zone, as on the deployed host)
+        """
+        self.now = pd.Timestamp(0, tz="UTC")
+        self.local_tz = local_tz
+        if start is not None:
+            self.set(start)
+
+        clock = self
+
+        class ReplayDatetime(datetime):
+            @classmethod
+            def now(cls, tz=None):
+                return clock.now_datetime(tz)
+
+            @classmethod
+            def utcnow(cls):
+                return clock.now.tz_localize(None).to_pydatetime()
+
+            @classmethod
+            def today(cls):
+                return clock.now_datetime()
+
+        self.datetime = ReplayDatetime
+
+    def set(self, timestamp) -> None:
+        """Move the clock to a timestamp (naive = UTC)."""
+        timestamp = pd.Timestamp(timestamp)
+        self.now = timestamp.tz_localize("UTC") if timestamp.tz is None else timestamp.tz_convert("UTC")
+
+    def now_datetime(self, tz=None) -> datetime:
+        """datetime.now(tz) at the clock time (naive local time when tz is None)."""
+        current = self.now.to_pydatetime()
+        if tz is not None:
+            return current.astimezone(tz)
+        local_tz = None if self.local_tz is None else pd.Timestamp(0, tz=self.local_tz).tzinfo
+        return current.astimezone(local_tz).replace(tzinfo=None)
+
+
+class ReplayBarSet:
+    """BarSet stand-in: .data maps symbol -> list of bars (what src.bar_fetch reads)."""
+
+    def __init__(self, data: Dict[str, List[StreamBar]]):
+        self.data = data
+
+
+class ReplayQuote:
+    """Latest-quote stand-in with bid/ask around the last closed bar's close."""
+
+    __slots__ = ("symbol", "timestamp", "bid_price", "ask_price")
+
+    def __init__(self, symbol, timestamp, bid_price, ask_price):
+        self.symbol = symbol
+        self.timestamp = timestamp
+        self.bid_price = bid_price
+        self.ask_price = ask_price
+
+
+class _BarSeries:
+    """Flat arrays for one symbol at one timeframe."""
+
+    __slots__ = ("ts", "values", "available")
+
+    def __init__(self, bars: pd.DataFrame, duration: pd.Timedelta):
+        self.ts = _to_utc_ns(bars.index)
+        self.values = bars[list(BAR_FIELDS)].to_numpy(dtype=np.float64).T.copy()
+        self.available = self.ts + duration.value
+
+
+class ReplayDataClient:
+    """
+    Local stand-in for StockHistoricalDataClient (and the bar store used for seeding).
+
+    Usage:
+        client = ReplayDataClient({"SOFI": bars_df}, clock)
+        client.get_stock_bars(StockBarsRequest(...))   # only bars closed by clock.now
+    """
+
+    def __init__(self, bars: Dict[str, pd.DataFrame], clock: ReplayClock, timeframe: str = "1min", spread_bps: float = 0.0):
+        """
+        Initialize ReplayDataClient.
+
+        Args:
+            bars: Dict of symbol -> bars indexed by timestamp (naive = UTC) with OHLCV columns
+            clock: Replay clock bounding what is served
+            timeframe: Cache timeframe of the bars ('1min', '1hour' or '1day');
+                coarser requests are resampled from them
+            spread_bps: Quoted bid/ask spread around the last close
+        """
+        self.clock = clock
+        self.timeframe = timeframe
+        self.spread_bps = spread_bps
+        self.frames = {symbol: df.sort_index() for symbol, df in bars.items()}
+        self.series: Dict[tuple, _BarSeries] = {
+            (symbol, timeframe): _BarSeries(df, TIMEFRAME_DURATIONS[timeframe]) for symbol, df in self.frames.items()
+        }
+        self.requests = 0
+
+    def _series(self, symbol: str, timeframe: str) -> Optional[_BarSeries]:
+        key = (symbol, timeframe)
+        if key not in self.series and symbol in self.frames:
+            order = list(TIMEFRAME_DURATIONS)
+            if order.index(timeframe) < order.index(self.timeframe):
+                raise ValueError(f"Cannot serve {timeframe} bars from {self.timeframe} bars")
+            self.series[key] = _BarSeries(resample_bars(self.frames[symbol], timeframe), TIMEFRAME_DURATIONS[timeframe])
+        return self.series.get(key)
+
+    def _forming_bar(self, symbol: str, timeframe: str, now: int) -> Optional[tuple]:
+        """Partial bar of a derived timeframe built from the base bars closed by now."""
+        base = self.series[(symbol, self.timeframe)]
+        bucket = pd.Timestamp(now, tz="UTC").floor(RESAMPLE_RULES[timeframe]).value
+        lo = int(np.searchsorted(base.ts, bucket, side="left"))
+        hi = int(np.searchsorted(base.available, now, side="right"))
+        if hi <= lo:
+            return None
+        o, h, l, c, v = (base.values[i, lo:hi] for i in range(len(BAR_FIELDS)))
+        return bucket, (o[0], h.max(), l.min(), c[-1], v.sum())
+
+    def visible_bars(self, symbol: str, timeframe: str, start=None, end=None) -> tuple:
+        """
+        Timestamps (int64 ns UTC) and (5, n) OHLCV values served for a window at the clock time.
+
+        Args:
+            symbol: Symbol
+            timeframe: Cache timeframe
+            start: Window start (inclusive, naive = UTC; None = unbounded)
+            end: Window end (inclusive, naive = UTC; None = now)
+        """
+        series = self._series(symbol, timeframe)
+        if series is None:
+            return np.empty(0, dtype=np.int64), np.empty((len(BAR_FIELDS), 0))
+
+        now = self.clock.now.value
+        end_ns = now if end is None else min(now, _to_utc_ns([end])[0])
+        closed = int(np.searchsorted(series.available, now, side="right"))
+        lo = 0 if start is None else int(np.searchsorted(series.ts[:closed], _to_utc_ns([start])[0], side="left"))
+        hi = int(np.searchsorted(series.ts[:closed], end_ns, side="right"))
+        ts, values = series.ts[lo:hi], series.values[:, lo:hi]
+
+        if timeframe != self.timeframe:
+            forming = self._forming_bar(symbol, timeframe, now)
+            in_window = forming is not None and forming[0] <= end_ns and (start is None or forming[0] >= _to_utc_ns([start])[0])
+            if in_window and closed < len(series.ts) and series.ts[closed] == forming[0]:
+                ts = np.append(ts, forming[0])
+                values = np.column_stack([values, forming[1]])
+        return ts, values
+
+    def get_stock_bars(self, request) -> ReplayBarSet:
+        """StockBarsRequest -> bars closed by the clock time, as a BarSet stand-in."""
+        self.requests += 1
+        symbols = request.symbol_or_symbols
+        symbols = [symbols] if isinstance(symbols, str) else list(symbols)
+        timeframe = TIMEFRAME_KEYS[str(request.timeframe)]
+
+        data = {}
+        for symbol in symbols:
+            ts, values = self.visible_bars(symbol, timeframe, request.start, request.end)
+            if len(ts):
+                stamps = pd.DatetimeIndex(ts.view("datetime64[ns]")).tz_localize("UTC")
+                data[symbol] = [StreamBar(symbol, stamp, *row) for stamp, row in zip(stamps, values.T.tolist())]
+        return ReplayBarSet(data)
+
+    def last_close(self, symbol: str) -> Optional[float]:
+        """Close of the last base bar closed by the clock time (None before the first bar)."""
+        series = self.series.get((symbol, self.timeframe))
+        if series is None:
+            return None
+        closed = int(np.searchsorted(series.available, self.clock.now.value, side="right"))
+        return float(series.values[3, closed - 1]) if closed else None
+
+    def next_open(self, symbol: str) -> Optional[float]:
+        """Open of the first base bar starting at or after the clock time (the next trade)."""
+        series = self.series.get((symbol, self.timeframe))
+        if series is None:
+            return None
+        i = int(np.searchsorted(series.ts, self.clock.now.value, side="left"))
+        return float(series.values[0, i]) if i < len(series.ts) else None
+
+    def get_stock_latest_quote(self, request) -> Dict[str, ReplayQuote]:
+        """StockLatestQuoteRequest -> {symbol: quote} around the last closed bar's close."""
+        symbols = request.symbol_or_symbols
+        symbols = [symbols] if isinstance(symbols, str) else list(symbols)
+        half_spread = self.spread_bps / 2 / 10000.0
+        quotes = {}
+        for symbol in symbols:
+            price = self.last_close(symbol)
+            if price is not None:
+                quotes[symbol] = ReplayQuote(
+                    symbol, self.clock.now, price * (1 - half_spread), price * (1 + half_spread)
+                )
+        return quotes
+
+    def read(self, asset_type: str, symbol: str, timeframe: str, start, end, columns: List[str] = None) -> pd.DataFrame:
+        """PartitionedBarStore.read surface (dates inclusive), limited to bars closed by the clock time."""
+        start_ts = pd.Timestamp(pd.Timestamp(start).date())
+        end_ts = pd.Timestamp(pd.Timestamp(end).date()) + pd.Timedelta(days=1) - pd.Timedelta(1)
+        ts, values = self.visible_bars(symbol, timeframe, start_ts, end_ts)
+        frame = pd.DataFrame(
+            {field: values[i] for i, field in enumerate(BAR_FIELDS)},
+            index=pd.DatetimeIndex(ts.view("datetime64[ns]"), name="timestamp"),
+        )
+        return frame[columns] if columns else frame
+
+
+class ReplayAPIError(Exception):
+    """Raised where the Alpaca API would answer with an error (e.g. no open position)."""
+
+
+class ReplayOrder:
+    """Filled (or canceled) order record returned by ReplayTradingClient.submit_order."""
+
+    __slots__ = (
+        "id", "client_order_id", "symbol", "qty", "filled_qty", "side", "type",
+        "status", "limit_price", "filled_avg_price", "submitted_at", "filled_at",
+    )
+
+    def __init__(self, **fields):
+        for name in self.__slots__:
+            setattr(self, name, fields.get(name))
+
+    def __repr__(self) -> str:
+        return f"ReplayOrder({self.id} {self.side} {self.qty} {self.symbol} {self.status} @ {self.filled_avg_price})"
+
+
+class ReplayPosition:
+    """Open position record (string fields, as in the Alpaca Position model)."""
+
+    __slots__ = ("symbol", "qty", "side", "avg_entry_price", "current_price", "market_value", "unrealized_pl")
+
+    def __init__(self, symbol: str, qty: float, avg_entry_price: float, current_price: float):
+        self.symbol = symbol
+        self.qty = str(qty)
+        self.side = "long" if qty > 0 else "short"
+        self.avg_entry_price = str(avg_entry_price)
+        self.current_price = str(current_price)
+        self.market_value = str(qty * current_price)
+        self.unrealized_pl = str(qty * (current_price - avg_entry_price))
+
+
+class ReplayAccount:
+    """Account record (string fields, as in the Alpaca TradeAccount model)."""
+
+    __slots__ = ("cash", "equity", "portfolio_value", "buying_power")
+
+    def __init__(self, cash: float, equity: float, buying_power: float):
+        self.cash = str(cash)
+        self.equity = str(equity)
+        self.portfolio_value = str(equity)
+        self.buying_power = str(buying_power)
+
+
+class ReplayTradingClient:
+    """
+    Local stand-in for TradingClient with simulated fills.
+
+    Market orders fill at the open of the next bar (the first trade after the
+    order), moved against the order by slippage_bps; with no later bar they fill
+    at the last close. Limit orders fill at that price when it is marketable and
+    are canceled otherwise (no resting orders).
+
+    Usage:
+        trading = ReplayTradingClient(data_client, cash=100000)
+        order = trading.submit_order(MarketOrderRequest(symbol="SOFI", qty=100, side=OrderSide.BUY, ...))
+        trading.fills_frame()
+    """
+
+    def __init__(self, data_client: ReplayDataClient, cash: float = 100000.0, slippage_bps: float = 0.0, margin_multiplier: float = 1.0):
+        """
+        Initialize ReplayTradingClient.
+
+        Args:
+            data_client: ReplayDataClient providing prices (and the clock)
+            cash: Starting cash
+            slippage_bps: Adverse fill adjustment per order in basis points
+            margin_multiplier: Buying power multiple of equity
+        """
+        self.data_client = data_client
+        self.clock = data_client.clock
+        self.cash = float(cash)
+        self.slippage_bps = slippage_bps
+        self.margin_multiplier = margin_multiplier
+        self.positions: Dict[str, list] = {}  # symbol -> [qty, avg_entry_price]
+        self.realized_pnl = 0.0
+        self.fills: List[dict] = []
+        self._order_seq = 0
+
+    def _mark(self, symbol: str) -> float:
+        price = self.data_client.last_close(symbol)
+        return self.positions[symbol][1] if price is None else price
+
+    def equity(self) -> float:
+        """Cash plus open positions marked at the last closed bar."""
+        return self.cash + sum(qty * self._mark(symbol) for symbol, (qty, _) in self.positions.items())
+
+    def get_account(self) -> ReplayAccount:
+        equity = self.equity()
+        return ReplayAccount(self.cash, equity, equity * self.margin_multiplier)
+
+    def get_open_position(self, symbol_or_asset_id: str) -> ReplayPosition:
+        if symbol_or_asset_id not in self.positions:
+            raise ReplayAPIError(f"position does not exist: {symbol_or_asset_id}")
+        qty, avg_price = self.positions[symbol_or_asset_id]
+        return ReplayPosition(symbol_or_asset_id, qty, avg_price, self._mark(symbol_or_asset_id))
+
+    def get_all_positions(self) -> List[ReplayPosition]:
+        return [self.get_open_position(symbol) for symbol in self.positions]
+
+    def submit_order(self, order_data) -> ReplayOrder:
+        """Fill a Market/LimitOrderRequest against the replayed bars."""
+        symbol = order_data.symbol
+        side = getattr(order_data.side, "value", order_data.side)
+        qty = float(order_data.qty)
+        if qty <= 0:
+            raise ReplayAPIError(f"qty must be > 0, got {order_data.qty}")
+
+        market = self.data_client.next_open(symbol)
+        if market is None:
+            market = self.data_client.last_close(symbol)
+        if market is None:
+            raise ReplayAPIError(f"no price available for {symbol} at {self.clock.now}")
+
+        direction = 1.0 if side == "buy" else -1.0
+        price = market * (1 + direction * self.slippage_bps / 10000.0)
+        limit_price = getattr(order_data, "limit_price", None)
+        if limit_price is not None and direction * (price - float(limit_price)) > 0:
+            status, price = "canceled", None
+        else:
+            status = "filled"
+
+        self._order_seq += 1
+        order = ReplayOrder(
+            id=f"replay-{self._order_seq:06d}",
+            client_order_id=getattr(order_data, "client_order_id", None),
+            symbol=symbol,
+            qty=str(order_data.qty),
+            filled_qty=str(qty if status == "filled" else 0),
+            side=side,
+            type="limit" if limit_price is not None else "market",
+            status=status,
+            limit_price=None if limit_price is None else str(limit_price),
+            filled_avg_price=None if price is None else str(price),
+            submitted_at=self.clock.now,
+            filled_at=self.clock.now if status == "filled" else None,
+        )
+        if status == "filled":
+            self._apply_fill(symbol, direction * qty, price)
+            self.fills.append(
+                {"timestamp": self.clock.now, "order_id": order.id, "symbol": symbol, "side": side, "qty": qty, "price": price}
+            )
+        return order
+
+    def _apply_fill(self, symbol: str, signed_qty: float, price: float) -> None:
+        self.cash -= signed_qty * price
+        held, avg_price = self.positions.get(symbol, (0.0, 0.0))
+        new_qty = held + signed_qty
+        if held == 0 or np.sign(held) == np.sign(signed_qty):
+            avg_price = (held * avg_price + signed_qty * price) / new_qty
+        else:
+            closed = min(abs(held), abs(signed_qty))
+            self.realized_pnl += float(closed * (price - avg_price) * np.sign(held))
+            if np.sign(new_qty) == -np.sign(held):
+                avg_price = price  # Reversal: the remainder opens at the fill price
+        if new_qty == 0:
+            self.positions.pop(symbol, None)
+        else:
+            self.positions[symbol] = [new_qty, avg_price]
+
+    def fills_frame(self) -> pd.DataFrame:
+        """Fill ledger (timestamp, order_id, symbol, side, qty, price)."""
+        return pd.DataFrame(self.fills, columns=["timestamp", "order_id", "symbol", "side", "qty", "price"])
+
+
+def _minutes(start: str, end: str, step: int = 1) -> List[str]:
+    """'HH:MM' times of day from start to end inclusive."""
+    times = pd.date_range(f"2000-01-03 {start}", f"2000-01-03 {end}", freq=f"{step}min")
+    return list(times.strftime("%H:%M"))
+
+
+def _bear_trap_cycle(strategy, clock: ReplayClock) -> None:
+    # run_poll body; its follow-up calls (evaluate_entries, ...) are not defined on the class
+    strategy.process_market_data()
+
+
+def _midas_cycle(strategy, clock: ReplayClock) -> None:
+    # runner main-loop body
+    now = clock.now_datetime()
+    if now.hour == 2 and now.minute == 0:
+        strategy.reset_daily_state()
+    if not strategy.is_in_session():
+        if len(strategy.positions) > 0:
+            strategy.close_all_positions("Session end - flat outside 02:00-06:00 UTC")
+        return
+    strategy.process_market_data()
+    if strategy.check_risk_gates():
+        setup = strategy.evaluate_entry(strategy.symbol)
+        if setup and strategy.symbol not in strategy.positions:
+            strategy.enter_position(strategy.symbol, setup)
+    if strategy.symbol in strategy.positions:
+        strategy.manage_position(strategy.symbol)
+
+
+def _hourly_swing_cycle(strategy, clock: ReplayClock) -> None:
+    strategy.process_hourly_signals()
+    strategy.manage_positions()
+    strategy.check_risk_gates()
+
+
+def _daily_trend_cycle(strategy, clock: ReplayClock) -> None:
+    if clock.now.tz_convert("America/New_York").hour < 12:
+        strategy.execute_signals()
+    else:
+        strategy.generate_signals()
+
+
+# Runner cadence per strategy: cycle times of day (weekdays, in the runner's zone)
+STRATEGIES = {
+    "bear_trap": {
+        "path": "prod/bear_trap/strategy.py",
+        "class": "BearTrapStrategy",
+        "tz": "America/New_York",
+        "times": _minutes("09:30", "16:00"),  # run_poll during market hours, one cycle per new bar
+        "warmup": timedelta(minutes=45),
+        "cycle": _bear_trap_cycle,
+    },
+    "midas_protocol": {
+        "path": "prod/midas_protocol/strategy.py",
+        "class": "MIDASProtocolStrategy",
+        "tz": "UTC",
+        "times": _minutes("02:00", "06:01"),  # Asian session, plus the session-end flatten
+        "warmup": timedelta(minutes=300),
+        "cycle": _midas_cycle,
+    },
+    "hourly_swing": {
+        "path": "prod/hourly_swing/strategy.py",
+        "class": "HourlySwingExecutor",
+        "tz": "America/New_York",
+        "times": ["09:30"] + _minutes("10:00", "16:00", step=60),  # first check each market hour
+        "warmup": timedelta(days=30),
+        "cycle": _hourly_swing_cycle,
+    },
+    "daily_trend": {
+        "path": "prod/daily_trend/strategy.py",
+        "class": "DailyTrendExecutor",
+        "tz": "America/New_York",
+        "times": ["09:30", "16:05"],  # execute yesterday's signals, then generate
+        "warmup": timedelta(days=150),
+        "cycle": _daily_trend_cycle,
+    },
+}
+
+_MODULES: Dict[str, object] = {}
+
+
+def load_strategy_module(name: str):
+    """Load prod/<name>/strategy.py as a private module (cached per process)."""
+    if name not in _MODULES:
+        spec = importlib.util.spec_from_file_location(f"replay_{name}_strategy", project_root / STRATEGIES[name]["path"])
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        _MODULES[name] = module
+    return _MODULES[name]
+
+
+def cycle_times(name: str, start, end) -> pd.DatetimeIndex:
+    """
+    UTC times at which the strategy's runner loop would act, weekdays from start to end.
+
+    Args:
+        name: Strategy key in STRATEGIES
+        start: First date (inclusive)
+        end: Last date (inclusive)
+    """
+    spec = STRATEGIES[name]
+    days = pd.bdate_range(pd.Timestamp(start).date(), pd.Timestamp(end).date())
+    offsets = pd.to_timedelta([f"{t}:00" for t in spec["times"]])
+    local = pd.DatetimeIndex([day + offset for day in days for offset in offsets])
+    return local.tz_localize(spec["tz"], nonexistent="shift_forward", ambiguous=True).tz_convert("UTC")
+
+
+def _redirect_open(run_dir: Path) -> Callable:
+    """open() that maps paths under DEPLOY_ROOT into the run directory."""
+
+    def replay_open(file, *args, **kwargs):
+        path = str(file)
+        if path.startswith(DEPLOY_ROOT):
+            path = str(run_dir / path[len(DEPLOY_ROOT):].lstrip("/"))
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+        return open(path, *args, **kwargs)
+
+    return replay_open
+
+
+def _swap(targets: List[tuple]) -> List[tuple]:
+    """Set (object, name, value) attributes; returns the previous values for _restore."""
+    saved = []
+    for obj, name, value in targets:
+        saved.append((obj, name, getattr(obj, name, None), hasattr(obj, name)))
+        setattr(obj, name, value)
+    return saved
+
+
+def _restore(saved: List[tuple]) -> None:
+    for obj, name, value, existed in reversed(saved):
+        if existed:
+            setattr(obj, name, value)
+        else:
+            delattr(obj, name)
+
+
+def _load_bars(source, start: pd.Timestamp, end: pd.Timestamp) -> pd.DataFrame:
+    """Bars from a parquet path or frame, limited to [start, end)."""
+    df = pd.read_parquet(source) if isinstance(source, (str, Path)) else source
+    if "timestamp" in df.columns:
+        df = df.set_index("timestamp")
+    index = pd.DatetimeIndex(df.index)
+    if index.tz is not None:
+        df = df.set_axis(index.tz_convert("UTC").tz_localize(None))
+    df = df.sort_index()
+    return df.loc[(df.index >= start) & (df.index < end), list(BAR_FIELDS)]
+
+
+def replay_strategy(task: Dict) -> Dict:
+    """
+    Replay one strategy over a date range in this process.
+
+    Args:
+        task: Dict with
+            - strategy: Key in STRATEGIES
+            - bars: Dict of symbol -> parquet path or bars frame (naive = UTC)
+            - start, end: First and last replay date (inclusive)
+            - symbols: Symbols to trade (default: the bars keys)
+            - timeframe: Cache timeframe of the bars (default: '1min')
+            - config: Strategy config (default: prod/<strategy>/config.json)
+            - cash, slippage_bps, spread_bps: Simulated account and fills
+            - log_dir: Directory for strategy logs (default: temporary, removed)
+            - local_tz: Zone of naive datetime.now() (default: this machine's)
+
+    Returns:
+        Dict with fills (DataFrame), final_equity, realized_pnl, open_positions,
+        status (strategy.get_status() if defined), cycles, errors, bars, elapsed
+    """
+    started = time.perf_counter()
+    name = task["strategy"]
+    spec = STRATEGIES[name]
+    module = load_strategy_module(name)
+
+    first_day = pd.Timestamp(task["start"]).normalize()
+    end = pd.Timestamp(task["end"]).normalize() + pd.Timedelta(days=1)
+    # Bars needed before the first cycle (look-back plus weekend / holiday slack)
+    data_start = first_day - spec["warmup"] - pd.Timedelta(days=4)
+    bars = {symbol: _load_bars(source, data_start, end) for symbol, source in task["bars"].items()}
+    symbols = list(task.get("symbols") or bars)
+
+    config = copy.deepcopy(task.get("config"))
+    if config is None:
+        with open(project_root / Path(spec["path"]).parent / "config.json") as f:
+            config = json.load(f)
+
+    temp_dir = None
+    if task.get("log_dir") is None:
+        temp_dir = tempfile.TemporaryDirectory(prefix=f"replay_{name}_")
+        run_dir = Path(temp_dir.name)
+    else:
+        run_dir = Path(task["log_dir"])
+        run_dir.mkdir(parents=True, exist_ok=True)
+    config.setdefault("monitoring", {}).setdefault("log_directory", str(run_dir / "logs"))
+
+    times = cycle_times(name, task["start"], task["end"])
+    clock = ReplayClock(times[0] if len(times) else first_day, local_tz=task.get("local_tz"))
+    data_client = ReplayDataClient(bars, clock, task.get("timeframe", "1min"), task.get("spread_bps", 0.0))
+    trading_client = ReplayTradingClient(data_client, task.get("cash", 100000.0), task.get("slippage_bps", 0.0))
+
+    targets = [
+        (module, "TradingClient", lambda *args, **kwargs: trading_client),
+        (module, "StockHistoricalDataClient", lambda *args, **kwargs: data_client),
+        (module, "datetime", clock.datetime),
+        (module, "open", _redirect_open(run_dir)),
+        (bar_buffer_module, "datetime", clock.datetime),
+        (trade_logger_module, "datetime", clock.datetime),
+    ]
+    if hasattr(module, "PartitionedBarStore"):
+        targets.append((module, "PartitionedBarStore", lambda *args, **kwargs: data_client))
+    if hasattr(module, "TradeLogger"):
+        targets.append((module, "TradeLogger", partial(trade_logger_module.TradeLogger, log_dir=str(run_dir / "logs"))))
+
+    saved = _swap(targets)
+    errors = 0
+    strategy = None
+    try:
+        strategy = getattr(module, spec["class"])("replay", "replay", "replay", symbols, config)
+        for timestamp in times:
+            clock.set(timestamp)
+            try:
+                spec["cycle"](strategy, clock)
+            except Exception as e:
+                errors += 1
+                LOG.debug(f"[REPLAY] {name} cycle at {timestamp} failed: {e}")
+        status = strategy.get_status() if hasattr(strategy, "get_status") else {}
+    finally:
+        if strategy is not None and hasattr(strategy, "trade_logger"):
+            strategy.trade_logger.close()
+        _restore(saved)
+        if temp_dir is not None:
+            temp_dir.cleanup()
+
+    replayed = 0
+    if len(times):
+        window = (_to_utc_ns([first_day])[0], clock.now.value)
+        for symbol in symbols:
+            series = data_client.series.get((symbol, data_client.timeframe))
+            if series is not None:
+                replayed += int(np.searchsorted(series.ts, window[1], "left") - np.searchsorted(series.ts, window[0], "left"))
+
+    return {
+        "strategy": name,
+        "symbols": symbols,
+        "start": str(pd.Timestamp(task["start"]).date()),
+        "end": str(pd.Timestamp(task["end"]).date()),
+        "fills": trading_client.fills_frame(),
+        "final_equity": trading_client.equity(),
+        "realized_pnl": float(trading_client.realized_pnl),
+        "open_positions": {symbol: qty for symbol, (qty, _) in trading_client.positions.items()},
+        "status": status,
+        "cycles": len(times),
+        "errors": errors,
+        "bars": replayed,
+        "elapsed": time.perf_counter() - started,
+    }
+
+
+def symbol_day_tasks(strategy: str, bars: Dict[str, object], days: Iterable, **options) -> List[Dict]:
+    """
+    One replay task per (symbol, day).
+
+    Args:
+        strategy: Key in STRATEGIES
+        bars: Dict of symbol -> parquet path or bars frame
+        days: Dates to replay
+        **options: Extra task fields (config, cash, slippage_bps, timeframe, ...)
+
+    Returns:
+        List of task dicts for run_replays
+    """
+    return [
+        {"strategy": strategy, "bars": {symbol: source}, "start": day, "end": day, **options}
+        for symbol, source in bars.items()
+        for day in days
+    ]
+
+
+def run_replays(tasks: List[Dict], workers: Optional[int] = None) -> List[Dict]:
+    """
+    Run replay tasks across a process pool.
+
+    Args:
+        tasks: Task dicts for replay_strategy
+        workers: Worker processes (default: CPU count; 1 = run in this process)
+
+    Returns:
+        Results in task order; failed tasks are {'error': message} entries
+    """
+    workers = workers or os.cpu_count() or 1
+    results: List[Optional[Dict]] = [None] * len(tasks)
+
+    if workers > 1 and len(tasks) > 1:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = {pool.submit(replay_strategy, task): i for i, task in enumerate(tasks)}
+            for future in as_completed(futures):
+                try:
+                    results[futures[future]] = future.result()
+                except Exception as e:
+                    results[futures[future]] = {"error": str(e)}
+    else:
+        for i, task in enumerate(tasks):
+            try:
+                results[i] = replay_strategy(task)
+            except Exception as e:
+                results[i] = {"error": str(e)}
+    return results
@@ -0,0 +1,242 @@
+"""
+Rolling Statistics Module
+Shared look-back-only rolling statistics used across signal nodes and strategies.
+
+Every function here is causal (bar t only sees bars <= t) and is computed once per
+frame as whole columns, so callers never need to recompute a rolling window inside
+a per-bar loop.
+
+Consumers:
+- generate_master_signal: VSS cryogenic temperature/baseline, IWM HAW volatility
+- BearTrapStrategy: ATR for stop placement
+- add_normalized_features: 252-bar rolling min-max normalization of alpha factors
+- src.streaming_indicators: batch references for the O(1) incremental indicators
+"""
+
+from typing import Tuple
+
+import numpy as np
+import pandas as pd
+
+
+def true_range(high: pd.Series, low: pd.Series, close: pd.Series) -> pd.Series:
+    """
+    Calculate True Range.
+
+    TR = max(High - Low, |High - PrevClose|, |Low - PrevClose|)
+
+    Args:
+        high: Series of bar highs
+        low: Series of bar lows
+        close: Series of bar closes
+
+    Returns:
+        Series of true range values (first bar falls back to High - Low)
+    """
+    prev_close = close.shift(1)
+    high_low = high - low
+    high_close = (high - prev_close).abs()
+    low_close = (low - prev_close).abs()
+    return pd.concat([high_low, high_close, low_close], axis=1).max(axis=1)
+
+
+def rolling_atr(high: pd.Series, low: pd.Series, close: pd.Series, window: int = 14) -> pd.Series:
+    """
+    Calculate simple rolling Average True Range.
+
+    Args:
+        high: Series of bar highs
+        low: Series of bar lows
+        close: Series of bar closes
+        window: ATR window in bars (default: 14)
+
+    Returns:
+        Series of ATR values (NaN during warmup)
+    """
+    return true_range(high, low, close).rolling(window=window).mean()
+
+
+def session_vwap(
+    high: pd.Series, low: pd.Series, close: pd.Series, volume: pd.Series, sessions=None
+) -> pd.Series:
+    """
+    Calculate session-anchored VWAP on the typical price.
+
+    VWAP = cumsum(((H + L + C) / 3) * V) / cumsum(V), restarted every session.
+
+    Args:
+        high: Series of bar highs
+        low: Series of bar lows
+        close: Series of bar closes
+        volume: Series of bar volumes
+        sessions: Session key per bar (default: calendar date of the timestamp index)
+
+    Returns:
+        Series of VWAP values (NaN until the session has traded volume)
+    """
+    if sessions is None:
+        sessions = high.index.date
+    typical = (high + low + close) / 3
+    cum_pv = (typical * volume).groupby(sessions).cumsum()
+    cum_volume = volume.groupby(sessions).cumsum()
+    return cum_pv / cum_volume.replace(0, np.nan)
+
+
+def rolling_baseline(series: pd.Series, window: int = 200) -> pd.Series:
+    """
+    Calculate a rolling-median baseline.
+
+    Args:
+        series: Input series (e.g. ATR temperature)
+        window: Median window in bars (default: 200)
+
+    Returns:
+        Series of rolling medians (NaN during warmup)
+    """
+    return series.rolling(window=window).median()
+
+
+def rolling_volatility(returns: pd.Series, window: int = 12) -> pd.Series:
+    """
+    Calculate rolling standard deviation of returns.
+
+    Args:
+        returns: Series of (log) returns
+        window: Window in bars (default: 12 = 1 hour of 5Min bars)
+
+    Returns:
+        Series of rolling volatility values
+    """
+    return returns.rolling(window=window).std()
+
+
+def thermal_state(
+    high: pd.Series,
+    low: pd.Series,
+    close: pd.Series,
+    atr_window: int = 20,
+    baseline_window: int = 200,
+    hot_multiple: float = 1.5,
+    max_damping: float = 0.80,
+    fallback_damping: float = 0.50,
+) -> pd.DataFrame:
+    """
+    Calculate cryogenic temperature, baseline and damping columns in one pass.
+
+    - vol_temp: Rolling ATR ("temperature")
+    - baseline_temp: Rolling median of vol_temp
+    - temp_ratio: vol_temp / baseline_temp
+    - cryo_hot: True where vol_temp > hot_multiple * baseline_temp
+    - cryo_scaling: 1 - damping, where damping = min(temp_ratio - 1, max_damping)
+      (fallback_damping if the baseline is unavailable or zero)
+
+    Args:
+        high: Series of bar highs
+        low: Series of bar lows
+        close: Series of bar closes
+        atr_window: ATR window for the temperature (default: 20)
+        baseline_window: Rolling-median window for the baseline (default: 200)
+        hot_multiple: Temperature multiple that marks a bar as too hot (default: 1.5)
+        max_damping: Maximum proportional damping (default: 0.80)
+        fallback_damping: Damping used when the baseline is unavailable (default: 0.50)
+
+    Returns:
+        DataFrame indexed like the inputs with the five columns above
+    """
+    vol_temp = rolling_atr(high, low, close, window=atr_window)
+    baseline_temp = rolling_baseline(vol_temp, window=baseline_window)
+    temp_ratio = vol_temp / baseline_temp
+
+    ratio_values = temp_ratio.to_numpy()
+    damping = np.where(ratio_values > 1.0, np.minimum(ratio_values - 1.0, max_damping), 0.0)
+    damping = np.where((baseline_temp > 0).to_numpy(), damping, fallback_damping)
+
+    return pd.DataFrame(
+        {
+            "vol_temp": vol_temp,
+            "baseline_temp": baseline_temp,
+            "temp_ratio": temp_ratio,
+            "cryo_hot": vol_temp > (hot_multiple * baseline_temp),
+            "cryo_scaling": 1.0 - damping,
+        },
+        index=vol_temp.index,
+    )
+
+
+def rolling_min_max(values: np.ndarray, window: int, min_periods: int = None) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Calculate rolling min and max in O(n) with the van Herk/Gil-Werman block scheme.
+
+    The series is split into blocks of `window` bars; each block gets a prefix and a
+    suffix running min/max (one monotonic pass each), and every window is the
+    combination of one suffix and one prefix. NaN/inf values are skipped and
+    windows with fewer than min_periods valid values are NaN, exactly like
+    Series.rolling(window, min_periods).min()/.max().
+
+    Args:
+        values: 1-D array of values (NaN/inf = missing)
+        window: Window length in bars
+        min_periods: Minimum valid values per window (default: window)
+
+    Returns:
+        Tuple of (rolling_min, rolling_max) float arrays
+    """
+    x = np.asarray(values, dtype=float)
+    n = len(x)
+    if min_periods is None:
+        min_periods = window
+    if n == 0:
+        return np.empty(0), np.empty(0)
+
+    valid = np.isfinite(x)
+    valid_counts = np.cumsum(valid)
+    valid_counts[window:] = valid_counts[window:] - valid_counts[:-window]
+
+    # Left-pad so bar i's window is padded[i : i + window], right-pad to whole blocks
+    pad_front = window - 1
+    pad_back = -(pad_front + n) % window
+
+    def _window_extreme(fill: float, accumulate) -> np.ndarray:
+        padded = np.concatenate([np.full(pad_front, fill), np.where(valid, x, fill), np.full(pad_back, fill)])
+        blocks = padded.reshape(-1, window)
+        prefix = accumulate(blocks, axis=1).ravel()
+        suffix = accumulate(blocks[:, ::-1], axis=1)[:, ::-1].ravel()
+        return suffix[:n], prefix[pad_front : pad_front + n]
+
+    suffix_min, prefix_min = _window_extreme(np.inf, np.minimum.accumulate)
+    suffix_max, prefix_max = _window_extreme(-np.inf, np.maximum.accumulate)
+
+    insufficient = valid_counts < min_periods
+    rolling_min = np.where(insufficient, np.nan, np.minimum(suffix_min, prefix_min))
+    rolling_max = np.where(insufficient, np.nan, np.maximum(suffix_max, prefix_max))
+    return rolling_min, rolling_max
+
+
+def rolling_minmax_normalize(
+    series: pd.Series, window: int = 252, min_periods: int = 20, fill_value: float = 0.5
+) -> pd.Series:
+    """
+    Rolling min-max normalization to 0-1 (look-back only).
+
+    A flat window (max == min) normalizes to 0.0; warmup bars are filled with
+    fill_value.
+
+    Args:
+        series: Input series (e.g. volume_zscore)
+        window: Look-back window in bars (default: 252 = ~1 trading day of 1-minute bars)
+        min_periods: Minimum valid values before a window is usable (default: 20)
+        fill_value: Warmup period fallback (default: 0.5)
+
+    Returns:
+        Series of normalized values indexed like the input
+    """
+    values = series.to_numpy(dtype=float)
+    rolling_min, rolling_max = rolling_min_max(values, window, min_periods)
+
+    col_range = rolling_max - rolling_min
+    col_range[col_range == 0] = np.inf
+
+    with np.errstate(invalid="ignore"):
+        normalized = (values - rolling_min) / col_range
+
+    return pd.Series(normalized, index=series.index).fillna(fill_value)
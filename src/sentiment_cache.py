@@ -0,0 +1,198 @@
+"""
+Local NLP Sentiment Cache
+Persistent, content-addressed cache for TextBlob polarity scores.
+
+When FMP sentiment is missing, merge_news_pit() falls back to local NLP. Scoring the
+same articles again on every rolling window and every run is pure waste, so scores
+are keyed by an MD5 hash of the article text and persisted as parquet next to the
+news cache. Misses are scored in batches, optionally across a process pool.
+
+Cache Structure:
+    data/cache/
+        news/                               # Raw FMP news (DataCache)
+        news_sentiment/
+            textblob_polarity.parquet       # article_hash -> polarity
+            textblob_polarity.parquet.lock  # Serializes saves across processes
+"""
+
+import hashlib
+import os
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, List
+
+import pandas as pd
+from textblob import TextBlob
+
+try:
+    import fcntl
+except ImportError:  # Windows: no advisory locks, saves are best-effort
+    fcntl = None
+
+
+def article_hash(full_text: str) -> str:
+    """
+    Content hash used as the sentiment cache key.
+
+    Args:
+        full_text: Concatenated article title and body
+
+    Returns:
+        Hex MD5 digest of the UTF-8 text
+    """
+    return hashlib.md5(full_text.encode("utf-8")).hexdigest()
+
+
+def _score_batch(texts: List[str]) -> List[float]:
+    """Score a batch of texts with TextBlob (top-level so it can run in a worker process)."""
+    return [TextBlob(text).sentiment.polarity if text else 0.0 for text in texts]
+
+
+class SentimentCache:
+    """
+    Manages persistent TextBlob polarity scores keyed by article hash.
+
+    Usage:
+        cache = SentimentCache()
+        scores = cache.score(["Apple beats earnings", "Chipmaker misses guidance"])
+        cache.stats()  # {'hits': 0, 'misses': 2, 'cached_articles': 2}
+    """
+
+    def __init__(self, cache_dir: str = "data/cache", batch_size: int = 256, workers: int = 1):
+        """
+        Initialize SentimentCache (the parquet file is loaded lazily on first use).
+
+        Args:
+            cache_dir: Root cache directory (default: data/cache)
+            batch_size: Number of texts per scoring batch (default: 256)
+            workers: Process pool size for scoring misses (default: 1 = in-process)
+        """
+        self.cache_path = Path(cache_dir) / "news_sentiment" / "textblob_polarity.parquet"
+        self.batch_size = batch_size
+        self.workers = workers
+
+        self.hits = 0
+        self.misses = 0
+
+        self._scores: Dict[str, float] = None
+
+    def _read_disk(self) -> Dict[str, float]:
+        """Read the persisted scores (empty if no cache file yet)."""
+        if not self.cache_path.exists():
+            return {}
+        cached = pd.read_parquet(self.cache_path)
+        return dict(zip(cached["article_hash"], cached["polarity"]))
+
+    def _load(self) -> Dict[str, float]:
+        """Load cached scores from parquet on first access."""
+        if self._scores is None:
+            self._scores = self._read_disk()
+        return self._scores
+
+    @contextmanager
+    def _file_lock(self):
+        """Exclusive lock on a sidecar file, serializing saves across processes."""
+        lock_path = self.cache_path.with_suffix(".parquet.lock")
+        with open(lock_path, "a") as lock_file:
+            if fcntl is not None:
+                fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def _save(self) -> None:
+        """
+        Persist scores atomically, merged with whatever other processes saved.
+
+        Under the lock, the file on disk is re-read and merged with the in-memory
+        scores, written to a unique temp file in the same directory and swapped in.
+        """
+        self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+        with self._file_lock():
+            merged = self._read_disk()
+            merged.update(self._scores)
+            self._scores = merged
+
+            df = pd.DataFrame({"article_hash": list(merged.keys()), "polarity": list(merged.values())})
+            with tempfile.NamedTemporaryFile(
+                dir=self.cache_path.parent, prefix=self.cache_path.name, suffix=".tmp", delete=False
+            ) as tmp:
+                tmp_path = tmp.name
+            try:
+                df.to_parquet(tmp_path, index=False)
+                os.replace(tmp_path, self.cache_path)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+
+    def _score_misses(self, texts: List[str]) -> List[float]:
+        """Score uncached texts in batches, across a process pool if workers > 1."""
+        batches = [texts[i : i + self.batch_size] for i in range(0, len(texts), self.batch_size)]
+
+        if self.workers > 1 and len(batches) > 1:
+            with ProcessPoolExecutor(max_workers=self.workers) as pool:
+                results = list(pool.map(_score_batch, batches))
+        else:
+            results = [_score_batch(batch) for batch in batches]
+
+        return [score for batch in results for score in batch]
+
+    def score(self, texts: List[str]) -> List[float]:
+        """
+        Return TextBlob polarity for each text, scoring only cache misses.
+
+        Empty texts score 0.0 and are not cached.
+
+        Args:
+            texts: List of full article texts (title + body)
+
+        Returns:
+            List of polarity scores (-1.0 to 1.0) aligned with texts
+        """
+        scores = self._load()
+
+        keys = [article_hash(text) if text else None for text in texts]
+
+        # Deduplicate misses so repeated articles in one call are scored once
+        miss_keys = {}
+        for key, text in zip(keys, texts):
+            if key is None:
+                continue
+            if key in scores:
+                self.hits += 1
+            else:
+                self.misses += 1
+                miss_keys.setdefault(key, text)
+
+        if miss_keys:
+            new_scores = self._score_misses(list(miss_keys.values()))
+            scores.update(zip(miss_keys.keys(), new_scores))
+            self._save()
+
+        return [scores[key] if key is not None else 0.0 for key in keys]
+
+    def stats(self) -> Dict:
+        """
+        Return cache hit/miss counters.
+
+        Returns:
+            Dict with 'hits', 'misses' and 'cached_articles'
+        """
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "cached_articles": len(self._load()),
+        }
+
+    def reset_stats(self) -> None:
+        """Reset hit/miss counters (cached scores are kept)."""
+        self.hits = 0
+        self.misses = 0
+
+
+# Global instance
+sentiment_cache = SentimentCache()
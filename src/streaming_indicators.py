@@ -0,0 +1,561 @@
+"""
+Streaming Indicators Module
+O(1) incremental indicators for live runners and event-driven backtests.
+
+Each indicator keeps only the running state it needs and advances one bar at a
+time with update(bar), so reading the latest value no longer means recomputing
+a full pandas series on every tick. The update arithmetic mirrors the batch
+implementations (pandas ewm(adjust=False), Kahan-compensated rolling mean/var,
+grouped cumulative sums), so streaming values match the batch functions when
+fed the same bars:
+
+- EMA:              series.ewm(span=period, adjust=False).mean()
+- RSI:              src.features.calculate_rsi (EMA or Wilder smoothing)
+- ATR:              src.rolling_stats.rolling_atr (SMA) or MIDAS calculate_atr (EMA)
+- RollingMean:      series.rolling(window).mean()
+- RollingZScore:    volume_zscore in src.features.add_technical_indicators
+- SessionVWAP:      src.rolling_stats.session_vwap
+- SessionHigh/Low:  per-session cummax/cummin
+
+Bars are mappings or objects (Alpaca Bar, dict, pandas row) with timestamp /
+open / high / low / close / volume. Every indicator's state() is a plain
+JSON-serializable dict; indicator_from_state() rebuilds it, so a runner can
+persist its indicators and resume after a restart without a warm-up refetch.
+
+Usage:
+    engine = IndicatorEngine({"rsi": RSI(14), "atr": ATR(14), "vwap": SessionVWAP()})
+    values = engine.update(bar)            # {"rsi": 61.2, "atr": 0.31, "vwap": 12.04}
+    saved = json.dumps(engine.state())
+    engine = IndicatorEngine.from_state(json.loads(saved))
+"""
+
+import math
+from collections import deque
+from collections.abc import Mapping
+from typing import Dict, Optional
+
+import pandas as pd
+
+NAN = float("nan")
+
+
+def bar_value(bar, field: str):
+    """Read a field from a mapping or attribute-style bar."""
+    if isinstance(bar, Mapping):
+        return bar[field]
+    return getattr(bar, field)
+
+
+def _session_key(timestamp) -> str:
+    """Session key of a bar timestamp (its calendar date)."""
+    return pd.Timestamp(timestamp).date().isoformat()
+
+
+class StreamingIndicator:
+    """
+    Base class for incremental indicators.
+
+    Subclasses list their constructor parameters in _PARAMS and their running
+    state in _STATE; deque-valued state entries are listed in _DEQUES.
+    """
+
+    _PARAMS = ()
+    _STATE = ()
+    _DEQUES = ()
+
+    def update(self, bar) -> float:
+        """Advance by one bar and return the new value."""
+        raise NotImplementedError
+
+    @property
+    def value(self) -> float:
+        """Latest value (NaN during warmup)."""
+        raise NotImplementedError
+
+    def state(self) -> Dict:
+        """Return a JSON-serializable snapshot of parameters and running state."""
+        snapshot = {"kind": type(self).__name__}
+        for name in self._PARAMS + self._STATE:
+            item = getattr(self, name)
+            snapshot[name] = list(item) if isinstance(item, deque) else item
+        return snapshot
+
+    @classmethod
+    def from_state(cls, state: Dict) -> "StreamingIndicator":
+        """Rebuild an indicator from state()."""
+        indicator = cls(**{name: state[name] for name in cls._PARAMS})
+        for name in cls._STATE:
+            item = state[name]
+            if name in cls._DEQUES:
+                item = deque(item, maxlen=getattr(indicator, name).maxlen)
+            setattr(indicator, name, item)
+        return indicator
+
+
+class _EWM:
+    """ewm(adjust=False).mean() recursion, step for step as pandas computes it."""
+
+    __slots__ = ("alpha", "weighted")
+
+    def __init__(self, alpha: float, weighted: Optional[float] = None):
+        self.alpha = alpha
+        self.weighted = weighted
+
+    def add(self, x: float) -> float:
+        if self.weighted is None:
+            self.weighted = x
+        elif self.weighted != x:
+            old_wt = 1.0 - self.alpha
+            self.weighted = (old_wt * self.weighted + self.alpha * x) / (old_wt + self.alpha)
+        return self.weighted
+
+
+class EMA(StreamingIndicator):
+    """Exponential moving average, alpha = 2 / (period + 1), seeded with the first value."""
+
+    _PARAMS = ("period", "field")
+    _STATE = ("ema",)
+
+    def __init__(self, period: int, field: str = "close"):
+        self.period = period
+        self.field = field
+        self._ewm = _EWM(2.0 / (period + 1))
+
+    @property
+    def ema(self) -> Optional[float]:
+        return self._ewm.weighted
+
+    @ema.setter
+    def ema(self, weighted: Optional[float]) -> None:
+        self._ewm.weighted = weighted
+
+    def push(self, x: float) -> float:
+        """Add a raw value (used when the input is derived, e.g. true range)."""
+        return self._ewm.add(x)
+
+    def update(self, bar) -> float:
+        return self.push(float(bar_value(bar, self.field)))
+
+    @property
+    def value(self) -> float:
+        return NAN if self.ema is None else self.ema
+
+
+class RSI(StreamingIndicator):
+    """
+    Relative Strength Index on closes.
+
+    Matches calculate_rsi: EMA smoothing (span = period) by default, Wilder's
+    alpha = 1/period with wilder=True; RSI is 100 when the average loss is zero
+    and 0 when the average gain is zero (the first bar is 0).
+    """
+
+    _PARAMS = ("period", "wilder", "field")
+    _STATE = ("prev_close", "avg_gain", "avg_loss")
+
+    def __init__(self, period: int = 14, wilder: bool = False, field: str = "close"):
+        self.period = period
+        self.wilder = wilder
+        self.field = field
+        self.prev_close = None
+        alpha = 1.0 / period if wilder else 2.0 / (period + 1)
+        self._gains = _EWM(alpha)
+        self._losses = _EWM(alpha)
+
+    @property
+    def avg_gain(self) -> Optional[float]:
+        return self._gains.weighted
+
+    @avg_gain.setter
+    def avg_gain(self, weighted: Optional[float]) -> None:
+        self._gains.weighted = weighted
+
+    @property
+    def avg_loss(self) -> Optional[float]:
+        return self._losses.weighted
+
+    @avg_loss.setter
+    def avg_loss(self, weighted: Optional[float]) -> None:
+        self._losses.weighted = weighted
+
+    def update(self, bar) -> float:
+        close = float(bar_value(bar, self.field))
+        delta = 0.0 if self.prev_close is None else close - self.prev_close
+        self.prev_close = close
+        self._gains.add(delta if delta > 0 else 0.0)
+        self._losses.add(-delta if delta < 0 else 0.0)
+        return self.value
+
+    @property
+    def value(self) -> float:
+        if self.avg_gain is None:
+            return NAN
+        if self.avg_gain == 0:
+            return 0.0
+        if self.avg_loss == 0:
+            return 100.0
+        return 100 - (100 / (1 + self.avg_gain / self.avg_loss))
+
+
+class RollingMean(StreamingIndicator):
+    """
+    Simple moving average over a fixed window (NaN until the window is full).
+
+    Uses the same Kahan-compensated add/remove sums as pandas rolling().mean().
+    """
+
+    _PARAMS = ("window", "field")
+    _STATE = ("values", "total", "add_comp", "remove_comp", "neg_count", "same_count", "prev_value")
+    _DEQUES = ("values",)
+
+    def __init__(self, window: int, field: str = "close"):
+        self.window = window
+        self.field = field
+        self.values = deque(maxlen=window)
+        self.total = 0.0
+        self.add_comp = 0.0
+        self.remove_comp = 0.0
+        self.neg_count = 0
+        self.same_count = 0
+        self.prev_value = None
+
+    def push(self, x: float) -> float:
+        """Add a raw value (used when the input is derived, e.g. true range)."""
+        if len(self.values) == self.window:
+            old = self.values[0]
+            y = -old - self.remove_comp
+            t = self.total + y
+            self.remove_comp = t - self.total - y
+            self.total = t
+            if old < 0:
+                self.neg_count -= 1
+
+        self.values.append(x)
+        y = x - self.add_comp
+        t = self.total + y
+        self.add_comp = t - self.total - y
+        self.total = t
+        if x < 0:
+            self.neg_count += 1
+        self.same_count = self.same_count + 1 if x == self.prev_value else 1
+        self.prev_value = x
+        return self.value
+
+    def update(self, bar) -> float:
+        return self.push(float(bar_value(bar, self.field)))
+
+    @property
+    def value(self) -> float:
+        n = len(self.values)
+        if n < self.window:
+            return NAN
+        if self.same_count >= n:
+            return self.prev_value
+        mean = self.total / n
+        if self.neg_count == 0 and mean < 0:
+            return 0.0
+        if self.neg_count == n and mean > 0:
+            return 0.0
+        return mean
+
+
+class RollingZScore(StreamingIndicator):
+    """
+    Rolling z-score (x - mean) / std with sample std (ddof=1) over a fixed window.
+
+    Matches volume_zscore in add_technical_indicators: NaN until the window is
+    full, 0.0 when the window is constant. Variance uses the Welford/Kahan
+    add/remove updates of pandas rolling().var().
+    """
+
+    _PARAMS = ("window", "field")
+    _STATE = ("mean_state", "mean_x", "ssqdm", "add_comp", "remove_comp", "same_count", "prev_value", "last")
+
+    def __init__(self, window: int = 20, field: str = "volume"):
+        self.window = window
+        self.field = field
+        self._mean = RollingMean(window)
+        self.mean_x = 0.0
+        self.ssqdm = 0.0
+        self.add_comp = 0.0
+        self.remove_comp = 0.0
+        self.same_count = 0
+        self.prev_value = None
+        self.last = None
+
+    @property
+    def mean_state(self) -> Dict:
+        return self._mean.state()
+
+    @mean_state.setter
+    def mean_state(self, state: Dict) -> None:
+        self._mean = RollingMean.from_state(state)
+
+    def update(self, bar) -> float:
+        x = float(bar_value(bar, self.field))
+        values = self._mean.values
+        nobs = len(values)
+
+        if nobs == self.window:
+            old = values[0]
+            nobs -= 1
+            if nobs:
+                prev_mean = self.mean_x - self.remove_comp
+                y = old - self.remove_comp
+                t = y - self.mean_x
+                self.remove_comp = t + self.mean_x - y
+                self.mean_x -= t / nobs
+                self.ssqdm -= (old - prev_mean) * (old - self.mean_x)
+            else:
+                self.mean_x = 0.0
+                self.ssqdm = 0.0
+
+        nobs += 1
+        self.same_count = self.same_count + 1 if x == self.prev_value else 1
+        self.prev_value = x
+        prev_mean = self.mean_x - self.add_comp
+        y = x - self.add_comp
+        t = y - self.mean_x
+        self.add_comp = t + self.mean_x - y
+        self.mean_x += t / nobs
+        self.ssqdm += (x - prev_mean) * (x - self.mean_x)
+
+        self._mean.push(x)
+        self.last = x
+        return self.value
+
+    @property
+    def mean(self) -> float:
+        """Rolling mean of the window."""
+        return self._mean.value
+
+    @property
+    def std(self) -> float:
+        """Rolling sample standard deviation of the window."""
+        nobs = len(self._mean.values)
+        if nobs < self.window or nobs < 2:
+            return NAN
+        if self.same_count >= nobs:
+            return 0.0
+        variance = self.ssqdm / (nobs - 1)
+        return math.sqrt(variance) if variance > 0 else 0.0
+
+    @property
+    def value(self) -> float:
+        std = self.std
+        if math.isnan(std):
+            return NAN
+        if std == 0:
+            return 0.0
+        return (self.last - self.mean) / std
+
+
+class ATR(StreamingIndicator):
+    """
+    Average True Range.
+
+    method="sma" matches rolling_atr (simple rolling mean of TR, BearTrap);
+    method="ema" matches MIDAS calculate_atr (TR.ewm(span=period, adjust=False)).
+    The first bar's true range falls back to high - low.
+    """
+
+    _PARAMS = ("period", "method")
+    _STATE = ("prev_close", "tr", "avg_state")
+
+    def __init__(self, period: int = 14, method: str = "sma"):
+        if method not in ("sma", "ema"):
+            raise ValueError(f"Unknown ATR method: {method}")
+        self.period = period
+        self.method = method
+        self.prev_close = None
+        self.tr = None
+        self._avg = RollingMean(period) if method == "sma" else EMA(period)
+
+    @property
+    def avg_state(self) -> Dict:
+        return self._avg.state()
+
+    @avg_state.setter
+    def avg_state(self, state: Dict) -> None:
+        self._avg = indicator_from_state(state)
+
+    def update(self, bar) -> float:
+        high = float(bar_value(bar, "high"))
+        low = float(bar_value(bar, "low"))
+        tr = high - low
+        if self.prev_close is not None:
+            tr = max(tr, abs(high - self.prev_close), abs(low - self.prev_close))
+        self.prev_close = float(bar_value(bar, "close"))
+        self.tr = tr
+        return self._avg.push(tr)
+
+    @property
+    def value(self) -> float:
+        return self._avg.value
+
+
+class SessionVWAP(StreamingIndicator):
+    """
+    Session-anchored VWAP on the typical price (H + L + C) / 3, reset each session.
+
+    Cumulative sums are Kahan-compensated like pandas groupby().cumsum().
+    """
+
+    _PARAMS = ()
+    _STATE = ("session", "cum_pv", "pv_comp", "cum_volume", "volume_comp")
+
+    def __init__(self):
+        self.session = None
+        self.cum_pv = 0.0
+        self.pv_comp = 0.0
+        self.cum_volume = 0.0
+        self.volume_comp = 0.0
+
+    def update(self, bar) -> float:
+        session = _session_key(bar_value(bar, "timestamp"))
+        if session != self.session:
+            self.session = session
+            self.cum_pv = self.pv_comp = 0.0
+            self.cum_volume = self.volume_comp = 0.0
+        typical = (float(bar_value(bar, "high")) + float(bar_value(bar, "low")) + float(bar_value(bar, "close"))) / 3
+        volume = float(bar_value(bar, "volume"))
+
+        y = typical * volume - self.pv_comp
+        t = self.cum_pv + y
+        self.pv_comp = t - self.cum_pv - y
+        self.cum_pv = t
+
+        y = volume - self.volume_comp
+        t = self.cum_volume + y
+        self.volume_comp = t - self.cum_volume - y
+        self.cum_volume = t
+        return self.value
+
+    @property
+    def value(self) -> float:
+        return self.cum_pv / self.cum_volume if self.cum_volume else NAN
+
+
+class SessionHigh(StreamingIndicator):
+    """Running session high, reset each session."""
+
+    _PARAMS = ("field",)
+    _STATE = ("session", "extreme")
+
+    def __init__(self, field: str = "high"):
+        self.field = field
+        self.session = None
+        self.extreme = None
+
+    def _better(self, x: float) -> bool:
+        return x > self.extreme
+
+    def update(self, bar) -> float:
+        session = _session_key(bar_value(bar, "timestamp"))
+        x = float(bar_value(bar, self.field))
+        if session != self.session or self._better(x):
+            self.session = session
+            self.extreme = x
+        return self.extreme
+
+    @property
+    def value(self) -> float:
+        return NAN if self.extreme is None else self.extreme
+
+
+class SessionLow(SessionHigh):
+    """Running session low, reset each session."""
+
+    def __init__(self, field: str = "low"):
+        super().__init__(field)
+
+    def _better(self, x: float) -> bool:
+        return x < self.extreme
+
+
+INDICATORS = {
+    cls.__name__: cls
+    for cls in (EMA, RSI, RollingMean, RollingZScore, ATR, SessionVWAP, SessionHigh, SessionLow)
+}
+
+
+def indicator_from_state(state: Dict) -> StreamingIndicator:
+    """Rebuild any indicator from its state() snapshot."""
+    return INDICATORS[state["kind"]].from_state(state)
+
+
+class IndicatorEngine:
+    """
+    Named set of streaming indicators advanced together, one bar at a time.
+
+    Usage:
+        engine = IndicatorEngine({"rsi_14": RSI(14), "ema_200": EMA(200), "atr": ATR(14)})
+        engine.warm_up(history_df)
+        values = engine.update(bar)
+    """
+
+    def __init__(self, indicators: Dict[str, StreamingIndicator]):
+        """
+        Initialize IndicatorEngine.
+
+        Args:
+            indicators: Dict of output name -> indicator
+        """
+        self.indicators = dict(indicators)
+        self.bars_seen = 0
+        self.last_timestamp = None
+
+    def update(self, bar) -> Dict[str, float]:
+        """
+        Advance every indicator by one bar.
+
+        Args:
+            bar: Mapping or object with timestamp/open/high/low/close/volume
+
+        Returns:
+            Dict of output name -> latest value
+        """
+        self.bars_seen += 1
+        has_timestamp = "timestamp" in bar if isinstance(bar, Mapping) else hasattr(bar, "timestamp")
+        if has_timestamp:
+            self.last_timestamp = str(pd.Timestamp(bar_value(bar, "timestamp")))
+        return {name: indicator.update(bar) for name, indicator in self.indicators.items()}
+
+    @property
+    def values(self) -> Dict[str, float]:
+        """Latest value of every indicator."""
+        return {name: indicator.value for name, indicator in self.indicators.items()}
+
+    def warm_up(self, bars: pd.DataFrame) -> pd.DataFrame:
+        """
+        Feed a bar history through the engine (e.g. a cached look-back window).
+
+        Args:
+            bars: DataFrame indexed by timestamp with the bar columns
+
+        Returns:
+            DataFrame of indicator values, one row per bar, indexed like bars
+        """
+        columns = list(bars.columns)
+        rows = []
+        for timestamp, *fields in bars.itertuples(name=None):
+            bar = dict(zip(columns, fields))
+            bar["timestamp"] = timestamp
+            rows.append(self.update(bar))
+        return pd.DataFrame(rows, index=bars.index, columns=list(self.indicators))
+
+    def state(self) -> Dict:
+        """Return a JSON-serializable snapshot of every indicator."""
+        return {
+            "bars_seen": self.bars_seen,
+            "last_timestamp": self.last_timestamp,
+            "indicators": {name: indicator.state() for name, indicator in self.indicators.items()},
+        }
+
+    @classmethod
+    def from_state(cls, state: Dict) -> "IndicatorEngine":
+        """Rebuild an engine from state()."""
+        engine = cls({name: indicator_from_state(s) for name, s in state["indicators"].items()})
+        engine.bars_seen = state["bars_seen"]
+        engine.last_timestamp = state["last_timestamp"]
+        return engine
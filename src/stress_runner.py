@@ -0,0 +1,354 @@
+"""
+Portfolio Stress-Test Runner
+Fans run_rolling_backtest out over a basket of symbols in a process pool.
+
+Each symbol runs in its own worker process (bars come from the local data cache
+when the interval is cacheable), so a MAG7 + index basket takes roughly as long
+as its slowest symbol. As symbols finish, their per-window results are streamed
+into a single Parquet file (one row group per symbol) instead of per-line text
+appends, and the per-symbol equity curves and daily results are aggregated into
+a portfolio view.
+
+Output Structure:
+    stress_test_results.parquet             # symbol, date, window metrics, weight_<feature>
+    stress_test_results_equity.parquet      # timestamp x symbol equity + portfolio total
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Dict, List
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from src.backtester_pro import resolve_trading_days, run_rolling_backtest
+from src.pnl_tracker import calculate_max_drawdown
+
+# Features whose optimized weights are recorded per window (matches run_rolling_backtest)
+WEIGHT_FEATURES = ["rsi_14", "volume_zscore", "sentiment"]
+
+# Stress-test intervals that the DataCache can serve
+CACHE_TIMEFRAMES = {"1Min": "1min", "1Hour": "1hour", "1Day": "1day"}
+
+WINDOW_SCHEMA = pa.schema(
+    [
+        ("symbol", pa.string()),
+        ("date", pa.string()),
+        ("in_sample_hit_rate", pa.float64()),
+        ("out_sample_hit_rate", pa.float64()),
+        ("wfe", pa.float64()),
+        ("daily_pnl_dollars", pa.float64()),
+        ("daily_pnl_pct", pa.float64()),
+        ("ending_equity", pa.float64()),
+        ("is_pnl_dollars", pa.float64()),
+        ("is_max_dd", pa.float64()),
+        ("is_sharpe", pa.float64()),
+        ("oos_max_dd", pa.float64()),
+        ("oos_sharpe", pa.float64()),
+    ]
+    + [(f"weight_{feature}", pa.float64()) for feature in WEIGHT_FEATURES]
+)
+
+
+def _load_cached_bars(symbol: str, interval: str, start: str, end: str) -> pd.DataFrame:
+    """
+    Load bars through the DataCache (fetching and caching on a miss).
+
+    Returns None when the interval is not cacheable or the cache cannot serve the
+    request, in which case run_rolling_backtest fetches from Alpaca itself.
+    """
+    timeframe = CACHE_TIMEFRAMES.get(interval)
+    if timeframe is None:
+        return None
+
+    try:
+        from src.data_cache import DataCache
+
+        return DataCache().get_or_fetch_equity(symbol, timeframe, start, end)
+    except Exception as e:
+        print(f"[PORTFOLIO STRESS] {symbol} cache unavailable ({e}), fetching directly")
+        return None
+
+
+def _run_symbol(task: Dict) -> Dict:
+    """
+    Run one symbol's rolling backtest (top-level so it can run in a worker process).
+
+    Args:
+        task: Keyword arguments for run_rolling_backtest, plus 'use_cache'
+
+    Returns:
+        Dict returned from run_rolling_backtest()
+    """
+    task = dict(task)
+    use_cache = task.pop("use_cache")
+
+    if use_cache:
+        trading_days = resolve_trading_days(
+            task["days"], task["in_sample_days"], start_date=task["start_date"], end_date=task["end_date"]
+        )
+        node_config = task["node_config"] or {}
+        task["all_bars"] = _load_cached_bars(
+            task["symbol"],
+            node_config.get("interval", "1Min"),
+            trading_days[0].strftime("%Y-%m-%d"),
+            (trading_days[-1] + timedelta(days=1)).strftime("%Y-%m-%d"),
+        )
+
+    return run_rolling_backtest(**task)
+
+
+def window_results_table(symbol: str, daily_results: List[Dict]) -> pa.Table:
+    """
+    Convert one symbol's daily_results into a columnar table of per-window rows.
+
+    Args:
+        symbol: Stock symbol
+        daily_results: 'daily_results' list from run_rolling_backtest()
+
+    Returns:
+        pyarrow Table with WINDOW_SCHEMA
+    """
+    columns = {name: [] for name in WINDOW_SCHEMA.names}
+    for day in daily_results:
+        weights = day.get("optimal_weights") or {}
+        columns["symbol"].append(symbol)
+        for name in WINDOW_SCHEMA.names[1:]:
+            if name.startswith("weight_"):
+                columns[name].append(weights.get(name[len("weight_") :], np.nan))
+            else:
+                columns[name].append(day[name])
+
+    return pa.Table.from_pydict(columns, schema=WINDOW_SCHEMA)
+
+
+def aggregate_equity_curves(results: Dict[str, Dict]) -> pd.DataFrame:
+    """
+    Align per-symbol master equity curves on a common timestamp index.
+
+    Before a symbol's first bar its equity is its initial capital; after that the
+    last known equity is carried forward. The 'portfolio' column is the sum.
+
+    Args:
+        results: Successful run_rolling_backtest() results keyed by symbol
+
+    Returns:
+        DataFrame indexed by timestamp with one column per symbol plus 'portfolio'
+    """
+    curves = {}
+    for symbol, result in results.items():
+        curve = result["master_equity_curve"]
+        if len(curve) > 0:
+            curves[symbol] = curve[~curve.index.duplicated(keep="last")]
+
+    if not curves:
+        return pd.DataFrame(columns=["portfolio"], dtype=float)
+
+    equity = pd.DataFrame(curves).sort_index().ffill()
+    equity = equity.fillna({symbol: results[symbol]["initial_capital"] for symbol in curves})
+    equity["portfolio"] = equity.sum(axis=1)
+    return equity
+
+
+def aggregate_daily_results(results: Dict[str, Dict]) -> pd.DataFrame:
+    """
+    Combine per-symbol daily results into one row per OOS date.
+
+    Args:
+        results: Successful run_rolling_backtest() results keyed by symbol
+
+    Returns:
+        DataFrame indexed by date with summed P&L, mean hit rates and symbol count
+    """
+    rows = [
+        {
+            "date": day["date"],
+            "daily_pnl_dollars": day["daily_pnl_dollars"],
+            "in_sample_hit_rate": day["in_sample_hit_rate"],
+            "out_sample_hit_rate": day["out_sample_hit_rate"],
+            "wfe": day["wfe"],
+        }
+        for result in results.values()
+        for day in result["daily_results"]
+    ]
+    if not rows:
+        return pd.DataFrame()
+
+    daily = (
+        pd.DataFrame(rows)
+        .groupby("date")
+        .agg(
+            daily_pnl_dollars=("daily_pnl_dollars", "sum"),
+            avg_in_sample_hr=("in_sample_hit_rate", "mean"),
+            avg_out_sample_hr=("out_sample_hit_rate", "mean"),
+            avg_wfe=("wfe", "mean"),
+            symbols=("daily_pnl_dollars", "size"),
+        )
+        .sort_index()
+    )
+    daily["cumulative_pnl_dollars"] = daily["daily_pnl_dollars"].cumsum()
+    return daily
+
+
+def run_portfolio_stress_test(
+    symbols: List[str],
+    days: int = 15,
+    in_sample_days: int = 3,
+    initial_capital: float = 100000.0,
+    start_date: datetime = None,
+    end_date: datetime = None,
+    node_configs: Dict = None,
+    workers: int = None,
+    feature_mode: str = "window",
+    result_path: str = "stress_test_results.parquet",
+    use_cache: bool = True,
+    quiet: bool = False,
+) -> Dict:
+    """
+    Run the rolling walk-forward stress test over a basket of symbols in parallel.
+
+    Args:
+        symbols: Stock symbols to test (e.g. MAG7 + SPY/QQQ/IWM)
+        days: Out-of-sample days per symbol (default: 15)
+        in_sample_days: Days for in-sample optimization (default: 3)
+        initial_capital: Starting capital per symbol, unless a node config sets
+            'position_cap_usd' (default: 100,000)
+        start_date: Start of an explicit temporal range (overrides days)
+        end_date: End of the range (default: yesterday)
+        node_configs: Per-symbol node configs keyed by symbol ('SPY' is the fallback)
+        workers: Process pool size (default: min(len(symbols), cpu count); 1 = in-process)
+        feature_mode: run_rolling_backtest feature mode (default: 'window', as in run_rolling_backtest;
+            'full' = feature-once)
+        result_path: Parquet file receiving per-window rows; equity curves go to
+            '<stem>_equity.parquet' next to it
+        use_cache: Load bars through the DataCache (default: True)
+        quiet: Suppress per-symbol progress output
+
+    Returns:
+        Dict with per-symbol results, aggregated 'equity_curves' and 'daily_results',
+        portfolio summary statistics and output file paths
+    """
+    node_configs = node_configs or {}
+    if workers is None:
+        workers = min(len(symbols), os.cpu_count() or 1)
+
+    tasks = {}
+    for symbol in symbols:
+        node_config = node_configs.get(symbol, node_configs.get("SPY"))
+        tasks[symbol] = {
+            "symbol": symbol,
+            "days": days,
+            "in_sample_days": in_sample_days,
+            "initial_capital": (node_config or {}).get("position_cap_usd", initial_capital),
+            "start_date": start_date,
+            "end_date": end_date,
+            "report_only": True,
+            "quiet": True,
+            "node_config": node_config,
+            "feature_mode": feature_mode,
+            "use_cache": use_cache,
+        }
+
+    if not quiet:
+        print("\n" + "=" * 60)
+        print(f"[PORTFOLIO STRESS] {len(symbols)} symbols | Workers: {workers} | Feature mode: {feature_mode}")
+        print("=" * 60)
+
+    results = {}
+    errors = {}
+    Path(result_path).parent.mkdir(parents=True, exist_ok=True)
+
+    with pq.ParquetWriter(result_path, WINDOW_SCHEMA) as writer:
+
+        def collect(symbol: str, result: Dict) -> None:
+            if "error" in result:
+                errors[symbol] = result["error"]
+                if not quiet:
+                    print(f"[PORTFOLIO STRESS] {symbol}: FAILED ({result['error']})")
+                return
+
+            results[symbol] = result
+            writer.write_table(window_results_table(symbol, result["daily_results"]))
+            if not quiet:
+                print(
+                    f"[PORTFOLIO STRESS] {symbol}: {result['total_days']} windows | "
+                    f"P&L ${result['cumulative_pnl_dollars']:+,.2f} ({result['cumulative_pnl_pct']:+.2f}%)"
+                )
+
+        if workers > 1 and len(tasks) > 1:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                futures = {pool.submit(_run_symbol, task): symbol for symbol, task in tasks.items()}
+                for future in as_completed(futures):
+                    symbol = futures[future]
+                    try:
+                        result = future.result()
+                    except Exception as e:
+                        result = {"error": str(e)}
+                    collect(symbol, result)
+        else:
+            for symbol, task in tasks.items():
+                try:
+                    result = _run_symbol(task)
+                except Exception as e:
+                    result = {"error": str(e)}
+                collect(symbol, result)
+
+    # Keep the caller's symbol order regardless of completion order
+    results = {symbol: results[symbol] for symbol in symbols if symbol in results}
+
+    equity = aggregate_equity_curves(results)
+    equity_path = str(Path(result_path).with_name(f"{Path(result_path).stem}_equity.parquet"))
+    equity.to_parquet(equity_path)
+
+    portfolio_initial = sum(result["initial_capital"] for result in results.values())
+    portfolio_final = sum(result["final_equity"] for result in results.values())
+    portfolio_pnl = portfolio_final - portfolio_initial
+
+    return {
+        "symbols": list(results),
+        "errors": errors,
+        "results": results,
+        "initial_capital": portfolio_initial,
+        "final_equity": portfolio_final,
+        "cumulative_pnl_dollars": portfolio_pnl,
+        "cumulative_pnl_pct": (portfolio_pnl / portfolio_initial) * 100 if portfolio_initial else 0.0,
+        "max_drawdown_pct": calculate_max_drawdown(equity["portfolio"]) if len(equity) > 0 else 0.0,
+        "equity_curves": equity,
+        "daily_results": aggregate_daily_results(results),
+        "result_path": result_path,
+        "equity_path": equity_path,
+    }
+
+
+def print_portfolio_summary(portfolio: Dict) -> None:
+    """
+    Print the per-symbol and portfolio-level stress test summary.
+
+    Args:
+        portfolio: Dict returned from run_portfolio_stress_test()
+    """
+    print("=" * 60)
+    print("[PORTFOLIO STRESS TEST SUMMARY]")
+    print("=" * 60)
+    print(f"{'Symbol':<8} {'Days':>5} {'Win%':>7} {'OOS HR':>8} {'WFE':>6} {'P&L':>14} {'MaxDD':>8}")
+    print("-" * 60)
+    for symbol, result in portfolio["results"].items():
+        print(
+            f"{symbol:<8} {result['total_days']:>5} {result['win_rate']*100:>6.1f}% "
+            f"{result['avg_out_sample_hr']*100:>7.2f}% {result['avg_wfe']:>6.2f} "
+            f"${result['cumulative_pnl_dollars']:>+12,.2f} {result['max_drawdown_pct']:>7.2f}%"
+        )
+    for symbol, error in portfolio["errors"].items():
+        print(f"{symbol:<8} [ERROR] {error}")
+    print("-" * 60)
+    print(f"  Initial Capital:     ${portfolio['initial_capital']:,.2f}")
+    print(f"  Final Equity:        ${portfolio['final_equity']:,.2f}")
+    print(f"  Cumulative P&L:      ${portfolio['cumulative_pnl_dollars']:+,.2f} ({portfolio['cumulative_pnl_pct']:+.2f}%)")
+    print(f"  Max Drawdown:        {portfolio['max_drawdown_pct']:.2f}%")
+    print(f"  Window results:      {portfolio['result_path']}")
+    print(f"  Equity curves:       {portfolio['equity_path']}")
+    print("=" * 60)
@@ -1,102 +1,262 @@
 """
 Magellan Trade Logger
 Detailed logging of all trading decisions and executions
+
+Rows are appended to in-memory batches and written as Parquet parts by a
+background thread, either every `flush_interval` seconds or as soon as a batch
+reaches `flush_rows` (and at exit). Each daily log is a directory of parts with a
+fixed Arrow schema, so it reads back as one typed DataFrame:
+
+    logs/
+        bear_trap_trades_20260120/part-<ms>-<pid>-<seq>.parquet
+        bear_trap_signals_20260120/...
+        bear_trap_decisions_20260120/...
+        bear_trap_summary_20260120.json
+
+Nested dict fields (indicators, risk status, ...) are stored as JSON strings and
+serialized on the flush thread; read_log(..., parse_json=True) decodes them.
+Timestamps are stored in UTC (naive datetimes are taken as local time).
+
+Consumers:
+- BearTrapStrategy: trades, signals, and a SKIP decision per symbol per cycle
 """
 
-import csv
+import atexit
+import json
 import os
-from datetime import datetime
+import threading
+import time
+from datetime import datetime, timezone
 from pathlib import Path
-import json
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+
+JSON = "json"  # Marker type: dict serialized to a JSON string column
+
+LOG_FIELDS = {
+    "trades": [
+        ("timestamp", pa.timestamp("us", tz="UTC")),
+        ("symbol", pa.string()),
+        ("action", pa.string()),  # ENTRY, EXIT, SCALE_OUT
+        ("side", pa.string()),  # BUY, SELL
+        ("quantity", pa.int64()),
+        ("price", pa.float64()),
+        ("order_id", pa.string()),
+        ("position_size_before", pa.int64()),
+        ("position_size_after", pa.int64()),
+        ("entry_reason", pa.string()),
+        ("exit_reason", pa.string()),
+        ("pnl_dollars", pa.float64()),
+        ("pnl_percent", pa.float64()),
+        ("hold_time_minutes", pa.float64()),
+        ("market_conditions", JSON),
+        ("indicators", JSON),
+        ("risk_metrics", JSON),
+    ],
+    "signals": [
+        ("timestamp", pa.timestamp("us", tz="UTC")),
+        ("symbol", pa.string()),
+        ("signal_type", pa.string()),  # BUY, SELL, HOLD
+        ("signal_strength", pa.float64()),
+        ("indicator_values", JSON),
+        ("entry_criteria_met", pa.bool_()),
+        ("exit_criteria_met", pa.bool_()),
+        ("risk_gates_passed", pa.bool_()),
+        ("action_taken", pa.string()),  # EXECUTED, SKIPPED, PENDING
+        ("skip_reason", pa.string()),
+    ],
+    "decisions": [
+        ("timestamp", pa.timestamp("us", tz="UTC")),
+        ("symbol", pa.string()),
+        ("decision_type", pa.string()),  # SKIP_ENTRY, SKIP_EXIT, HOLD
+        ("reason", pa.string()),
+        ("details", pa.string()),
+        ("current_price", pa.float64()),
+        ("indicator_values", JSON),
+        ("risk_status", JSON),
+    ],
+}
+
+LOG_SCHEMAS = {
+    kind: pa.schema([(name, pa.string() if dtype is JSON else dtype) for name, dtype in fields])
+    for kind, fields in LOG_FIELDS.items()
+}
+
+# Defaults applied when a log_* call omits a field (legacy CSV behaviour)
+LOG_DEFAULTS = {
+    "trades": {
+        "position_size_before": 0, "position_size_after": 0, "entry_reason": "", "exit_reason": "",
+        "pnl_dollars": 0, "pnl_percent": 0, "hold_time_minutes": 0,
+        "market_conditions": {}, "indicators": {}, "risk_metrics": {},
+    },
+    "signals": {
+        "signal_strength": 0, "indicator_values": {}, "entry_criteria_met": False,
+        "exit_criteria_met": False, "risk_gates_passed": False, "skip_reason": "",
+    },
+    "decisions": {"details": "", "indicator_values": {}, "risk_status": {}},
+}
+
+
+def _json_default(value):
+    """json.dumps fallback for NumPy scalars/arrays and timestamps."""
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    if isinstance(value, (datetime, pd.Timestamp)):
+        return value.isoformat()
+    return str(value)
+
+
+_ENCODER = json.JSONEncoder(default=_json_default)
+
+
+def _to_utc(value) -> datetime:
+    """Normalize a log timestamp to an aware UTC datetime (naive = local time)."""
+    if isinstance(value, pd.Timestamp):
+        value = value.to_pydatetime()
+    return value.astimezone(timezone.utc)
+
+
+def _column(values: list, dtype):
+    """Build one Arrow column from raw logged values."""
+    if dtype is JSON:
+        encode = _ENCODER.encode
+        return pa.array([encode(v) for v in values], type=pa.string())
+    if pa.types.is_timestamp(dtype):
+        return pa.array([_to_utc(v) for v in values], type=dtype)
+    if pa.types.is_string(dtype):
+        return pa.array([None if v is None else str(v) for v in values], type=dtype)
+    if pa.types.is_integer(dtype):
+        return pa.array([None if v is None else int(v) for v in values], type=dtype)
+    if pa.types.is_floating(dtype):
+        return pa.array([None if v is None else float(v) for v in values], type=dtype)
+    return pa.array([None if v is None else bool(v) for v in values], type=dtype)
 
 
 class TradeLogger:
     """Logs all trading decisions with full context"""
 
-    def __init__(self, strategy_name, log_dir="/home/ssm-user/magellan/logs"):
+    def __init__(self, strategy_name, log_dir="/home/ssm-user/magellan/logs", flush_interval=30.0, flush_rows=500):
+        """
+        Initialize TradeLogger.
+
+        Args:
+            strategy_name: Prefix for the log directories
+            log_dir: Root log directory
+            flush_interval: Seconds between background flushes
+            flush_rows: Flush as soon as any batch reaches this many rows
+        """
         self.strategy_name = strategy_name
         self.log_dir = Path(log_dir)
         self.log_dir.mkdir(parents=True, exist_ok=True)
+        self.flush_interval = flush_interval
+        self.flush_rows = flush_rows
 
-        # Create dated log files
+        # Create dated log directories
         self.date_str = datetime.now().strftime("%Y%m%d")
 
         # Trade execution log
-        self.trade_log_path = self.log_dir / f"{strategy_name}_trades_{self.date_str}.csv"
-        self._init_trade_log()
+        self.trade_log_path = self.log_path("trades")
 
         # Signal evaluation log
-        self.signal_log_path = self.log_dir / f"{strategy_name}_signals_{self.date_str}.csv"
-        self._init_signal_log()
+        self.signal_log_path = self.log_path("signals")
 
         # Decision log (why we didn't trade)
-        self.decision_log_path = self.log_dir / f"{strategy_name}_decisions_{self.date_str}.csv"
-        self._init_decision_log()
-
-    def _init_trade_log(self):
-        """Initialize trade execution log"""
-        if not self.trade_log_path.exists():
-            with open(self.trade_log_path, "w", newline="") as f:
-                writer = csv.writer(f)
-                writer.writerow(
-                    [
-                        "timestamp",
-                        "symbol",
-                        "action",  # ENTRY, EXIT, SCALE_OUT
-                        "side",  # BUY, SELL
-                        "quantity",
-                        "price",
-                        "order_id",
-                        "position_size_before",
-                        "position_size_after",
-                        "entry_reason",
-                        "exit_reason",
-                        "pnl_dollars",
-                        "pnl_percent",
-                        "hold_time_minutes",
-                        "market_conditions",
-                        "indicators",
-                        "risk_metrics",
-                    ]
-                )
-
-    def _init_signal_log(self):
-        """Initialize signal evaluation log"""
-        if not self.signal_log_path.exists():
-            with open(self.signal_log_path, "w", newline="") as f:
-                writer = csv.writer(f)
-                writer.writerow(
-                    [
-                        "timestamp",
-                        "symbol",
-                        "signal_type",  # BUY, SELL, HOLD
-                        "signal_strength",
-                        "indicator_values",
-                        "entry_criteria_met",
-                        "exit_criteria_met",
-                        "risk_gates_passed",
-                        "action_taken",  # EXECUTED, SKIPPED, PENDING
-                        "skip_reason",
-                    ]
-                )
-
-    def _init_decision_log(self):
-        """Initialize decision log (rejections)"""
-        if not self.decision_log_path.exists():
-            with open(self.decision_log_path, "w", newline="") as f:
-                writer = csv.writer(f)
-                writer.writerow(
-                    [
-                        "timestamp",
-                        "symbol",
-                        "decision_type",  # SKIP_ENTRY, SKIP_EXIT, HOLD
-                        "reason",
-                        "details",
-                        "current_price",
-                        "indicator_values",
-                        "risk_status",
-                    ]
-                )
+        self.decision_log_path = self.log_path("decisions")
+
+        self._batches = {kind: [] for kind in LOG_FIELDS}
+        self._lock = threading.Lock()
+        self._write_lock = threading.Lock()
+        self._wake = threading.Event()
+        self._closed = False
+        self._seq = 0
+        self._thread = None
+        atexit.register(self.close)
+
+    def log_path(self, kind: str, date_str: str = None) -> Path:
+        """Directory holding one day's parts for a log kind ('trades', 'signals', 'decisions')."""
+        return self.log_dir / f"{self.strategy_name}_{kind}_{date_str or self.date_str}"
+
+    # =========================================================================
+    # BUFFERED WRITES
+    # =========================================================================
+
+    def _append(self, kind: str, kwargs: dict):
+        """Buffer one row; wake the flush thread if the batch is full."""
+        defaults = LOG_DEFAULTS[kind]
+        row = []
+        for name, dtype in LOG_FIELDS[kind]:
+            value = kwargs.get(name, defaults.get(name))
+            if name == "timestamp":
+                value = value or datetime.now()
+            elif dtype is JSON and isinstance(value, dict):
+                value = dict(value)  # Serialized later on the flush thread
+            row.append(value)
+        with self._lock:
+            batch = self._batches[kind]
+            batch.append(row)
+            full = len(batch) >= self.flush_rows
+            if self._thread is None and not self._closed:
+                self._thread = threading.Thread(target=self._run, name=f"{self.strategy_name}-trade-logger", daemon=True)
+                self._thread.start()
+        if full:
+            self._wake.set()
+
+    def _run(self):
+        """Background flush loop: every flush_interval seconds or when woken."""
+        while not self._closed:
+            self._wake.wait(self.flush_interval)
+            self._wake.clear()
+            try:
+                self.flush()
+            except Exception:
+                pass  # Logging must never take the strategy down
+
+    def flush(self) -> int:
+        """
+        Write all buffered rows to new Parquet parts.
+
+        Returns:
+            Number of rows written
+        """
+        with self._lock:
+            batches, self._batches = self._batches, {kind: [] for kind in LOG_FIELDS}
+
+        written = 0
+        with self._write_lock:
+            for kind, rows in batches.items():
+                if not rows:
+                    continue
+                fields = LOG_FIELDS[kind]
+                columns = [_column([row[i] for row in rows], dtype) for i, (_, dtype) in enumerate(fields)]
+                table = pa.Table.from_arrays(columns, schema=LOG_SCHEMAS[kind])
+
+                path = self.log_path(kind)
+                path.mkdir(parents=True, exist_ok=True)
+                self._seq += 1
+                part = path / f"part-{int(time.time() * 1000)}-{os.getpid()}-{self._seq:05d}.parquet"
+                pq.write_table(table, part)
+                written += len(rows)
+        return written
+
+    def close(self):
+        """Flush remaining rows and stop the flush thread (registered at exit)."""
+        if self._closed:
+            return
+        self._closed = True
+        self._wake.set()
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join(timeout=5)
+        self.flush()
+
+    # =========================================================================
+    # LOGGING API
+    # =========================================================================
 
     def log_trade(self, **kwargs):
         """
@@ -121,29 +281,7 @@ class TradeLogger:
             indicators: dict
             risk_metrics: dict
         """
-        with open(self.trade_log_path, "a", newline="") as f:
-            writer = csv.writer(f)
-            writer.writerow(
-                [
-                    kwargs.get("timestamp", datetime.now()).isoformat(),
-                    kwargs.get("symbol"),
-                    kwargs.get("action"),
-                    kwargs.get("side"),
-                    kwargs.get("quantity"),
-                    kwargs.get("price"),
-                    kwargs.get("order_id"),
-                    kwargs.get("position_size_before", 0),
-                    kwargs.get("position_size_after", 0),
-                    kwargs.get("entry_reason", ""),
-                    kwargs.get("exit_reason", ""),
-                    kwargs.get("pnl_dollars", 0),
-                    kwargs.get("pnl_percent", 0),
-                    kwargs.get("hold_time_minutes", 0),
-                    json.dumps(kwargs.get("market_conditions", {})),
-                    json.dumps(kwargs.get("indicators", {})),
-                    json.dumps(kwargs.get("risk_metrics", {})),
-                ]
-            )
+        self._append("trades", kwargs)
 
     def log_signal(self, **kwargs):
         """
@@ -161,22 +299,7 @@ class TradeLogger:
             action_taken: str (EXECUTED, SKIPPED, PENDING)
             skip_reason: str
         """
-        with open(self.signal_log_path, "a", newline="") as f:
-            writer = csv.writer(f)
-            writer.writerow(
-                [
-                    kwargs.get("timestamp", datetime.now()).isoformat(),
-                    kwargs.get("symbol"),
-                    kwargs.get("signal_type"),
-                    kwargs.get("signal_strength", 0),
-                    json.dumps(kwargs.get("indicator_values", {})),
-                    kwargs.get("entry_criteria_met", False),
-                    kwargs.get("exit_criteria_met", False),
-                    kwargs.get("risk_gates_passed", False),
-                    kwargs.get("action_taken"),
-                    kwargs.get("skip_reason", ""),
-                ]
-            )
+        self._append("signals", kwargs)
 
     def log_decision(self, **kwargs):
         """
@@ -192,20 +315,7 @@ class TradeLogger:
             indicator_values: dict
             risk_status: dict
         """
-        with open(self.decision_log_path, "a", newline="") as f:
-            writer = csv.writer(f)
-            writer.writerow(
-                [
-                    kwargs.get("timestamp", datetime.now()).isoformat(),
-                    kwargs.get("symbol"),
-                    kwargs.get("decision_type"),
-                    kwargs.get("reason"),
-                    kwargs.get("details", ""),
-                    kwargs.get("current_price"),
-                    json.dumps(kwargs.get("indicator_values", {})),
-                    json.dumps(kwargs.get("risk_status", {})),
-                ]
-            )
+        self._append("decisions", kwargs)
 
     def log_market_scan(self, symbol, scan_results):
         """Log market scan results"""
@@ -213,7 +323,7 @@ class TradeLogger:
             symbol=symbol,
             decision_type="MARKET_SCAN",
             reason="Periodic scan",
-            details=json.dumps(scan_results),
+            details=json.dumps(scan_results, default=_json_default),
             current_price=scan_results.get("price"),
             indicator_values=scan_results.get("indicators", {}),
             risk_status=scan_results.get("risk_status", {}),
@@ -225,29 +335,103 @@ class TradeLogger:
             symbol=symbol,
             decision_type="RISK_GATE_FAILURE",
             reason=f"Risk gate failed: {gate_name}",
-            details=json.dumps(gate_details),
+            details=json.dumps(gate_details, default=_json_default),
             risk_status={"gate": gate_name, "details": gate_details},
         )
 
+    # =========================================================================
+    # READ BACK
+    # =========================================================================
+
+    def read_table(self, kind: str, date_str: str = None, columns=None, symbol: str = None) -> pa.Table:
+        """
+        Read one day's log as an Arrow table (buffered rows are flushed first).
+
+        Args:
+            kind: 'trades', 'signals' or 'decisions'
+            date_str: Day as YYYYMMDD (default: this logger's day)
+            columns: Optional column subset
+            symbol: Optional symbol filter (pushed down to Parquet)
+
+        Returns:
+            Table with the log's fixed schema (empty if nothing was logged)
+        """
+        if date_str in (None, self.date_str):
+            self.flush()
+        schema = LOG_SCHEMAS[kind]
+        path = self.log_path(kind, date_str)
+        if not path.exists() or not any(path.glob("*.parquet")):
+            table = schema.empty_table()
+            return table.select(columns) if columns else table
+
+        dataset = ds.dataset(path, schema=schema, format="parquet")
+        table = dataset.to_table(columns=columns, filter=(ds.field("symbol") == symbol) if symbol else None)
+        return table.sort_by("timestamp") if "timestamp" in table.column_names else table
+
+    def read_log(self, kind: str, date_str: str = None, symbol: str = None, parse_json: bool = False) -> pd.DataFrame:
+        """
+        Read one day's log as a typed DataFrame.
+
+        Args:
+            kind: 'trades', 'signals' or 'decisions'
+            date_str: Day as YYYYMMDD (default: this logger's day)
+            symbol: Optional symbol filter
+            parse_json: Decode the JSON dict columns back into dicts
+
+        Returns:
+            DataFrame with tz-aware UTC timestamps and typed columns
+        """
+        df = self.read_table(kind, date_str, symbol=symbol).to_pandas()
+        if parse_json:
+            for name, dtype in LOG_FIELDS[kind]:
+                if dtype is JSON:
+                    df[name] = [json.loads(v) if v is not None else None for v in df[name]]
+        return df
+
+    def read_trades(self, date_str: str = None, **kwargs) -> pd.DataFrame:
+        """Read one day's trades (see read_log)."""
+        return self.read_log("trades", date_str, **kwargs)
+
+    def read_signals(self, date_str: str = None, **kwargs) -> pd.DataFrame:
+        """Read one day's signal evaluations (see read_log)."""
+        return self.read_log("signals", date_str, **kwargs)
+
+    def read_decisions(self, date_str: str = None, **kwargs) -> pd.DataFrame:
+        """Read one day's decisions (see read_log)."""
+        return self.read_log("decisions", date_str, **kwargs)
+
+    def compact(self, kind: str, date_str: str = None) -> Path:
+        """Merge one day's parts into a single Parquet part."""
+        if date_str in (None, self.date_str):
+            self.flush()
+        path = self.log_path(kind, date_str)
+        with self._write_lock:
+            parts = sorted(path.glob("*.parquet")) if path.exists() else []
+            if len(parts) < 2:
+                return path
+            table = ds.dataset(parts, schema=LOG_SCHEMAS[kind], format="parquet").to_table().sort_by("timestamp")
+            pq.write_table(table, path / f"part-{int(time.time() * 1000)}-{os.getpid()}-compacted.parquet")
+            for part in parts:
+                part.unlink()
+        return path
+
     def create_daily_summary(self):
         """Create end-of-day summary report"""
         summary_path = self.log_dir / f"{self.strategy_name}_summary_{self.date_str}.json"
 
-        # Read trade log and create summary
-        trades = []
-        if self.trade_log_path.exists():
-            with open(self.trade_log_path, "r") as f:
-                reader = csv.DictReader(f)
-                trades = list(reader)
+        # Only the two columns the summary needs are read
+        trades = self.read_table("trades", columns=["symbol", "pnl_dollars"])
+        pnl = trades.column("pnl_dollars").to_numpy(zero_copy_only=False)
+        pnl = np.nan_to_num(pnl.astype(float))
 
         summary = {
             "date": self.date_str,
             "strategy": self.strategy_name,
-            "total_trades": len(trades),
-            "total_pnl": sum(float(t.get("pnl_dollars", 0)) for t in trades),
-            "winning_trades": len([t for t in trades if float(t.get("pnl_dollars", 0)) > 0]),
-            "losing_trades": len([t for t in trades if float(t.get("pnl_dollars", 0)) < 0]),
-            "symbols_traded": list(set(t["symbol"] for t in trades)),
+            "total_trades": trades.num_rows,
+            "total_pnl": float(pnl.sum()),
+            "winning_trades": int((pnl > 0).sum()),
+            "losing_trades": int((pnl < 0).sum()),
+            "symbols_traded": [s for s in trades.column("symbol").unique().to_pylist() if s is not None],
             "log_files": {
                 "trades": str(self.trade_log_path),
                 "signals": str(self.signal_log_path),
@@ -258,4 +442,7 @@ class TradeLogger:
         with open(summary_path, "w") as f:
             json.dump(summary, f, indent=2)
 
+        for kind in LOG_FIELDS:
+            self.compact(kind)
+
         return summary
@@ -191,6 +191,8 @@ def run_optimized_walk_forward_check(
 
     # Create working copy with forward returns
     cols_needed = feature_cols + [target_col]
+    # Carry the shared normalization stage so the optimizer reuses it
+    cols_needed += [f"{col}_norm" for col in feature_cols if f"{col}_norm" in df.columns]
     working_df = df[cols_needed].copy()
     working_df["forward_return"] = working_df[target_col].shift(-horizon)
     working_df = working_df.dropna()